@@ -0,0 +1,43 @@
+"""deadline changes
+
+Revision ID: 9c1f4b2a7d3e
+Revises: 6734aa7c5266
+Create Date: 2026-10-19 10:45:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1f4b2a7d3e'
+down_revision = '6734aa7c5266'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('deadline_changes',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('conference_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=64), nullable=False),
+    sa.Column('change', sa.String(length=16), nullable=False),
+    sa.Column('old_due_date', sa.Date(), nullable=True),
+    sa.Column('new_due_date', sa.Date(), nullable=True),
+    sa.Column('source_id', sa.Integer(), nullable=True),
+    sa.Column('run_id', sa.String(length=128), nullable=True),
+    sa.Column('detected_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['conference_id'], ['conferences.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['source_id'], ['sources.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_deadline_change_conf_detected', 'deadline_changes', ['conference_id', 'detected_at'], unique=False)
+    op.create_index('ix_deadline_change_detected', 'deadline_changes', ['detected_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_deadline_change_detected', table_name='deadline_changes')
+    op.drop_index('ix_deadline_change_conf_detected', table_name='deadline_changes')
+    op.drop_table('deadline_changes')
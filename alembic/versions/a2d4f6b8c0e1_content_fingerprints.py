@@ -0,0 +1,42 @@
+"""content fingerprints
+
+Revision ID: a2d4f6b8c0e1
+Revises: f1c3e5a7b9d2
+Create Date: 2026-10-19 18:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2d4f6b8c0e1'
+down_revision = 'f1c3e5a7b9d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('content_fingerprints',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('url', sa.String(length=800), nullable=False),
+    sa.Column('source', sa.String(length=64), nullable=True),
+    sa.Column('version', sa.String(length=32), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('simhash', sa.BigInteger(), nullable=False),
+    sa.Column('numbers_hash', sa.String(length=64), nullable=False),
+    sa.Column('follow_ups', sa.JSON(), nullable=False),
+    sa.Column('parsed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url', name='uq_content_fingerprint_url')
+    )
+    op.create_index('ix_content_fingerprint_source', 'content_fingerprints', ['source'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_content_fingerprint_source', table_name='content_fingerprints')
+    op.drop_table('content_fingerprints')
@@ -0,0 +1,90 @@
+"""crawl keys
+
+Revision ID: a7c9e1b3d5f8
+Revises: f4a6c8e0b2d5
+Create Date: 2026-10-20 12:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c9e1b3d5f8'
+down_revision = 'f4a6c8e0b2d5'
+branch_labels = None
+depends_on = None
+
+crawl_states = sa.table(
+    'crawl_states',
+    sa.column('spider', sa.String),
+    sa.column('status', sa.String),
+    sa.column('run_keys', sa.JSON),
+    sa.column('known_keys', sa.JSON),
+)
+
+
+def upgrade() -> None:
+    crawl_keys = op.create_table('crawl_keys',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('spider', sa.String(length=64), nullable=False),
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('known', sa.Boolean(), nullable=False),
+    sa.Column('current', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('spider', 'key', name='uq_crawl_key_spider_key')
+    )
+
+    # Move the key arrays out of crawl_states; run keys only matter to unfinished crawls
+    rows = []
+    for spider, status, run_keys, known_keys in op.get_bind().execute(
+        sa.select(crawl_states.c.spider, crawl_states.c.status, crawl_states.c.run_keys,
+                  crawl_states.c.known_keys)
+    ):
+        known = set(known_keys or [])
+        current = set(run_keys or []) if status == 'running' else set()
+        rows += [
+            {'spider': spider, 'key': key, 'known': key in known, 'current': key in current}
+            for key in sorted(known | current)
+        ]
+    if rows:
+        op.bulk_insert(crawl_keys, rows)
+
+    with op.batch_alter_table('crawl_states') as batch_op:
+        batch_op.drop_column('known_keys')
+        batch_op.drop_column('run_keys')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('crawl_states') as batch_op:
+        batch_op.add_column(sa.Column('run_keys', sa.JSON(), server_default='[]', nullable=False))
+        batch_op.add_column(sa.Column('known_keys', sa.JSON(), server_default='[]', nullable=False))
+
+    crawl_keys = sa.table(
+        'crawl_keys',
+        sa.column('spider', sa.String),
+        sa.column('key', sa.String),
+        sa.column('known', sa.Boolean),
+        sa.column('current', sa.Boolean),
+    )
+    keys: dict[str, tuple[list[str], list[str]]] = {}
+    for spider, key, known, current in op.get_bind().execute(
+        sa.select(crawl_keys.c.spider, crawl_keys.c.key, crawl_keys.c.known, crawl_keys.c.current)
+        .order_by(crawl_keys.c.key)
+    ):
+        run, known_keys = keys.setdefault(spider, ([], []))
+        if current:
+            run.append(key)
+        if known:
+            known_keys.append(key)
+    for spider, (run, known_keys) in keys.items():
+        op.execute(
+            crawl_states.update()
+            .where(crawl_states.c.spider == spider)
+            .values(run_keys=run, known_keys=known_keys)
+        )
+    op.drop_table('crawl_keys')
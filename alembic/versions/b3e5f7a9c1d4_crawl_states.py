@@ -0,0 +1,42 @@
+"""crawl states
+
+Revision ID: b3e5f7a9c1d4
+Revises: a2d4f6b8c0e1
+Create Date: 2026-10-19 20:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e5f7a9c1d4'
+down_revision = 'a2d4f6b8c0e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('crawl_states',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('spider', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('pending', sa.JSON(), nullable=False),
+    sa.Column('seen', sa.JSON(), nullable=False),
+    sa.Column('cursor', sa.String(length=800), nullable=True),
+    sa.Column('pages', sa.Integer(), nullable=False),
+    sa.Column('run_keys', sa.JSON(), nullable=False),
+    sa.Column('known_keys', sa.JSON(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('spider', name='uq_crawl_state_spider')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('crawl_states')
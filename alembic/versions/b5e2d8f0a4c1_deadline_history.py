@@ -0,0 +1,62 @@
+"""deadline history
+
+Revision ID: b5e2d8f0a4c1
+Revises: 9c1f4b2a7d3e
+Create Date: 2026-10-19 11:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e2d8f0a4c1'
+down_revision = '9c1f4b2a7d3e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('deadline_history',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('conference_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=64), nullable=False),
+    sa.Column('due_date', sa.Date(), nullable=False),
+    sa.Column('timezone', sa.String(length=64), nullable=True),
+    sa.Column('source_id', sa.Integer(), nullable=True),
+    sa.Column('valid_from', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('valid_to', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['conference_id'], ['conferences.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['source_id'], ['sources.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_deadline_history_conf_kind_from', 'deadline_history', ['conference_id', 'kind', 'valid_from'], unique=False)
+    op.create_index('ix_deadline_history_valid', 'deadline_history', ['valid_to', 'valid_from'], unique=False)
+
+    # Seed one open version per existing deadline, valid since it was first stored.
+    # OPEN_END is bound with the column type so it is stored exactly as the ORM
+    # stores it; record_history closes open versions by equality on valid_to
+    open_end = sa.bindparam(
+        "open_end",
+        datetime(9999, 12, 31, tzinfo=timezone.utc),
+        type_=sa.DateTime(timezone=True),
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO deadline_history "
+            "(conference_id, kind, due_date, timezone, source_id, valid_from, valid_to) "
+            "SELECT conference_id, kind, due_date, timezone, source_id, created_at, "
+            ":open_end FROM deadlines"
+        ).bindparams(open_end)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_deadline_history_valid', table_name='deadline_history')
+    op.drop_index('ix_deadline_history_conf_kind_from', table_name='deadline_history')
+    op.drop_table('deadline_history')
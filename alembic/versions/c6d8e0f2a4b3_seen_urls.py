@@ -0,0 +1,37 @@
+"""seen urls
+
+Revision ID: c6d8e0f2a4b3
+Revises: b3e5f7a9c1d4
+Create Date: 2026-10-19 21:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6d8e0f2a4b3'
+down_revision = 'b3e5f7a9c1d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('seen_urls',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('source', sa.String(length=64), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('url', sa.String(length=800), nullable=False),
+    sa.Column('last_fetched_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('fetch_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('source', 'fingerprint', name='uq_seen_url_source_fingerprint')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('seen_urls')
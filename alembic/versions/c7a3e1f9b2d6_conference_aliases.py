@@ -0,0 +1,38 @@
+"""conference aliases
+
+Revision ID: c7a3e1f9b2d6
+Revises: b5e2d8f0a4c1
+Create Date: 2026-10-19 12:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a3e1f9b2d6'
+down_revision = 'b5e2d8f0a4c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('conference_aliases',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('alias_key', sa.String(length=64), nullable=False),
+    sa.Column('canonical_key', sa.String(length=64), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('method', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('alias_key', name='uq_conference_alias_key')
+    )
+    op.create_index('ix_conference_alias_canonical', 'conference_aliases', ['canonical_key'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_conference_alias_canonical', table_name='conference_aliases')
+    op.drop_table('conference_aliases')
@@ -0,0 +1,35 @@
+"""conference parent
+
+Revision ID: d4f6a8c0e2b7
+Revises: c7a3e1f9b2d6
+Create Date: 2026-10-19 13:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f6a8c0e2b7'
+down_revision = 'c7a3e1f9b2d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batch mode recreates the table on SQLite, which can't add a foreign key in place
+    with op.batch_alter_table('conferences') as batch_op:
+        batch_op.add_column(sa.Column('parent_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_conference_parent', 'conferences', ['parent_id'], ['id'], ondelete='SET NULL'
+        )
+        batch_op.create_index('ix_conference_parent', ['parent_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('conferences') as batch_op:
+        batch_op.drop_index('ix_conference_parent')
+        batch_op.drop_constraint('fk_conference_parent', type_='foreignkey')
+        batch_op.drop_column('parent_id')
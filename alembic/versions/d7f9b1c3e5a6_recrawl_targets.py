@@ -0,0 +1,41 @@
+"""recrawl targets
+
+Revision ID: d7f9b1c3e5a6
+Revises: c6d8e0f2a4b3
+Create Date: 2026-10-19 22:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f9b1c3e5a6'
+down_revision = 'c6d8e0f2a4b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('recrawl_targets',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('url', sa.String(length=800), nullable=False),
+    sa.Column('spider', sa.String(length=64), nullable=False),
+    sa.Column('nearest_due_date', sa.Date(), nullable=True),
+    sa.Column('interval_s', sa.Integer(), nullable=False),
+    sa.Column('next_crawl_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_crawled_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_run_id', sa.String(length=128), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url', name='uq_recrawl_target_url')
+    )
+    op.create_index('ix_recrawl_target_next', 'recrawl_targets', ['next_crawl_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recrawl_target_next', table_name='recrawl_targets')
+    op.drop_table('recrawl_targets')
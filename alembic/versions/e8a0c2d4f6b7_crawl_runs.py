@@ -0,0 +1,44 @@
+"""crawl runs
+
+Revision ID: e8a0c2d4f6b7
+Revises: d7f9b1c3e5a6
+Create Date: 2026-10-19 23:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a0c2d4f6b7'
+down_revision = 'd7f9b1c3e5a6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('crawl_runs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('run_id', sa.String(length=128), nullable=True),
+    sa.Column('asset', sa.String(length=64), nullable=False),
+    sa.Column('source', sa.String(length=64), nullable=False),
+    sa.Column('partition', sa.String(length=128), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('wall_time_s', sa.Float(), nullable=False),
+    sa.Column('requests', sa.Integer(), nullable=False),
+    sa.Column('bytes_downloaded', sa.BigInteger(), nullable=False),
+    sa.Column('cache_hit_ratio', sa.Float(), nullable=True),
+    sa.Column('items', sa.Integer(), nullable=False),
+    sa.Column('items_per_s', sa.Float(), nullable=False),
+    sa.Column('db_rows', sa.Integer(), nullable=False),
+    sa.Column('db_write_s', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_crawl_run_asset_source_finished', 'crawl_runs', ['asset', 'source', 'finished_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_crawl_run_asset_source_finished', table_name='crawl_runs')
+    op.drop_table('crawl_runs')
@@ -0,0 +1,41 @@
+"""raw pages
+
+Revision ID: e8b1c3d5f7a9
+Revises: d4f6a8c0e2b7
+Create Date: 2026-10-19 14:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b1c3d5f7a9'
+down_revision = 'd4f6a8c0e2b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('raw_pages',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('url', sa.String(length=800), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.Integer(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(length=64), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_raw_page_url_fetched', 'raw_pages', ['url', 'fetched_at'], unique=False)
+    op.create_index('ix_raw_page_source_fetched', 'raw_pages', ['source', 'fetched_at'], unique=False)
+    op.create_index('ix_raw_page_sha256', 'raw_pages', ['sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_raw_page_sha256', table_name='raw_pages')
+    op.drop_index('ix_raw_page_source_fetched', table_name='raw_pages')
+    op.drop_index('ix_raw_page_url_fetched', table_name='raw_pages')
+    op.drop_table('raw_pages')
@@ -0,0 +1,38 @@
+"""reprocess checkpoints
+
+Revision ID: f1c3e5a7b9d2
+Revises: e8b1c3d5f7a9
+Create Date: 2026-10-19 16:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c3e5a7b9d2'
+down_revision = 'e8b1c3d5f7a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('reprocess_checkpoints',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=128), nullable=False),
+    sa.Column('source', sa.String(length=64), nullable=False),
+    sa.Column('last_page_id', sa.Integer(), nullable=False),
+    sa.Column('pages', sa.Integer(), nullable=False),
+    sa.Column('items', sa.Integer(), nullable=False),
+    sa.Column('errors', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name', name='uq_reprocess_checkpoint_name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('reprocess_checkpoints')
@@ -0,0 +1,69 @@
+"""crawl requests
+
+Revision ID: f4a6c8e0b2d5
+Revises: e8a0c2d4f6b7
+Create Date: 2026-10-20 09:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4a6c8e0b2d5'
+down_revision = 'e8a0c2d4f6b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    crawl_requests = op.create_table('crawl_requests',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('spider', sa.String(length=64), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('request', sa.JSON(), nullable=True),
+    sa.Column('parsed', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('spider', 'fingerprint', name='uq_crawl_request_spider_fingerprint')
+    )
+
+    # Move the frontier of unfinished crawls out of the crawl_states JSON columns,
+    # so they still resume; pending entries keep their [url, callback] form
+    crawl_states = sa.table(
+        'crawl_states',
+        sa.column('spider', sa.String),
+        sa.column('status', sa.String),
+        sa.column('pending', sa.JSON),
+        sa.column('seen', sa.JSON),
+    )
+    rows = []
+    for spider, pending, seen in op.get_bind().execute(
+        sa.select(crawl_states.c.spider, crawl_states.c.pending, crawl_states.c.seen).where(
+            crawl_states.c.status == 'running'
+        )
+    ):
+        rows += [
+            {'spider': spider, 'fingerprint': fp, 'request': request, 'parsed': False}
+            for fp, request in (pending or {}).items()
+        ]
+        rows += [
+            {'spider': spider, 'fingerprint': fp, 'request': None, 'parsed': True}
+            for fp in seen or []
+        ]
+    if rows:
+        op.bulk_insert(crawl_requests, rows)
+
+    with op.batch_alter_table('crawl_states') as batch_op:
+        batch_op.drop_column('seen')
+        batch_op.drop_column('pending')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('crawl_states') as batch_op:
+        batch_op.add_column(sa.Column('pending', sa.JSON(), server_default='{}', nullable=False))
+        batch_op.add_column(sa.Column('seen', sa.JSON(), server_default='[]', nullable=False))
+    op.drop_table('crawl_requests')
@@ -0,0 +1,125 @@
+"""Benchmark AIDeadlinesScraper parse engines on a synthetic aideadlin.es page.
+
+Builds a page with ``--conferences`` entries marked up like aideadlin.es (nested
+rows, website icons, tags, one countdown block per conference in a large
+script), checks that both engines return identical output, and reports
+pages/sec for each.
+
+Usage:
+    python benchmarks/ai_deadlines_parse.py --conferences 250 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from confradar.scrapers.ai_deadlines import ENGINES, AIDeadlinesScraper
+
+TAGS = ["ML", "CV", "NLP", "RO", "SP", "DM"]
+
+
+def make_page(conferences: int) -> str:
+    """Return an aideadlin.es-like page with ``conferences`` entries."""
+    items = []
+    blocks = []
+    for i in range(conferences):
+        key = f"conf{i}{20 + i % 10}"
+        tag = TAGS[i % len(TAGS)]
+        items.append(f"""
+      <div id="{key}" class="ConfItem {tag}-conf">
+        <div class="row conf-row">
+          <div class="col-xs-12 col-sm-6">
+            <span class="conf-title">
+              <a title="Click to show conference info" href="/conference?id={key}">CONF{i}</a>
+            </span>
+            <span class="conf-title-small">
+              <a title="Click to show conference info" href="/conference?id={key}">CONF{i}</a>
+            </span>
+            <span class="conf-title-icon">
+              <a title="Conference Website" href="https://conf{i}.org/20{20 + i % 10}/">
+                <img src="/static/img/203-earth.svg" class="badge-link" alt="Link"/>
+              </a>
+            </span>
+            <span class="conf-sub"></span>
+            <div class="meta">
+              <span class="conf-date">May {i % 28 + 1}-{i % 28 + 3}, 20{20 + i % 10}.</span>
+              <span class="conf-place"><a href="http://maps.google.com/?q=City{i}">City{i}</a>.</span>
+            </div>
+            <div class="note">Abstract deadline one week before the paper deadline.</div>
+          </div>
+          <div class="col-xs-12 col-sm-6">
+            <span class="timer"></span>
+            <div class="deadline">
+              <div>Deadline: <span class="deadline-time">2025-{i % 12 + 1:02d}-15</span></div>
+            </div>
+            <div class="conf-tags"><span class="badge badge-{tag}">{tag}</span></div>
+          </div>
+        </div>
+        <hr>
+      </div>""")
+        blocks.append(f"""
+      $('#{key} .deadline-time').html(confDeadline.local().format('D MMM YYYY, h:mm:ss a'));
+      var timezone = "UTC-{i % 12}";
+      var confDeadline = moment.tz("2025-{i % 12 + 1:02d}-15 23:59:59", timezone);
+      var {key}Timer = $('#{key} .timer').countdown(confDeadline.toDate(), function(event) {{
+        $(this).html(event.strftime('%D days %Hh %Mm %Ss'));
+      }});""")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>AI Conference Deadlines</title>
+  <link rel="stylesheet" href="/static/css/deadlines.css">
+  <script src="/static/js/moment.min.js"></script>
+</head>
+<body>
+  <div class="container">
+    <div class="page-header"><h1>AI Conference Deadlines</h1></div>
+    <div class="row"><select id="subject">{''.join(f'<option>{t}</option>' for t in TAGS)}</select>
+    </div>
+    <div class="conf-container">{"".join(items)}
+    </div>
+  </div>
+  <script type="text/javascript" charset="utf-8">
+    $(function() {{{"".join(blocks)}
+      $('#subject').change(function() {{ update_filtering(); }});
+    }});
+  </script>
+</body>
+</html>
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conferences", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = make_page(args.conferences)
+    outputs = {engine: AIDeadlinesScraper(engine=engine).parse(page) for engine in ENGINES}
+    reference = outputs["bs4"]
+    assert all(out == reference for out in outputs.values()), "engine outputs differ"
+    deadlines = sum(len(c["deadlines"]) for c in reference)
+    print(
+        f"page: {len(page) / 1024:.0f} KiB, {len(reference)} conferences, {deadlines} deadlines; "
+        "engine outputs identical"
+    )
+
+    rates = {}
+    for engine in ENGINES:
+        scraper = AIDeadlinesScraper(engine=engine)
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            scraper.parse(page)
+        elapsed = time.perf_counter() - started
+        rates[engine] = args.repeat / elapsed
+        print(
+            f"{engine:>5}: {elapsed / args.repeat * 1000:7.1f} ms/page {rates[engine]:7.1f} pages/s"
+        )
+    print(f"speedup: {rates['lxml'] / rates['bs4']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Load-test ingestion and read queries on a large synthetic database.
+
+Ingests ``--crawls`` synthetic crawls (``confradar.synthetic``: duplicates,
+aliases, multi-source overlap; every crawl after the first moves some
+deadlines) source by source, the way ``store_conferences`` does, in batches of
+``--batch-size`` with one commit per batch. Reader threads run the read queries
+meanwhile and for ``--read-seconds`` after the ingest. Finally
+``DatabasePipeline`` (one commit per item) stores ``--pipeline-items`` items of
+another crawl into the loaded database. Reports items/sec per crawl and source,
+the pipeline's items/sec, and p50/p95 latency of each query under write load
+and idle.
+
+Runs on a temporary SQLite file unless ``--url`` points elsewhere; the target
+database must be empty.
+
+Usage:
+    python benchmarks/load_test.py --conferences 100000 --deadlines-per-conference 10
+    python benchmarks/load_test.py --conferences 100000 --deadlines-per-conference 10 \\
+        --url postgresql+psycopg://localhost/confradar_load
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from confradar.db.base import Base, get_engine
+from confradar.db.history import deadline_timeline, deadlines_as_of
+from confradar.db.identity import IdentityMap
+from confradar.db.ingest import upsert_items
+from confradar.db.models import Conference
+from confradar.synthetic import SyntheticConfig, conference_key, generate_items
+
+Query = Callable[[Session, random.Random, SyntheticConfig], Any]
+
+QUERIES: dict[str, Query] = {
+    "upcoming": lambda session, rng, config: session.execute(
+        text(
+            "SELECT c.key, d.kind, d.due_date FROM conferences c "
+            "JOIN deadlines d ON d.conference_id = c.id "
+            "WHERE d.due_date >= :today ORDER BY d.due_date LIMIT 50"
+        ),
+        {"today": date(config.first_year, 1, 1) + timedelta(days=rng.randrange(365))},
+    ).fetchall(),
+    "conference": lambda session, rng, config: session.execute(
+        text(
+            "SELECT c.name, d.kind, d.due_date FROM conferences c "
+            "JOIN deadlines d ON d.conference_id = c.id WHERE c.key = :key"
+        ),
+        {"key": conference_key(config, rng.randrange(config.conferences))},
+    ).fetchall(),
+    "name_search": lambda session, rng, config: session.execute(
+        text("SELECT key, name FROM conferences WHERE name LIKE :prefix ORDER BY name LIMIT 20"),
+        {"prefix": f"International Conference on {rng.choice('ACDIKMNRS')}%"},
+    ).fetchall(),
+    "recent_changes": lambda session, rng, config: session.execute(
+        text(
+            "SELECT conference_id, kind, change, new_due_date FROM deadline_changes "
+            "ORDER BY detected_at DESC LIMIT 50"
+        )
+    ).fetchall(),
+    "timeline": lambda session, rng, config: deadline_timeline(
+        session, rng.randint(1, config.conferences)
+    ),
+    "as_of": lambda session, rng, config: deadlines_as_of(
+        session, datetime.now(timezone.utc), conference_id=rng.randint(1, config.conferences)
+    ),
+}
+
+
+class Reader(threading.Thread):
+    """Runs QUERIES round-robin, recording latencies per query and phase."""
+
+    def __init__(self, engine: Engine, config: SyntheticConfig, seed: int):
+        super().__init__(daemon=True)
+        self.engine = engine
+        self.config = config
+        self.rng = random.Random(seed)
+        self.phase = "ingest"
+        self.stop = threading.Event()
+        self.latencies: dict[tuple[str, str], list[float]] = defaultdict(list)
+        self.errors = 0
+
+    def run(self) -> None:
+        while not self.stop.is_set():
+            for name, query in QUERIES.items():
+                phase = self.phase
+                started = time.perf_counter()
+                try:
+                    with Session(self.engine) as session:
+                        query(session, self.rng, self.config)
+                    self.latencies[(name, phase)].append(time.perf_counter() - started)
+                except OperationalError:
+                    self.errors += 1
+
+
+def ingest(engine: Engine, config: SyntheticConfig, crawl: int, batch_size: int) -> None:
+    """Store one crawl source by source, one commit per batch; prints throughput."""
+    for source in config.sources:
+        identity = IdentityMap()
+        items = moved = 0
+        stream = generate_items(config, crawl=crawl, source=source)
+        started = time.perf_counter()
+        with Session(engine) as session:
+            while batch := list(islice(stream, batch_size)):
+                stats = upsert_items(
+                    session, batch, identity=identity, run_id=f"load-{crawl}-{source}"
+                )
+                session.commit()
+                items += stats.items
+                moved += stats.changes.moved
+        elapsed = time.perf_counter() - started
+        print(
+            f"crawl={crawl} {source:<14} {items:>8} items {items / elapsed:>9.0f} items/s  "
+            f"moved={moved}"
+        )
+
+
+def run_pipeline(config: SyntheticConfig, crawl: int, count: int) -> None:
+    """Store ``count`` items through ``DatabasePipeline``; prints throughput."""
+    from scrapy import Spider
+
+    from confradar.scrapers.pipelines import DatabasePipeline
+
+    spider = Spider(name="load_test")
+    pipeline = DatabasePipeline()
+    pipeline.open_spider(spider)
+    started = time.perf_counter()
+    for item in islice(generate_items(config, crawl=crawl), count):
+        pipeline.process_item(item, spider)
+    elapsed = time.perf_counter() - started
+    pipeline.close_spider(spider)
+    print(f"DatabasePipeline       {count:>8} items {count / elapsed:>9.0f} items/s")
+
+
+def report_reads(readers: list[Reader]) -> None:
+    merged: dict[tuple[str, str], list[float]] = defaultdict(list)
+    for reader in readers:
+        for key, latencies in reader.latencies.items():
+            merged[key].extend(latencies)
+    for phase in ("ingest", "idle"):
+        for name in QUERIES:
+            latencies = sorted(merged.get((name, phase), []))
+            if len(latencies) < 2:
+                continue
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            print(
+                f"{phase:<6} {name:<15} n={len(latencies):<7} "
+                f"p50={statistics.median(latencies) * 1000:.2f}ms  p95={p95 * 1000:.2f}ms"
+            )
+    print(f"read errors: {sum(reader.errors for reader in readers)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conferences", type=int, default=10_000)
+    parser.add_argument("--deadlines-per-conference", type=int, default=10)
+    parser.add_argument("--crawls", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--read-seconds", type=float, default=5.0)
+    parser.add_argument("--pipeline-items", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--url", help="database URL (default: a temporary SQLite file)")
+    args = parser.parse_args()
+    config = SyntheticConfig(
+        conferences=args.conferences,
+        deadlines_per_conference=args.deadlines_per_conference,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{Path(tmp) / 'load.db'}"
+        os.environ["DATABASE_URL"] = url  # for DatabasePipeline
+        engine = get_engine(url)
+        Base.metadata.create_all(engine)  # SQLite file must exist for mode=ro readers
+        with Session(engine) as session:
+            if session.scalar(select(func.count()).select_from(Conference)):
+                parser.error(f"{engine.url!r} is not empty; use a scratch database")
+
+        readers = [
+            Reader(get_engine(url, read_only=True), config, seed=args.seed + i)
+            for i in range(args.readers)
+        ]
+        for reader in readers:
+            reader.start()
+
+        started = time.perf_counter()
+        for crawl in range(args.crawls):
+            ingest(engine, config, crawl, args.batch_size)
+        elapsed = time.perf_counter() - started
+
+        for reader in readers:
+            reader.phase = "idle"
+        time.sleep(args.read_seconds)
+        for reader in readers:
+            reader.stop.set()
+            reader.join()
+
+        with Session(engine) as session:
+            counts = {
+                table: session.scalar(text(f"SELECT COUNT(*) FROM {table}"))
+                for table in ("conferences", "deadlines", "deadline_changes")
+            }
+        print(
+            f"ingested {args.crawls} crawls in {elapsed:.1f}s: "
+            + ", ".join(f"{count} {table}" for table, count in counts.items())
+        )
+        if args.pipeline_items:
+            run_pipeline(config, args.crawls, args.pipeline_items)
+        report_reads(readers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+"""Benchmark the spiders end-to-end on recorded responses served from localhost.
+
+``record`` crawls the live sites once and stores every response (status,
+headers and the body as sent on the wire, redirects included) under
+``fixtures/replay/<spider>/``. ``run`` serves those responses from a local HTTP
+server and runs each spider through the project's item pipelines into a fresh
+SQLite database, with no download delay or throttling, so only crawl and parse
+work is measured. It reports pages/sec, items/sec, peak RSS and the time spent
+in each stage (download, callbacks, pipelines; from ``SpiderTimingExtension``),
+and fails when a spider is slower or larger than the baseline by more than
+``--tolerance``.
+
+Each spider runs in its own process: the Twisted reactor cannot be restarted,
+and a fresh process gives a clean peak RSS.
+
+Usage:
+    python benchmarks/spider_replay.py record --spiders elra wikicfp --max-pages 40
+    python benchmarks/spider_replay.py run --repeat 3
+    python benchmarks/spider_replay.py run --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, quote, urlsplit
+
+SPIDERS = ["ai_deadlines", "acl_web", "wikicfp", "elra", "chairing_tool"]
+FIXTURES = Path(__file__).parent / "fixtures" / "replay"
+# Hop-by-hop and framing headers; the replay server sets its own
+SKIP_HEADERS = {"connection", "content-length", "keep-alive", "transfer-encoding"}
+# Throughput may drop, and memory grow, by this share before a run counts as a regression
+TOLERANCE = 0.25
+
+
+class RecordingMiddleware:
+    """Downloader middleware storing each response in a spider's fixture directory.
+
+    Sits above RedirectMiddleware (600) so redirects are recorded, and above
+    HttpCompressionMiddleware (590) so bodies are stored as sent.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.responses: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> RecordingMiddleware:
+        from scrapy import signals
+
+        middleware = cls(Path(crawler.settings["REPLAY_FIXTURES"]) / crawler.spidercls.name)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def process_response(self, request: Any, response: Any, spider: Any = None) -> Any:
+        if request.method == "GET":
+            digest = hashlib.sha256(response.body).hexdigest()
+            body_path = self.directory / "bodies" / f"{digest}.body"
+            if not body_path.exists():
+                body_path.parent.mkdir(parents=True, exist_ok=True)
+                body_path.write_bytes(response.body)
+            headers = [
+                [name.decode("latin-1"), value.decode("latin-1")]
+                for name, values in response.headers.items()
+                if name.decode("latin-1").lower() not in SKIP_HEADERS
+                for value in values
+            ]
+            self.responses[request.url] = {
+                "status": response.status,
+                "headers": headers,
+                "body": body_path.name,
+            }
+        return response
+
+    def spider_closed(self, spider: Any) -> None:
+        if not self.responses:
+            return  # keep the previous recording of a failed crawl
+        self.directory.mkdir(parents=True, exist_ok=True)
+        index = {
+            "spider": spider.name,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "responses": dict(sorted(self.responses.items())),
+        }
+        (self.directory / "index.json").write_text(json.dumps(index, indent=1) + "\n")
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Serves a spider's recorded responses at ``/replay?url=<original url>``."""
+
+    daemon_threads = True
+
+    def __init__(self, directory: Path):
+        super().__init__(("127.0.0.1", 0), ReplayRequestHandler)
+        self.directory = directory
+        self.responses = json.loads((directory / "index.json").read_text())["responses"]
+        self.missing: set[str] = set()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler naming
+        url = parse_qs(urlsplit(self.path).query).get("url", [""])[0]
+        recorded = self.server.responses.get(url)
+        if recorded is None:
+            self.server.missing.add(url)
+            status, headers, body = 404, [], b""
+        else:
+            status, headers = recorded["status"], recorded["headers"]
+            body = (self.server.directory / "bodies" / recorded["body"]).read_bytes()
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _replay_handler_class() -> type:
+    """Scrapy download handler fetching every URL from the replay server.
+
+    Scrapy 2.14 made ``download_request(request)`` a coroutine; earlier
+    versions call ``download_request(request, spider)`` and expect a Deferred.
+    """
+    from scrapy.core.downloader.handlers.http11 import HTTP11DownloadHandler
+
+    class ReplayHandlerBase(HTTP11DownloadHandler):
+        server_url = ""
+
+        @classmethod
+        def from_crawler(cls, crawler: Any) -> Any:
+            handler = super().from_crawler(crawler)
+            handler.server_url = crawler.settings["REPLAY_SERVER"]
+            return handler
+
+        def _local(self, request: Any) -> Any:
+            return request.replace(
+                url=f"{self.server_url}/replay?url={quote(request.url, safe='')}"
+            )
+
+        @staticmethod
+        def _restore(request: Any, local: Any, response: Any) -> Any:
+            if "download_latency" in local.meta:
+                request.meta["download_latency"] = local.meta["download_latency"]
+            # Callbacks, redirects and offsite checks see the original URL
+            return response.replace(url=request.url, request=request)
+
+    if inspect.iscoroutinefunction(HTTP11DownloadHandler.download_request):
+
+        class ReplayDownloadHandler(ReplayHandlerBase):
+            async def download_request(self, request: Any) -> Any:
+                local = self._local(request)
+                return self._restore(request, local, await super().download_request(local))
+
+    else:
+
+        class ReplayDownloadHandler(ReplayHandlerBase):  # type: ignore[no-redef]
+            def download_request(self, request: Any, spider: Any) -> Any:
+                local = self._local(request)
+                return (
+                    super()
+                    .download_request(local, spider)
+                    .addCallback(lambda response: self._restore(request, local, response))
+                )
+
+    return ReplayDownloadHandler
+
+
+def _crawl(spider_name: str, overrides: dict[str, Any]) -> dict[str, Any]:
+    """Run one spider in this process; returns its final stats."""
+    os.environ.setdefault("SCRAPY_SETTINGS_MODULE", "confradar.scrapers.settings")
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+
+    from confradar.scrapers.registry import spiders
+
+    settings = get_project_settings()
+    overrides = {
+        # Stateful middlewares would skip pages seen by an earlier run
+        "SEEN_URLS_ENABLED": False,
+        "CONTENT_GATE_ENABLED": False,
+        "CRAWL_FRONTIER_ENABLED": False,
+        "RAW_ARCHIVE_ENABLED": False,
+        "HTTPCACHE_ENABLED": False,
+        # Per-domain limits still apply; the default DownloaderAwarePriorityQueue
+        # refuses to start with a per-IP limit
+        "CONCURRENT_REQUESTS_PER_IP": 0,
+        "LOG_LEVEL": "WARNING",
+        **overrides,
+    }
+    for name, value in overrides.items():
+        # Above the spiders' custom_settings (e.g., their DOWNLOAD_DELAY)
+        settings.set(name, value, priority="cmdline")
+
+    process = CrawlerProcess(settings)
+    crawler = process.create_crawler(spiders.load(spider_name))
+    process.crawl(crawler)
+    process.start()
+    stats = crawler.stats.get_stats() if crawler.stats else {}
+    if "finish_reason" not in stats:
+        sys.exit(f"{spider_name} did not start; see the log above")
+    return stats
+
+
+def record_one(spider_name: str, fixtures: Path, max_pages: int) -> None:
+    stats = _crawl(
+        spider_name,
+        {
+            "REPLAY_FIXTURES": str(fixtures),
+            "DOWNLOADER_MIDDLEWARES": {
+                **_project_setting("DOWNLOADER_MIDDLEWARES"),
+                RecordingMiddleware: 650,
+            },
+            "ITEM_PIPELINES": {},
+            "CLOSESPIDER_PAGECOUNT": max_pages,
+        },
+    )
+    print(
+        f"{spider_name:<14} recorded {stats.get('downloader/response_count', 0)} responses "
+        f"({stats.get('downloader/response_bytes', 0)} bytes)"
+    )
+
+
+def replay_one(spider_name: str, fixtures: Path) -> dict[str, Any]:
+    """Replay one spider's fixtures through the pipelines into a temporary SQLite DB."""
+    server = ReplayServer(fixtures / spider_name)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'replay.db'}"
+        from sqlalchemy import func, select
+
+        import confradar.db.models  # noqa: F401 - registers the tables
+        from confradar.db.base import Base, get_engine, get_session
+        from confradar.db.models import Conference
+
+        Base.metadata.create_all(get_engine())
+        handler = _replay_handler_class()
+        stats = _crawl(
+            spider_name,
+            {
+                "REPLAY_SERVER": server.url,
+                "DOWNLOAD_HANDLERS": {"http": handler, "https": handler},
+                "DOWNLOAD_DELAY": 0,
+                "AUTOTHROTTLE_ENABLED": False,
+                "ROBOTSTXT_OBEY": False,
+                "SPIDER_TIMING_ENABLED": True,
+                "SPIDER_TIMING_DIR": "",  # stats only, no report file
+            },
+        )
+        with get_session() as session:
+            stored = session.scalar(select(func.count()).select_from(Conference))
+        get_engine().dispose()
+    server.shutdown()
+
+    elapsed = stats.get("elapsed_time_seconds") or 0.0
+    pages = stats.get("downloader/response_count", 0)
+    items = stats.get("item_scraped_count", 0)
+    stages = {
+        key[len("timing/") : -len("/count")]: round(
+            value * stats.get(key[: -len("count")] + "mean", 0.0), 1
+        )
+        for key, value in stats.items()
+        if key.startswith("timing/") and key.endswith("/count")
+    }
+    return {
+        "spider": spider_name,
+        "elapsed_s": round(elapsed, 3),
+        "pages": pages,
+        "items": items,
+        "stored": stored,
+        "pages_per_s": round(pages / elapsed, 2) if elapsed else 0.0,
+        "items_per_s": round(items / elapsed, 2) if elapsed else 0.0,
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "stage_ms": {k: v for k, v in stages.items() if not k.endswith(("_bytes", "_response"))},
+        "missing": sorted(server.missing),
+        "finish_reason": stats.get("finish_reason"),
+    }
+
+
+def _project_setting(name: str) -> dict[str, Any]:
+    from confradar.scrapers import settings
+
+    return dict(getattr(settings, name, {}))
+
+
+def _in_subprocess(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, __file__, *args], capture_output=True, text=True, check=False
+    )
+
+
+def median_result(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Median of each measurement over repeated runs of one spider."""
+    result = dict(results[0])
+    for key in ("elapsed_s", "pages_per_s", "items_per_s", "peak_rss_mb"):
+        result[key] = round(statistics.median(r[key] for r in results), 2)
+    result["stage_ms"] = {
+        stage: round(statistics.median(r["stage_ms"].get(stage, 0.0) for r in results), 1)
+        for stage in results[0]["stage_ms"]
+    }
+    return result
+
+
+def regressions(result: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Measurements of ``result`` worse than ``baseline`` by more than ``tolerance``."""
+    found = []
+    for key in ("pages_per_s", "items_per_s"):
+        if baseline.get(key) and result[key] < baseline[key] * (1 - tolerance):
+            found.append(f"{key} {result[key]:g} < {baseline[key]:g}")
+    if baseline.get("peak_rss_mb") and result["peak_rss_mb"] > baseline["peak_rss_mb"] * (
+        1 + tolerance
+    ):
+        found.append(f"peak_rss_mb {result['peak_rss_mb']:g} > {baseline['peak_rss_mb']:g}")
+    return found
+
+
+def print_result(result: dict[str, Any]) -> None:
+    print(
+        f"{result['spider']:<14} {result['pages']:>4} pages {result['items']:>5} items "
+        f"({result['stored']} stored) in {result['elapsed_s']:.2f}s  "
+        f"{result['pages_per_s']:>8.1f} pages/s {result['items_per_s']:>8.1f} items/s  "
+        f"rss={result['peak_rss_mb']:.0f}MB"
+    )
+    for stage, ms in sorted(result["stage_ms"].items(), key=lambda kv: -kv[1]):
+        print(f"    {stage:<40} {ms:>10.1f} ms")
+    if result["missing"]:
+        print(f"    {len(result['missing'])} URLs not in the fixtures, e.g. {result['missing'][0]}")
+
+
+def run(args: argparse.Namespace) -> int:
+    baseline_path = args.baseline or args.fixtures / "baseline.json"
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    results: dict[str, dict[str, Any]] = {}
+    failed: list[str] = []
+
+    for spider_name in args.spiders:
+        if not (args.fixtures / spider_name / "index.json").exists():
+            print(
+                f"{spider_name:<14} no fixtures; record them with `record --spiders {spider_name}`"
+            )
+            continue
+        runs = []
+        for _ in range(args.repeat):
+            proc = _in_subprocess("replay-one", spider_name, "--fixtures", str(args.fixtures))
+            if proc.returncode:
+                print(f"{spider_name:<14} failed:\n{proc.stderr}")
+                failed.append(f"{spider_name}: replay failed")
+                break
+            runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        if len(runs) < args.repeat:
+            continue
+
+        result = results[spider_name] = median_result(runs)
+        print_result(result)
+        if spider_name in baseline:
+            expected = baseline[spider_name]
+            failed.extend(
+                f"{spider_name}: {r}" for r in regressions(result, expected, args.tolerance)
+            )
+            if result["items"] != expected.get("items", result["items"]):
+                print(f"    items changed from {expected['items']}")
+
+    if args.update_baseline and results:
+        keep = ("pages", "items", "pages_per_s", "items_per_s", "peak_rss_mb")
+        baseline.update({name: {k: r[k] for k in keep} for name, r in results.items()})
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {baseline_path}")
+    elif failed:
+        print(f"regressions (tolerance {args.tolerance:.0%}):")
+        for line in failed:
+            print(f"  {line}")
+        return 1
+    return 0 if results else 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--fixtures", type=Path, default=FIXTURES)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", parents=[common], help="record live responses")
+    record.add_argument("--spiders", nargs="+", default=SPIDERS)
+    record.add_argument("--max-pages", type=int, default=40)
+
+    bench = commands.add_parser(
+        "run", parents=[common], help="replay and compare with the baseline"
+    )
+    bench.add_argument("--spiders", nargs="+", default=SPIDERS)
+    bench.add_argument("--repeat", type=int, default=3)
+    bench.add_argument("--baseline", type=Path)
+    bench.add_argument("--tolerance", type=float, default=TOLERANCE)
+    bench.add_argument("--update-baseline", action="store_true")
+
+    # One spider in this process; used by record and run
+    for name in ("record-one", "replay-one"):
+        one = commands.add_parser(name, parents=[common])
+        one.add_argument("spider")
+        one.add_argument("--max-pages", type=int, default=40)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        for spider_name in args.spiders:
+            proc = _in_subprocess(
+                "record-one", spider_name, "--fixtures", str(args.fixtures),
+                "--max-pages", str(args.max_pages),
+            )  # fmt: skip
+            print(proc.stdout.strip() or f"{spider_name:<14} failed:\n{proc.stderr}")
+    elif args.command == "record-one":
+        record_one(args.spider, args.fixtures, args.max_pages)
+    elif args.command == "replay-one":
+        print(json.dumps(replay_one(args.spider, args.fixtures)))
+    else:
+        sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark SQLite ingest throughput: stock settings vs the performance profile.
+
+Writes synthetic conference items through ``upsert_items`` (one commit per item,
+like ``DatabasePipeline``, and batched, like ``BatchingDatabasePipeline``) while a
+reader thread queries upcoming deadlines, as an analysis script would.
+
+Usage:
+    python benchmarks/sqlite_ingest.py --items 2000 --batch-size 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from confradar.db.base import Base, create_sqlite_engine
+from confradar.db.ingest import upsert_items
+
+READ_QUERY = text(
+    "SELECT c.key, d.due_date FROM conferences c JOIN deadlines d ON d.conference_id = c.id "
+    "WHERE d.due_date >= :today ORDER BY d.due_date LIMIT 50"
+)
+
+
+def make_items(count: int) -> list[dict]:
+    return [
+        {
+            "key": f"conf{i}",
+            "name": f"Conference {i}",
+            "homepage": f"https://conf{i}.example.org",
+            "url": "https://bench.example.org",
+            "source": "bench",
+            "scraped_at": "2025-01-01T00:00:00",
+            "deadlines": [
+                {"kind": "abstract", "due_date": f"2025-{1 + i % 12:02d}-10"},
+                {"kind": "submission", "due_date": f"2025-{1 + i % 12:02d}-17"},
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+class Reader(threading.Thread):
+    """Runs READ_QUERY in a loop, recording latencies and lock errors."""
+
+    def __init__(self, engine: Engine):
+        super().__init__(daemon=True)
+        self.engine = engine
+        self.stop = threading.Event()
+        self.latencies: list[float] = []
+        self.errors = 0
+
+    def run(self) -> None:
+        while not self.stop.is_set():
+            started = time.perf_counter()
+            try:
+                with self.engine.connect() as conn:
+                    conn.execute(READ_QUERY, {"today": "2025-01-01"}).fetchall()
+                self.latencies.append(time.perf_counter() - started)
+            except OperationalError:
+                self.errors += 1
+
+
+def run(write_engine: Engine, read_engine: Engine, items: list[dict], batch_size: int) -> dict:
+    Base.metadata.create_all(write_engine)
+    reader = Reader(read_engine)
+    reader.start()
+
+    started = time.perf_counter()
+    with Session(write_engine) as session:
+        for start in range(0, len(items), batch_size):
+            upsert_items(session, items[start : start + batch_size])
+            session.commit()
+    elapsed = time.perf_counter() - started
+
+    reader.stop.set()
+    reader.join()
+    latencies = sorted(reader.latencies)
+    return {
+        "items_per_s": len(items) / elapsed,
+        "reads": len(latencies),
+        "read_p95_ms": (
+            statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else 0.0
+        ),
+        "read_errors": reader.errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+    items = make_items(args.items)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for batch_size in (1, args.batch_size):
+            for profile in ("stock", "performance"):
+                url = f"sqlite:///{Path(tmp) / f'{profile}-{batch_size}.db'}"
+                if profile == "stock":
+                    write_engine = create_engine(url)
+                    read_engine = create_engine(url)
+                else:
+                    write_engine = create_sqlite_engine(url)
+                    Base.metadata.create_all(write_engine)  # file must exist for mode=ro
+                    read_engine = create_sqlite_engine(url, read_only=True)
+
+                result = run(write_engine, read_engine, items, batch_size)
+                print(
+                    f"batch={batch_size:<4} {profile:<12} "
+                    f"{result['items_per_s']:>9.0f} items/s  "
+                    f"reads={result['reads']:<6} p95={result['read_p95_ms']:.1f}ms  "
+                    f"lock_errors={result['read_errors']}"
+                )
+                write_engine.dispose()
+                read_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Content-addressed archive of raw fetched pages.
+
+Page bodies are stored once per SHA-256, zstd-compressed, under a two-level
+fan-out (``objects/ab/cdef....zst``). Each fetch adds a small ``raw_pages`` index
+row (url, fetched_at, sha256, status), so an unchanged page costs an index row
+and no blob bytes, and history can be reprocessed without refetching.
+
+``record_page`` adds one index row at a time; ``RawArchive.record`` buffers
+rows until ``RawArchive.flush`` inserts them in bulk.
+
+Example:
+    >>> archive = RawArchive("raw_archive")
+    >>> page = record_page(session, archive, url, body, status=200, source="wikicfp")
+    >>> archive.record(url, body, source="wikicfp")
+    >>> archive.flush(session)
+    >>> for page, body in iter_pages(session, archive, source="wikicfp"):
+    ...     items = parse(body)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from .db.models import RawPage
+
+try:  # Python 3.14+
+    from compression import zstd
+except ImportError:  # pragma: no cover - depends on interpreter version
+    from backports import zstd
+
+DEFAULT_LEVEL = 10
+
+
+@dataclass
+class StoredBlob:
+    """Result of storing one body in the archive."""
+
+    sha256: str
+    size: int
+    stored_bytes: int  # compressed bytes written; 0 if the blob already existed
+
+    @property
+    def deduplicated(self) -> bool:
+        return self.stored_bytes == 0
+
+
+class RawArchive:
+    """Filesystem blob store keyed by the SHA-256 of the uncompressed body.
+
+    Writes are atomic (temp file + rename), so concurrent writers of the same
+    body are safe and readers never see partial blobs. Index rows added with
+    ``record`` are buffered in memory until ``flush``.
+
+    Args:
+        root: Archive directory; created on first write
+        level: zstd compression level
+    """
+
+    def __init__(self, root: str | Path, level: int = DEFAULT_LEVEL):
+        self.root = Path(root)
+        self.level = level
+        self._pending: list[dict] = []
+
+    def path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / f"{sha256[2:]}.zst"
+
+    def __contains__(self, sha256: str) -> bool:
+        return self.path(sha256).exists()
+
+    def put(self, body: bytes) -> StoredBlob:
+        """Store ``body`` unless an identical one is already archived."""
+        sha256 = hashlib.sha256(body).hexdigest()
+        target = self.path(sha256)
+        if target.exists():
+            return StoredBlob(sha256=sha256, size=len(body), stored_bytes=0)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        data = zstd.compress(body, level=self.level)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return StoredBlob(sha256=sha256, size=len(body), stored_bytes=len(data))
+
+    def get(self, sha256: str) -> bytes:
+        """Return the uncompressed body for ``sha256``.
+
+        Raises:
+            FileNotFoundError: If the blob is not in the archive
+        """
+        return zstd.decompress(self.path(sha256).read_bytes())
+
+    def record(
+        self,
+        url: str,
+        body: bytes,
+        status: int = 200,
+        fetched_at: datetime | None = None,
+        source: str | None = None,
+    ) -> StoredBlob:
+        """Store ``body`` and buffer its ``raw_pages`` row; written by the next ``flush``."""
+        blob = self.put(body)
+        self._pending.append(
+            {
+                "url": url,
+                "fetched_at": fetched_at or datetime.now(timezone.utc),
+                "sha256": blob.sha256,
+                "status": status,
+                "size": blob.size,
+                "source": source,
+            }
+        )
+        return blob
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self, session: Session) -> int:
+        """Insert buffered index rows; the caller owns the transaction."""
+        rows, self._pending = self._pending, []
+        if rows:
+            session.execute(insert(RawPage), rows)
+        return len(rows)
+
+
+def record_page(
+    session: Session,
+    archive: RawArchive,
+    url: str,
+    body: bytes,
+    status: int,
+    fetched_at: datetime | None = None,
+    source: str | None = None,
+) -> RawPage:
+    """Archive a fetched body and add its ``raw_pages`` index row.
+
+    Args:
+        session: Open session; the caller owns the transaction
+        archive: Blob store for the body
+        url: Fetched URL
+        body: Response body as received (decompressed transfer encoding)
+        status: HTTP status
+        fetched_at: Fetch time (defaults to now)
+        source: Scraper/spider name
+
+    Returns:
+        The new (flushed) RawPage row
+    """
+    blob = archive.put(body)
+    page = RawPage(
+        url=url,
+        fetched_at=fetched_at or datetime.now(timezone.utc),
+        sha256=blob.sha256,
+        status=status,
+        size=blob.size,
+        source=source,
+    )
+    session.add(page)
+    session.flush()
+    return page
+
+
+def iter_pages(
+    session: Session,
+    archive: RawArchive,
+    url: str | None = None,
+    source: str | None = None,
+    since: datetime | None = None,
+) -> Iterator[tuple[RawPage, bytes]]:
+    """Yield archived pages with their bodies, oldest fetch first.
+
+    Bodies shared by several fetches are decompressed once per run of identical
+    hashes, not once per row.
+    """
+    stmt = select(RawPage)
+    if url is not None:
+        stmt = stmt.where(RawPage.url == url)
+    if source is not None:
+        stmt = stmt.where(RawPage.source == source)
+    if since is not None:
+        stmt = stmt.where(RawPage.fetched_at >= since)
+
+    last_sha: str | None = None
+    body = b""
+    for page in session.scalars(stmt.order_by(RawPage.fetched_at, RawPage.id)):
+        if page.sha256 != last_sha:
+            body = archive.get(page.sha256)
+            last_sha = page.sha256
+        yield page, body
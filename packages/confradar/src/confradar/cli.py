@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import argparse
 import sys
+from datetime import datetime, timezone
 
-import httpx
-
-from confradar.parsers.dates import extract_dates_from_text
+# Command dependencies are imported inside each command so that ``--help`` and
+# argument errors stay fast (see tests/test_import_time.py)
 
 
 def _read_stdin() -> str:
@@ -13,6 +13,8 @@ def _read_stdin() -> str:
 
 
 def cmd_parse(args: argparse.Namespace) -> int:
+    from confradar.parsers.dates import extract_dates_from_text
+
     text = args.text if args.text is not None else _read_stdin()
     dates = extract_dates_from_text(text)
     for d in dates:
@@ -21,6 +23,10 @@ def cmd_parse(args: argparse.Namespace) -> int:
 
 
 def cmd_fetch(args: argparse.Namespace) -> int:
+    import httpx
+
+    from confradar.parsers.dates import extract_dates_from_text
+
     url = args.url
     with httpx.Client(timeout=15) as client:
         resp = client.get(url)
@@ -32,6 +38,131 @@ def cmd_fetch(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_resolve_aliases(args: argparse.Namespace) -> int:
+    from confradar.db.base import get_session
+    from confradar.resolution.aliases import load_name_records, resolve_aliases, write_aliases
+
+    session = get_session()
+    try:
+        matches, stats = resolve_aliases(load_name_records(session), threshold=args.threshold)
+        if not args.dry_run:
+            write_aliases(session, matches)
+            session.commit()
+    finally:
+        session.close()
+
+    for m in matches:
+        print(f"{m.alias_key} -> {m.canonical_key} ({m.score:.2f})")
+    print(
+        f"{stats.aliases} aliases from {stats.records} keys "
+        f"({stats.candidates} candidate pairs, {stats.elapsed_s:.2f}s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def cmd_link_workshops(args: argparse.Namespace) -> int:
+    from confradar.db.base import get_session
+    from confradar.resolution.workshops import link_workshops
+
+    session = get_session()
+    try:
+        stats = link_workshops(session, threshold=args.threshold)
+        session.commit()
+    finally:
+        session.close()
+
+    print(
+        f"Linked {stats.linked} of {stats.workshops} workshops "
+        f"({stats.candidates} candidates from {stats.conferences} conferences)"
+    )
+    return 0
+
+
+def _parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def cmd_reprocess(args: argparse.Namespace) -> int:
+    from confradar.archive import RawArchive
+    from confradar.db.base import get_session
+    from confradar.reprocess import reprocess
+    from confradar.settings import get_settings
+
+    def report(stats) -> None:
+        print(
+            f"{stats.pages}/{stats.total_pages} pages, {stats.items} items, "
+            f"{stats.errors} errors ({stats.pages_per_s:.1f} pages/s, "
+            f"{stats.mb_per_s:.2f} MB/s)",
+            file=sys.stderr,
+        )
+
+    settings = get_settings()
+    session = get_session()
+    try:
+        stats = reprocess(
+            session,
+            RawArchive(args.archive_dir or settings.raw_archive_dir),
+            args.source,
+            since=args.since,
+            until=args.until,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            name=args.name,
+            restart=args.restart,
+            progress=report,
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    finally:
+        session.close()
+
+    for url, error in stats.failures:
+        print(f"Could not parse {url}: {error}", file=sys.stderr)
+    print(
+        f"Reprocessed {stats.pages} pages ({stats.bodies} distinct bodies) into "
+        f"{stats.items} items with {stats.errors} errors in {stats.elapsed_s:.1f}s; "
+        f"{stats.stale} pages skipped for newer fetches; resumed after page {stats.resumed_from}"
+    )
+    return 0
+
+
+def cmd_sources(args: argparse.Namespace) -> int:
+    from confradar.scrapers.registry import scrapers, spiders
+
+    for kind, registry in (("scraper", scrapers), ("spider", spiders)):
+        for name in registry:
+            print(f"{kind}\t{name}\t{registry.target(name)}")
+    return 0
+
+
+def cmd_timing_report(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from confradar.scrapers.timing import format_report, latest_report, load_report
+
+    if args.target.endswith(".json"):
+        path = Path(args.target)
+    else:
+        directory = args.dir
+        if directory is None:
+            from scrapy.utils.project import data_path
+
+            directory = data_path("timing")
+        path = latest_report(directory, args.target)
+    if path is None or not path.exists():
+        print(f"No timing report for {args.target}", file=sys.stderr)
+        return 1
+
+    report = load_report(path)
+    print(f"{report['spider']} ({report['reason']}) finished at {report['finished_at']}")
+    for line in format_report(report):
+        print(line)
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="confradar", description="ConfRadar CLI")
     sub = p.add_subparsers(dest="command", required=True)
@@ -44,6 +175,64 @@ def build_parser() -> argparse.ArgumentParser:
     p_fetch.add_argument("url", type=str, help="URL to fetch")
     p_fetch.set_defaults(func=cmd_fetch)
 
+    p_alias = sub.add_parser(
+        "resolve-aliases", help="Find conference keys that refer to the same conference"
+    )
+    p_alias.add_argument(
+        "--threshold", type=float, default=0.6, help="Minimum match score (default: 0.6)"
+    )
+    p_alias.add_argument(
+        "--dry-run", action="store_true", help="Print aliases without writing them"
+    )
+    p_alias.set_defaults(func=cmd_resolve_aliases)
+
+    p_link = sub.add_parser("link-workshops", help="Link unlinked workshops to parent conferences")
+    p_link.add_argument(
+        "--threshold", type=float, default=0.5, help="Minimum link score (default: 0.5)"
+    )
+    p_link.set_defaults(func=cmd_link_workshops)
+
+    p_reprocess = sub.add_parser(
+        "reprocess", help="Re-parse archived raw pages of a source and store the results"
+    )
+    p_reprocess.add_argument("source", type=str, help="Archived source name (e.g., ai_deadlines)")
+    p_reprocess.add_argument(
+        "--since", type=_parse_timestamp, default=None, help="Only pages fetched at/after (ISO)"
+    )
+    p_reprocess.add_argument(
+        "--until", type=_parse_timestamp, default=None, help="Only pages fetched before (ISO)"
+    )
+    p_reprocess.add_argument(
+        "--workers", type=int, default=None, help="Parser processes (default: CPU count)"
+    )
+    p_reprocess.add_argument(
+        "--batch-size", type=int, default=200, help="Pages per transaction (default: 200)"
+    )
+    p_reprocess.add_argument(
+        "--name", type=str, default=None, help="Checkpoint name (default: source@version)"
+    )
+    p_reprocess.add_argument(
+        "--restart", action="store_true", help="Ignore the stored checkpoint and start over"
+    )
+    p_reprocess.add_argument(
+        "--archive-dir", type=str, default=None, help="Raw archive directory (default: settings)"
+    )
+    p_reprocess.set_defaults(func=cmd_reprocess)
+
+    p_sources = sub.add_parser("sources", help="List registered scrapers and spiders")
+    p_sources.set_defaults(func=cmd_sources)
+
+    p_timing = sub.add_parser(
+        "timing-report", help="Show callback, download and pipeline timings of a spider run"
+    )
+    p_timing.add_argument(
+        "target", type=str, help="Spider name (latest report) or path to a report JSON"
+    )
+    p_timing.add_argument(
+        "--dir", type=str, default=None, help="Report directory (default: .scrapy/timing)"
+    )
+    p_timing.set_defaults(func=cmd_timing_report)
+
     return p
 
 
@@ -0,0 +1,249 @@
+"""Skip parsing pages whose content has not changed since their last parse.
+
+Each successfully parsed page leaves a ``content_fingerprints`` row with three
+digests of its normalized text:
+
+- ``content_hash``: SHA-256 of the normalized text (markup, comments, styles,
+  nonces and cache-busting parameters removed; link targets and scripts kept)
+- ``simhash``: 64-bit simhash of its word tokens
+- ``numbers_hash``: SHA-256 of the tokens containing digits, in order
+
+A page is unchanged if its content hash matches, or if its simhash is within
+``max_distance`` bits and every number (dates, years, times) is the same. A
+moved deadline therefore always changes the page, while wording churn such as
+rotating banners does not. Fingerprints are versioned with the parser, so a
+parser fix invalidates them.
+
+Example:
+    >>> gate = ContentGate()
+    >>> gate.load(session, source="aideadlines")
+    >>> result = scraper.scrape(gate=gate)
+    >>> gate.flush(session)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .db.ingest import CHUNK_SIZE, dialect_insert
+from .db.models import ContentFingerprint
+
+# Simhash bits that may differ between two versions of an unchanged page
+DEFAULT_MAX_DISTANCE = 3
+
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_STYLE_RE = re.compile(r"<style\b.*?</style\s*>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]*>")
+_LINK_ATTR_RE = re.compile(r"\b(?:href|src)\s*=\s*[\"']([^\"']*)[\"']", re.IGNORECASE)
+# Cache busters and per-request tokens that change on every fetch
+_CACHE_BUSTER_RE = re.compile(
+    r"[?&](?:v|ver|version|t|ts|_|cb|nonce|token|sid|session)=[^&\"'\s>]*", re.IGNORECASE
+)
+_NONCE_RE = re.compile(r"\b(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{16,}\b")
+_WS_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"\w+")
+
+_MASK64 = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class PageDigest:
+    """Digests of one page body."""
+
+    content_hash: str
+    simhash: int  # unsigned 64-bit
+    numbers_hash: str
+
+
+@dataclass
+class GateStats:
+    """Counters for one crawl or scrape run."""
+
+    checked: int = 0
+    unchanged: int = 0
+    changed: int = 0
+    new: int = 0
+
+
+@dataclass
+class _Known:
+    digest: PageDigest
+    version: str
+    follow_ups: list[Any] = field(default_factory=list)
+
+
+def normalize_text(body: str | bytes) -> str:
+    """Reduce a page to the text that matters for parsing.
+
+    Tags are replaced by their ``href``/``src`` targets; comments, styles,
+    hex nonces and cache-busting query parameters are dropped. Script bodies
+    are kept because some sources embed deadlines in JavaScript.
+    """
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    text = _STYLE_RE.sub(" ", _COMMENT_RE.sub(" ", body))
+    text = _TAG_RE.sub(lambda m: " " + " ".join(_LINK_ATTR_RE.findall(m.group())) + " ", text)
+    text = _NONCE_RE.sub(" ", _CACHE_BUSTER_RE.sub(" ", text.lower()))
+    return _WS_RE.sub(" ", text).strip()
+
+
+def simhash(tokens: Iterable[str]) -> int:
+    """Return the 64-bit simhash of ``tokens``, weighted by token frequency.
+
+    Weights are accumulated per hash byte value (8 additions per token instead
+    of 64) and expanded to per-bit sums once at the end.
+    """
+    tables = [[0] * 256 for _ in range(8)]
+    for token, weight in Counter(tokens).items():
+        h = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        for table, byte in zip(tables, h, strict=True):
+            table[byte] += weight
+    total = sum(tables[0])
+    value = 0
+    for position, table in enumerate(tables):
+        for bit in range(8):
+            ones = sum(w for byte, w in enumerate(table) if byte >> bit & 1)
+            if 2 * ones > total:
+                # Byte 0 of the digest holds the most significant bits
+                value |= 1 << ((7 - position) * 8 + bit)
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two simhashes."""
+    return (a ^ b).bit_count()
+
+
+def digest(body: str | bytes) -> PageDigest:
+    """Compute the content hash, simhash and numbers hash of a page body."""
+    text = normalize_text(body)
+    tokens = _TOKEN_RE.findall(text)
+    numbers = " ".join(t for t in tokens if any(c.isdigit() for c in t))
+    return PageDigest(
+        content_hash=hashlib.sha256(text.encode()).hexdigest(),
+        simhash=simhash(tokens),
+        numbers_hash=hashlib.sha256(numbers.encode()).hexdigest(),
+    )
+
+
+def is_unchanged(
+    old: PageDigest, new: PageDigest, max_distance: int = DEFAULT_MAX_DISTANCE
+) -> bool:
+    """Return True if ``new`` has no relevant change from ``old``."""
+    if old.content_hash == new.content_hash:
+        return True
+    return (
+        old.numbers_hash == new.numbers_hash
+        and hamming_distance(old.simhash, new.simhash) <= max_distance
+    )
+
+
+def _to_signed(value: int) -> int:
+    # BIGINT is signed; store the unsigned simhash in two's complement
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class ContentGate:
+    """In-memory view of stored fingerprints with buffered writes.
+
+    Load the fingerprints of a source once, check each fetched page, record
+    pages that were parsed successfully, and flush the records at the end.
+
+    Args:
+        max_distance: Simhash bits that may differ for an unchanged page; a
+            negative value only accepts identical normalized text
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.stats = GateStats()
+        self._known: dict[str, _Known] = {}
+        self._pending: dict[str, dict[str, Any]] = {}
+
+    def load(self, session: Session, source: str | None = None) -> int:
+        """Load stored fingerprints (of one source, if given); returns the count."""
+        f = ContentFingerprint
+        stmt = select(f.url, f.version, f.content_hash, f.simhash, f.numbers_hash, f.follow_ups)
+        if source is not None:
+            stmt = stmt.where(f.source == source)
+        rows = session.execute(stmt).all()
+        for url, version, content_hash, simhash_value, numbers_hash, follow_ups in rows:
+            self._known[url] = _Known(
+                PageDigest(content_hash, simhash_value & _MASK64, numbers_hash),
+                version,
+                follow_ups or [],
+            )
+        return len(rows)
+
+    def check(self, url: str, page: PageDigest, version: str = "") -> bool:
+        """Return True if ``url`` is unchanged since its last parse by this parser version."""
+        self.stats.checked += 1
+        known = self._known.get(url)
+        if known is None or known.version != version:
+            self.stats.new += 1
+            return False
+        if is_unchanged(known.digest, page, self.max_distance):
+            self.stats.unchanged += 1
+            return True
+        self.stats.changed += 1
+        return False
+
+    def follow_ups(self, url: str) -> list[Any]:
+        """Requests the last parse of ``url`` produced, as recorded (JSON-serializable)."""
+        known = self._known.get(url)
+        return known.follow_ups if known else []
+
+    def record(
+        self,
+        url: str,
+        page: PageDigest,
+        source: str | None = None,
+        version: str = "",
+        follow_ups: list[Any] | None = None,
+    ) -> None:
+        """Record a successful parse of ``url``; written by the next ``flush``."""
+        self._known[url] = _Known(page, version, follow_ups or [])
+        self._pending[url] = {
+            "url": url,
+            "source": source,
+            "version": version,
+            "content_hash": page.content_hash,
+            "simhash": _to_signed(page.simhash),
+            "numbers_hash": page.numbers_hash,
+            "follow_ups": follow_ups or [],
+            "parsed_at": datetime.now(timezone.utc),
+        }
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self, session: Session) -> int:
+        """Upsert recorded fingerprints; the caller owns the transaction."""
+        rows, self._pending = list(self._pending.values()), {}
+        for start in range(0, len(rows), CHUNK_SIZE):
+            stmt = dialect_insert(session, ContentFingerprint.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["url"],
+                set_={
+                    "source": stmt.excluded.source,
+                    "version": stmt.excluded.version,
+                    "content_hash": stmt.excluded.content_hash,
+                    "simhash": stmt.excluded.simhash,
+                    "numbers_hash": stmt.excluded.numbers_hash,
+                    "follow_ups": stmt.excluded.follow_ups,
+                    "parsed_at": stmt.excluded.parsed_at,
+                    "updated_at": func.now(),
+                },
+            )
+            session.execute(stmt, rows[start : start + CHUNK_SIZE])
+        return len(rows)
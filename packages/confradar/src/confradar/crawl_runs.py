@@ -0,0 +1,121 @@
+"""Performance metrics of crawl steps, kept per run for trend tracking.
+
+Each scrape and store asset materialization measures a ``CrawlMetrics``:
+wall time, requests made, bytes downloaded, HTTP cache hit ratio, items and
+items per second, database rows written and database write time. The metrics
+are attached to the materialization as Dagster metadata (plotted across
+materializations in the UI) and written to the ``crawl_runs`` table, so
+throughput regressions show up when comparing runs of one asset and source.
+
+Example:
+    >>> metrics = CrawlMetrics.from_scrapy_stats(stats, items=120, wall_time_s=42.0)
+    >>> record_crawl_run(session, metrics, asset="scraped_conferences", source="wikicfp")
+    >>> runs = recent_crawl_runs(session, "scraped_conferences", "wikicfp")
+    >>> [round(run.items_per_s, 1) for run in runs]
+    [3.1, 2.9]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .db.models import CrawlRun
+
+
+@dataclass
+class CrawlMetrics:
+    """Measurements of one scrape or store step."""
+
+    wall_time_s: float = 0.0
+    requests: int = 0
+    bytes_downloaded: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    items: int = 0
+    db_rows: int = 0  # rows upserted
+    db_write_s: float = 0.0
+
+    @classmethod
+    def from_scrapy_stats(
+        cls, stats: Mapping[str, Any], items: int, wall_time_s: float
+    ) -> CrawlMetrics:
+        """Metrics of a spider run from its final Scrapy stats."""
+        return cls(
+            wall_time_s=wall_time_s,
+            requests=stats.get("downloader/request_count", 0),
+            bytes_downloaded=stats.get("downloader/response_bytes", 0),
+            cache_hits=stats.get("httpcache/hit", 0),
+            cache_misses=stats.get("httpcache/miss", 0),
+            items=items,
+        )
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Share of cache lookups served from the cache; None without lookups."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    @property
+    def items_per_s(self) -> float:
+        return self.items / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    def metadata(self) -> dict[str, Any]:
+        """Values for Dagster ``Output`` metadata."""
+        metadata = {
+            "wall_time_s": round(self.wall_time_s, 3),
+            "requests": self.requests,
+            "bytes_downloaded": self.bytes_downloaded,
+            "items_per_s": round(self.items_per_s, 3),
+            "db_rows": self.db_rows,
+            "db_write_s": round(self.db_write_s, 3),
+        }
+        if self.cache_hit_ratio is not None:
+            metadata["cache_hit_ratio"] = round(self.cache_hit_ratio, 3)
+        return metadata
+
+
+def record_crawl_run(
+    session: Session,
+    metrics: CrawlMetrics,
+    asset: str,
+    source: str,
+    run_id: str | None = None,
+    partition: str | None = None,
+    finished_at: datetime | None = None,
+) -> CrawlRun:
+    """Add a ``crawl_runs`` row for ``metrics``; the caller owns the transaction."""
+    run = CrawlRun(
+        run_id=run_id,
+        asset=asset,
+        source=source,
+        partition=partition,
+        finished_at=finished_at or datetime.now(timezone.utc),
+        wall_time_s=metrics.wall_time_s,
+        requests=metrics.requests,
+        bytes_downloaded=metrics.bytes_downloaded,
+        cache_hit_ratio=metrics.cache_hit_ratio,
+        items=metrics.items,
+        items_per_s=metrics.items_per_s,
+        db_rows=metrics.db_rows,
+        db_write_s=metrics.db_write_s,
+    )
+    session.add(run)
+    session.flush()
+    return run
+
+
+def recent_crawl_runs(session: Session, asset: str, source: str, limit: int = 30) -> list[CrawlRun]:
+    """The latest ``limit`` runs of ``asset`` for ``source``, oldest first."""
+    stmt = (
+        select(CrawlRun)
+        .where(CrawlRun.asset == asset, CrawlRun.source == source)
+        .order_by(CrawlRun.finished_at.desc(), CrawlRun.id.desc())
+        .limit(limit)
+    )
+    return list(session.scalars(stmt))[::-1]
@@ -1,32 +1,119 @@
 """Dagster assets for web scraping conference data.
 
-Each asset represents a scraper that fetches conference data from a specific source.
-Assets return lists of conference dictionaries that can be consumed by downstream assets.
+``scraped_conferences`` is partitioned by source and crawl date, so each source
+is crawled, retried and stored on its own: a failing or slow source only holds
+up its own partition. Each partition holds the list of conference dictionaries
+its spider scraped. Spiders are looked up by name in
+``confradar.scrapers.registry`` and, like Scrapy, only imported when an asset
+runs, so loading the code location stays fast.
 """
 
+import time
+from dataclasses import dataclass
 from typing import Any
 
-from dagster import MetadataValue, Output, asset
-from scrapy.crawler import CrawlerProcess
-from scrapy.utils.project import get_project_settings
+from dagster import (
+    AssetExecutionContext,
+    DailyPartitionsDefinition,
+    MetadataValue,
+    MultiPartitionsDefinition,
+    Output,
+    RetryRequested,
+    StaticPartitionsDefinition,
+    asset,
+)
 
-from confradar.scrapers.spiders.acl_web import ACLWebSpider
-from confradar.scrapers.spiders.ai_deadlines import AIDeadlinesSpider
-from confradar.scrapers.spiders.chairing_tool import ChairingToolSpider
-from confradar.scrapers.spiders.elra import ELRASpider
-from confradar.scrapers.spiders.seeded import SeededSpider
-from confradar.scrapers.spiders.wikicfp import WikiCFPSpider
+from confradar.crawl_runs import CrawlMetrics
+from confradar.scrapers.registry import spiders
 
 
-def run_spider(spider_class) -> list[dict[str, Any]]:
-    """Run a Scrapy spider and collect items.
+@dataclass(frozen=True)
+class CrawlSource:
+    """A crawl source: its spider and retry policy.
 
-    Args:
-        spider_class: The spider class to run
+    Attributes:
+        spider: Name in ``confradar.scrapers.registry.spiders``
+        description: Shown in partition metadata
+        max_retries: Retries of a failed crawl of this source
+        retry_delay_s: Wait before the first retry; doubled on each further retry
+    """
 
-    Returns:
-        List of scraped conference items as dictionaries
+    spider: str
+    description: str
+    max_retries: int = 2
+    retry_delay_s: int = 300
+
+
+# Partition names are the historical source names used in item metadata
+SOURCES = {
+    "seeded": CrawlSource("seeded", "Seed core conference series (no parsing)", max_retries=0),
+    "aideadlines": CrawlSource("ai_deadlines", "NLP conference data from AI Deadlines"),
+    "acl_web": CrawlSource("acl_web", "ACL sponsored events"),
+    "chairing_tool": CrawlSource("chairing_tool", "Conferences from ChairingTool"),
+    "elra": CrawlSource("elra", "ELRA language resources events"),
+    # Slow and rate limited: fewer, later retries
+    "wikicfp": CrawlSource("wikicfp", "Calls for papers from WikiCFP", 1, 1800),
+}
+
+crawl_partitions = MultiPartitionsDefinition(
+    {
+        "source": StaticPartitionsDefinition(list(SOURCES)),
+        # end_offset=1: today's crawl writes today's partition
+        "date": DailyPartitionsDefinition(start_date="2026-10-01", end_offset=1),
+    }
+)
+
+
+@dataclass
+class SpiderRun:
+    """Items and final Scrapy stats of one spider run."""
+
+    items: list[dict[str, Any]]
+    stats: dict[str, Any]
+
+    @property
+    def error(self) -> str | None:
+        """Why the crawl failed as a whole, or None."""
+        reason = self.stats.get("finish_reason")
+        if reason not in (None, "finished"):
+            return f"finished with {reason!r}"
+        if self.stats.get("downloader/exception_count") and not self.stats.get(
+            "downloader/response_count"
+        ):
+            return "every request failed"
+        return None
+
+    @property
+    def timing(self) -> dict[str, Any]:
+        """Histogram summaries from the run's timing report (``SpiderTimingExtension``)."""
+        from confradar.scrapers.timing import load_report
+
+        path = self.stats.get("timing/report")
+        try:
+            histograms = load_report(path)["histograms"] if path else {}
+        except (OSError, ValueError):
+            return {}
+        return {
+            name: {k: v for k, v in histogram.items() if k != "buckets"}
+            for name, histogram in histograms.items()
+        }
+
+
+def crawl_spider(
+    spider_name: str, settings_overrides: dict[str, Any] | None = None, **spider_kwargs: Any
+) -> SpiderRun:
+    """Run a registered Scrapy spider; returns its items and stats.
+
+    Args:
+        spider_name: Name of the spider in ``confradar.scrapers.registry.spiders``
+        settings_overrides: Scrapy settings to set on top of the project settings
+        **spider_kwargs: Spider arguments (e.g., ``start_urls``)
     """
+    from scrapy import signals
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+
+    spider_class = spiders.load(spider_name)
     collected_items = []
 
     def collect_item(item, response, spider):
@@ -44,154 +131,111 @@ def run_spider(spider_class) -> list[dict[str, Any]]:
             "confradar.scrapers.pipelines.DeduplicationPipeline": 200,
         },
     )
+    # store_conferences stores the items later; fingerprints written when the
+    # spider closes would hide the pages of items that step then fails to store
+    settings.set("CONTENT_GATE_ENABLED", False)
+    for name, value in (settings_overrides or {}).items():
+        settings.set(name, value)
 
-    # Create crawler process
     process = CrawlerProcess(settings)
+    crawler = process.create_crawler(spider_class)
+    crawler.signals.connect(collect_item, signal=signals.item_scraped)
 
-    # Connect signal to collect items
-    from scrapy import signals
-    from scrapy.signalmanager import dispatcher
-
-    dispatcher.connect(collect_item, signal=signals.item_scraped)
-
-    # Run spider
-    process.crawl(spider_class)
+    process.crawl(crawler, **spider_kwargs)
     process.start()
 
-    return collected_items
-
-
-@asset(
-    description="Scrape NLP conference data from AI Deadlines",
-    group_name="scrapers",
-)
-def ai_deadlines_conferences() -> Output[list[dict[str, Any]]]:
-    """Scrape conferences from aideadlines.org (NLP focus)."""
-    items = run_spider(AIDeadlinesSpider)
-
-    return Output(
-        value=items,
-        metadata={
-            "count": len(items),
-            "source": "aideadlines",
-            "preview": (
-                MetadataValue.md("\n".join([f"- {item['name']}" for item in items[:5]]))
-                if items
-                else "No items scraped"
-            ),
-        },
-    )
-
-
-@asset(
-    description="Scrape ACL sponsored events",
-    group_name="scrapers",
-)
-def acl_web_conferences() -> Output[list[dict[str, Any]]]:
-    """Scrape conferences from ACL Web."""
-    items = run_spider(ACLWebSpider)
-
-    return Output(
-        value=items,
-        metadata={
-            "count": len(items),
-            "source": "acl_web",
-            "preview": (
-                MetadataValue.md("\n".join([f"- {item['name']}" for item in items[:5]]))
-                if items
-                else "No items scraped"
-            ),
-        },
-    )
-
-
-@asset(
-    description="Scrape conferences from ChairingTool",
-    group_name="scrapers",
-)
-def chairing_tool_conferences() -> Output[list[dict[str, Any]]]:
-    """Scrape conferences from ChairingTool platform."""
-    items = run_spider(ChairingToolSpider)
-
-    return Output(
-        value=items,
-        metadata={
-            "count": len(items),
-            "source": "chairing_tool",
-            "preview": (
-                MetadataValue.md("\n".join([f"- {item['name']}" for item in items[:5]]))
-                if items
-                else "No items scraped"
-            ),
-        },
-    )
+    return SpiderRun(collected_items, crawler.stats.get_stats() if crawler.stats else {})
 
 
-@asset(
-    description="Scrape ELRA language resources events",
-    group_name="scrapers",
-)
-def elra_conferences() -> Output[list[dict[str, Any]]]:
-    """Scrape conferences from ELRA."""
-    items = run_spider(ELRASpider)
-
-    return Output(
-        value=items,
-        metadata={
-            "count": len(items),
-            "source": "elra",
-            "preview": (
-                MetadataValue.md("\n".join([f"- {item['name']}" for item in items[:5]]))
-                if items
-                else "No items scraped"
-            ),
-        },
-    )
+def run_spider(
+    spider_name: str, settings_overrides: dict[str, Any] | None = None, **spider_kwargs: Any
+) -> list[dict[str, Any]]:
+    """Run a registered Scrapy spider and collect items.
 
+    Args:
+        spider_name: Name of the spider in ``confradar.scrapers.registry.spiders``
+        settings_overrides: Scrapy settings to set on top of the project settings
+        **spider_kwargs: Spider arguments (e.g., ``start_urls``)
 
-@asset(
-    description="Scrape call for papers from WikiCFP",
-    group_name="scrapers",
-)
-def wikicfp_conferences() -> Output[list[dict[str, Any]]]:
-    """Scrape conferences from WikiCFP."""
-    items = run_spider(WikiCFPSpider)
-
-    return Output(
-        value=items,
-        metadata={
-            "count": len(items),
-            "source": "wikicfp",
-            "preview": (
-                MetadataValue.md("\n".join([f"- {item['name']}" for item in items[:5]]))
-                if items
-                else "No items scraped"
-            ),
-        },
-    )
+    Returns:
+        List of scraped conference items as dictionaries
+    """
+    return crawl_spider(spider_name, settings_overrides, **spider_kwargs).items
+
+
+def record_crawl_metrics(
+    context: AssetExecutionContext, source_name: str, metrics: CrawlMetrics
+) -> None:
+    """Write a materialization's metrics to ``crawl_runs``; a failure is only logged."""
+    from confradar.crawl_runs import record_crawl_run
+    from confradar.db.base import get_sessionmaker
+
+    try:
+        with get_sessionmaker()() as session:
+            record_crawl_run(
+                session,
+                metrics,
+                asset=context.asset_key.to_user_string(),
+                source=source_name,
+                run_id=context.run_id,
+                partition=context.partition_key,
+            )
+            session.commit()
+    except Exception as e:  # metrics never fail a crawl
+        context.log.warning(f"Could not record crawl metrics: {e!r}")
 
 
 @asset(
-    description="Seed core conference series (no parsing)",
+    description="Conferences scraped from one source on one crawl date",
     group_name="scrapers",
+    partitions_def=crawl_partitions,
 )
-def seeded_conferences() -> Output[list[dict[str, Any]]]:
-    """Emit curated seed conferences as items via a simple spider.
-
-    This ensures canonical keys and homepages exist in storage even if other
-    scrapers are unavailable or rate-limited.
+def scraped_conferences(context: AssetExecutionContext) -> Output[list[dict[str, Any]]]:
+    """Crawl the partition's source with its spider.
+
+    A crawl that fails as a whole (an exception, an abnormal finish reason, or
+    no request succeeding) is retried with the source's own policy; other
+    partitions are unaffected. Runs of the same source are serialized by the
+    ``dagster/partition/source`` tag limit in ``dagster.yaml``. Performance
+    metrics go to the output metadata and the ``crawl_runs`` table.
     """
-    items = run_spider(SeededSpider)
-
-    return Output(
-        value=items,
-        metadata={
-            "count": len(items),
-            "source": "seeded",
-            "preview": (
-                MetadataValue.md("\n".join([f"- {item['name']}" for item in items[:8]]))
-                if items
-                else "No seeds emitted"
-            ),
-        },
+    source_name = context.partition_key.keys_by_dimension["source"]
+    source = SOURCES[source_name]
+
+    started = time.perf_counter()
+    try:
+        run = crawl_spider(source.spider)
+        error = run.error
+    except Exception as e:  # any crawl failure is retried
+        run, error = None, f"raised {e!r}"
+    if error is not None:
+        context.log.warning(f"{source_name} crawl {error} (attempt {context.retry_number + 1})")
+        if context.retry_number >= source.max_retries:
+            raise RuntimeError(f"{source_name} crawl {error}")
+        raise RetryRequested(
+            max_retries=source.max_retries,
+            seconds_to_wait=source.retry_delay_s * 2**context.retry_number,
+        )
+
+    items = run.items
+    metrics = CrawlMetrics.from_scrapy_stats(
+        run.stats, items=len(items), wall_time_s=time.perf_counter() - started
     )
+    record_crawl_metrics(context, source_name, metrics)
+    metadata = {
+        "count": len(items),
+        "source": source_name,
+        "spider": source.spider,
+        "description": source.description,
+        "responses": run.stats.get("downloader/response_count", 0),
+        **metrics.metadata(),
+        "preview": (
+            MetadataValue.md("\n".join([f"- {item['name']}" for item in items[:5]]))
+            if items
+            else "No items scraped"
+        ),
+    }
+    timing = run.timing
+    if timing:
+        metadata["timing"] = MetadataValue.json(timing)
+    return Output(value=items, metadata=metadata)
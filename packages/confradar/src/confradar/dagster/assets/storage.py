@@ -1,134 +1,100 @@
 """Dagster assets for storing conference data in the database.
 
 These assets take scraped conference data and persist it to the database
-using SQLAlchemy models.
+using SQLAlchemy models, one source and crawl date partition at a time.
 """
 
+import time
+from dataclasses import asdict
 from typing import Any
 
-from dagster import MetadataValue, Output, asset
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from dagster import AssetExecutionContext, MetadataValue, Output, asset
 
-from confradar.db.base import Base
-from confradar.db.models import Conference, Source
-from confradar.settings import get_settings
+from confradar.crawl_runs import CrawlMetrics
+from confradar.dagster.assets.scrapers import crawl_partitions, record_crawl_metrics
+from confradar.db.base import Base, get_engine, get_sessionmaker, pool_stats
+from confradar.db.identity import IdentityMap
+from confradar.db.ingest import upsert_items
+from confradar.resolution.workshops import link_workshops
 
 
 @asset(
-    description="Store all scraped conferences in the database",
+    description="Store one source's scraped conferences in the database",
     group_name="storage",
+    partitions_def=crawl_partitions,
 )
 def store_conferences(
-    ai_deadlines_conferences: list[dict[str, Any]],
-    acl_web_conferences: list[dict[str, Any]],
-    chairing_tool_conferences: list[dict[str, Any]],
-    elra_conferences: list[dict[str, Any]],
-    wikicfp_conferences: list[dict[str, Any]],
-    seeded_conferences: list[dict[str, Any]],
+    context: AssetExecutionContext,
+    scraped_conferences: list[dict[str, Any]],
 ) -> Output[dict[str, int]]:
-    """Store all scraped conferences in the database.
+    """Store the conferences of one source and crawl date in the database.
 
-    Merges conferences from all sources and stores them in the database.
-    Uses upsert logic to update existing conferences or insert new ones.
+    Partitions match ``scraped_conferences``, so each source is stored as soon
+    as its own crawl finishes. Uses bulk upserts to update existing
+    conferences or insert new ones.
 
     Returns:
         Dictionary with statistics about stored conferences
     """
-    settings = get_settings()
-
-    # Create database engine and session
-    engine = create_engine(settings.database_url)
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    source_name = context.partition_key.keys_by_dimension["source"]
+    started = time.perf_counter()
+    # Shared engine/session factory from the process-wide registry
+    Base.metadata.create_all(get_engine())
+    session = get_sessionmaker()()
 
     try:
-        # Combine all conferences
-        all_conferences = []
-        source_counts = {}
-
-        for source_name, conferences in [
-            ("seeded", seeded_conferences),
-            ("aideadlines", ai_deadlines_conferences),
-            ("acl_web", acl_web_conferences),
-            ("chairing_tool", chairing_tool_conferences),
-            ("elra", elra_conferences),
-            ("wikicfp", wikicfp_conferences),
-        ]:
-            all_conferences.extend(conferences)
-            source_counts[source_name] = len(conferences)
-
-        # Track stats
-        new_count = 0
-        updated_count = 0
-
-        for conf_data in all_conferences:
-            # Check if conference exists
-            existing = session.query(Conference).filter_by(key=conf_data["key"]).first()
-
-            if existing:
-                # Update existing conference
-                existing.name = conf_data["name"]
-                existing.homepage = conf_data.get("homepage")
-                updated_count += 1
-
-                # Check if we need to add a new source URL
-                source_url = conf_data.get("url")
-                if source_url:
-                    source_exists = (
-                        session.query(Source)
-                        .filter_by(conference_id=existing.id, url=source_url)
-                        .first()
-                    )
-
-                    if not source_exists:
-                        source = Source(
-                            conference_id=existing.id,
-                            url=source_url,
-                            notes=f"Scraped from {conf_data['source']}",
-                        )
-                        session.add(source)
-            else:
-                # Create new conference
-                conference = Conference(
-                    key=conf_data["key"],
-                    name=conf_data["name"],
-                    homepage=conf_data.get("homepage"),
-                )
-                session.add(conference)
-                session.flush()  # Get the ID
-
-                # Add source URL
-                if conf_data.get("url"):
-                    source = Source(
-                        conference_id=conference.id,
-                        url=conf_data["url"],
-                        notes=f"Scraped from {conf_data['source']}",
-                    )
-                    session.add(source)
-
-                new_count += 1
+        all_conferences = scraped_conferences
+
+        # Conferences already in the database are found with one bulk lookup;
+        # the identity map then serves their ids to the upsert without extra queries
+        identity = IdentityMap()
+        existing = identity.resolve_conferences(session, (c["key"] for c in all_conferences))
+        new_count = len({c["key"] for c in all_conferences} - existing.keys())
+        updated_count = len(all_conferences) - new_count
+
+        write_started = time.perf_counter()
+        ingest = upsert_items(session, all_conferences, identity=identity, run_id=context.run_id)
+
+        # Link this run's workshops (and workshops waiting for a new parent) incrementally
+        scraped_ids = {identity.get_conference(c["key"]) for c in all_conferences} - {None}
+        links = link_workshops(session, conference_ids=scraped_ids)
 
         # Commit all changes
         session.commit()
+        write_s = time.perf_counter() - write_started
+        changes = ingest.changes
+        rows = ingest.conferences + ingest.sources + ingest.deadlines + links.linked
+        metrics = CrawlMetrics(
+            wall_time_s=time.perf_counter() - started,
+            items=len(all_conferences),
+            db_rows=rows + changes.added + changes.moved + changes.removed,
+            db_write_s=write_s,
+        )
+        record_crawl_metrics(context, source_name, metrics)
 
         stats = {
             "total_scraped": len(all_conferences),
             "new_conferences": new_count,
             "updated_conferences": updated_count,
-            **{f"{k}_count": v for k, v in source_counts.items()},
+            "deadlines_added": ingest.changes.added,
+            "deadlines_moved": ingest.changes.moved,
+            "deadlines_removed": ingest.changes.removed,
+            "workshops_linked": links.linked,
         }
 
         return Output(
             value=stats,
             metadata={
+                "source": source_name,
                 "total": len(all_conferences),
                 "new": new_count,
                 "updated": updated_count,
-                "breakdown": MetadataValue.md(
-                    "\n".join([f"- **{k}**: {v}" for k, v in source_counts.items()])
-                ),
+                "deadlines_added": ingest.changes.added,
+                "deadlines_moved": ingest.changes.moved,
+                "deadlines_removed": ingest.changes.removed,
+                "workshops_linked": links.linked,
+                **metrics.metadata(),
+                "db_pool": MetadataValue.json(asdict(pool_stats())),
             },
         )
 
@@ -3,43 +3,35 @@
 This module defines all Dagster assets, jobs, schedules, and sensors for ConfRadar.
 """
 
-from dagster import Definitions, ScheduleDefinition, define_asset_job
+from dagster import Definitions, build_schedule_from_partitioned_job, define_asset_job
 
-from confradar.dagster.assets.scrapers import (
-    acl_web_conferences,
-    ai_deadlines_conferences,
-    chairing_tool_conferences,
-    elra_conferences,
-    seeded_conferences,
-    wikicfp_conferences,
-)
+from confradar.dagster.assets.scrapers import crawl_partitions, scraped_conferences
 from confradar.dagster.assets.storage import store_conferences
+from confradar.dagster.jobs import recrawl_job, reprocess_job, scrape_sources_job
+from confradar.dagster.sensors import deadline_recrawl_sensor, upstream_change_sensor
 
 # Define jobs
+# One run per source and crawl date: each source is scraped and stored independently
 crawl_job = define_asset_job(
     name="crawl_job",
-    description="Daily conference crawling pipeline - scrape all sources and store in database",
+    selection=[scraped_conferences, store_conferences],
+    partitions_def=crawl_partitions,
+    description="Daily conference crawling pipeline - scrape a source and store it in the database",
 )
 
 # Define schedules
-daily_crawl_schedule = ScheduleDefinition(
+daily_crawl_schedule = build_schedule_from_partitioned_job(
+    crawl_job,
     name="daily_crawl_schedule",
-    job=crawl_job,
-    cron_schedule="0 2 * * *",  # Run at 2 AM daily
+    hour_of_day=2,  # Run at 2 AM daily, one run per source
+    minute_of_hour=0,
     description="Run daily conference crawl pipeline",
 )
 
 # Main Definitions object
 defs = Definitions(
-    assets=[
-        seeded_conferences,
-        ai_deadlines_conferences,
-        acl_web_conferences,
-        chairing_tool_conferences,
-        elra_conferences,
-        wikicfp_conferences,
-        store_conferences,
-    ],
-    jobs=[crawl_job],
+    assets=[scraped_conferences, store_conferences],
+    jobs=[crawl_job, reprocess_job, scrape_sources_job, recrawl_job],
     schedules=[daily_crawl_schedule],
+    sensors=[deadline_recrawl_sensor, upstream_change_sensor],
 )
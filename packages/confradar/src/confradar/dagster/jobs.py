@@ -0,0 +1,232 @@
+"""Dagster jobs that are not asset materializations.
+
+Scraper, archive and ingest modules are imported inside the ops, so loading the
+code location does not import them.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from dagster import Config, MetadataValue, OpExecutionContext, Output, job, op
+
+from confradar.scrapers.registry import scrapers
+
+
+class ReprocessConfig(Config):
+    """Run config for ``reprocess_job``; timestamps are ISO 8601 (UTC if naive)."""
+
+    source: str = "ai_deadlines"
+    since: str | None = None
+    until: str | None = None
+    workers: int | None = None
+    batch_size: int = 200
+    restart: bool = False
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@op(description="Re-parse archived raw pages of one source and upsert the results")
+def reprocess_raw_pages(
+    context: OpExecutionContext, config: ReprocessConfig
+) -> Output[dict[str, Any]]:
+    """Run ``confradar.reprocess.reprocess`` with checkpointing and progress logs.
+
+    The checkpoint name depends only on the source, parser schema version and
+    window, so re-running a failed job resumes where it stopped.
+    """
+    from confradar.archive import RawArchive
+    from confradar.db.base import Base, get_engine, get_sessionmaker
+    from confradar.reprocess import reprocess
+    from confradar.settings import get_settings
+
+    Base.metadata.create_all(get_engine())
+    session = get_sessionmaker()()
+
+    def log_progress(stats) -> None:
+        context.log.info(
+            f"{stats.pages}/{stats.total_pages} pages, {stats.items} items, "
+            f"{stats.errors} errors ({stats.pages_per_s:.1f} pages/s)"
+        )
+
+    try:
+        stats = reprocess(
+            session,
+            RawArchive(get_settings().raw_archive_dir),
+            config.source,
+            since=_timestamp(config.since),
+            until=_timestamp(config.until),
+            workers=config.workers,
+            batch_size=config.batch_size,
+            restart=config.restart,
+            run_id=context.run_id,
+            progress=log_progress,
+        )
+    finally:
+        session.close()
+
+    for url, error in stats.failures:
+        context.log.warning(f"Could not parse {url}: {error}")
+
+    summary = {
+        "pages": stats.pages,
+        "bodies": stats.bodies,
+        "items": stats.items,
+        "errors": stats.errors,
+        "stale": stats.stale,
+        "resumed_from": stats.resumed_from,
+    }
+    return Output(
+        value=summary,
+        metadata={
+            **summary,
+            "elapsed_s": round(stats.elapsed_s, 2),
+            "pages_per_s": round(stats.pages_per_s, 1),
+            "items_per_s": round(stats.items_per_s, 1),
+            "mb_per_s": round(stats.mb_per_s, 2),
+            "source": MetadataValue.text(config.source),
+        },
+    )
+
+
+@job(description="Re-parse archived raw pages after a parser fix or schema version bump")
+def reprocess_job():
+    reprocess_raw_pages()
+
+
+class ScrapeSourcesConfig(Config):
+    """Run config for ``scrape_sources_job``; sources are ``registry.scrapers`` names."""
+
+    sources: list[str] = ["aideadlines"]
+    max_connections: int = 20
+    per_host: int = 2
+    timeout: float = 120.0
+    request_timeout: float = 20.0
+
+
+@op(description="Fetch non-Scrapy sources concurrently and upsert their items")
+def scrape_sources(
+    context: OpExecutionContext, config: ScrapeSourcesConfig
+) -> Output[dict[str, Any]]:
+    """Run the configured ``Scraper`` sources on one async connection pool.
+
+    Failed or timed-out sources are logged and reported in the metadata; the
+    op itself only fails if an unknown source is configured.
+    """
+    from confradar.db.base import Base, get_engine, get_sessionmaker
+    from confradar.db.identity import IdentityMap
+    from confradar.db.ingest import upsert_items
+    from confradar.scrapers.runner import run_scrapers
+
+    outcomes = run_scrapers(
+        [scrapers.load(source)() for source in config.sources],
+        max_connections=config.max_connections,
+        per_host=config.per_host,
+        timeout=config.timeout,
+        request_timeout=config.request_timeout,
+    )
+    items = []
+    for outcome in outcomes:
+        if outcome.ok:
+            context.log.info(
+                f"{outcome.source_name}: {len(outcome.result.normalized)} items "
+                f"in {outcome.elapsed_s:.1f}s"
+            )
+            url = outcome.result.metadata.get("url")
+            scraped_at = outcome.result.scraped_at.isoformat()
+            items.extend(
+                {
+                    **item,
+                    "url": item.get("url") or url,
+                    "source": outcome.source_name,
+                    "scraped_at": scraped_at,
+                }
+                for item in outcome.result.normalized
+            )
+        else:
+            context.log.warning(f"{outcome.source_name} failed: {outcome.error}")
+
+    Base.metadata.create_all(get_engine())
+    with get_sessionmaker()() as session:
+        ingest = upsert_items(session, items, identity=IdentityMap(), run_id=context.run_id)
+        session.commit()
+
+    summary = {
+        "sources": len(outcomes),
+        "failed": sum(not o.ok for o in outcomes),
+        "items": ingest.items,
+        "deadlines_added": ingest.changes.added,
+        "deadlines_moved": ingest.changes.moved,
+    }
+    return Output(
+        value=summary,
+        metadata={
+            **summary,
+            "elapsed_s": MetadataValue.json(
+                {o.source_name: round(o.elapsed_s, 2) for o in outcomes}
+            ),
+            "errors": MetadataValue.json({o.source_name: o.error for o in outcomes if not o.ok}),
+        },
+    )
+
+
+@job(description="Scrape non-Scrapy sources in parallel inside one op")
+def scrape_sources_job():
+    scrape_sources()
+
+
+class RecrawlConfig(Config):
+    """Run config for ``recrawl_job``; set by ``deadline_recrawl_sensor``."""
+
+    spider: str = "wikicfp"
+    urls: list[str] = []
+
+
+@op(description="Recrawl due source URLs with one spider and reschedule them")
+def recrawl_urls(context: OpExecutionContext, config: RecrawlConfig) -> Output[dict[str, Any]]:
+    """Crawl only ``config.urls`` and their direct follow-ups, then upsert the items.
+
+    The spider's persistent frontier is disabled, so a targeted run neither
+    resumes nor overwrites the state of its full crawls. The URLs are marked
+    crawled afterwards, which schedules their next recrawl.
+    """
+    from confradar.dagster.assets.scrapers import run_spider
+    from confradar.db.base import Base, get_engine, get_sessionmaker
+    from confradar.db.identity import IdentityMap
+    from confradar.db.ingest import upsert_items
+    from confradar.recrawl import mark_crawled
+
+    items = run_spider(
+        config.spider,
+        # Depth 1: due listing pages plus their direct follow-ups (e.g., the next page)
+        settings_overrides={"CRAWL_FRONTIER_ENABLED": False, "DEPTH_LIMIT": 1},
+        start_urls=list(config.urls),
+    )
+    context.log.info(f"{config.spider}: {len(items)} items from {len(config.urls)} due URLs")
+
+    Base.metadata.create_all(get_engine())
+    with get_sessionmaker()() as session:
+        ingest = upsert_items(session, items, identity=IdentityMap(), run_id=context.run_id)
+        marked = mark_crawled(session, config.urls, run_id=context.run_id)
+        session.commit()
+
+    summary = {
+        "urls": len(config.urls),
+        "marked": marked,
+        "items": ingest.items,
+        "deadlines_added": ingest.changes.added,
+        "deadlines_moved": ingest.changes.moved,
+    }
+    return Output(
+        value=summary,
+        metadata={**summary, "spider": MetadataValue.text(config.spider)},
+    )
+
+
+@job(description="Recrawl the source URLs the deadline-proximity scheduler found due")
+def recrawl_job():
+    recrawl_urls()
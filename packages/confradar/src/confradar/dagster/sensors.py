@@ -0,0 +1,109 @@
+"""Dagster sensors.
+
+Like the jobs, sensors import the database and scheduling modules when they
+are evaluated, not when the code location loads.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from dagster import MultiPartitionKey, RunRequest, SensorEvaluationContext, SkipReason, sensor
+
+from confradar.dagster.assets.scrapers import SOURCES
+from confradar.dagster.jobs import recrawl_job
+
+# Due URLs handed out per tick, earliest first; the rest wait for the next tick
+MAX_URLS_PER_TICK = 200
+
+
+@sensor(
+    job=recrawl_job,
+    minimum_interval_seconds=300,
+    description="Launch recrawls of source URLs due by deadline proximity",
+)
+def deadline_recrawl_sensor(context: SensorEvaluationContext):
+    """Refresh the recrawl schedule and request one ``recrawl_job`` run per spider.
+
+    Intervals follow each URL's nearest upcoming deadline (hourly within a
+    week, daily within a month, weekly otherwise; see ``confradar.recrawl``).
+    Run keys identify the due batch, so a batch is launched once per hour at
+    most even while its run is still in progress.
+    """
+    from confradar.db.base import Base, get_engine, get_sessionmaker
+    from confradar.recrawl import due_by_spider, refresh_targets, run_key
+
+    now = datetime.now(timezone.utc)
+    Base.metadata.create_all(get_engine())
+    with get_sessionmaker()() as session:
+        stats = refresh_targets(session, now)
+        session.commit()
+        due = due_by_spider(session, now, limit=MAX_URLS_PER_TICK)
+        requests = [
+            RunRequest(
+                run_key=run_key(spider, targets, now),
+                run_config={
+                    "ops": {
+                        "recrawl_urls": {
+                            "config": {"spider": spider, "urls": [t.url for t in targets]}
+                        }
+                    }
+                },
+                tags={"confradar/spider": spider},
+            )
+            for spider, targets in sorted(due.items())
+        ]
+
+    context.log.info(
+        f"{stats.urls} source URLs: {stats.added} new targets, {stats.rescheduled} rescheduled, "
+        f"{stats.unassigned} without a recrawlable spider; {len(requests)} runs due"
+    )
+    if not requests:
+        return SkipReason("No source URLs due for a recrawl")
+    return requests
+
+
+@sensor(
+    job_name="crawl_job",
+    minimum_interval_seconds=180,
+    description="Crawl sources whose index pages changed upstream",
+)
+def upstream_change_sensor(context: SensorEvaluationContext):
+    """Probe each source's index pages and request ``crawl_job`` runs for changed sources.
+
+    Index pages are the spiders' ``start_urls``, probed with conditional
+    ``HEAD``/``GET`` requests (see ``confradar.upstream``); the cursor holds
+    their ETags, ``Last-Modified`` dates and content digests. A changed source
+    gets a run of today's partition, so runs queue behind that source's other
+    crawls. The first tick only records a baseline.
+    """
+    from confradar.upstream import index_urls, probe_sources
+
+    states = json.loads(context.cursor) if context.cursor else {}
+    urls = {name: index_urls(source.spider) for name, source in SOURCES.items()}
+    probes = probe_sources({name: u for name, u in urls.items() if u}, states)
+
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    new_states = {}
+    requests = []
+    for name, probe in probes.items():
+        new_states.update(probe.states)
+        for url_probe in probe.urls:
+            if url_probe.error:
+                context.log.warning(f"{name}: probe of {url_probe.url} failed: {url_probe.error}")
+        if probe.changed:
+            version = hashlib.sha256(json.dumps(probe.states, sort_keys=True).encode()).hexdigest()
+            requests.append(
+                RunRequest(
+                    run_key=f"upstream:{name}:{version[:16]}",
+                    partition_key=MultiPartitionKey({"source": name, "date": today}),
+                    tags={"confradar/trigger": "upstream_change"},
+                )
+            )
+    context.update_cursor(json.dumps(new_states, sort_keys=True))
+
+    probed = sum(len(probe.urls) for probe in probes.values())
+    context.log.info(f"Probed {probed} index pages; {len(requests)} sources changed")
+    if not requests:
+        return SkipReason("No source changed upstream")
+    return requests
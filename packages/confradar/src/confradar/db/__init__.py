@@ -1,4 +1,37 @@
 from .base import Base
-from .models import Conference, Deadline, Source
+from .models import (
+    Conference,
+    ConferenceAlias,
+    ContentFingerprint,
+    CrawlKey,
+    CrawlRequest,
+    CrawlRun,
+    CrawlState,
+    Deadline,
+    DeadlineChange,
+    DeadlineHistory,
+    RawPage,
+    RecrawlTarget,
+    ReprocessCheckpoint,
+    SeenUrl,
+    Source,
+)
 
-__all__ = ["Base", "Conference", "Deadline", "Source"]
+__all__ = [
+    "Base",
+    "Conference",
+    "ConferenceAlias",
+    "ContentFingerprint",
+    "CrawlKey",
+    "CrawlRequest",
+    "CrawlRun",
+    "CrawlState",
+    "Deadline",
+    "DeadlineChange",
+    "DeadlineHistory",
+    "RawPage",
+    "RecrawlTarget",
+    "ReprocessCheckpoint",
+    "SeenUrl",
+    "Source",
+]
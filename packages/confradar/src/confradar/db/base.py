@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import DateTime, create_engine, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from sqlalchemy import DateTime, Engine, create_engine, event, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 
 class Base(DeclarativeBase):
@@ -20,12 +26,226 @@ class TimestampMixin:
     )
 
 
-def get_engine():
-    """Get SQLAlchemy engine from settings."""
-    from confradar.settings import Settings
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait to obtain a connection."""
 
-    settings = Settings()
-    return create_engine(settings.database_url)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time_s = 0.0
+        self.max_wait_s = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_time_s += waited
+            self.max_wait_s = max(self.max_wait_s, waited)
+
+
+@dataclass
+class PoolStats:
+    """Connection pool statistics for one engine.
+
+    Attributes:
+        url: Database URL (password masked)
+        size: Configured pool size
+        checked_out: Connections currently in use
+        checked_in: Idle connections held by the pool
+        overflow: Connections opened beyond ``size`` (negative while the pool fills)
+        checkouts: Connections handed out since the pool was created
+        wait_time_s: Total time spent waiting for a connection
+        max_wait_s: Longest single wait for a connection
+    """
+
+    url: str
+    size: int | None = None
+    checked_out: int | None = None
+    checked_in: int | None = None
+    overflow: int | None = None
+    checkouts: int = 0
+    wait_time_s: float = 0.0
+    max_wait_s: float = 0.0
+
+
+_engines: dict[tuple[str, bool], Engine] = {}
+_sessionmakers: dict[tuple[str, bool], sessionmaker[Session]] = {}
+_registry_lock = threading.Lock()
+_registry_pid = os.getpid()
+
+
+def _reset_after_fork() -> None:
+    """Drop pooled connections inherited from the parent process.
+
+    Scrapy and Dagster may fork worker processes; sharing a parent's sockets would
+    corrupt both sides. ``dispose(close=False)`` discards the pool without closing
+    connections the parent still owns.
+    """
+    global _registry_pid, _registry_lock
+    _registry_lock = threading.Lock()
+    for engine in _engines.values():
+        engine.dispose(close=False)
+    _registry_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def sqlite_pragmas(read_only: bool = False) -> dict[str, str | int]:
+    """PRAGMAs applied to every connection in SQLite performance mode.
+
+    WAL lets readers proceed while the pipeline writes, ``synchronous=NORMAL``
+    only fsyncs at checkpoints (safe with WAL), and a larger page cache plus
+    memory-mapped I/O cut read syscalls. ``busy_timeout`` makes writers wait for
+    the lock instead of failing with "database is locked".
+    """
+    from confradar.settings import get_settings
+
+    settings = get_settings()
+    pragmas: dict[str, str | int] = {
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "cache_size": -settings.sqlite_cache_size_kb,  # negative = KiB, not pages
+        "mmap_size": settings.sqlite_mmap_size_bytes,
+        "temp_store": "MEMORY",
+    }
+    if read_only:
+        pragmas["query_only"] = "ON"
+    else:
+        pragmas["journal_mode"] = "WAL"
+        pragmas["synchronous"] = "NORMAL"
+    return pragmas
+
+
+def create_sqlite_engine(
+    url: str, *, performance: bool = True, read_only: bool = False, **kwargs
+) -> Engine:
+    """Create a SQLite engine, optionally tuned for concurrent local use.
+
+    Args:
+        url: SQLite database URL (e.g., ``sqlite:///confradar.db``)
+        performance: Apply ``sqlite_pragmas()`` to each new connection; when False
+            the engine runs with stock SQLite settings
+        read_only: Open the file with ``mode=ro`` for readers (analysis scripts,
+            reports) so they can never take the write lock
+        **kwargs: Passed through to ``create_engine``
+    """
+    sa_url = make_url(url)
+    if read_only and sa_url.database and sa_url.database != ":memory:":
+        sa_url = sa_url.set(
+            database=f"file:{sa_url.database}", query={**sa_url.query, "mode": "ro", "uri": "true"}
+        )
+
+    engine = create_engine(sa_url, **kwargs)
+    if performance:
+        pragmas = sqlite_pragmas(read_only=read_only)
+
+        @event.listens_for(engine, "connect")
+        def _set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
+
+
+def _create_engine(url: str, read_only: bool = False) -> Engine:
+    from confradar.settings import get_settings
+
+    settings = get_settings()
+    kwargs: dict = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if make_url(url).get_backend_name() == "sqlite":
+        # SQLite connections are local files; sizing/recycling a pool buys nothing
+        return create_sqlite_engine(
+            url, performance=settings.sqlite_performance_mode, read_only=read_only, **kwargs
+        )
+
+    engine = create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_s,
+        pool_recycle=settings.db_pool_recycle_s,
+        **kwargs,
+    )
+    if read_only and engine.dialect.name == "postgresql":
+        # Read-only transactions (SET TRANSACTION READ ONLY) on a separate pool
+        engine = engine.execution_options(postgresql_readonly=True)
+    return engine
+
+
+def get_engine(url: str | None = None, *, read_only: bool = False) -> Engine:
+    """Get the process-wide engine for a database URL.
+
+    Engines (and their connection pools) are created once per URL and shared by
+    every caller in the process. Pool behaviour is configured via settings
+    (``DB_POOL_SIZE``, ``DB_MAX_OVERFLOW``, ``DB_POOL_PRE_PING``,
+    ``DB_POOL_RECYCLE_S``, ``DB_POOL_TIMEOUT_S``). SQLite URLs get the
+    performance profile from ``sqlite_pragmas()`` unless
+    ``SQLITE_PERFORMANCE_MODE`` is disabled.
+
+    Args:
+        url: Database URL; defaults to ``settings.database_url``
+        read_only: Return a separate engine for readers that never writes
+    """
+    if url is None:
+        from confradar.settings import get_settings
+
+        url = get_settings().database_url
+
+    if os.getpid() != _registry_pid:
+        _reset_after_fork()
+
+    key = (url, read_only)
+    engine = _engines.get(key)
+    if engine is None:
+        with _registry_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = _engines[key] = _create_engine(url, read_only=read_only)
+    return engine
+
+
+def get_sessionmaker(url: str | None = None, *, read_only: bool = False) -> sessionmaker[Session]:
+    """Get the shared ``sessionmaker`` bound to the engine for ``url``."""
+    engine = get_engine(url, read_only=read_only)
+    key = (engine.url.render_as_string(hide_password=False), read_only)
+    factory = _sessionmakers.get(key)
+    if factory is None:
+        with _registry_lock:
+            factory = _sessionmakers.setdefault(key, sessionmaker(bind=engine))
+    return factory
+
+
+def pool_stats(url: str | None = None, *, read_only: bool = False) -> PoolStats:
+    """Return connection pool statistics for the engine serving ``url``."""
+    engine = get_engine(url, read_only=read_only)
+    pool = engine.pool
+    stats = PoolStats(url=engine.url.render_as_string(hide_password=True))
+    if isinstance(pool, QueuePool):
+        stats.size = pool.size()
+        stats.checked_out = pool.checkedout()
+        stats.checked_in = pool.checkedin()
+        stats.overflow = pool.overflow()
+    if isinstance(pool, TimedQueuePool):
+        stats.checkouts = pool.checkouts
+        stats.wait_time_s = pool.wait_time_s
+        stats.max_wait_s = pool.max_wait_s
+    return stats
+
+
+def dispose_engines() -> None:
+    """Close all pooled connections and forget every registered engine."""
+    with _registry_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _sessionmakers.clear()
 
 
 def get_session() -> Session:
@@ -43,8 +263,12 @@ def get_session() -> Session:
         >>> finally:
         >>>     session.close()
     """
-    engine = get_engine()
-    return Session(engine)
+    return get_sessionmaker()()
+
+
+def get_read_session() -> Session:
+    """Create a session on the read-only engine (for reports and analysis)."""
+    return get_sessionmaker(read_only=True)()
 
 
 @contextmanager
@@ -0,0 +1,316 @@
+"""Set-based deadline change detection.
+
+Incoming deadlines for a crawl batch are staged in a temporary table and compared
+with the current ``deadlines`` rows in SQL. Each incoming or current deadline that
+doesn't match exactly is classified as:
+
+- ``added``: a ``(conference, kind)`` deadline with no current counterpart
+- ``moved``: a current deadline replaced by a different date for the same kind
+- ``removed``: a current deadline no longer reported by its source
+
+Changes are applied to ``deadlines`` (moved rows are updated in place, so a moved
+deadline no longer leaves a second row behind), appended to ``deadline_changes``
+and versioned in ``deadline_history``. Nothing is compared row-by-row in Python.
+
+Removal is scoped conservatively: only conferences that have at least one incoming
+deadline are considered, and only rows that came from one of the incoming sources
+(or have no source). A source that stops reporting deadlines altogether, or another
+source's deadlines, are never removed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from .models import Deadline, DeadlineChange
+
+ADDED = "added"
+MOVED = "moved"
+REMOVED = "removed"
+
+# Rows per INSERT statement; keeps SQLite below its bound-parameter limit
+CHUNK_SIZE = 500
+
+# Session-local staging tables; kept out of Base.metadata so they are never
+# created as permanent tables
+_staging = MetaData()
+
+incoming_deadlines = Table(
+    "tmp_incoming_deadlines",
+    _staging,
+    Column("conference_id", Integer, nullable=False),
+    Column("kind", String(64), nullable=False),
+    Column("due_date", Date, nullable=False),
+    Column("timezone", String(64)),
+    Column("source_id", Integer),
+    prefixes=["TEMPORARY"],
+)
+
+deadline_diff = Table(
+    "tmp_deadline_diff",
+    _staging,
+    Column("deadline_id", Integer),  # current row (moved/removed)
+    Column("conference_id", Integer, nullable=False),
+    Column("kind", String(64), nullable=False),
+    Column("change", String(16), nullable=False),
+    Column("old_due_date", Date),
+    Column("new_due_date", Date),
+    Column("timezone", String(64)),
+    Column("source_id", Integer),
+    prefixes=["TEMPORARY"],
+)
+
+
+@dataclass
+class ChangeStats:
+    """Deadline changes detected in one batch."""
+
+    added: int = 0
+    moved: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+
+def _chunks(rows: list[dict[str, Any]], size: int = CHUNK_SIZE) -> Iterator[list[dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _reset_staging(session: Session) -> None:
+    for table in (incoming_deadlines, deadline_diff):
+        session.execute(CreateTable(table, if_not_exists=True))
+        session.execute(delete(table))
+
+
+def _diff_select() -> Any:
+    """Build the SELECT classifying unmatched incoming/current deadlines."""
+    d = Deadline.__table__
+    i = incoming_deadlines.alias("i")
+    scope = incoming_deadlines.alias("scope")
+
+    exact_current = exists().where(
+        d.c.conference_id == i.c.conference_id,
+        d.c.kind == i.c.kind,
+        d.c.due_date == i.c.due_date,
+    )
+    exact_incoming = exists().where(
+        i.c.conference_id == d.c.conference_id,
+        i.c.kind == d.c.kind,
+        i.c.due_date == d.c.due_date,
+    )
+
+    # Incoming deadlines that don't already exist, ranked by date per (conference, kind)
+    inc = (
+        select(
+            i.c.conference_id,
+            i.c.kind,
+            i.c.due_date,
+            i.c.timezone,
+            i.c.source_id,
+            func.row_number()
+            .over(partition_by=(i.c.conference_id, i.c.kind), order_by=i.c.due_date)
+            .label("rn"),
+        )
+        .where(~exact_current)
+        .cte("inc")
+    )
+
+    # Current deadlines in scope that are no longer reported verbatim
+    cur = (
+        select(
+            d.c.id,
+            d.c.conference_id,
+            d.c.kind,
+            d.c.due_date,
+            d.c.source_id,
+            func.row_number()
+            .over(partition_by=(d.c.conference_id, d.c.kind), order_by=d.c.due_date)
+            .label("rn"),
+        )
+        .where(
+            exists().where(
+                scope.c.conference_id == d.c.conference_id,
+                or_(d.c.source_id.is_(None), scope.c.source_id == d.c.source_id),
+            )
+        )
+        .where(~exact_incoming)
+        .cte("cur")
+    )
+
+    # Pair leftovers by rank: a partner on both sides is a move, otherwise add/remove
+    paired = and_(
+        cur.c.conference_id == inc.c.conference_id,
+        cur.c.kind == inc.c.kind,
+        cur.c.rn == inc.c.rn,
+    )
+    added_or_moved = select(
+        cur.c.id,
+        inc.c.conference_id,
+        inc.c.kind,
+        case((cur.c.id.is_(None), literal(ADDED)), else_=literal(MOVED)),
+        cur.c.due_date,
+        inc.c.due_date,
+        inc.c.timezone,
+        inc.c.source_id,
+    ).select_from(inc.outerjoin(cur, paired))
+    removed = select(
+        cur.c.id,
+        cur.c.conference_id,
+        cur.c.kind,
+        literal(REMOVED),
+        cur.c.due_date,
+        null(),
+        null(),
+        cur.c.source_id,
+    ).where(~exists().where(paired))
+    return union_all(added_or_moved, removed)
+
+
+def apply_deadline_changes(
+    session: Session,
+    rows: list[dict[str, Any]],
+    run_id: str | None = None,
+    observed_at: datetime | None = None,
+) -> ChangeStats:
+    """Diff incoming deadlines against current ones, apply and log the changes.
+
+    Args:
+        session: Open session; the caller owns the transaction
+        rows: Incoming deadlines, unique on ``(conference_id, kind, due_date)``, with
+            keys conference_id, kind, due_date, timezone, source_id
+        run_id: Identifier of the crawl/run, recorded on each change event
+        observed_at: When the batch was observed; recorded as ``detected_at`` and
+            bounds history versions (defaults to now)
+
+    Returns:
+        ChangeStats with counts per change type
+    """
+    stats = ChangeStats()
+    if not rows:
+        return stats
+    observed_at = observed_at or datetime.now(timezone.utc)
+
+    _reset_staging(session)
+    for chunk in _chunks(rows):
+        session.execute(insert(incoming_deadlines), chunk)
+
+    diff = deadline_diff
+    session.execute(
+        insert(diff).from_select(
+            [
+                diff.c.deadline_id,
+                diff.c.conference_id,
+                diff.c.kind,
+                diff.c.change,
+                diff.c.old_due_date,
+                diff.c.new_due_date,
+                diff.c.timezone,
+                diff.c.source_id,
+            ],
+            _diff_select(),
+        )
+    )
+
+    counts = dict(
+        session.execute(select(diff.c.change, func.count()).group_by(diff.c.change)).all()
+    )
+    stats.added = counts.get(ADDED, 0)
+    stats.moved = counts.get(MOVED, 0)
+    stats.removed = counts.get(REMOVED, 0)
+    stats.unchanged = len(rows) - stats.added - stats.moved
+
+    if not counts:
+        session.execute(delete(incoming_deadlines))
+        return stats
+
+    # Append change events
+    session.execute(
+        insert(DeadlineChange).from_select(
+            [
+                "conference_id",
+                "kind",
+                "change",
+                "old_due_date",
+                "new_due_date",
+                "source_id",
+                "run_id",
+                "detected_at",
+            ],
+            select(
+                diff.c.conference_id,
+                diff.c.kind,
+                diff.c.change,
+                diff.c.old_due_date,
+                diff.c.new_due_date,
+                diff.c.source_id,
+                literal(run_id, String(128)),
+                literal(observed_at, DateTime(timezone=True)),
+            ),
+        )
+    )
+
+    # Moved: update current rows in place (correlated subqueries work on SQLite and PostgreSQL)
+    d = Deadline.__table__
+    moved = select(diff).where(diff.c.change == MOVED, diff.c.deadline_id == d.c.id)
+    session.execute(
+        update(d)
+        .where(d.c.id.in_(select(diff.c.deadline_id).where(diff.c.change == MOVED)))
+        .values(
+            due_date=moved.with_only_columns(diff.c.new_due_date).scalar_subquery(),
+            timezone=moved.with_only_columns(diff.c.timezone).scalar_subquery(),
+            source_id=moved.with_only_columns(diff.c.source_id).scalar_subquery(),
+            updated_at=func.now(),
+        )
+    )
+
+    session.execute(
+        insert(d).from_select(
+            ["conference_id", "kind", "due_date", "timezone", "source_id"],
+            select(
+                diff.c.conference_id,
+                diff.c.kind,
+                diff.c.new_due_date,
+                diff.c.timezone,
+                diff.c.source_id,
+            ).where(diff.c.change == ADDED),
+        )
+    )
+
+    session.execute(
+        delete(d).where(d.c.id.in_(select(diff.c.deadline_id).where(diff.c.change == REMOVED)))
+    )
+
+    from .history import record_history
+
+    record_history(session, diff, observed_at)
+
+    session.execute(delete(incoming_deadlines))
+    session.execute(delete(diff))
+    return stats
@@ -0,0 +1,96 @@
+"""Versioned deadline history and as-of queries.
+
+``deadline_history`` keeps every value a deadline has held, with a
+``[valid_from, valid_to)`` range. It is maintained set-based from the change
+detection diff (see ``confradar.db.changes``): added and moved deadlines open a
+new version, moved and removed deadlines close the current one.
+
+Example:
+    >>> from datetime import datetime, timezone
+    >>> last_tuesday = datetime(2025, 1, 28, tzinfo=timezone.utc)
+    >>> deadlines_as_of(session, last_tuesday, conference_id=icml.id)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Table, and_, exists, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from .changes import ADDED, MOVED, REMOVED
+from .models import OPEN_END, DeadlineHistory
+
+
+def record_history(session: Session, diff: Table, observed_at: datetime) -> None:
+    """Close and open history versions for the changes staged in ``diff``.
+
+    Args:
+        session: Open session; the caller owns the transaction
+        diff: Staging table produced by change detection (conference_id, kind,
+            change, old_due_date, new_due_date, timezone, source_id)
+        observed_at: Crawl observation time; closes old versions and opens new ones
+    """
+    h = DeadlineHistory.__table__
+    session.execute(
+        update(h)
+        .where(
+            h.c.valid_to == OPEN_END,
+            exists().where(
+                diff.c.change.in_([MOVED, REMOVED]),
+                diff.c.conference_id == h.c.conference_id,
+                diff.c.kind == h.c.kind,
+                diff.c.old_due_date == h.c.due_date,
+            ),
+        )
+        .values(valid_to=observed_at)
+    )
+    session.execute(
+        insert(h).from_select(
+            [
+                "conference_id",
+                "kind",
+                "due_date",
+                "timezone",
+                "source_id",
+                "valid_from",
+                "valid_to",
+            ],
+            select(
+                diff.c.conference_id,
+                diff.c.kind,
+                diff.c.new_due_date,
+                diff.c.timezone,
+                diff.c.source_id,
+                literal(observed_at, DateTime(timezone=True)),
+                literal(OPEN_END, DateTime(timezone=True)),
+            ).where(diff.c.change.in_([ADDED, MOVED])),
+        )
+    )
+
+
+def deadlines_as_of(
+    session: Session, as_of: datetime, conference_id: int | None = None
+) -> list[DeadlineHistory]:
+    """Return the deadline versions that were current at ``as_of`` (UTC).
+
+    With ``conference_id`` this is an index seek on
+    ``(conference_id, kind, valid_from)``; without it, a range scan on
+    ``(valid_to, valid_from)``.
+    """
+    h = DeadlineHistory
+    stmt = select(h).where(and_(h.valid_from <= as_of, h.valid_to > as_of))
+    if conference_id is not None:
+        stmt = stmt.where(h.conference_id == conference_id)
+    return list(session.scalars(stmt.order_by(h.conference_id, h.kind, h.due_date)))
+
+
+def deadline_timeline(
+    session: Session, conference_id: int, kind: str | None = None
+) -> list[DeadlineHistory]:
+    """Return every version of a conference's deadlines, oldest first."""
+    h = DeadlineHistory
+    stmt = select(h).where(h.conference_id == conference_id)
+    if kind is not None:
+        stmt = stmt.where(h.kind == kind)
+    return list(session.scalars(stmt.order_by(h.kind, h.valid_from)))
@@ -0,0 +1,165 @@
+"""Ingestion-scoped identity map for conference and source ids.
+
+The same conference keys show up again and again across sources (seeded,
+aideadlines, acl_web, ...). Caching ``Conference.key -> id`` and
+``(conference_id, url) -> Source.id`` for the duration of an ingestion run means a
+repeated conference costs no extra lookups.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from .models import Conference, Source
+
+# Keys per SELECT ... IN (...) statement; keeps SQLite below its bound-parameter limit
+CHUNK_SIZE = 500
+
+
+class _LRU:
+    """Minimal bounded LRU mapping."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.data: OrderedDict[Hashable, int] = OrderedDict()
+
+    def get(self, key: Hashable) -> int | None:
+        value = self.data.get(key)
+        if value is not None:
+            self.data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: int) -> None:
+        self.data[key] = value
+        self.data.move_to_end(key)
+        while len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class IdentityMap:
+    """Cache of database ids for conferences and sources during one ingestion run.
+
+    Lookups that miss the cache are resolved in bulk with one query per batch of
+    keys, and the results (plus ids of newly inserted rows) are remembered. Both
+    caches are bounded LRUs so long runs don't grow without limit.
+
+    The cache assumes rows are not deleted while it is in use. Call ``clear()``
+    after a rollback, since ids from the failed transaction may not exist.
+
+    Example:
+        >>> identity = IdentityMap()
+        >>> ids = identity.resolve_conferences(session, ["icml25", "acl25"])
+        >>> ids["icml25"]
+        42
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self._conferences = _LRU(max_size)
+        self._sources = _LRU(max_size)
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+
+    def __len__(self) -> int:
+        return len(self._conferences) + len(self._sources)
+
+    def clear(self) -> None:
+        """Drop all cached ids (e.g., after a rollback)."""
+        self._conferences = _LRU(self._conferences.max_size)
+        self._sources = _LRU(self._sources.max_size)
+
+    def get_conference(self, key: str) -> int | None:
+        """Return the cached id for a conference key, or None."""
+        conf_id = self._conferences.get(key)
+        if conf_id is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return conf_id
+
+    def add_conference(self, key: str, conf_id: int) -> None:
+        self._conferences.put(key, conf_id)
+
+    def get_source(self, conference_id: int, url: str) -> int | None:
+        """Return the cached id for a ``(conference_id, url)`` source, or None."""
+        source_id = self._sources.get((conference_id, url))
+        if source_id is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return source_id
+
+    def has_source(self, conference_id: int, url: str) -> bool:
+        """Check whether a source id is cached (does not touch LRU order or counters)."""
+        return (conference_id, url) in self._sources
+
+    def add_source(self, conference_id: int, url: str, source_id: int) -> None:
+        self._sources.put((conference_id, url), source_id)
+
+    def resolve_conferences(self, session: Session, keys: Iterable[str]) -> dict[str, int]:
+        """Map conference keys to ids, querying only keys missing from the cache.
+
+        Keys that don't exist in the database are absent from the result.
+        """
+        resolved: dict[str, int] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            conf_id = self.get_conference(key)
+            if conf_id is None:
+                missing.append(key)
+            else:
+                resolved[key] = conf_id
+
+        for chunk in _chunks(missing):
+            self.queries += 1
+            rows = session.execute(
+                select(Conference.key, Conference.id).where(Conference.key.in_(chunk))
+            )
+            for key, conf_id in rows:
+                self.add_conference(key, conf_id)
+                resolved[key] = conf_id
+        return resolved
+
+    def resolve_sources(
+        self, session: Session, pairs: Iterable[tuple[int, str]]
+    ) -> dict[tuple[int, str], int]:
+        """Map ``(conference_id, url)`` pairs to source ids, querying only cache misses.
+
+        Pairs that don't exist in the database are absent from the result.
+        """
+        resolved: dict[tuple[int, str], int] = {}
+        missing: list[tuple[int, str]] = []
+        for pair in dict.fromkeys(pairs):
+            source_id = self.get_source(*pair)
+            if source_id is None:
+                missing.append(pair)
+            else:
+                resolved[pair] = source_id
+
+        for chunk in _chunks(missing):
+            self.queries += 1
+            rows = session.execute(
+                select(Source.conference_id, Source.url, Source.id).where(
+                    tuple_(Source.conference_id, Source.url).in_(chunk)
+                )
+            )
+            for conf_id, url, source_id in rows:
+                self.add_source(conf_id, url, source_id)
+                resolved[(conf_id, url)] = source_id
+        return resolved
+
+
+def _chunks(values: list[Any], size: int = CHUNK_SIZE) -> Iterable[list[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
@@ -0,0 +1,224 @@
+"""Set-based ingestion of scraped conference items.
+
+Instead of querying ``Conference``, ``Source`` and every ``Deadline`` one row at a
+time, a batch of items is written with a handful of bulk upserts inside a single
+transaction. Used by the batching Scrapy pipeline and the Dagster storage asset;
+``upsert_stream`` feeds a record stream (``Scraper.iter_scrape``) through it in
+fixed-size batches.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .changes import ChangeStats, apply_deadline_changes
+from .identity import IdentityMap
+from .models import Conference, Source
+
+# Rows per INSERT statement; keeps SQLite below its bound-parameter limit
+CHUNK_SIZE = 500
+
+
+@dataclass
+class IngestStats:
+    """Counters for one ingested batch."""
+
+    items: int = 0
+    conferences: int = 0
+    sources: int = 0
+    deadlines: int = 0
+    skipped_deadlines: int = 0
+    changes: ChangeStats = field(default_factory=ChangeStats)
+
+    def merge(self, other: IngestStats) -> None:
+        """Add the counters of ``other`` to these."""
+        self.items += other.items
+        self.conferences += other.conferences
+        self.sources += other.sources
+        self.deadlines += other.deadlines
+        self.skipped_deadlines += other.skipped_deadlines
+        self.changes.added += other.changes.added
+        self.changes.moved += other.changes.moved
+        self.changes.removed += other.changes.removed
+        self.changes.unchanged += other.changes.unchanged
+
+
+def coerce_due_date(value: Any) -> date | None:
+    """Convert a scraped deadline value to a ``date``.
+
+    Accepts ``date``/``datetime`` objects and ISO-8601 strings (date or datetime).
+    Returns None for missing or unparseable values.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).date()
+        except ValueError:
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _chunks(rows: list[dict[str, Any]], size: int = CHUNK_SIZE) -> Iterator[list[dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def dialect_insert(session: Session, table: Any) -> Any:
+    """Return a dialect-specific INSERT supporting ``ON CONFLICT`` clauses."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Bulk upsert not supported for dialect: {dialect}")
+    return insert(table)
+
+
+def upsert_items(
+    session: Session,
+    items: Iterable[Mapping[str, Any]],
+    identity: IdentityMap | None = None,
+    run_id: str | None = None,
+    observed_at: datetime | None = None,
+) -> IngestStats:
+    """Upsert a batch of conference items with bulk statements.
+
+    Conference names are overwritten, homepages only when the item provides one,
+    and sources are insert-if-missing (items without a ``url`` add none). Deadlines go through change detection
+    (``apply_deadline_changes``): new ones are inserted, moved ones updated in
+    place, and every change is logged to ``deadline_changes``.
+    The caller owns the transaction (commit/rollback).
+
+    Args:
+        session: Open SQLAlchemy session
+        items: ConferenceItem-like mappings (key, name, homepage, url, source, deadlines)
+        identity: Optional identity map shared across batches; ids already cached
+            skip the lookup queries, and known sources skip the insert
+        run_id: Crawl/run identifier recorded on deadline change events
+        observed_at: When the items were fetched; timestamps change events and
+            history versions (defaults to now)
+
+    Returns:
+        IngestStats with the number of rows submitted per table
+    """
+    stats = IngestStats()
+    if identity is None:
+        identity = IdentityMap()
+
+    items = list(items)
+    stats.items = len(items)
+    # Last occurrence of a key wins, like sequential per-item processing
+    by_key: dict[str, Mapping[str, Any]] = {item["key"]: item for item in items}
+    if not by_key:
+        return stats
+
+    conference_rows = [
+        {"key": key, "name": item["name"], "homepage": item.get("homepage")}
+        for key, item in by_key.items()
+    ]
+    for chunk in _chunks(conference_rows):
+        stmt = dialect_insert(session, Conference)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Conference.key],
+            set_={
+                "name": stmt.excluded.name,
+                "homepage": func.coalesce(stmt.excluded.homepage, Conference.homepage),
+                "updated_at": func.now(),
+            },
+        )
+        session.execute(stmt, chunk)
+    stats.conferences = len(conference_rows)
+
+    conference_ids = identity.resolve_conferences(session, by_key)
+
+    # Every item contributes its own source, even when several share a key
+    source_rows: dict[tuple[int, str], dict[str, Any]] = {}
+    for item in items:
+        conf_id = conference_ids[item["key"]]
+        url = item.get("url")
+        if not url or (conf_id, url) in source_rows or identity.has_source(conf_id, url):
+            continue
+        source_rows[(conf_id, url)] = {
+            "conference_id": conf_id,
+            "url": url,
+            "notes": f"Scraped by {item.get('source', 'unknown')} on {item.get('scraped_at', '')}",
+        }
+    for chunk in _chunks(list(source_rows.values())):
+        stmt = dialect_insert(session, Source).on_conflict_do_nothing(
+            index_elements=[Source.conference_id, Source.url]
+        )
+        session.execute(stmt, chunk)
+    stats.sources = len(source_rows)
+
+    source_ids = identity.resolve_sources(
+        session, ((conference_ids[item["key"]], item["url"]) for item in items if item.get("url"))
+    )
+
+    deadline_rows: dict[tuple[int, str, date], dict[str, Any]] = {}
+    for item in items:
+        conf_id = conference_ids[item["key"]]
+        source_id = source_ids.get((conf_id, item.get("url")))
+        for deadline in item.get("deadlines") or []:
+            # Handle both due_at and due_date keys (for compatibility)
+            due = coerce_due_date(deadline.get("due_date") or deadline.get("due_at"))
+            if due is None:
+                stats.skipped_deadlines += 1
+                continue
+            kind = deadline.get("kind", "submission")
+            deadline_rows.setdefault(
+                (conf_id, kind, due),
+                {
+                    "conference_id": conf_id,
+                    "kind": kind,
+                    "due_date": due,
+                    "timezone": deadline.get("timezone"),
+                    "source_id": source_id,
+                },
+            )
+    stats.changes = apply_deadline_changes(
+        session, list(deadline_rows.values()), run_id=run_id, observed_at=observed_at
+    )
+    stats.deadlines = len(deadline_rows)
+
+    return stats
+
+
+def upsert_stream(
+    session: Session,
+    items: Iterable[Mapping[str, Any]],
+    batch_size: int = CHUNK_SIZE,
+    identity: IdentityMap | None = None,
+    run_id: str | None = None,
+) -> IngestStats:
+    """Upsert an item stream in batches of ``batch_size``, holding one batch at a time.
+
+    Each batch goes through ``upsert_items`` with a shared identity map; the
+    caller owns the transaction. A key repeated across batches is upserted by
+    each of them, so its last occurrence wins as within ``upsert_items``.
+
+    Returns:
+        IngestStats summed over all batches
+    """
+    if identity is None:
+        identity = IdentityMap()
+    total = IngestStats()
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        total.merge(upsert_items(session, batch, identity=identity, run_id=run_id))
+    return total
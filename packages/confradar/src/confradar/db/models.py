@@ -1,8 +1,19 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime, timezone
 
-from sqlalchemy import ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -14,12 +25,20 @@ class Conference(TimestampMixin, Base):
     key: Mapped[str] = mapped_column(String(64), nullable=False)  # canonical key, e.g., neurips
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     homepage: Mapped[str | None] = mapped_column(String(512))
+    # Parent conference of a workshop, set by confradar.resolution.workshops
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("conferences.id", ondelete="SET NULL"))
 
     __table_args__ = (
         UniqueConstraint("key", name="uq_conference_key"),
         Index("ix_conference_name", "name"),
+        Index("ix_conference_parent", "parent_id"),
     )
 
+    parent: Mapped[Conference | None] = relationship(
+        back_populates="workshops", remote_side="Conference.id"
+    )
+    workshops: Mapped[list[Conference]] = relationship(back_populates="parent")
+
     deadlines: Mapped[list[Deadline]] = relationship(
         back_populates="conference", cascade="all, delete-orphan"
     )
@@ -59,3 +78,282 @@ class Deadline(TimestampMixin, Base):
         UniqueConstraint("conference_id", "kind", "due_date", name="uq_deadline_unique"),
         Index("ix_deadline_due_date", "due_date"),
     )
+
+
+class DeadlineChange(Base):
+    """Append-only log of deadline changes detected between crawls.
+
+    One row per added, moved or removed deadline. Rows are never updated.
+    """
+
+    __tablename__ = "deadline_changes"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    conference_id: Mapped[int] = mapped_column(ForeignKey("conferences.id", ondelete="CASCADE"))
+    kind: Mapped[str] = mapped_column(String(64), nullable=False)
+    change: Mapped[str] = mapped_column(String(16), nullable=False)  # added, moved, removed
+    old_due_date: Mapped[date | None] = mapped_column()
+    new_due_date: Mapped[date | None] = mapped_column()
+    source_id: Mapped[int | None] = mapped_column(ForeignKey("sources.id", ondelete="SET NULL"))
+    run_id: Mapped[str | None] = mapped_column(String(128))  # crawl/run that observed it
+    detected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_deadline_change_conf_detected", "conference_id", "detected_at"),
+        Index("ix_deadline_change_detected", "detected_at"),
+    )
+
+
+# Open-ended validity for current history rows; a sentinel instead of NULL keeps
+# "valid_to > ts" range predicates index-friendly
+OPEN_END = datetime(9999, 12, 31, tzinfo=timezone.utc)
+
+
+class DeadlineHistory(Base):
+    """Versioned deadline values with validity ranges.
+
+    Each row is one value a deadline held during ``[valid_from, valid_to)``, in
+    crawl-observation time; ``recorded_at`` is when the row was written. The
+    current value has ``valid_to == OPEN_END``. Current-state reads stay on
+    ``deadlines``; this table answers "as of" and timeline questions.
+    """
+
+    __tablename__ = "deadline_history"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    conference_id: Mapped[int] = mapped_column(ForeignKey("conferences.id", ondelete="CASCADE"))
+    kind: Mapped[str] = mapped_column(String(64), nullable=False)
+    due_date: Mapped[date] = mapped_column(nullable=False)
+    timezone: Mapped[str | None] = mapped_column(String(64))
+    source_id: Mapped[int | None] = mapped_column(ForeignKey("sources.id", ondelete="SET NULL"))
+    valid_from: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    valid_to: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=OPEN_END
+    )
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        # Per-conference timelines and as-of lookups
+        Index("ix_deadline_history_conf_kind_from", "conference_id", "kind", "valid_from"),
+        # Whole-table as-of: seek on valid_to > ts, filter valid_from <= ts
+        Index("ix_deadline_history_valid", "valid_to", "valid_from"),
+    )
+
+
+class ConferenceAlias(TimestampMixin, Base):
+    """Maps a conference key produced by one spider to its canonical key.
+
+    Written by alias resolution (``confradar.resolution.aliases``). Keys are plain
+    strings so aliases can be recorded before every variant has been ingested.
+    """
+
+    __tablename__ = "conference_aliases"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    alias_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    canonical_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    method: Mapped[str] = mapped_column(String(32), nullable=False)  # e.g., minhash
+
+    __table_args__ = (
+        UniqueConstraint("alias_key", name="uq_conference_alias_key"),
+        Index("ix_conference_alias_canonical", "canonical_key"),
+    )
+
+
+class RawPage(Base):
+    """Index of archived raw pages; one row per fetch.
+
+    Bodies live in the content-addressed archive (``confradar.archive``) keyed
+    by ``sha256``; identical bodies across fetches share one blob.
+    """
+
+    __tablename__ = "raw_pages"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    url: Mapped[str] = mapped_column(String(800), nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[int] = mapped_column(nullable=False)
+    size: Mapped[int] = mapped_column(nullable=False)  # uncompressed bytes
+    source: Mapped[str | None] = mapped_column(String(64))  # scraper/spider name
+
+    __table_args__ = (
+        Index("ix_raw_page_url_fetched", "url", "fetched_at"),
+        Index("ix_raw_page_source_fetched", "source", "fetched_at"),
+        Index("ix_raw_page_sha256", "sha256"),
+    )
+
+
+class ReprocessCheckpoint(TimestampMixin, Base):
+    """Progress of a named reprocessing run over ``raw_pages``.
+
+    Written in the same transaction as each reprocessed batch
+    (``confradar.reprocess``), so a resumed run continues after the last
+    committed page.
+    """
+
+    __tablename__ = "reprocess_checkpoints"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(128), nullable=False)
+    source: Mapped[str] = mapped_column(String(64), nullable=False)
+    last_page_id: Mapped[int] = mapped_column(nullable=False, default=0)
+    pages: Mapped[int] = mapped_column(nullable=False, default=0)
+    items: Mapped[int] = mapped_column(nullable=False, default=0)
+    errors: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    __table_args__ = (UniqueConstraint("name", name="uq_reprocess_checkpoint_name"),)
+
+
+class ContentFingerprint(TimestampMixin, Base):
+    """Digests of a page's content at its last successful parse.
+
+    Maintained by the content gate (``confradar.content_gate``) so unchanged
+    pages skip parsing and database writes on later crawls.
+    """
+
+    __tablename__ = "content_fingerprints"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    url: Mapped[str] = mapped_column(String(800), nullable=False)
+    source: Mapped[str | None] = mapped_column(String(64))  # scraper/spider name
+    version: Mapped[str] = mapped_column(String(32), nullable=False, default="")  # parser version
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    simhash: Mapped[int] = mapped_column(BigInteger, nullable=False)  # signed 64-bit
+    numbers_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Requests the parse produced, as [url, callback name]; replayed when unchanged
+    follow_ups: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    parsed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("url", name="uq_content_fingerprint_url"),
+        Index("ix_content_fingerprint_source", "source"),
+    )
+
+
+class CrawlState(TimestampMixin, Base):
+    """Persistent frontier of a resumable spider (``confradar.frontier``).
+
+    ``status`` is "running" until a crawl finishes cleanly; a rerun of a
+    running crawl re-issues its pending ``crawl_requests`` and skips the pages
+    already parsed instead of starting over.
+    """
+
+    __tablename__ = "crawl_states"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    spider: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)  # running | finished
+    cursor: Mapped[str | None] = mapped_column(String(800))  # last page parsed
+    pages: Mapped[int] = mapped_column(nullable=False, default=0)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (UniqueConstraint("spider", name="uq_crawl_state_spider"),)
+
+
+class CrawlRequest(TimestampMixin, Base):
+    """A request of the current run of a resumable spider (``confradar.frontier``).
+
+    Pending until the page it fetches is parsed; a crawl that finishes deletes
+    its spider's rows.
+    """
+
+    __tablename__ = "crawl_requests"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    spider: Mapped[str] = mapped_column(String(64), nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)  # request fingerprint
+    # ``request_state`` of the request; None for pages not yielded by the spider (start URLs)
+    request: Mapped[dict | None] = mapped_column(JSON)
+    parsed: Mapped[bool] = mapped_column(nullable=False, default=False)
+
+    __table_args__ = (
+        UniqueConstraint("spider", "fingerprint", name="uq_crawl_request_spider_fingerprint"),
+    )
+
+
+class CrawlKey(TimestampMixin, Base):
+    """A listing (item) key seen by a resumable spider (``confradar.frontier``).
+
+    ``current`` while the unfinished run has seen it, ``known`` once a finished
+    run has; incremental crawls stop at pages that list only known keys.
+    """
+
+    __tablename__ = "crawl_keys"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    spider: Mapped[str] = mapped_column(String(64), nullable=False)
+    key: Mapped[str] = mapped_column(String(64), nullable=False)
+    known: Mapped[bool] = mapped_column(nullable=False, default=False)
+    current: Mapped[bool] = mapped_column(nullable=False, default=False)
+
+    __table_args__ = (UniqueConstraint("spider", "key", name="uq_crawl_key_spider_key"),)
+
+
+class SeenUrl(TimestampMixin, Base):
+    """Last fetch of a URL by a spider, across crawls (``confradar.seen_urls``).
+
+    Keyed by Scrapy request fingerprint; an on-disk Bloom filter in front of
+    this table answers "never fetched" without a query.
+    """
+
+    __tablename__ = "seen_urls"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    source: Mapped[str] = mapped_column(String(64), nullable=False)  # spider name
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)  # request fingerprint
+    url: Mapped[str] = mapped_column(String(800), nullable=False)
+    last_fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    fetch_count: Mapped[int] = mapped_column(nullable=False, default=1)
+
+    __table_args__ = (
+        UniqueConstraint("source", "fingerprint", name="uq_seen_url_source_fingerprint"),
+    )
+
+
+class RecrawlTarget(TimestampMixin, Base):
+    """A source URL with its next recrawl time (``confradar.recrawl``).
+
+    The recrawl interval follows the nearest upcoming deadline of the
+    conferences scraped from the URL; ``ix_recrawl_target_next`` serves the
+    "due now" scan in ``next_crawl_at`` order, like the top of a heap.
+    """
+
+    __tablename__ = "recrawl_targets"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    url: Mapped[str] = mapped_column(String(800), nullable=False)
+    spider: Mapped[str] = mapped_column(String(64), nullable=False)
+    nearest_due_date: Mapped[date | None] = mapped_column()
+    interval_s: Mapped[int] = mapped_column(nullable=False)
+    next_crawl_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_crawled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_run_id: Mapped[str | None] = mapped_column(String(128))
+
+    __table_args__ = (
+        UniqueConstraint("url", name="uq_recrawl_target_url"),
+        Index("ix_recrawl_target_next", "next_crawl_at"),
+    )
+
+
+class CrawlRun(Base):
+    """Performance of one scrape or store step of a crawl (``confradar.crawl_runs``).
+
+    One row per successful asset materialization, so throughput can be
+    compared across runs of the same asset and source.
+    """
+
+    __tablename__ = "crawl_runs"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    run_id: Mapped[str | None] = mapped_column(String(128))  # Dagster run
+    asset: Mapped[str] = mapped_column(String(64), nullable=False)
+    source: Mapped[str] = mapped_column(String(64), nullable=False)
+    partition: Mapped[str | None] = mapped_column(String(128))
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    wall_time_s: Mapped[float] = mapped_column(Float, nullable=False)
+    requests: Mapped[int] = mapped_column(nullable=False, default=0)
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cache_hit_ratio: Mapped[float | None] = mapped_column(Float)  # None without cache lookups
+    items: Mapped[int] = mapped_column(nullable=False, default=0)
+    items_per_s: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    db_rows: Mapped[int] = mapped_column(nullable=False, default=0)  # rows upserted
+    db_write_s: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        Index("ix_crawl_run_asset_source_finished", "asset", "source", "finished_at"),
+    )
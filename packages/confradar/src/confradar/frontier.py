@@ -0,0 +1,235 @@
+"""Persistent crawl frontier for resumable, incremental paginated crawls.
+
+A spider's frontier is one ``crawl_states`` row with the last page parsed
+(``cursor``); one ``crawl_requests`` row per request of the current run: the
+requests it has yielded but not parsed yet (``pending``, stored with
+``request_state``) and the request fingerprints of pages parsed (``seen``); and
+one ``crawl_keys`` row per listing key seen in this run or earlier finished
+ones. A flush only writes the requests, pages and keys added since the last
+one.
+``CrawlFrontierMiddleware`` keeps the frontier up to date while a spider runs.
+
+- Resume: a rerun of a crawl that did not finish starts from ``pending``
+  instead of the spider's start URLs, and drops requests for pages in ``seen``.
+- Incremental: once a page lists only keys seen in earlier finished runs, its
+  follow-up requests (the next pages) are dropped, assuming newest-first
+  listings.
+
+Example:
+    >>> frontier = CrawlFrontier("wikicfp")
+    >>> frontier.load(session)
+    >>> frontier.resuming
+    True
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from .db.ingest import dialect_insert
+from .db.models import CrawlKey, CrawlRequest, CrawlState
+
+RUNNING = "running"
+FINISHED = "finished"
+
+
+class CrawlFrontier:
+    """In-memory frontier of one spider, stored in ``crawl_states``, ``crawl_requests``
+    and ``crawl_keys``.
+
+    ``pending`` maps request fingerprints to ``request_state`` dicts (or the
+    ``[url, callback]`` pairs stored by earlier versions).
+    """
+
+    def __init__(self, spider: str):
+        self.spider = spider
+        self.status = FINISHED
+        self.pending: dict[str, Any] = {}
+        self.seen: set[str] = set()
+        self.cursor: str | None = None
+        self.pages = 0
+        self.run_keys: set[str] = set()
+        self.known_keys: set[str] = set()
+        self.started_at = datetime.now(timezone.utc)
+        self.finished_at: datetime | None = None
+        self.resuming = False
+        self.dirty = False
+        # Changes since the last flush. ``_reset`` drops the stored requests and
+        # ``_stale_keys`` the keys of an earlier unfinished run; ``_finishing`` is
+        # the ``incremental`` flag of an unflushed finish
+        self._enqueued: dict[str, Any] = {}
+        self._parsed: set[str] = set()
+        self._new_keys: set[str] = set()
+        self._finishing: bool | None = None
+        self._reset = False
+        self._stale_keys = False
+
+    def load(self, session: Session) -> bool:
+        """Load the stored state; returns True if an unfinished crawl is resumed.
+
+        Without an unfinished crawl, a new run starts with the stored known keys;
+        requests and keys left by an earlier run are dropped on the first flush.
+        """
+        state = session.scalar(select(CrawlState).where(CrawlState.spider == self.spider))
+        requests, keys = [], []
+        if state is not None:
+            keys = session.execute(
+                select(CrawlKey.key, CrawlKey.known, CrawlKey.current).where(
+                    CrawlKey.spider == self.spider
+                )
+            ).all()
+            self.known_keys = {key for key, known, _ in keys if known}
+            if state.status == RUNNING:
+                requests = session.execute(
+                    select(CrawlRequest.fingerprint, CrawlRequest.request, CrawlRequest.parsed)
+                    .where(CrawlRequest.spider == self.spider)
+                    .order_by(CrawlRequest.id)
+                ).all()
+        if requests:
+            self.status = RUNNING
+            self.pending = {fp: request for fp, request, parsed in requests if not parsed}
+            self.seen = {fp for fp, _, parsed in requests if parsed}
+            self.cursor = state.cursor
+            self.pages = state.pages
+            self.run_keys = {key for key, _, current in keys if current}
+            self.started_at = state.started_at
+            self.resuming = True
+        else:
+            self.status = RUNNING
+            self.started_at = datetime.now(timezone.utc)
+            self._reset = self._stale_keys = True
+        self.dirty = True
+        return self.resuming
+
+    def enqueue(self, fingerprint: str, request: dict[str, Any]) -> bool:
+        """Add a yielded request (its ``request_state``).
+
+        Returns False if its page was already parsed this run.
+        """
+        if fingerprint in self.seen:
+            return False
+        self.pending[fingerprint] = request
+        self._enqueued[fingerprint] = request
+        self.dirty = True
+        return True
+
+    def page_done(self, fingerprint: str, url: str, keys: Iterable[str] = ()) -> None:
+        """Mark the page fetched by a request as parsed, with the listing keys it yielded."""
+        self.pending.pop(fingerprint, None)
+        self.seen.add(fingerprint)
+        self._parsed.add(fingerprint)
+        self.cursor = url
+        self.pages += 1
+        new_keys = set(keys) - self.run_keys
+        self.run_keys |= new_keys
+        self._new_keys |= new_keys
+        self.dirty = True
+
+    def all_known(self, keys: Iterable[str]) -> bool:
+        """True if ``keys`` is non-empty and every key was seen in an earlier finished run."""
+        keys = set(keys)
+        return bool(keys) and keys <= self.known_keys
+
+    def finish(self, incremental: bool = False) -> None:
+        """Mark the crawl finished; the next run starts fresh.
+
+        A full crawl replaces the known keys with this run's; an incremental one
+        (which stops early) adds to them.
+        """
+        self.known_keys = self.known_keys | self.run_keys if incremental else set(self.run_keys)
+        self.status = FINISHED
+        self.pending = {}
+        self.seen = set()
+        self.run_keys = set()
+        self.finished_at = datetime.now(timezone.utc)
+        self._enqueued, self._parsed = {}, set()
+        self._finishing, self._reset = incremental, True
+        self.dirty = True
+
+    def flush(self, session: Session) -> None:
+        """Write the changes since the last flush; the caller owns the transaction."""
+        self._flush_keys(session)
+        table = CrawlRequest.__table__
+        if self._reset:
+            session.execute(delete(table).where(table.c.spider == self.spider))
+        if self._enqueued:
+            stmt = dialect_insert(session, table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["spider", "fingerprint"],
+                set_={"request": stmt.excluded.request, "updated_at": func.now()},
+            )
+            session.execute(
+                stmt,
+                [
+                    {"spider": self.spider, "fingerprint": fp, "request": request, "parsed": False}
+                    for fp, request in self._enqueued.items()
+                ],
+            )
+        if self._parsed:
+            # Start URLs were never enqueued, so their rows are created here
+            stmt = dialect_insert(session, table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["spider", "fingerprint"],
+                set_={"parsed": True, "updated_at": func.now()},
+            )
+            session.execute(
+                stmt,
+                [
+                    {"spider": self.spider, "fingerprint": fp, "request": None, "parsed": True}
+                    for fp in sorted(self._parsed)
+                ],
+            )
+
+        row = {
+            "spider": self.spider,
+            "status": self.status,
+            "cursor": self.cursor,
+            "pages": self.pages,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        stmt = dialect_insert(session, CrawlState.__table__).values(**row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["spider"],
+            set_={**{k: v for k, v in row.items() if k != "spider"}, "updated_at": func.now()},
+        )
+        session.execute(stmt)
+        self._enqueued, self._parsed, self._reset = {}, set(), False
+        self.dirty = False
+
+    def _flush_keys(self, session: Session) -> None:
+        """Add this run's new keys; on finish, make them the known keys."""
+        table = CrawlKey.__table__
+        spider = table.c.spider == self.spider
+        if self._stale_keys:
+            session.execute(delete(table).where(spider, table.c.known.is_(False)))
+            session.execute(
+                update(table).where(spider, table.c.current.is_(True)).values(current=False)
+            )
+        if self._new_keys:
+            stmt = dialect_insert(session, table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["spider", "key"],
+                set_={"current": True, "updated_at": func.now()},
+            )
+            session.execute(
+                stmt,
+                [
+                    {"spider": self.spider, "key": key, "known": False, "current": True}
+                    for key in sorted(self._new_keys)
+                ],
+            )
+        if self._finishing is not None:
+            if not self._finishing:  # a full crawl forgets keys it no longer lists
+                session.execute(delete(table).where(spider, table.c.current.is_(False)))
+            session.execute(
+                update(table)
+                .where(spider, table.c.current.is_(True))
+                .values(known=True, current=False, updated_at=func.now())
+            )
+        self._new_keys, self._finishing, self._stale_keys = set(), None, False
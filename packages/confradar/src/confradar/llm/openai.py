@@ -5,7 +5,7 @@ from typing import Any
 
 from litellm import completion, completion_cost
 
-from ..settings import settings
+from ..settings import get_settings
 from .base import LLMClient
 from .types import LLMResponse
 
@@ -18,6 +18,7 @@ class OpenAIClient(LLMClient):
     """
 
     def __init__(self, api_key: str | None = None, base_url: str | None = None) -> None:
+        settings = get_settings()
         key = api_key or settings.openai_api_key
         if not key:
             raise RuntimeError(
@@ -50,7 +51,7 @@ class OpenAIClient(LLMClient):
             attempt += 1
             try:
                 resp = completion(
-                    model=model or settings.llm_model,
+                    model=model or get_settings().llm_model,
                     messages=messages,  # type: ignore[arg-type]
                     max_tokens=max_tokens,
                     temperature=temperature,
@@ -61,7 +62,7 @@ class OpenAIClient(LLMClient):
                 choices = getattr(resp, "choices", None) or resp.get("choices", [])
                 usage = getattr(resp, "usage", None) or resp.get("usage", {})
                 model_name = getattr(resp, "model", None) or resp.get(
-                    "model", model or settings.llm_model
+                    "model", model or get_settings().llm_model
                 )
                 text = ""
                 if choices:
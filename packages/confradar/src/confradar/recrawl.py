@@ -0,0 +1,222 @@
+"""Deadline-proximity recrawl scheduling.
+
+Each source URL (a ``sources`` row) is recrawled at an interval set by the
+nearest upcoming deadline of the conferences scraped from it:
+
+- hourly when a deadline is at most a week away
+- daily when one is at most a month away
+- weekly otherwise, and when no deadline is upcoming
+
+``refresh_targets`` keeps one ``recrawl_targets`` row per URL with its next
+recrawl time; ``due_targets`` reads the URLs due now in ``next_crawl_at``
+order from its index. The Dagster sensor ``deadline_recrawl_sensor`` launches a
+``recrawl_job`` run per spider for just those URLs, and the run calls
+``mark_crawled`` afterwards.
+
+Only spiders with ``recrawlable = True`` take part; they must crawl whatever
+``start_urls`` they are given. Targets are assigned to a spider by URL host,
+using its ``allowed_domains``.
+
+Example:
+    >>> refresh_targets(session)
+    >>> [t.url for t in due_by_spider(session).get("wikicfp", [])]
+    ['http://www.wikicfp.com/cfp/call?conference=acl']
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .db.ingest import CHUNK_SIZE, dialect_insert
+from .db.models import Deadline, RecrawlTarget, Source
+
+HOURLY = timedelta(hours=1)
+DAILY = timedelta(days=1)
+WEEKLY = timedelta(weeks=1)
+
+
+def recrawl_interval(nearest_due: date | None, today: date) -> timedelta:
+    """Recrawl interval for a URL whose nearest upcoming deadline is ``nearest_due``."""
+    if nearest_due is None or nearest_due < today:
+        return WEEKLY
+    days = (nearest_due - today).days
+    if days <= 7:
+        return HOURLY
+    if days <= 30:
+        return DAILY
+    return WEEKLY
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def recrawl_spiders() -> dict[str, list[str]]:
+    """Allowed domains of the registered spiders that support targeted recrawls."""
+    from .scrapers.registry import spiders
+
+    domains = {}
+    for name in spiders:
+        spider_cls = spiders.load(name)
+        if getattr(spider_cls, "recrawlable", False):
+            domains[name] = list(getattr(spider_cls, "allowed_domains", None) or [])
+    return domains
+
+
+def spider_for_url(url: str, domains: dict[str, list[str]]) -> str | None:
+    """The spider whose allowed domains cover ``url``'s host, if any."""
+    host = (urlsplit(url).hostname or "").lower()
+    for name, allowed in sorted(domains.items()):
+        if any(host == d or host.endswith(f".{d}") for d in allowed):
+            return name
+    return None
+
+
+@dataclass
+class RefreshStats:
+    """Outcome of one ``refresh_targets`` call."""
+
+    urls: int = 0
+    added: int = 0
+    rescheduled: int = 0  # existing targets whose interval changed
+    unassigned: int = 0  # URLs no recrawlable spider covers
+
+
+def refresh_targets(
+    session: Session,
+    now: datetime | None = None,
+    domains: dict[str, list[str]] | None = None,
+) -> RefreshStats:
+    """Add targets for new source URLs and recompute every target's interval.
+
+    A new target is first due one interval from now (it was just crawled). An
+    existing one keeps its last crawl time as the anchor, so a deadline moving
+    closer pulls its next recrawl forward. The caller owns the transaction.
+    """
+    now = now or datetime.now(timezone.utc)
+    today = now.date()
+    domains = recrawl_spiders() if domains is None else domains
+    stats = RefreshStats()
+
+    nearest = (
+        select(
+            Source.url,
+            func.min(Deadline.due_date).filter(Deadline.due_date >= today).label("due"),
+        )
+        .outerjoin(Deadline, Deadline.conference_id == Source.conference_id)
+        .where(Source.url != "")
+        .group_by(Source.url)
+    )
+    existing = {t.url: t for t in session.scalars(select(RecrawlTarget))}
+    rows = []
+    for url, due in session.execute(nearest):
+        stats.urls += 1
+        target = existing.get(url)
+        spider = target.spider if target is not None else spider_for_url(url, domains)
+        if spider is None:
+            stats.unassigned += 1
+            continue
+        interval = recrawl_interval(due, today)
+        if target is None:
+            stats.added += 1
+            next_crawl_at = now + interval
+        elif target.interval_s == int(interval.total_seconds()):
+            # Same band: keep the schedule, only record a moved deadline
+            if target.nearest_due_date == due:
+                continue
+            next_crawl_at = target.next_crawl_at
+        else:
+            stats.rescheduled += 1
+            anchor = target.last_crawled_at or (
+                target.next_crawl_at - timedelta(seconds=target.interval_s)
+            )
+            next_crawl_at = _aware(anchor) + interval
+        rows.append(
+            {
+                "url": url,
+                "spider": spider,
+                "nearest_due_date": due,
+                "interval_s": int(interval.total_seconds()),
+                "next_crawl_at": next_crawl_at,
+            }
+        )
+
+    for start in range(0, len(rows), CHUNK_SIZE):
+        stmt = dialect_insert(session, RecrawlTarget.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["url"],
+            set_={
+                "nearest_due_date": stmt.excluded.nearest_due_date,
+                "interval_s": stmt.excluded.interval_s,
+                "next_crawl_at": stmt.excluded.next_crawl_at,
+                "updated_at": func.now(),
+            },
+        )
+        session.execute(stmt, rows[start : start + CHUNK_SIZE])
+    return stats
+
+
+def due_targets(
+    session: Session, now: datetime | None = None, limit: int | None = None
+) -> list[RecrawlTarget]:
+    """Targets due at ``now``, earliest first."""
+    now = now or datetime.now(timezone.utc)
+    stmt = (
+        select(RecrawlTarget)
+        .where(RecrawlTarget.next_crawl_at <= now)
+        .order_by(RecrawlTarget.next_crawl_at, RecrawlTarget.id)
+        .limit(limit)
+    )
+    return list(session.scalars(stmt))
+
+
+def due_by_spider(
+    session: Session, now: datetime | None = None, limit: int | None = None
+) -> dict[str, list[RecrawlTarget]]:
+    """Targets due at ``now`` grouped by spider, earliest first within each spider."""
+    grouped: dict[str, list[RecrawlTarget]] = {}
+    for target in due_targets(session, now, limit):
+        grouped.setdefault(target.spider, []).append(target)
+    return grouped
+
+
+def mark_crawled(
+    session: Session,
+    urls: Iterable[str],
+    now: datetime | None = None,
+    run_id: str | None = None,
+) -> int:
+    """Record a recrawl of ``urls`` and schedule each one interval later; returns the count."""
+    now = now or datetime.now(timezone.utc)
+    urls = list(urls)
+    updated = 0
+    for start in range(0, len(urls), CHUNK_SIZE):
+        chunk = urls[start : start + CHUNK_SIZE]
+        for target in session.scalars(select(RecrawlTarget).where(RecrawlTarget.url.in_(chunk))):
+            target.last_crawled_at = now
+            target.next_crawl_at = now + timedelta(seconds=target.interval_s)
+            target.last_run_id = run_id
+            updated += 1
+    session.flush()
+    return updated
+
+
+def run_key(spider: str, targets: Iterable[RecrawlTarget], now: datetime | None = None) -> str:
+    """Key of a due batch for one sensor hour.
+
+    The same batch is not relaunched on later ticks of the same hour; if its run
+    failed, the next hour launches it again.
+    """
+    now = now or datetime.now(timezone.utc)
+    digest = hashlib.sha256()
+    for target in sorted(targets, key=lambda t: t.url):
+        digest.update(f"{target.url}\t{_aware(target.next_crawl_at).isoformat()}\n".encode())
+    return f"recrawl:{spider}:{now:%Y%m%d%H}:{digest.hexdigest()[:16]}"
@@ -0,0 +1 @@
+"""Entity resolution for conferences scraped from several sources."""
@@ -0,0 +1,311 @@
+"""Resolve conference keys produced by different spiders to canonical keys.
+
+Spiders derive ``Conference.key`` with different heuristics (ACL Web takes the
+longest acronym, WikiCFP/ELRA/ChairingTool the first one, keys without a year get
+an md5 suffix), so one conference can be stored under several keys. Resolution:
+
+1. Blocking: MinHash signatures of normalized-name character shingles are banded
+   with LSH; records sharing a ``(key acronym, year)`` block are added too.
+2. Scoring: candidate pairs are scored on name similarity, shared acronyms and
+   homepage host. Pairs with conflicting years are rejected.
+3. Clustering: accepted pairs are merged with union-find; each cluster keeps one
+   canonical key and the other keys become aliases in ``conference_aliases``.
+
+Example:
+    >>> matches, stats = resolve_aliases(load_name_records(session))
+    >>> write_aliases(session, matches)
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import combinations
+from urllib.parse import urlsplit
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..db.ingest import CHUNK_SIZE, dialect_insert
+from ..db.models import Conference, ConferenceAlias
+from .minhash import MinHasher, Signature, lsh_candidate_pairs, shingles, similarity
+
+METHOD = "minhash"
+
+# Character shingle length
+SHINGLE_SIZE = 3
+
+# Score weights; identical names alone reach the default threshold, a shared
+# acronym or homepage host lowers the name similarity needed
+NAME_WEIGHT = 0.6
+ACRONYM_WEIGHT = 0.25
+DOMAIN_WEIGHT = 0.15
+DEFAULT_THRESHOLD = 0.6
+
+# Blocks larger than this are paired with their first member only (see lsh_candidate_pairs)
+MAX_BLOCK = 100
+
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+_ORDINAL_RE = re.compile(r"\b\d+(?:st|nd|rd|th)\b")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_ACRONYM_RE = re.compile(r"\b[A-Z][A-Z0-9-]*[A-Z0-9]\b")
+_KEY_RE = re.compile(r"^([a-z]+)[a-z0-9-]*?(\d{2})?(?:_[0-9a-f]{4})?$")
+
+# Words shared by most conference names; dropping them before shingling keeps
+# unrelated names out of each other's LSH buckets
+STOPWORDS = frozenset(
+    "a an and annual at conference for in international meeting of on symposium the "
+    "to workshop".split()
+)
+
+
+@dataclass(frozen=True)
+class NameRecord:
+    """A conference key with the attributes used for matching."""
+
+    key: str
+    name: str
+    homepage: str | None = None
+
+
+@dataclass(frozen=True)
+class AliasMatch:
+    """One alias: ``alias_key`` resolves to ``canonical_key``."""
+
+    alias_key: str
+    canonical_key: str
+    score: float
+
+
+@dataclass
+class ResolutionStats:
+    """Counters for one resolution run."""
+
+    records: int = 0
+    candidates: int = 0
+    matched_pairs: int = 0
+    aliases: int = 0
+    elapsed_s: float = 0.0
+
+
+@dataclass(frozen=True)
+class _Features:
+    key_acronym: str | None
+    acronyms: frozenset[str]
+    year: int | None
+    host: str | None
+    signature: Signature
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a conference name and drop years, ordinals, punctuation and stopwords."""
+    text = _ORDINAL_RE.sub(" ", _YEAR_RE.sub(" ", name.lower()))
+    return " ".join(w for w in _NON_ALNUM_RE.split(text) if w and w not in STOPWORDS)
+
+
+def extract_year(key: str, name: str) -> int | None:
+    """Return the edition year from the name, or from a two-digit key suffix."""
+    found = _YEAR_RE.search(name)
+    if found:
+        return int(found.group())
+    match = _KEY_RE.match(key)
+    if match and match.group(2):
+        return 2000 + int(match.group(2))
+    return None
+
+
+def extract_acronyms(name: str) -> frozenset[str]:
+    """Return the uppercase acronyms in a conference name, lowercased."""
+    return frozenset(
+        a.lower().replace("-", "") for a in _ACRONYM_RE.findall(name) if not a.isdigit()
+    )
+
+
+def key_acronym(key: str) -> str | None:
+    """Return the leading acronym of a spider-generated key (``acl25`` -> ``acl``)."""
+    match = _KEY_RE.match(key)
+    return match.group(1) if match else None
+
+
+def homepage_host(url: str | None) -> str | None:
+    """Return the homepage host without a leading ``www.``."""
+    if not url:
+        return None
+    host = urlsplit(url if "//" in url else f"//{url}").hostname
+    if not host:
+        return None
+    return host.removeprefix("www.")
+
+
+def _features(record: NameRecord, hasher: MinHasher) -> _Features:
+    prefix = key_acronym(record.key)
+    acronyms = extract_acronyms(record.name)
+    if prefix:
+        acronyms |= {prefix}
+    return _Features(
+        key_acronym=prefix,
+        acronyms=acronyms,
+        year=extract_year(record.key, record.name),
+        host=homepage_host(record.homepage),
+        signature=hasher.signature(shingles(normalize_name(record.name), SHINGLE_SIZE)),
+    )
+
+
+def score_pair(a: _Features, b: _Features) -> float:
+    """Score how likely two records are the same conference edition (0..1)."""
+    if a.year is not None and b.year is not None and a.year != b.year:
+        return 0.0
+    score = NAME_WEIGHT * similarity(a.signature, b.signature)
+    if a.acronyms & b.acronyms:
+        score += ACRONYM_WEIGHT
+    if a.host is not None and a.host == b.host:
+        score += DOMAIN_WEIGHT
+    return score
+
+
+def _canonical_order(key: str) -> tuple[bool, int, str]:
+    # Prefer keys with a year suffix and no hash, then the shortest
+    match = _KEY_RE.match(key)
+    has_year = bool(match and match.group(2))
+    return (not has_year, len(key), key)
+
+
+def resolve_aliases(
+    records: Iterable[NameRecord],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = 64,
+    bands: int = 8,
+) -> tuple[list[AliasMatch], ResolutionStats]:
+    """Find keys that refer to the same conference.
+
+    Args:
+        records: Records to resolve; duplicate keys keep the first record
+        threshold: Minimum pair score to merge two keys
+        num_perm: MinHash signature length
+        bands: LSH bands; ``num_perm / bands`` rows per band. The default 8x8
+            makes pairs with name similarity above ~0.75 likely candidates
+
+    Returns:
+        Tuple of (alias matches sorted by alias key, stats)
+    """
+    started = time.perf_counter()
+    unique: dict[str, NameRecord] = {}
+    for record in records:
+        unique.setdefault(record.key, record)
+    keys = list(unique)
+    stats = ResolutionStats(records=len(keys))
+
+    hasher = MinHasher(num_perm=num_perm)
+    features = [_features(unique[k], hasher) for k in keys]
+
+    candidates = lsh_candidate_pairs([f.signature for f in features], bands=bands)
+    blocks: dict[tuple[str, int | None], list[int]] = defaultdict(list)
+    for idx, f in enumerate(features):
+        if f.key_acronym:
+            blocks[(f.key_acronym, f.year)].append(idx)
+    for members in blocks.values():
+        if len(members) > MAX_BLOCK:
+            candidates.update((members[0], other) for other in members[1:])
+        else:
+            candidates.update(combinations(members, 2))
+    stats.candidates = len(candidates)
+
+    parent = list(range(len(keys)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    accepted = []
+    for i, j in candidates:
+        score = score_pair(features[i], features[j])
+        if score >= threshold:
+            accepted.append((score, min(i, j), max(i, j)))
+    stats.matched_pairs = len(accepted)
+
+    # Merge best pairs first; a cluster never spans two known years, so a key
+    # without a year can't chain two editions together
+    years = [f.year for f in features]
+    best: dict[int, float] = {}
+    for score, i, j in sorted(accepted, key=lambda p: (-p[0], p[1], p[2])):
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            continue
+        year_i, year_j = years[root_i], years[root_j]
+        if year_i is not None and year_j is not None and year_i != year_j:
+            continue
+        parent[root_j] = root_i
+        years[root_i] = year_i if year_i is not None else year_j
+        best[i] = max(best.get(i, 0.0), score)
+        best[j] = max(best.get(j, 0.0), score)
+
+    clusters: dict[int, list[int]] = defaultdict(list)
+    for idx in best:
+        clusters[find(idx)].append(idx)
+
+    matches: list[AliasMatch] = []
+    for members in clusters.values():
+        canonical = min((keys[i] for i in members), key=_canonical_order)
+        matches.extend(
+            AliasMatch(alias_key=keys[i], canonical_key=canonical, score=round(best[i], 4))
+            for i in members
+            if keys[i] != canonical
+        )
+    matches.sort(key=lambda m: m.alias_key)
+    stats.aliases = len(matches)
+    stats.elapsed_s = time.perf_counter() - started
+    return matches, stats
+
+
+def load_name_records(session: Session) -> list[NameRecord]:
+    """Load every stored conference as a ``NameRecord``."""
+    rows = session.execute(select(Conference.key, Conference.name, Conference.homepage))
+    return [NameRecord(key=k, name=n, homepage=h) for k, n, h in rows]
+
+
+def write_aliases(session: Session, matches: list[AliasMatch], method: str = METHOD) -> int:
+    """Upsert alias matches into ``conference_aliases``.
+
+    Args:
+        session: Open session; the caller owns the transaction
+        matches: Output of ``resolve_aliases``
+        method: Resolution method recorded with each alias
+
+    Returns:
+        Number of rows written
+    """
+    rows = [
+        {
+            "alias_key": m.alias_key,
+            "canonical_key": m.canonical_key,
+            "score": m.score,
+            "method": method,
+        }
+        for m in matches
+    ]
+    for start in range(0, len(rows), CHUNK_SIZE):
+        stmt = dialect_insert(session, ConferenceAlias.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["alias_key"],
+            set_={
+                "canonical_key": stmt.excluded.canonical_key,
+                "score": stmt.excluded.score,
+                "method": stmt.excluded.method,
+                "updated_at": func.now(),
+            },
+        )
+        session.execute(stmt, rows[start : start + CHUNK_SIZE])
+    return len(rows)
+
+
+def canonical_key(session: Session, key: str) -> str:
+    """Return the canonical key for ``key`` (``key`` itself if it has no alias)."""
+    found = session.scalar(
+        select(ConferenceAlias.canonical_key).where(ConferenceAlias.alias_key == key)
+    )
+    return found or key
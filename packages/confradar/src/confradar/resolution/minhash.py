@@ -0,0 +1,124 @@
+"""MinHash signatures and LSH banding for near-duplicate detection.
+
+Signatures use one-permutation hashing: every shingle is hashed once (hashes are
+cached, names share most of their shingles) and dropped into one of ``num_perm``
+bins, keeping the minimum per bin. Empty bins borrow from a filled bin chosen by
+a fixed random probe sequence per bin ("optimal densification"; borrowing from
+the next bin instead makes short names collide in whole LSH bands), so a
+signature costs O(shingles) instead of O(shingles x num_perm). Banding the signatures finds candidate pairs without
+comparing every name with every other one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from itertools import combinations
+from operator import eq
+
+_MASK64 = (1 << 64) - 1
+
+Signature = tuple[int, ...]
+
+
+def shingles(text: str, k: int = 3) -> set[str]:
+    """Return the character ``k``-shingles of ``text``, padded with spaces."""
+    padded = f" {text} "
+    if len(padded) <= k:
+        return {padded}
+    return {padded[i : i + k] for i in range(len(padded) - k + 1)}
+
+
+class MinHasher:
+    """Computes one-permutation MinHash signatures of length ``num_perm``.
+
+    Args:
+        num_perm: Signature length (number of bins)
+        seed: Hash seed; equal seeds give comparable signatures
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        if num_perm < 1 or num_perm & (num_perm - 1):
+            raise ValueError(f"num_perm must be a power of two, got {num_perm}")
+        self.num_perm = num_perm
+        self._key = seed.to_bytes(8, "little")
+        rng = random.Random(seed)
+        self._probes = [rng.sample(range(num_perm), num_perm) for _ in range(num_perm)]
+        self._cache: dict[str, int] = {}
+        self._empty: Signature = (_MASK64,) * num_perm
+
+    def _hash(self, token: str) -> int:
+        digest = hashlib.blake2b(token.encode(), digest_size=8, key=self._key).digest()
+        return int.from_bytes(digest, "little")
+
+    def signature(self, tokens: Iterable[str]) -> Signature:
+        """Return the MinHash signature of a set of tokens (e.g., shingles)."""
+        cache = self._cache
+        tokens = list(tokens)
+        for token in tokens:
+            if token not in cache:
+                cache[token] = self._hash(token)
+        if not tokens:
+            return self._empty
+
+        # Low bits pick the bin; hashes in one bin share them, so the full hash
+        # orders like the remaining bits. Smaller hashes are written last: min per bin
+        n = self.num_perm
+        hashes = sorted(map(cache.__getitem__, tokens), reverse=True)
+        bins = dict(zip(map((n - 1).__and__, hashes), hashes, strict=True))
+        sig = list(map(bins.get, range(n)))
+        if len(bins) < n:
+            for i, value in enumerate(sig):
+                if value is None:
+                    for j in self._probes[i]:
+                        if j in bins:
+                            sig[i] = bins[j]
+                            break
+        return tuple(sig)  # type: ignore[arg-type]
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimate the Jaccard similarity of the sets behind two signatures."""
+    return sum(map(eq, a, b)) / len(a)
+
+
+def lsh_candidate_pairs(
+    signatures: Sequence[Signature], bands: int, max_bucket: int = 100
+) -> set[tuple[int, int]]:
+    """Return index pairs whose signatures agree on at least one band.
+
+    With ``r = len(signature) / bands`` rows per band, pairs with Jaccard
+    similarity ``s`` become candidates with probability ``1 - (1 - s**r)**bands``.
+
+    Args:
+        signatures: Equal-length signatures
+        bands: Number of bands; must divide the signature length
+        max_bucket: Buckets larger than this are paired with their first member
+            only, instead of all-pairs, to stay sub-quadratic on very common names
+
+    Returns:
+        Set of ``(i, j)`` pairs with ``i < j``
+    """
+    if not signatures:
+        return set()
+    rows, remainder = divmod(len(signatures[0]), bands)
+    if remainder:
+        raise ValueError(f"{bands} bands do not divide signature length {len(signatures[0])}")
+
+    pairs: set[tuple[int, int]] = set()
+    for band in range(bands):
+        start = band * rows
+        buckets: dict[Signature, list[int]] = defaultdict(list)
+        for idx, sig in enumerate(signatures):
+            buckets[sig[start : start + rows]].append(idx)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) > max_bucket:
+                first = members[0]
+                pairs.update((first, other) for other in members[1:])
+            else:
+                pairs.update(combinations(members, 2))
+    return pairs
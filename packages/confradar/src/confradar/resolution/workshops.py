@@ -0,0 +1,353 @@
+"""Link workshops to their parent conference.
+
+Every conference is indexed in inverted indexes (postings) on acronym tokens,
+homepage registrable domain and event year (and month, when the name mentions
+one). A workshop is compared only with conferences that share an acronym or
+domain posting, restricted to the workshop's year posting, instead of with every
+conference. The best candidate above a threshold becomes ``Conference.parent_id``.
+
+The index is incremental: ``WorkshopLinker.add`` indexes newly scraped
+conferences and workshops, and returns the links they create, including
+workshops seen earlier whose parent only appears now. ``link_workshops`` with
+``conference_ids`` only loads the stored rows that can share an acronym or
+domain posting with the new ones.
+
+Example:
+    >>> stats = link_workshops(session, conference_ids=new_ids)
+    >>> session.commit()
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..db.models import Conference
+from .aliases import extract_acronyms, extract_year, homepage_host, key_acronym
+
+# Score for a shared acronym; higher when the workshop names it as its host
+# ("@ ACL 2025", "co-located with ACL"). A shared acronym or domain alone, even
+# in the same year, needs one more signal to reach the default threshold
+ACRONYM_SCORE = 0.3
+HOST_ACRONYM_SCORE = 0.55
+DOMAIN_SCORE = 0.35
+YEAR_SCORE = 0.15
+MONTH_SCORE = 0.1
+DEFAULT_THRESHOLD = 0.5
+
+# Postings longer than this are too common to discriminate (e.g., "nlp")
+MAX_POSTINGS = 500
+# Posting filters per query when loading stored rows (SQLite limits expression depth)
+FILTER_CHUNK = 200
+
+# Field-wide acronyms that name no particular event
+GENERIC_ACRONYMS = frozenset({"acm", "ai", "cv", "ieee", "ml", "nlp"})
+
+# Hosting domains shared by unrelated events; never used as domain postings
+SHARED_DOMAINS = frozenset(
+    {
+        "easychair.org",
+        "github.io",
+        "google.com",
+        "openreview.net",
+        "softconf.com",
+        "wikicfp.com",
+    }
+)
+
+_WORKSHOP_RE = re.compile(r"\bworkshops?\b|\bws\b", re.IGNORECASE)
+# "ws" as its own key token (ws-sigdial, acl-ws25, lrec_ws), not a prefix of wsdm or wsc
+_WORKSHOP_KEY_RE = re.compile(r"(?:^|[-_])ws(?=$|[-_\d])", re.IGNORECASE)
+_HOST_RE = re.compile(
+    r"(?:@|\bat\b|co-?located with|in conjunction with|held with)\s+(?:the\s+)?([A-Za-z][\w-]*)",
+    re.IGNORECASE,
+)
+_MONTH_RE = re.compile(
+    r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(?:\d{1,2}(?:-\d{1,2})?,?\s+)?"
+    r"((?:19|20)\d{2})\b",
+    re.IGNORECASE,
+)
+_MONTHS = {m: i for i, m in enumerate("jan feb mar apr may jun jul aug sep oct nov dec".split(), 1)}
+_SECOND_LEVEL = frozenset({"ac", "co", "com", "edu", "gov", "net", "org"})
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """A stored conference or workshop with the attributes used for linking."""
+
+    id: int
+    key: str
+    name: str
+    homepage: str | None = None
+
+
+@dataclass
+class LinkStats:
+    """Counters for one linking run."""
+
+    conferences: int = 0
+    workshops: int = 0
+    candidates: int = 0
+    linked: int = 0
+
+
+@dataclass(frozen=True)
+class _Event:
+    record: EventRecord
+    is_workshop: bool
+    acronyms: frozenset[str]
+    host_acronyms: frozenset[str]
+    tokens: frozenset[str]  # acronym postings
+    domain: str | None
+    year: int | None
+    month: int | None
+
+
+@dataclass
+class _Postings:
+    acronym: dict[str, set[int]] = field(default_factory=lambda: defaultdict(set))
+    domain: dict[str, set[int]] = field(default_factory=lambda: defaultdict(set))
+    year: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+    dated: set[int] = field(default_factory=set)
+
+    def add(self, event: _Event) -> None:
+        event_id = event.record.id
+        for token in event.tokens:
+            self.acronym[token].add(event_id)
+        if event.domain:
+            self.domain[event.domain].add(event_id)
+        if event.year is not None:
+            self.year[event.year].add(event_id)
+            self.dated.add(event_id)
+
+    def discard(self, event: _Event) -> None:
+        event_id = event.record.id
+        for token in event.tokens:
+            self.acronym[token].discard(event_id)
+        if event.domain:
+            self.domain[event.domain].discard(event_id)
+        if event.year is not None:
+            self.year[event.year].discard(event_id)
+            self.dated.discard(event_id)
+
+    def candidates(self, event: _Event) -> set[int]:
+        """Ids sharing an acronym or domain posting, and the year posting if dated."""
+        found: set[int] = set()
+        for token in event.tokens:
+            posting = self.acronym.get(token)
+            if posting and len(posting) <= MAX_POSTINGS:
+                found |= posting
+        if event.domain:
+            posting = self.domain.get(event.domain)
+            if posting and len(posting) <= MAX_POSTINGS:
+                found |= posting
+        if event.year is not None and found:
+            # Undated events stay candidates; dated ones must share the year
+            same_year = self.year.get(event.year, set())
+            found = {i for i in found if i in same_year or i not in self.dated}
+        return found
+
+
+def is_workshop(name: str, key: str = "") -> bool:
+    """Return True if a conference name or key looks like a workshop."""
+    return bool(_WORKSHOP_RE.search(name) or _WORKSHOP_KEY_RE.search(key))
+
+
+def registrable_domain(url: str | None) -> str | None:
+    """Approximate the registrable domain of a homepage (``2025.aclweb.org`` -> ``aclweb.org``)."""
+    host = homepage_host(url)
+    if not host:
+        return None
+    labels = host.split(".")
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL:
+        return ".".join(labels[-3:])  # e.g., example.ac.uk
+    return ".".join(labels[-2:])
+
+
+def _event(record: EventRecord) -> _Event:
+    workshop = is_workshop(record.name, record.key)
+    acronyms = extract_acronyms(record.name)
+    prefix = key_acronym(record.key)
+    if prefix:
+        acronyms |= {prefix}
+    acronyms -= GENERIC_ACRONYMS
+    # Only workshops name a host; for conferences "at <city>" is not an acronym
+    hosts = frozenset(m.lower().replace("-", "") for m in _HOST_RE.findall(record.name) if workshop)
+    domain = registrable_domain(record.homepage)
+    month_match = _MONTH_RE.search(record.name)
+    return _Event(
+        record=record,
+        is_workshop=workshop,
+        acronyms=acronyms,
+        host_acronyms=hosts,
+        tokens=acronyms | hosts,
+        domain=None if domain in SHARED_DOMAINS else domain,
+        year=extract_year(record.key, record.name),
+        month=_MONTHS[month_match.group(1).lower()[:3]] if month_match else None,
+    )
+
+
+def score_link(workshop: _Event, parent: _Event) -> float:
+    """Score how likely ``parent`` hosts ``workshop`` (0..1)."""
+    if workshop.year is not None and parent.year is not None and workshop.year != parent.year:
+        return 0.0
+    score = 0.0
+    if workshop.host_acronyms & parent.acronyms:
+        score += HOST_ACRONYM_SCORE
+    elif workshop.acronyms & parent.acronyms:
+        score += ACRONYM_SCORE
+    if workshop.domain is not None and workshop.domain == parent.domain:
+        score += DOMAIN_SCORE
+    if workshop.year is not None and workshop.year == parent.year:
+        score += YEAR_SCORE
+    if workshop.month is not None and workshop.month == parent.month:
+        score += MONTH_SCORE
+    return min(score, 1.0)
+
+
+class WorkshopLinker:
+    """Incremental inverted index of conferences and unlinked workshops.
+
+    Args:
+        threshold: Minimum score to link a workshop to a conference
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._events: dict[int, _Event] = {}
+        self._parents = _Postings()
+        self._orphans = _Postings()
+        self.stats = LinkStats()
+
+    def _index(self, records: Iterable[EventRecord]) -> tuple[list[_Event], list[_Event]]:
+        workshops: list[_Event] = []
+        parents: list[_Event] = []
+        for record in records:
+            event = _event(record)
+            self._events[record.id] = event
+            if event.is_workshop:
+                workshops.append(event)
+            else:
+                self._parents.add(event)
+                parents.append(event)
+        self.stats.workshops += len(workshops)
+        self.stats.conferences += len(parents)
+        return workshops, parents
+
+    def index(self, records: Iterable[EventRecord]) -> None:
+        """Index already-stored records without linking them.
+
+        Workshops are indexed as unlinked, so later conferences can claim them.
+        """
+        workshops, _ = self._index(records)
+        for workshop in workshops:
+            self._orphans.add(workshop)
+
+    def add(self, records: Iterable[EventRecord]) -> dict[int, int]:
+        """Index records and return the new ``{workshop_id: parent_id}`` links.
+
+        New workshops are matched against indexed conferences; new conferences
+        are matched against workshops that are still unlinked.
+        """
+        new_workshops, new_parents = self._index(records)
+
+        # Workshops affected: the new ones, plus orphans sharing postings with new parents
+        affected = {e.record.id: e for e in new_workshops}
+        for parent in new_parents:
+            for orphan_id in self._orphans.candidates(parent):
+                affected.setdefault(orphan_id, self._events[orphan_id])
+
+        links: dict[int, int] = {}
+        for workshop_id, workshop in affected.items():
+            parent_id = self._best_parent(workshop)
+            if parent_id is None:
+                self._orphans.add(workshop)
+            else:
+                self._orphans.discard(workshop)
+                links[workshop_id] = parent_id
+        self.stats.linked += len(links)
+        return links
+
+    def _best_parent(self, workshop: _Event) -> int | None:
+        candidates = self._parents.candidates(workshop)
+        self.stats.candidates += len(candidates)
+        best: tuple[float, str, int] | None = None
+        for parent_id in candidates:
+            parent = self._events[parent_id]
+            score = score_link(workshop, parent)
+            if score < self.threshold:
+                continue
+            # Highest score wins; ties go to the lexicographically smallest key
+            ranked = (-score, parent.record.key, parent_id)
+            if best is None or ranked < best:
+                best = ranked
+        return best[2] if best else None
+
+
+def _posting_filters(events: list[_Event]) -> Iterable[list[Any]]:
+    """Chunks of SQL filters matching the rows that may share a posting with ``events``.
+
+    Filters are a superset: a row's acronyms appear in its lowercased name
+    without hyphens or in its key, and its domain in its homepage.
+    """
+    name = func.replace(func.lower(Conference.name), "-", "")
+    key = func.lower(Conference.key)
+    homepage = func.lower(Conference.homepage)
+    clauses: list[Any] = []
+    for token in sorted(set().union(*(e.tokens for e in events))):
+        clauses += [name.contains(token, autoescape=True), key.contains(token, autoescape=True)]
+    for domain in sorted({e.domain for e in events if e.domain}):
+        clauses.append(homepage.contains(domain, autoescape=True))
+    for start in range(0, len(clauses), FILTER_CHUNK):
+        yield clauses[start : start + FILTER_CHUNK]
+
+
+def link_workshops(
+    session: Session,
+    conference_ids: Iterable[int] | None = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> LinkStats:
+    """Link workshops to parent conferences and persist ``parent_id``.
+
+    Args:
+        session: Open session; the caller owns the transaction
+        conference_ids: Newly scraped conferences to process incrementally; all
+            other rows only populate the index. None re-links every unlinked workshop
+        threshold: Minimum link score
+
+    Returns:
+        LinkStats for the run
+    """
+    c = Conference
+    columns = select(c.id, c.key, c.name, c.homepage)
+    linker = WorkshopLinker(threshold=threshold)
+    if conference_ids is None:
+        rows = session.execute(columns.where(c.parent_id.is_(None))).all()
+        links = linker.add(EventRecord(*r) for r in rows)
+    else:
+        new_ids = set(conference_ids)
+        new = [EventRecord(*r) for r in session.execute(columns.where(c.id.in_(new_ids)))]
+        # Stored rows only populate the index; links between them aren't re-evaluated
+        stored: dict[int, EventRecord] = {}
+        for clauses in _posting_filters([_event(record) for record in new]):
+            for r in session.execute(columns.where(c.parent_id.is_(None), or_(*clauses))):
+                if r.id not in new_ids:
+                    stored[r.id] = EventRecord(*r)
+        linker.index(stored.values())
+        links = linker.add(new)
+
+    if links:
+        session.execute(
+            update(Conference),
+            [
+                {"id": workshop_id, "parent_id": parent_id}
+                for workshop_id, parent_id in links.items()
+            ],
+        )
+    return linker.stats
@@ -2,9 +2,10 @@
 
 Each source implements the Scraper interface for consistent extraction,
 error handling, and Dagster integration. Scrapers return both raw data
-(for debugging/reprocessing) and normalized output (schema-versioned).
+(for debugging/reprocessing) and normalized output (schema-versioned), or
+stream validated records through ``Scraper.iter_scrape``.
 """
 
-from .base import Scraper, ScrapeResult
+from .base import Scraper, ScrapeResult, ScrapeStream
 
-__all__ = ["Scraper", "ScrapeResult"]
+__all__ = ["Scraper", "ScrapeResult", "ScrapeStream"]
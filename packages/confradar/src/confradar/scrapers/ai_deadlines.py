@@ -6,7 +6,9 @@ from datetime import datetime
 from typing import Any
 
 import httpx
+import lxml.html
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from confradar.scrapers.base import Scraper
 
@@ -29,6 +31,56 @@ class ConferenceItem:
 
 DEFAULT_URL = "https://aideadlin.es"
 
+# Parse engines: "lxml" (default, C-backed) and "bs4" (BeautifulSoup html.parser,
+# the original implementation, kept as a reference for parity checks)
+ENGINES = ("lxml", "bs4")
+
+_CONF_HREF_RE = re.compile(r"/conference\?id=")
+_CONF_ID_RE = re.compile(r"id=([^&]+)")
+_WEBSITE_HREF_RE = re.compile(r"^https?://")
+_KEY_YEAR_RE = re.compile(r"(\d{2})$")
+
+# Pattern: $('#confkey') ... var timezone = "UTC-12"; ... moment.tz("date", timezone)
+_DEADLINE_BLOCK_RE = re.compile(
+    r'\$\([\'"]#(\w+).*?var\s+timezone\s*=\s*[\'"]([^\'\"]+)[\'"].*?moment\.tz\([\'"]([^\'\"]+)[\'"]',
+    re.DOTALL,
+)
+# The same pattern over all <script> blocks joined with NUL: the gaps never cross
+# a NUL, so a match stays inside one block as when each block is scanned alone
+_SCRIPT_SEP = "\x00"
+_JOINED_DEADLINE_BLOCK_RE = re.compile(
+    r'\$\([\'"]#(\w+)[^\x00]*?var\s+timezone\s*=\s*[\'"]([^\'\"\x00]+)[\'"]'
+    r'[^\x00]*?moment\.tz\([\'"]([^\'\"\x00]+)[\'"]'
+)
+
+_CONF_LINKS = etree.XPath("//a[contains(@href, '/conference?id=')]")
+_WEBSITE_LINK = etree.XPath(
+    ".//a[@title='Conference Website']"
+    "[starts-with(@href, 'http://') or starts-with(@href, 'https://')]"
+)
+# Text like BeautifulSoup's get_text(): no comments, no script/style content
+_TEXT = etree.XPath(".//text()[not(parent::script or parent::style)]")
+_SCRIPTS = etree.XPath("//script")
+
+
+def _year_from_key(key: str) -> int | None:
+    # e.g., 'icml25' -> 2025
+    year_match = _KEY_YEAR_RE.search(key)
+    if not year_match:
+        return None
+    yr = int(year_match.group(1))
+    return 2000 + yr if yr < 50 else 1900 + yr
+
+
+def _parse_deadline(value: str) -> datetime | None:
+    # Handle both with and without seconds
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
 
 class AIDeadlinesScraper(Scraper):
     """Scraper for aideadlin.es website (HTML scraping).
@@ -40,8 +92,11 @@ class AIDeadlinesScraper(Scraper):
     The page structure may change - be prepared to update parse() logic.
     """
 
-    def __init__(self, url: str = DEFAULT_URL):
+    def __init__(self, url: str = DEFAULT_URL, engine: str = "lxml"):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown parse engine {engine!r}; expected one of {ENGINES}")
         self._url = url
+        self._engine = engine
 
     @property
     def source_name(self) -> str:
@@ -51,6 +106,10 @@ class AIDeadlinesScraper(Scraper):
     def schema_version(self) -> str:
         return "1.0"
 
+    @property
+    def url(self) -> str:
+        return self._url
+
     def fetch(self, **kwargs: Any) -> str:
         """Fetch HTML from aideadlin.es."""
         url = kwargs.get("url", self._url)
@@ -61,21 +120,101 @@ class AIDeadlinesScraper(Scraper):
             resp.raise_for_status()
             return resp.text
 
+    async def afetch(self, client: httpx.AsyncClient | None = None, **kwargs: Any) -> str:
+        """Fetch HTML from aideadlin.es on ``client`` (a new client if None).
+
+        ``kwargs["timeout"]`` overrides the shared client's timeout.
+        """
+        url = kwargs.get("url", self._url)
+
+        if client is None:
+            timeout = kwargs.get("timeout", 20.0)
+            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as own:
+                return await self.afetch(client=own, **kwargs)
+        resp = await client.get(url, timeout=kwargs.get("timeout", httpx.USE_CLIENT_DEFAULT))
+        resp.raise_for_status()
+        return resp.text
+
     def parse(self, raw: str, **kwargs: Any) -> list[dict[str, Any]]:
         """Parse HTML into normalized ConferenceItem records.
 
         The AI Deadlines site embeds deadline information in JavaScript code blocks.
         We extract this using regex patterns to find moment.tz() calls.
+        ``kwargs["engine"]`` overrides the scraper's parse engine.
         """
+        if kwargs.get("engine", self._engine) == "bs4":
+            return self._parse_bs4(raw)
+        return self._parse_lxml(raw)
+
+    def _parse_lxml(self, raw: str) -> list[dict[str, Any]]:
+        """Parse with lxml: XPath link lookup and one regex pass over all scripts."""
+        if not raw or not raw.strip():
+            return []
+        try:
+            doc = lxml.html.document_fromstring(raw)
+        except ValueError:
+            # Unicode input with an XML encoding declaration
+            doc = lxml.html.document_fromstring(raw.encode())
+
+        conferences: dict[str, dict[str, Any]] = {}
+        for link in _CONF_LINKS(doc):
+            try:
+                conf_id = _CONF_ID_RE.search(link.get("href") or "")
+                if not conf_id:
+                    continue
+                key = conf_id.group(1)
+                if key in conferences:
+                    continue
+
+                homepage = None
+                parent = link.getparent()
+                grandparent = parent.getparent() if parent is not None else None
+                if grandparent is not None:
+                    website_links = _WEBSITE_LINK(grandparent)
+                    if website_links:
+                        homepage = website_links[0].get("href")
+
+                conferences[key] = {
+                    "key": key,
+                    "name": "".join(t.strip() for t in _TEXT(link)),
+                    "year": _year_from_key(key),
+                    "homepage": homepage,
+                    "deadlines": [],
+                }
+            except Exception:
+                # Skip malformed entries
+                continue
+
+        scripts = _SCRIPT_SEP.join(script.text for script in _SCRIPTS(doc) if script.text)
+        for match in _JOINED_DEADLINE_BLOCK_RE.finditer(scripts):
+            conf_key, timezone_str, deadline_str = match.groups()
+            # Skip non-conference entries (like 'subject') and unparseable dates
+            if conf_key not in conferences:
+                continue
+            deadline_dt = _parse_deadline(deadline_str)
+            if deadline_dt is None:
+                continue
+            conferences[conf_key]["deadlines"].append(
+                {
+                    "kind": "submission",
+                    "due_at": deadline_dt.isoformat(),
+                    "timezone": timezone_str,
+                }
+            )
+
+        return list(conferences.values())
+
+    def _parse_bs4(self, raw: str) -> list[dict[str, Any]]:
+        """Parse with BeautifulSoup's html.parser (reference implementation)."""
         soup = BeautifulSoup(raw, "html.parser")
         conferences: dict[str, dict[str, Any]] = {}  # Use dict to deduplicate by key
 
         # Find conference entries - structure may vary, this is a best-effort parse
         # Look for conference links and deadline info
-        for link in soup.find_all("a", href=re.compile(r"/conference\?id=")):
+        for link in soup.find_all("a", href=_CONF_HREF_RE):
             try:
                 href_value = link.get("href") or ""
-                conf_id = re.search(r"id=([^&]+)", href_value)
+                conf_id = _CONF_ID_RE.search(href_value)
                 if not conf_id:
                     continue
 
@@ -94,17 +233,13 @@ class AIDeadlinesScraper(Scraper):
                     parent_parent = parent.parent
                     if parent_parent:
                         website_link = parent_parent.find(
-                            "a", href=re.compile(r"^https?://"), title="Conference Website"
+                            "a", href=_WEBSITE_HREF_RE, title="Conference Website"
                         )
                         if website_link:
                             homepage = website_link.get("href")
 
                 # Extract year from key if present (e.g., 'icml25' -> 2025)
-                year = None
-                year_match = re.search(r"(\d{2})$", key)
-                if year_match:
-                    yr = int(year_match.group(1))
-                    year = 2000 + yr if yr < 50 else 1900 + yr
+                year = _year_from_key(key)
 
                 conferences[key] = {
                     "key": key,
@@ -128,12 +263,7 @@ class AIDeadlinesScraper(Scraper):
 
             # Find conference deadline blocks
             # Each block looks like: $('#confkey') ... var timezone = "..."; moment.tz("date", timezone)
-            conf_block_pattern = re.compile(
-                r'\$\([\'"]#(\w+).*?var\s+timezone\s*=\s*[\'"]([^\'\"]+)[\'"].*?moment\.tz\([\'"]([^\'\"]+)[\'"]',
-                re.DOTALL,
-            )
-
-            for match in conf_block_pattern.finditer(script_text):
+            for match in _DEADLINE_BLOCK_RE.finditer(script_text):
                 conf_key = match.group(1)
                 timezone_str = match.group(2)
                 deadline_str = match.group(3)
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+    from confradar.archive import RawArchive
+    from confradar.content_gate import ContentGate
 
 
 @dataclass
@@ -16,7 +24,7 @@ class ScrapeResult:
         scraped_at: UTC timestamp when data was retrieved
         raw_data: Original response (JSON/HTML/etc.) for debugging and reprocessing
         normalized: List of normalized conference items (schema-versioned)
-        metadata: Optional fields (e.g., record count, API rate limits, error context)
+        metadata: Optional fields (e.g., record count, fetched ``url``, error context)
     """
 
     source_name: str
@@ -27,6 +35,39 @@ class ScrapeResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class ScrapeStream:
+    """Validated records of one scrape, produced while they are consumed.
+
+    Returned by ``Scraper.iter_scrape``. The raw payload is released once the
+    records are exhausted, and nothing is accumulated, so a consumer that
+    writes records in batches runs in constant memory. Iterate only once.
+
+    Attributes:
+        source_name: Identifier for the source
+        schema_version: Version string for the normalized records
+        scraped_at: UTC timestamp when data was retrieved
+        metadata: ``raw_sha256``/``unchanged`` as for ``scrape``; ``count`` is
+            set once the stream is exhausted
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        schema_version: str,
+        scraped_at: datetime,
+        records: Iterator[dict[str, Any]],
+        metadata: dict[str, Any],
+    ):
+        self.source_name = source_name
+        self.schema_version = schema_version
+        self.scraped_at = scraped_at
+        self.metadata = metadata
+        self._records = records
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self._records
+
+
 class Scraper(ABC):
     """Abstract base for all scrapers.
 
@@ -42,6 +83,14 @@ class Scraper(ABC):
         2. parse(raw) -> normalized list of dicts
         3. validate(normalized) -> check required fields
         4. Return ScrapeResult with raw + normalized + metadata
+
+    Async flow (``ascrape``): ``afetch`` awaits the download, optionally on a
+    shared ``httpx.AsyncClient``; parsing runs in a worker thread so other
+    downloads proceed. ``confradar.scrapers.runner`` runs many scrapers at once.
+
+    Streaming flow (``iter_scrape``): ``iter_parse(raw)`` yields records one at a
+    time and each is validated as it is consumed. Implement either ``parse`` or
+    ``iter_parse``; the other is derived from it.
     """
 
     @property
@@ -56,6 +105,11 @@ class Scraper(ABC):
         """Current schema version for normalized output."""
         pass
 
+    @property
+    def url(self) -> str | None:
+        """URL ``fetch`` downloads by default; None if the source has no single page."""
+        return None
+
     @abstractmethod
     def fetch(self, **kwargs: Any) -> Any:
         """Fetch raw data from the source.
@@ -65,15 +119,35 @@ class Scraper(ABC):
         """
         pass
 
-    @abstractmethod
+    async def afetch(self, client: httpx.AsyncClient | None = None, **kwargs: Any) -> Any:
+        """Fetch raw data without blocking the event loop.
+
+        Override to download on ``client``, a shared connection pool (see
+        ``confradar.scrapers.runner``). The default runs ``fetch`` in a worker
+        thread and ignores ``client``.
+        """
+        return await asyncio.to_thread(self.fetch, **kwargs)
+
     def parse(self, raw: Any, **kwargs: Any) -> list[dict[str, Any]]:
         """Parse raw data into normalized conference records.
 
         For LLM-based sources, this calls the LLM with structured output prompts.
         For JSON APIs, this maps fields to the schema.
-        Returns list of dicts matching schema_version.
+        Returns list of dicts matching schema_version. The default collects
+        ``iter_parse``.
         """
-        pass
+        return list(self.iter_parse(raw, **kwargs))
+
+    def iter_parse(self, raw: Any, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """Yield normalized conference records one at a time.
+
+        Override in sources that can emit records incrementally (paginated
+        APIs, line-delimited feeds). The default adapts a list-returning
+        ``parse``.
+        """
+        if type(self).parse is Scraper.parse:
+            raise NotImplementedError(f"{type(self).__name__} must implement parse or iter_parse")
+        yield from self.parse(raw, **kwargs)
 
     def validate(self, normalized: list[dict[str, Any]]) -> None:
         """Validate normalized output against schema expectations.
@@ -87,15 +161,78 @@ class Scraper(ABC):
             if "key" not in item or "name" not in item:
                 raise ValueError(f"Missing required fields: {item}")
 
-    def scrape(self, **kwargs: Any) -> ScrapeResult:
-        """Execute full scrape pipeline: fetch -> parse -> validate -> wrap result.
-
-        This is the main entry point for Dagster assets.
-        """
-        scraped_at = datetime.now(timezone.utc)
+    def _fetch_and_gate(
+        self,
+        archive: RawArchive | None,
+        gate: ContentGate | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[datetime, Any, dict[str, Any], Any]:
+        """Fetch, archive and gate-check; returns (fetched at, raw, metadata, page digest)."""
+        fetched_at = datetime.now(timezone.utc)
         raw = self.fetch(**kwargs)
+        return (fetched_at, raw, *self._archive_and_gate(raw, fetched_at, archive, gate, kwargs))
+
+    def _archive_and_gate(
+        self,
+        raw: Any,
+        fetched_at: datetime,
+        archive: RawArchive | None,
+        gate: ContentGate | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[dict[str, Any], Any]:
+        """Archive and gate-check a fetched payload; returns (metadata, page digest)."""
+        metadata: dict[str, Any] = {}
+        if url := self._page_url(kwargs):
+            metadata["url"] = url
+        if archive is not None and isinstance(raw, (str, bytes)):
+            blob = archive.record(
+                url or self.source_name,
+                raw.encode() if isinstance(raw, str) else raw,
+                fetched_at=fetched_at,
+                source=self.source_name,
+            )
+            metadata["raw_sha256"] = blob.sha256
+
+        page_digest = None
+        if gate is not None and isinstance(raw, (str, bytes)):
+            from confradar.content_gate import digest
+
+            page_digest = digest(raw)
+            metadata["unchanged"] = gate.check(
+                self._page_key(kwargs), page_digest, self.schema_version
+            )
+        return metadata, page_digest
+
+    def _page_url(self, kwargs: dict[str, Any]) -> str | None:
+        return kwargs.get("url") or self.url
+
+    def _page_key(self, kwargs: dict[str, Any]) -> str:
+        return kwargs.get("url") or self.source_name
+
+    def _build_result(
+        self,
+        raw: Any,
+        scraped_at: datetime,
+        metadata: dict[str, Any],
+        page_digest: Any,
+        gate: ContentGate | None,
+        kwargs: dict[str, Any],
+    ) -> ScrapeResult:
+        """Parse, validate and wrap a fetched payload (nothing is parsed if unchanged)."""
+        if metadata.get("unchanged"):
+            return ScrapeResult(
+                source_name=self.source_name,
+                schema_version=self.schema_version,
+                scraped_at=scraped_at,
+                raw_data=raw,
+                normalized=[],
+                metadata={"count": 0, **metadata},
+            )
+
         normalized = self.parse(raw, **kwargs)
         self.validate(normalized)
+        if gate is not None and page_digest is not None:
+            gate.record(self._page_key(kwargs), page_digest, self.source_name, self.schema_version)
 
         return ScrapeResult(
             source_name=self.source_name,
@@ -103,5 +240,88 @@ class Scraper(ABC):
             scraped_at=scraped_at,
             raw_data=raw,
             normalized=normalized,
-            metadata={"count": len(normalized)},
+            metadata={"count": len(normalized), **metadata},
+        )
+
+    def scrape(
+        self,
+        archive: RawArchive | None = None,
+        gate: ContentGate | None = None,
+        **kwargs: Any,
+    ) -> ScrapeResult:
+        """Execute full scrape pipeline: fetch -> parse -> validate -> wrap result.
+
+        This is the main entry point for Dagster assets. With ``archive``, a text
+        or bytes raw response is also stored in the raw archive and its hash is
+        recorded as ``metadata["raw_sha256"]``; its ``raw_pages`` row is written
+        by the caller's ``archive.flush(session)``.
+
+        With ``gate``, a text or bytes response whose content is unchanged since
+        its last parse (see ``confradar.content_gate``) is not parsed: the result
+        has no normalized items and ``metadata["unchanged"]`` is True. The page
+        is keyed by ``kwargs["url"]``, or the source name without one.
+        """
+        scraped_at, raw, metadata, page_digest = self._fetch_and_gate(archive, gate, kwargs)
+        return self._build_result(raw, scraped_at, metadata, page_digest, gate, kwargs)
+
+    async def ascrape(
+        self,
+        client: httpx.AsyncClient | None = None,
+        archive: RawArchive | None = None,
+        gate: ContentGate | None = None,
+        **kwargs: Any,
+    ) -> ScrapeResult:
+        """Async ``scrape``: await ``afetch``, then parse in a worker thread.
+
+        ``archive`` and ``gate`` behave as in ``scrape``.
+        """
+        scraped_at = datetime.now(timezone.utc)
+        raw = await self.afetch(client=client, **kwargs)
+        metadata, page_digest = self._archive_and_gate(raw, scraped_at, archive, gate, kwargs)
+        return await asyncio.to_thread(
+            self._build_result, raw, scraped_at, metadata, page_digest, gate, kwargs
         )
+
+    def iter_scrape(
+        self,
+        archive: RawArchive | None = None,
+        gate: ContentGate | None = None,
+        **kwargs: Any,
+    ) -> ScrapeStream:
+        """Streaming ``scrape``: fetch now, then parse and validate record by record.
+
+        Fetching, archiving and the gate check happen before this returns, so
+        ``metadata`` is available up front. Each record goes through
+        ``validate([record])`` as it is yielded; a gate fingerprint is only
+        recorded after the last record validated. The raw payload is not kept
+        on the stream.
+
+        Example:
+            >>> stream = scraper.iter_scrape()
+            >>> stats = upsert_stream(session, stream)
+            >>> stream.metadata["count"]
+        """
+        scraped_at, raw, metadata, page_digest = self._fetch_and_gate(archive, gate, kwargs)
+        if metadata.get("unchanged"):
+            metadata["count"] = 0
+            records: Iterator[dict[str, Any]] = iter(())
+        else:
+            records = self._iter_validated(raw, metadata, gate, page_digest, kwargs)
+        return ScrapeStream(self.source_name, self.schema_version, scraped_at, records, metadata)
+
+    def _iter_validated(
+        self,
+        raw: Any,
+        metadata: dict[str, Any],
+        gate: ContentGate | None,
+        page_digest: Any,
+        kwargs: dict[str, Any],
+    ) -> Iterator[dict[str, Any]]:
+        count = 0
+        for record in self.iter_parse(raw, **kwargs):
+            self.validate([record])
+            count += 1
+            yield record
+        metadata["count"] = count
+        if gate is not None and page_digest is not None:
+            gate.record(self._page_key(kwargs), page_digest, self.source_name, self.schema_version)
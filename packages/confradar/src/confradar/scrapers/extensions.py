@@ -0,0 +1,81 @@
+"""Scrapy extensions for confradar spiders."""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+
+class SpiderTimingExtension:
+    """Report the crawl's timing histograms when the spider closes.
+
+    Histograms are collected by ``CallbackTimingMiddleware`` and pipelines
+    decorated with ``timed_stage`` (``confradar.scrapers.timing``). On close,
+    each histogram's count, mean, max and percentiles are set as
+    ``timing/<histogram>/<field>`` stats, and the full histograms are written
+    to ``<SPIDER_TIMING_DIR>/<spider>/<UTC timestamp>.json``, whose path is set
+    as the ``timing/report`` stat (read by the Dagster assets and
+    ``confradar timing-report``).
+
+    Settings:
+        SPIDER_TIMING_ENABLED: Enable the extension and middleware (default: False)
+        SPIDER_TIMING_DIR: Report directory, under .scrapy (default: "timing");
+            empty to only set stats
+    """
+
+    def __init__(self, timings: Any, report_dir: str = "timing", stats: Any = None):
+        self.timings = timings
+        self.report_dir = report_dir
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> "SpiderTimingExtension":
+        settings = crawler.settings
+        if not settings.getbool("SPIDER_TIMING_ENABLED"):
+            raise NotConfigured("SPIDER_TIMING_ENABLED is off")
+
+        from confradar.scrapers.timing import crawl_timings
+
+        extension = cls(
+            crawl_timings(crawler, create=True),
+            report_dir=settings.get("SPIDER_TIMING_DIR", "timing"),
+            stats=crawler.stats,
+        )
+        crawler.signals.connect(extension.spider_closed, signal=signals.spider_closed)
+        return extension
+
+    def report(self, spider: Any, reason: str) -> dict[str, Any]:
+        return {
+            "spider": spider.name,
+            "reason": reason,
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "histograms": self.timings.report(),
+        }
+
+    def write(self, report: dict[str, Any]) -> Path:
+        """Write ``report`` atomically (temporary file, then rename)."""
+        from scrapy.utils.project import data_path
+
+        directory = Path(data_path(self.report_dir, createdir=True), report["spider"])
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.fromisoformat(report["finished_at"]).strftime("%Y%m%dT%H%M%S%fZ")
+        path = directory / f"{stamp}.json"
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(json.dumps(report, indent=2))
+        os.replace(tmp, path)
+        return path
+
+    def spider_closed(self, spider: Any, reason: str = "finished") -> None:
+        report = self.report(spider, reason)
+        if self.stats is not None:
+            for name, histogram in report["histograms"].items():
+                for field in ("count", "mean", "p50", "p95", "p99", "max"):
+                    self.stats.set_value(f"timing/{name}/{field}", histogram[field])
+        if self.report_dir:
+            path = self.write(report)
+            if self.stats is not None:
+                self.stats.set_value("timing/report", str(path))
@@ -0,0 +1,255 @@
+"""Scrapy HTTP cache storage in a single SQLite file, and the cache policy.
+
+``SqliteCacheStorage`` replaces ``FilesystemCacheStorage``, which writes seven
+small files per response and never evicts. Here each response is one row with
+a zstd-compressed body; the file is bounded by LRU eviction on total body size
+(and optionally entry count), and expired rows are purged when a spider opens.
+
+``RFC2616FallbackPolicy`` follows RFC 2616 (``Cache-Control``, ``Expires``,
+validators, revalidation with ``If-None-Match``/``If-Modified-Since``) and only
+falls back to ``HTTPCACHE_EXPIRATION_SECS`` for plain 200/203 responses that
+carry no caching headers at all. Error responses such as a bot-protection 409
+are never cached, so they are not replayed on the next crawl.
+
+Settings:
+    HTTPCACHE_DIR: Directory of the cache file (default: "httpcache")
+    HTTPCACHE_SQLITE_FILE: Cache file name (default: "httpcache.sqlite")
+    HTTPCACHE_MAX_BYTES: Compressed bodies kept before LRU eviction; 0 disables
+    HTTPCACHE_MAX_ENTRIES: Responses kept before LRU eviction; 0 disables
+    HTTPCACHE_COMPRESSION_LEVEL: zstd level for bodies (default: 3)
+    HTTPCACHE_EXPIRATION_SECS: Entries older than this are not served and are
+        purged; also the fallback freshness lifetime of the policy
+"""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from scrapy.extensions.httpcache import RFC2616Policy
+from scrapy.http import Headers, Request, Response
+from scrapy.responsetypes import responsetypes
+from scrapy.utils.project import data_path
+from w3lib.http import headers_dict_to_raw, headers_raw_to_dict
+
+try:  # Python 3.14+
+    from compression import zstd
+except ImportError:  # pragma: no cover - depends on interpreter version
+    from backports import zstd
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Eviction frees down to this fraction of the limit, so it does not run on every store
+EVICT_TO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    spider TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers BLOB NOT NULL,
+    body BLOB NOT NULL,
+    extra BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (spider, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS ix_http_cache_accessed_at ON http_cache (accessed_at);
+"""
+
+
+class SqliteCacheStorage:
+    """``HTTPCACHE_STORAGE`` backend keeping every spider's responses in one SQLite file.
+
+    Rows are keyed by spider name and request fingerprint. A hit refreshes the
+    row's access time; a store that pushes the total compressed size (or entry
+    count) over its limit evicts the least recently used rows down to 90% of
+    the limit. The file uses WAL mode, so crawls in separate processes can
+    share it.
+    """
+
+    def __init__(self, settings: Any):
+        self.path = Path(
+            data_path(settings.get("HTTPCACHE_DIR"), createdir=True),
+            settings.get("HTTPCACHE_SQLITE_FILE", "httpcache.sqlite"),
+        )
+        self.expiration_secs = settings.getint("HTTPCACHE_EXPIRATION_SECS")
+        self.max_bytes = settings.getint("HTTPCACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+        self.max_entries = settings.getint("HTTPCACHE_MAX_ENTRIES", 0)
+        self.level = settings.getint("HTTPCACHE_COMPRESSION_LEVEL", 3)
+        self.db: sqlite3.Connection | None = None
+        self.evictions = 0
+        # Running totals; recounted when a limit is hit (other processes may write)
+        self._bytes = 0
+        self._entries = 0
+
+    def open_spider(self, spider: Any) -> None:
+        self._fingerprinter = spider.crawler.request_fingerprinter
+        self.db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA busy_timeout = 5000")
+        # Must precede table creation to take effect on a new file
+        self.db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.executescript(_SCHEMA)
+        if self.expiration_secs > 0:
+            self.db.execute(
+                "DELETE FROM http_cache WHERE stored_at < ?", (time.time() - self.expiration_secs,)
+            )
+        self._count()
+        spider.logger.debug(f"Using SQLite cache storage in {self.path}")
+
+    def close_spider(self, spider: Any) -> None:
+        if self.db is not None:
+            self.db.execute("PRAGMA incremental_vacuum")
+            self.db.close()
+            self.db = None
+
+    def retrieve_response(self, spider: Any, request: Request) -> Response | None:
+        """Return the cached response, or None if missing or expired."""
+        key = self._fingerprinter.fingerprint(request).hex()
+        row = self.db.execute(
+            "SELECT url, status, headers, body, extra, stored_at FROM http_cache"
+            " WHERE spider = ? AND fingerprint = ?",
+            (spider.name, key),
+        ).fetchone()
+        if row is None:
+            return None
+        url, status, headers, body, extra, stored_at = row
+        if 0 < self.expiration_secs < time.time() - stored_at:
+            return None
+
+        self.db.execute(
+            "UPDATE http_cache SET accessed_at = ? WHERE spider = ? AND fingerprint = ?",
+            (time.time(), spider.name, key),
+        )
+        extra = pickle.loads(extra)  # noqa: S301 - written by store_response only
+        headers = Headers(headers_raw_to_dict(headers))
+        body = zstd.decompress(body)
+        respcls = responsetypes.from_args(headers=headers, url=url, body=body)
+        request.meta["cache_timestamp"] = stored_at
+        return respcls(
+            url=url,
+            status=status,
+            headers=headers,
+            body=body,
+            flags=extra.get("flags"),
+            protocol=extra.get("protocol"),
+        )
+
+    def store_response(self, spider: Any, request: Request, response: Response) -> None:
+        """Store (or replace) the response, then evict if over a limit."""
+        key = self._fingerprinter.fingerprint(request).hex()
+        body = zstd.compress(response.body, level=self.level)
+        extra = {"flags": response.flags, "protocol": response.protocol}
+        replaced = self.db.execute(
+            "SELECT size FROM http_cache WHERE spider = ? AND fingerprint = ?",
+            (spider.name, key),
+        ).fetchone()
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO http_cache"
+            " (spider, fingerprint, url, status, headers, body, extra, size, stored_at,"
+            " accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                spider.name,
+                key,
+                response.url,
+                response.status,
+                headers_dict_to_raw(response.headers),
+                body,
+                pickle.dumps(extra, protocol=4),
+                len(body),
+                now,
+                now,
+            ),
+        )
+        self._bytes += len(body) - (replaced[0] if replaced else 0)
+        self._entries += 0 if replaced else 1
+        if self._over_limit():
+            self._count()
+            if self._over_limit():
+                self._evict()
+
+    def _count(self) -> None:
+        self._entries, self._bytes = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache"
+        ).fetchone()
+
+    def _over_limit(self) -> bool:
+        return 0 < self.max_bytes < self._bytes or 0 < self.max_entries < self._entries
+
+    def _evict(self) -> None:
+        total, entries = self._bytes, self._entries
+        keep_bytes = int(self.max_bytes * EVICT_TO) if self.max_bytes > 0 else total
+        keep_entries = int(self.max_entries * EVICT_TO) if self.max_entries > 0 else entries
+        # Keep the most recently used rows that fit both targets
+        cursor = self.db.execute(
+            "DELETE FROM http_cache WHERE rowid IN ("
+            " SELECT rowid FROM ("
+            "  SELECT rowid,"
+            "   SUM(size) OVER (ORDER BY accessed_at DESC, rowid DESC) AS kept_bytes,"
+            "   ROW_NUMBER() OVER (ORDER BY accessed_at DESC, rowid DESC) AS kept_entries"
+            "  FROM http_cache)"
+            " WHERE kept_bytes > ? OR kept_entries > ?)",
+            (keep_bytes, keep_entries),
+        )
+        self.evictions += cursor.rowcount
+        self._count()
+
+
+class RFC2616FallbackPolicy(RFC2616Policy):
+    """RFC 2616 cache policy with a fixed lifetime for header-less 200/203 responses.
+
+    Scrapy's ``RFC2616Policy`` never caches a response that has neither
+    expiration information nor a validator, which is most CFP pages. Those are
+    cached here for ``HTTPCACHE_EXPIRATION_SECS``. ``HTTPCACHE_IGNORE_HTTP_CODES``
+    is honoured as well; everything else (``no-store``/``no-cache``,
+    ``max-age``, ``Expires``, revalidation, serving stale pages on 5xx) is
+    RFC 2616 behaviour.
+    """
+
+    FALLBACK_STATUSES = {200, 203}
+
+    def __init__(self, settings: Any):
+        super().__init__(settings)
+        self.fallback_lifetime = settings.getint("HTTPCACHE_EXPIRATION_SECS")
+        self.ignore_http_codes = {int(x) for x in settings.getlist("HTTPCACHE_IGNORE_HTTP_CODES")}
+
+    def _has_freshness_info(self, response: Response) -> bool:
+        cc = self._parse_cachecontrol(response)
+        headers = response.headers
+        return (
+            b"max-age" in cc
+            or b"Expires" in headers
+            or b"Last-Modified" in headers
+            or b"ETag" in headers
+        )
+
+    def should_cache_response(self, response: Response, request: Request) -> bool:
+        if response.status in self.ignore_http_codes:
+            return False
+        if super().should_cache_response(response, request):
+            return True
+        return (
+            self.fallback_lifetime > 0
+            and response.status in self.FALLBACK_STATUSES
+            and b"no-store" not in self._parse_cachecontrol(response)
+            and not self._has_freshness_info(response)
+        )
+
+    def _compute_freshness_lifetime(
+        self, response: Response, request: Request, now: float
+    ) -> float:
+        lifetime = super()._compute_freshness_lifetime(response, request, now)
+        if (
+            lifetime == 0
+            and response.status in self.FALLBACK_STATUSES
+            and not self._has_freshness_info(response)
+        ):
+            return self.fallback_lifetime
+        return lifetime
@@ -0,0 +1,772 @@
+"""Scrapy middlewares for confradar spiders."""
+
+import json
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import Any
+
+from scrapy import Request, signals
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+
+
+class RawArchiveMiddleware:
+    """Archive every downloaded response body in the content-addressed raw archive.
+
+    Bodies are stored once per SHA-256 (see ``confradar.archive``); each fetch
+    adds a ``raw_pages`` index row. Index rows are buffered and inserted in bulk
+    every ``RAW_ARCHIVE_BATCH_SIZE`` responses and when the spider closes.
+    Responses served from Scrapy's HTTP cache are skipped, since they were not
+    fetched. Placed below ``HttpCompressionMiddleware`` (590) so bodies are
+    archived decompressed.
+
+    Settings:
+        RAW_ARCHIVE_ENABLED: Enable the middleware (default: False)
+        RAW_ARCHIVE_DIR: Archive directory (default: settings.raw_archive_dir)
+        RAW_ARCHIVE_LEVEL: zstd compression level (default: settings.raw_archive_level)
+        RAW_ARCHIVE_BATCH_SIZE: Index rows per insert (default: 100)
+    """
+
+    def __init__(
+        self,
+        archive: Any,
+        batch_size: int = 100,
+        session_factory: Callable[[], Any] | None = None,
+        stats: Any = None,
+    ):
+        self.archive = archive
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> "RawArchiveMiddleware":
+        settings = crawler.settings
+        if not settings.getbool("RAW_ARCHIVE_ENABLED"):
+            raise NotConfigured("RAW_ARCHIVE_ENABLED is off")
+
+        from confradar.archive import RawArchive
+        from confradar.settings import get_settings
+
+        app_settings = get_settings()
+        archive = RawArchive(
+            settings.get("RAW_ARCHIVE_DIR") or app_settings.raw_archive_dir,
+            level=settings.getint("RAW_ARCHIVE_LEVEL", app_settings.raw_archive_level),
+        )
+        middleware = cls(
+            archive,
+            batch_size=settings.getint("RAW_ARCHIVE_BATCH_SIZE", 100),
+            stats=crawler.stats,
+        )
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def process_response(self, request: Any, response: Any, spider: Any) -> Any:
+        if "cached" in response.flags:
+            return response
+
+        blob = self.archive.record(response.url, response.body, response.status, source=spider.name)
+        if self.stats is not None:
+            self.stats.inc_value("raw_archive/pages")
+            self.stats.inc_value("raw_archive/bytes_in", blob.size)
+            self.stats.inc_value("raw_archive/bytes_stored", blob.stored_bytes)
+            if blob.deduplicated:
+                self.stats.inc_value("raw_archive/deduplicated")
+        if self.archive.pending >= self.batch_size:
+            self.flush()
+        return response
+
+    def flush(self) -> None:
+        """Insert buffered index rows in one transaction."""
+        if not self.archive.pending:
+            return
+        if self.session_factory is None:
+            from confradar.db.base import get_session
+
+            self.session_factory = get_session
+
+        session = self.session_factory()
+        try:
+            self.archive.flush(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def spider_closed(self, spider: Any) -> None:
+        self.flush()
+
+
+class FreshUrl(IgnoreRequest):
+    """Raised for a request whose URL was fetched within its freshness window."""
+
+
+class SeenUrlMiddleware:
+    """Skip requests for URLs fetched within a per-source freshness window, across crawls.
+
+    Successful (2xx) downloads are recorded in the seen-URL store
+    (``confradar.seen_urls``): request fingerprints with their last fetch time
+    in ``seen_urls``, fronted by an on-disk Bloom filter per spider so that
+    URLs never fetched cost no query. A request fetched less than its window
+    ago is dropped before it reaches the HTTP cache or the network, and is
+    fetched again once the window has passed.
+
+    The window is ``meta["freshness_secs"]`` of the request, else the spider's
+    ``freshness_secs`` attribute, else ``SEEN_URLS_FRESHNESS[spider.name]``,
+    else ``SEEN_URLS_DEFAULT_FRESHNESS``; 0 disables skipping. Requests with
+    ``dont_filter`` (resumed or replayed requests) and robots.txt requests are
+    never skipped. Responses served from the HTTP cache are not recorded.
+
+    Settings:
+        SEEN_URLS_ENABLED: Enable the middleware (default: False)
+        SEEN_URLS_DIR: Bloom filter directory, under .scrapy (default: "seen_urls")
+        SEEN_URLS_FRESHNESS: Freshness window in seconds by spider name
+        SEEN_URLS_DEFAULT_FRESHNESS: Window for other spiders (default: 0)
+        SEEN_URLS_BATCH_SIZE: Fetches per upsert (default: 100)
+    """
+
+    def __init__(
+        self,
+        freshness: dict[str, float] | None = None,
+        default_freshness: float = 0,
+        bloom_dir: str | None = None,
+        batch_size: int = 100,
+        session_factory: Callable[[], Any] | None = None,
+        stats: Any = None,
+        crawler: Any = None,
+    ):
+        self.freshness = dict(freshness or {})
+        self.default_freshness = default_freshness
+        self.bloom_dir = bloom_dir
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+        self.stats = stats
+        self.crawler = crawler
+        self.store: Any = None
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> "SeenUrlMiddleware":
+        settings = crawler.settings
+        if not settings.getbool("SEEN_URLS_ENABLED"):
+            raise NotConfigured("SEEN_URLS_ENABLED is off")
+        middleware = cls(
+            freshness=settings.getdict("SEEN_URLS_FRESHNESS"),
+            default_freshness=settings.getfloat("SEEN_URLS_DEFAULT_FRESHNESS", 0),
+            bloom_dir=settings.get("SEEN_URLS_DIR", "seen_urls"),
+            batch_size=settings.getint("SEEN_URLS_BATCH_SIZE", 100),
+            stats=crawler.stats,
+            crawler=crawler,
+        )
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def _spider(self, spider: Any) -> Any:
+        return spider if spider is not None else self.crawler.spider
+
+    def _session(self) -> Any:
+        if self.session_factory is None:
+            from confradar.db.base import get_session
+
+            self.session_factory = get_session
+        return self.session_factory()
+
+    def _inc(self, key: str, count: int = 1) -> None:
+        if self.stats is not None and count:
+            self.stats.inc_value(f"seen_urls/{key}", count)
+
+    def _store(self, spider: Any) -> Any:
+        if self.store is None:
+            from scrapy.utils.project import data_path
+
+            from confradar.seen_urls import SeenUrlStore
+
+            bloom_path = None
+            if self.bloom_dir:
+                bloom_path = f"{data_path(self.bloom_dir, createdir=True)}/{spider.name}.bloom"
+            self.store = SeenUrlStore(spider.name, bloom_path=bloom_path)
+            session = self._session()
+            try:
+                self.store.load(session)
+            finally:
+                session.close()
+        return self.store
+
+    def _window(self, request: Any, spider: Any) -> float:
+        window = request.meta.get("freshness_secs")
+        if window is None:
+            window = getattr(spider, "freshness_secs", None)
+        if window is None:
+            window = self.freshness.get(spider.name, self.default_freshness)
+        return float(window)
+
+    def _fingerprint(self, request: Any) -> str:
+        return self.crawler.request_fingerprinter.fingerprint(request).hex()
+
+    def process_request(self, request: Any, spider: Any = None) -> None:
+        spider = self._spider(spider)
+        if request.dont_filter or request.meta.get("dont_obey_robotstxt"):
+            return None
+        window = self._window(request, spider)
+        if window <= 0:
+            return None
+        store = self._store(spider)
+        session = self._session()
+        try:
+            fresh = store.is_fresh(session, self._fingerprint(request), window)
+        finally:
+            session.close()
+        if fresh:
+            self._inc("skipped_fresh")
+            raise FreshUrl(request.url)
+        return None
+
+    def process_response(self, request: Any, response: Any, spider: Any = None) -> Any:
+        if "cached" in response.flags or not 200 <= response.status < 300:
+            return response
+        if request.meta.get("dont_obey_robotstxt"):
+            return response
+        store = self._store(self._spider(spider))
+        store.record(self._fingerprint(request), response.url)
+        self._inc("recorded")
+        if store.pending >= self.batch_size:
+            self.flush()
+        return response
+
+    def flush(self) -> None:
+        """Write recorded fetches in one transaction."""
+        if self.store is None or not self.store.pending:
+            return
+        session = self._session()
+        try:
+            self.store.flush(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def spider_closed(self, spider: Any) -> None:
+        if self.store is not None:
+            self._inc("bloom_negative", self.store.stats.bloom_negative)
+            self._inc("lookups", self.store.stats.lookups)
+        self.flush()
+
+
+class UnchangedContent(IgnoreRequest):
+    """Raised for a response whose content is unchanged since its last parse."""
+
+
+def _method_name(method: Any) -> str | None:
+    return getattr(method, "__name__", None) if method else None
+
+
+def _json_safe(values: dict[str, Any]) -> dict[str, Any]:
+    safe = {}
+    for key, value in values.items():
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        safe[key] = value
+    return safe
+
+
+def request_state(request: Any) -> dict[str, Any]:
+    """JSON form of a request, for rebuilding it in a later crawl.
+
+    Keeps the callback and errback (as spider method names), priority, and the
+    JSON-serializable entries of ``meta`` and ``cb_kwargs``; other entries
+    (objects set by middlewares) cannot be stored and are dropped.
+    """
+    return {
+        "url": request.url,
+        "callback": _method_name(request.callback),
+        "errback": _method_name(request.errback),
+        "priority": request.priority,
+        "meta": _json_safe(request.meta),
+        "cb_kwargs": _json_safe(request.cb_kwargs),
+    }
+
+
+def request_from_state(state: dict[str, Any] | list[Any], spider: Any, **kwargs: Any) -> Any:
+    """Rebuild a request saved by ``request_state``; ``kwargs["meta"]`` is merged in.
+
+    Also accepts the ``[url, callback]`` pairs stored before meta was kept.
+    """
+    if isinstance(state, list):
+        url, callback = state
+        state = {"url": url, "callback": callback}
+    callback, errback = state.get("callback"), state.get("errback")
+    return Request(
+        state["url"],
+        callback=getattr(spider, callback) if callback else None,
+        errback=getattr(spider, errback) if errback else None,
+        priority=state.get("priority", 0),
+        meta={**state.get("meta", {}), **kwargs.pop("meta", {})},
+        cb_kwargs=state.get("cb_kwargs", {}),
+        **kwargs,
+    )
+
+
+class ContentGateMiddleware:
+    """Skip spider callbacks for pages unchanged since their last successful parse.
+
+    Each response is digested (``confradar.content_gate``) and compared with the
+    page's stored fingerprint. Unchanged responses never reach the callback, so
+    they produce no items and no database writes; the requests their last parse
+    yielded (e.g., pagination) are replayed so the crawl still reaches pages
+    behind them, with their meta, cb_kwargs, priority and errback
+    (``request_state``).
+
+    Fingerprints are recorded once a callback's output has been fully
+    consumed, but only written when the spider closes, after the item
+    pipelines have stored the items. If any item failed to be stored (an
+    ``item_error`` or a ``db/flush_errors``/``db/item_errors`` stat), none are
+    written, so the next crawl parses those pages again.
+
+    Spiders can set a ``parser_version`` attribute; bumping it invalidates their
+    stored fingerprints. Requests with ``meta["dont_gate"]`` are never skipped.
+
+    Settings:
+        CONTENT_GATE_ENABLED: Enable the middleware (default: False)
+        CONTENT_GATE_MAX_DISTANCE: Simhash bits that may differ (default: 3)
+    """
+
+    WRITE_ERROR_STATS = ("db/flush_errors", "db/item_errors")
+
+    def __init__(
+        self,
+        gate: Any,
+        session_factory: Callable[[], Any] | None = None,
+        stats: Any = None,
+        crawler: Any = None,
+    ):
+        self.gate = gate
+        self.session_factory = session_factory
+        self.stats = stats
+        self.crawler = crawler
+        self.item_errors = 0
+        self._loaded = False
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> "ContentGateMiddleware":
+        settings = crawler.settings
+        if not settings.getbool("CONTENT_GATE_ENABLED"):
+            raise NotConfigured("CONTENT_GATE_ENABLED is off")
+
+        from confradar.content_gate import DEFAULT_MAX_DISTANCE, ContentGate
+
+        middleware = cls(
+            ContentGate(
+                max_distance=settings.getint("CONTENT_GATE_MAX_DISTANCE", DEFAULT_MAX_DISTANCE)
+            ),
+            stats=crawler.stats,
+            crawler=crawler,
+        )
+        crawler.signals.connect(middleware.item_error, signal=signals.item_error)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def _spider(self, spider: Any) -> Any:
+        return spider if spider is not None else self.crawler.spider
+
+    def _session(self) -> Any:
+        if self.session_factory is None:
+            from confradar.db.base import get_session
+
+            self.session_factory = get_session
+        return self.session_factory()
+
+    def _load(self, spider: Any) -> None:
+        session = self._session()
+        try:
+            self.gate.load(session, source=spider.name)
+        finally:
+            session.close()
+        self._loaded = True
+
+    def _inc(self, key: str, count: int = 1) -> None:
+        if self.stats is not None:
+            self.stats.inc_value(f"content_gate/{key}", count)
+
+    def process_spider_input(self, response: Any, spider: Any = None) -> None:
+        spider = self._spider(spider)
+        if response.status != 200 or response.meta.get("dont_gate"):
+            return
+        if not self._loaded:
+            self._load(spider)
+
+        from confradar.content_gate import digest
+
+        page = digest(response.body)
+        response.meta["content_digest"] = page
+        if self.gate.check(response.url, page, str(getattr(spider, "parser_version", ""))):
+            response.meta["content_unchanged"] = True
+            self._inc("unchanged")
+            raise UnchangedContent(response.url)
+        self._inc("parsed")
+
+    def process_spider_exception(
+        self, response: Any, exception: Exception, spider: Any = None
+    ) -> list[Any] | None:
+        if not isinstance(exception, UnchangedContent):
+            return None
+        spider = self._spider(spider)
+        requests = [
+            request_from_state(state, spider) for state in self.gate.follow_ups(response.url)
+        ]
+        self._inc("replayed_requests", len(requests))
+        return requests
+
+    def process_spider_output(
+        self, response: Any, result: Iterable[Any], spider: Any = None
+    ) -> Iterator[Any]:
+        follow_ups: list[dict[str, Any]] = []
+        for obj in result:
+            if isinstance(obj, Request):
+                follow_ups.append(request_state(obj))
+            yield obj
+        self._record(response, follow_ups, self._spider(spider))
+
+    async def process_spider_output_async(
+        self, response: Any, result: AsyncIterator[Any], spider: Any = None
+    ) -> AsyncIterator[Any]:
+        follow_ups: list[dict[str, Any]] = []
+        async for obj in result:
+            if isinstance(obj, Request):
+                follow_ups.append(request_state(obj))
+            yield obj
+        self._record(response, follow_ups, self._spider(spider))
+
+    def _record(self, response: Any, follow_ups: list[dict[str, Any]], spider: Any) -> None:
+        page = response.meta.get("content_digest")
+        if page is None:
+            return
+        self.gate.record(
+            response.url,
+            page,
+            source=spider.name,
+            version=str(getattr(spider, "parser_version", "")),
+            follow_ups=follow_ups,
+        )
+
+    def flush(self) -> None:
+        """Upsert recorded fingerprints in one transaction."""
+        if not self.gate.pending:
+            return
+        session = self._session()
+        try:
+            self.gate.flush(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def item_error(self, item: Any, response: Any, spider: Any, failure: Any) -> None:
+        self.item_errors += 1
+
+    def _write_errors(self) -> int:
+        stats = (
+            [self.stats.get_value(key, 0) for key in self.WRITE_ERROR_STATS] if self.stats else []
+        )
+        return self.item_errors + sum(stats)
+
+    def spider_closed(self, spider: Any) -> None:
+        errors = self._write_errors()
+        if errors and self.gate.pending:
+            spider.logger.warning(
+                f"Not recording {self.gate.pending} content fingerprints: "
+                f"{errors} items failed to be stored"
+            )
+            self._inc("discarded", self.gate.pending)
+            return
+        self.flush()
+
+
+def _truthy(value: Any) -> bool:
+    # Spider arguments (-a incremental=1) arrive as strings
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+class CrawlFrontierMiddleware:
+    """Persist the crawl frontier of resumable spiders so reruns resume and stop early.
+
+    Applies to spiders with ``resumable = True``. Requests they yield are kept
+    as pending (with their meta, cb_kwargs, priority and errback,
+    ``request_state``) and pages they parse as seen, in ``crawl_requests``
+    (``confradar.frontier``), flushed every ``CRAWL_FRONTIER_BATCH_SIZE`` pages
+    and when the spider closes. If the previous crawl did not finish, the next
+    one starts from its pending requests instead of the start URLs and skips
+    pages it already parsed.
+
+    In incremental mode (``CRAWL_FRONTIER_INCREMENTAL`` or ``-a incremental=1``)
+    a page whose items were all seen in an earlier finished crawl, or whose
+    content is unchanged (``ContentGateMiddleware``), yields no follow-up
+    requests, so pagination stops there. Placed below ``ContentGateMiddleware``
+    (950) so it also sees the requests the gate replays.
+
+    Settings:
+        CRAWL_FRONTIER_ENABLED: Enable the middleware (default: False)
+        CRAWL_FRONTIER_BATCH_SIZE: Parsed pages per state flush (default: 10)
+        CRAWL_FRONTIER_INCREMENTAL: Incremental mode for every resumable spider
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 10,
+        incremental: bool = False,
+        session_factory: Callable[[], Any] | None = None,
+        stats: Any = None,
+        crawler: Any = None,
+    ):
+        self.batch_size = batch_size
+        self.incremental = incremental
+        self.session_factory = session_factory
+        self.stats = stats
+        self.crawler = crawler
+        self.frontier: Any = None
+        self._unflushed = 0
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> "CrawlFrontierMiddleware":
+        settings = crawler.settings
+        if not settings.getbool("CRAWL_FRONTIER_ENABLED"):
+            raise NotConfigured("CRAWL_FRONTIER_ENABLED is off")
+        middleware = cls(
+            batch_size=settings.getint("CRAWL_FRONTIER_BATCH_SIZE", 10),
+            incremental=settings.getbool("CRAWL_FRONTIER_INCREMENTAL"),
+            stats=crawler.stats,
+            crawler=crawler,
+        )
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def _spider(self, spider: Any) -> Any:
+        return spider if spider is not None else self.crawler.spider
+
+    def _session(self) -> Any:
+        if self.session_factory is None:
+            from confradar.db.base import get_session
+
+            self.session_factory = get_session
+        return self.session_factory()
+
+    def _inc(self, key: str, count: int = 1) -> None:
+        if self.stats is not None and count:
+            self.stats.inc_value(f"frontier/{key}", count)
+
+    def _frontier(self, spider: Any) -> Any:
+        """The spider's frontier, loaded on first use; None for non-resumable spiders."""
+        if not getattr(spider, "resumable", False):
+            return None
+        if self.frontier is None:
+            from confradar.frontier import CrawlFrontier
+
+            self.frontier = CrawlFrontier(spider.name)
+            session = self._session()
+            try:
+                if self.frontier.load(session):
+                    spider.logger.info(
+                        f"Resuming crawl after {self.frontier.pages} pages at "
+                        f"{self.frontier.cursor} ({len(self.frontier.pending)} pending)"
+                    )
+            finally:
+                session.close()
+        return self.frontier
+
+    def _is_incremental(self, spider: Any) -> bool:
+        return self.incremental or _truthy(getattr(spider, "incremental", False))
+
+    def _fingerprint(self, request: Any) -> str:
+        return request.meta.get("frontier_fingerprint") or (
+            self.crawler.request_fingerprinter.fingerprint(request).hex()
+        )
+
+    async def process_start(self, start: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        spider = self.crawler.spider
+        frontier = self._frontier(spider)
+        if frontier is None or not frontier.resuming or not frontier.pending:
+            async for obj in start:
+                yield obj
+            return
+        for fingerprint, state in list(frontier.pending.items()):
+            self._inc("resumed_requests")
+            yield request_from_state(
+                state, spider, meta={"frontier_fingerprint": fingerprint}, dont_filter=True
+            )
+
+    def process_spider_output(
+        self, response: Any, result: Iterable[Any], spider: Any = None
+    ) -> Iterator[Any]:
+        spider = self._spider(spider)
+        if self._frontier(spider) is None:
+            yield from result
+            return
+        keys: list[str] = []
+        requests: list[Any] = []
+        for obj in result:
+            if isinstance(obj, Request):
+                requests.append(obj)
+                continue
+            keys.extend(self._item_keys(obj))
+            yield obj
+        yield from self._page_done(response, keys, requests, spider)
+
+    async def process_spider_output_async(
+        self, response: Any, result: AsyncIterator[Any], spider: Any = None
+    ) -> AsyncIterator[Any]:
+        spider = self._spider(spider)
+        if self._frontier(spider) is None:
+            async for obj in result:
+                yield obj
+            return
+        keys: list[str] = []
+        requests: list[Any] = []
+        async for obj in result:
+            if isinstance(obj, Request):
+                requests.append(obj)
+                continue
+            keys.extend(self._item_keys(obj))
+            yield obj
+        for request in self._page_done(response, keys, requests, spider):
+            yield request
+
+    @staticmethod
+    def _item_keys(obj: Any) -> list[str]:
+        from itemadapter import ItemAdapter, is_item
+
+        if not is_item(obj):
+            return []
+        key = ItemAdapter(obj).get("key")
+        return [key] if key else []
+
+    def _page_done(
+        self, response: Any, keys: list[str], requests: list[Any], spider: Any
+    ) -> list[Any]:
+        """Record a parsed page; returns the follow-up requests to schedule."""
+        frontier = self.frontier
+        if requests and self._is_incremental(spider):
+            if response.meta.get("content_unchanged") or frontier.all_known(keys):
+                spider.logger.info(f"Incremental crawl: nothing new at {response.url}, stopping")
+                self._inc("incremental_stops")
+                requests = []
+
+        follow_ups = []
+        for request in requests:
+            fingerprint = self._fingerprint(request)
+            if frontier.enqueue(fingerprint, request_state(request)):
+                request.meta["frontier_fingerprint"] = fingerprint
+                follow_ups.append(request)
+            else:
+                self._inc("skipped_seen")
+
+        frontier.page_done(self._fingerprint(response.request), response.url, keys)
+        self._inc("pages")
+        self._unflushed += 1
+        if self._unflushed >= self.batch_size:
+            self.flush()
+        return follow_ups
+
+    def flush(self) -> None:
+        """Write the frontier state in one transaction."""
+        if self.frontier is None or not self.frontier.dirty:
+            return
+        session = self._session()
+        try:
+            self.frontier.flush(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        self._unflushed = 0
+
+    def spider_closed(self, spider: Any, reason: str = "finished") -> None:
+        if self.frontier is None:
+            return
+        if reason == "finished":
+            self.frontier.finish(incremental=self._is_incremental(spider))
+        self.flush()
+
+
+class CallbackTimingMiddleware:
+    """Time spider callbacks and record response size and yield per response.
+
+    Observes, per response, into the crawl's timings
+    (``confradar.scrapers.timing``): time spent inside the callback
+    (``callback/<name>``), download latency (``download``), body size
+    (``response_bytes``) and items yielded (``items_per_response``). Callback
+    time only counts the callback's own iteration, not the middlewares and
+    pipelines that consume its output, so it sits closest to the spider (990).
+    ``SpiderTimingExtension`` reports the histograms when the spider closes.
+
+    Settings:
+        SPIDER_TIMING_ENABLED: Enable the middleware and extension (default: False)
+    """
+
+    def __init__(self, timings: Any):
+        self.timings = timings
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> "CallbackTimingMiddleware":
+        if not crawler.settings.getbool("SPIDER_TIMING_ENABLED"):
+            raise NotConfigured("SPIDER_TIMING_ENABLED is off")
+
+        from confradar.scrapers.timing import crawl_timings
+
+        return cls(crawl_timings(crawler, create=True))
+
+    def _response(self, response: Any) -> str:
+        latency = response.meta.get("download_latency")
+        if latency is not None:
+            self.timings.observe("download", latency * 1000)
+        self.timings.observe("response_bytes", len(response.body), unit="bytes")
+        callback = getattr(response.request, "callback", None) if response.request else None
+        return f"callback/{getattr(callback, '__name__', None) or 'parse'}"
+
+    def _done(self, name: str, elapsed: float, items: int) -> None:
+        self.timings.observe(name, elapsed * 1000)
+        self.timings.observe("items_per_response", items, unit="items")
+
+    def process_spider_output(
+        self, response: Any, result: Iterable[Any], spider: Any = None
+    ) -> Iterator[Any]:
+        name = self._response(response)
+        elapsed, items = 0.0, 0
+        iterator = iter(result)
+        while True:
+            started = time.perf_counter()
+            try:
+                obj = next(iterator)
+            except StopIteration:
+                elapsed += time.perf_counter() - started
+                break
+            elapsed += time.perf_counter() - started
+            items += not isinstance(obj, Request)
+            yield obj
+        self._done(name, elapsed, items)
+
+    async def process_spider_output_async(
+        self, response: Any, result: AsyncIterator[Any], spider: Any = None
+    ) -> AsyncIterator[Any]:
+        name = self._response(response)
+        elapsed, items = 0.0, 0
+        iterator = aiter(result)
+        while True:
+            started = time.perf_counter()
+            try:
+                obj = await anext(iterator)
+            except StopAsyncIteration:
+                elapsed += time.perf_counter() - started
+                break
+            elapsed += time.perf_counter() - started
+            items += not isinstance(obj, Request)
+            yield obj
+        self._done(name, elapsed, items)
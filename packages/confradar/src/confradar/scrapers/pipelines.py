@@ -1,11 +1,19 @@
 """Scrapy pipelines for processing conference items."""
 
+import queue
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
 from typing import Any
 
+from .timing import timed_stage
+
 
 class ValidationPipeline:
     """Validate conference items have required fields."""
 
+    @timed_stage
     def process_item(self, item: dict, spider: Any) -> dict:
         """Validate item has required fields."""
         required = ["key", "name"]
@@ -29,6 +37,7 @@ class DeduplicationPipeline:
         """Reset seen keys at start of spider."""
         self.seen_keys = set()
 
+    @timed_stage
     def process_item(self, item: dict, spider: Any) -> dict:
         """Drop item if we've seen this conference key already."""
         key = item.get("key")
@@ -44,18 +53,22 @@ class DatabasePipeline:
 
     def __init__(self):
         self.session = None
+        self.identity = None
 
     def open_spider(self, spider: Any) -> None:
         """Connect to database."""
         from confradar.db.base import get_session
+        from confradar.db.identity import IdentityMap
 
         self.session = get_session()
+        self.identity = IdentityMap()
 
     def close_spider(self, spider: Any) -> None:
         """Close database connection."""
         if self.session:
             self.session.close()
 
+    @timed_stage
     def process_item(self, item: dict, spider: Any) -> dict:
         """Save conference to database.
 
@@ -64,6 +77,7 @@ class DatabasePipeline:
         - Source record (linking to scraper source)
         - Deadline records (one for each deadline)
         """
+        from sqlalchemy import update
         from sqlalchemy.exc import IntegrityError
 
         from confradar.db.models import Conference, Deadline, Source
@@ -72,42 +86,56 @@ class DatabasePipeline:
             raise RuntimeError("Database session not initialized")
 
         try:
-            # Find or create conference
-            conference = self.session.query(Conference).filter_by(key=item["key"]).first()
-
-            if not conference:
-                conference = Conference(
-                    key=item["key"], name=item["name"], homepage=item.get("homepage")
-                )
-                self.session.add(conference)
-                self.session.flush()  # Get the ID
+            # Find or create conference (cached ids skip the lookup)
+            conference_id = self.identity.get_conference(item["key"])
+
+            if conference_id is None:
+                conference = self.session.query(Conference).filter_by(key=item["key"]).first()
+                if not conference:
+                    conference = Conference(
+                        key=item["key"], name=item["name"], homepage=item.get("homepage")
+                    )
+                    self.session.add(conference)
+                    self.session.flush()  # Get the ID
+                else:
+                    # Update existing conference
+                    conference.name = item["name"]
+                    if item.get("homepage"):
+                        conference.homepage = item.get("homepage")
+                conference_id = conference.id
             else:
-                # Update existing conference
-                conference.name = item["name"]
+                # Update existing conference in place, without reading it back
+                values: dict[str, Any] = {"name": item["name"]}
                 if item.get("homepage"):
-                    conference.homepage = item.get("homepage")
-
-            # Create or update source
-            source_url = item.get("url", "")
-            source = (
-                self.session.query(Source)
-                .filter_by(conference_id=conference.id, url=source_url)
-                .first()
-            )
-
-            if not source:
-                source = Source(
-                    conference_id=conference.id,
-                    url=source_url,
-                    notes=(
-                        "Scraped by "
-                        f"{item.get('source', 'unknown')} "
-                        "on "
-                        f"{item.get('scraped_at', '')}"
-                    ),
+                    values["homepage"] = item.get("homepage")
+                self.session.execute(
+                    update(Conference).where(Conference.id == conference_id).values(**values)
+                )
+
+            # Create or update source; items without a URL have none
+            source_url = item.get("url")
+            source_id = self.identity.get_source(conference_id, source_url) if source_url else None
+            if source_url and source_id is None:
+                source = (
+                    self.session.query(Source)
+                    .filter_by(conference_id=conference_id, url=source_url)
+                    .first()
                 )
-                self.session.add(source)
-                self.session.flush()
+
+                if not source:
+                    source = Source(
+                        conference_id=conference_id,
+                        url=source_url,
+                        notes=(
+                            "Scraped by "
+                            f"{item.get('source', 'unknown')} "
+                            "on "
+                            f"{item.get('scraped_at', '')}"
+                        ),
+                    )
+                    self.session.add(source)
+                    self.session.flush()
+                source_id = source.id
 
             # Process deadlines
             for deadline_data in item.get("deadlines", []):
@@ -147,7 +175,7 @@ class DatabasePipeline:
                 existing_deadline = (
                     self.session.query(Deadline)
                     .filter_by(
-                        conference_id=conference.id,
+                        conference_id=conference_id,
                         kind=deadline_data.get("kind", "submission"),
                         due_date=due_date_obj,
                     )
@@ -156,22 +184,241 @@ class DatabasePipeline:
 
                 if not existing_deadline:
                     deadline = Deadline(
-                        conference_id=conference.id,
+                        conference_id=conference_id,
                         kind=deadline_data.get("kind", "submission"),
                         due_date=due_date_obj,
                         timezone=deadline_data.get("timezone"),
-                        source_id=source.id,
+                        source_id=source_id,
                     )
                     self.session.add(deadline)
 
             self.session.commit()
+            self.identity.add_conference(item["key"], conference_id)
+            self.identity.add_source(conference_id, source_url, source_id)
 
         except IntegrityError as e:
             self.session.rollback()
+            self.identity.clear()
             spider.logger.warning(f"Database integrity error for {item['key']}: {e}")
         except Exception as e:
             self.session.rollback()
+            self.identity.clear()
             spider.logger.error(f"Database error for {item['key']}: {e}")
             raise
 
         return item
+
+
+class BatchingDatabasePipeline:
+    """Store conferences in the database in batches from a background writer thread.
+
+    Items are handed to a bounded queue and returned immediately, so database
+    latency never blocks Scrapy's reactor. The writer thread collects up to
+    ``DB_BATCH_SIZE`` items or waits ``DB_BATCH_INTERVAL_MS`` milliseconds, then
+    writes the batch with bulk upserts in a single transaction. When the queue is
+    full (``DB_WRITE_QUEUE_SIZE``), ``process_item`` blocks until the writer
+    catches up, applying backpressure to the crawl. Remaining items are flushed and
+    committed on ``close_spider``. A failed batch is retried item by item, so a bad
+    item is skipped (``db/item_errors``) without losing the rest; a connection-level
+    error stops the writer, and the next ``process_item`` or ``close_spider``
+    raises it instead of waiting on the queue.
+
+    Settings:
+        DB_BATCH_SIZE: Maximum items per transaction (default: 200)
+        DB_BATCH_INTERVAL_MS: Maximum time an item waits before being flushed (default: 1000)
+        DB_WRITE_QUEUE_SIZE: Maximum items buffered ahead of the writer (default: 1000)
+    """
+
+    _STOP = object()
+    # Seconds between writer checks while waiting on a full queue
+    _PUT_TIMEOUT_S = 1.0
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        batch_interval_ms: int = 1000,
+        queue_size: int = 1000,
+        session_factory: Callable[[], Any] | None = None,
+        stats: Any = None,
+    ):
+        self.batch_size = batch_size
+        self.batch_interval_s = batch_interval_ms / 1000
+        self.queue_size = queue_size
+        self.session_factory = session_factory
+        self.stats = stats
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.writer: threading.Thread | None = None
+        self.error: BaseException | None = None
+        self.logger: Any = None
+        self.identity: Any = None
+        self.run_id: str | None = None
+
+    @classmethod
+    def from_crawler(cls, crawler: Any) -> "BatchingDatabasePipeline":
+        settings = crawler.settings
+        return cls(
+            batch_size=settings.getint("DB_BATCH_SIZE", 200),
+            batch_interval_ms=settings.getint("DB_BATCH_INTERVAL_MS", 1000),
+            queue_size=settings.getint("DB_WRITE_QUEUE_SIZE", 1000),
+            stats=crawler.stats,
+        )
+
+    def open_spider(self, spider: Any) -> None:
+        """Start the background writer thread."""
+        from confradar.db.identity import IdentityMap
+
+        if self.session_factory is None:
+            from confradar.db.base import get_session
+
+            self.session_factory = get_session
+
+        self.identity = IdentityMap()
+        self.run_id = f"{spider.name}:{datetime.now(timezone.utc).isoformat()}"
+        self.logger = spider.logger
+        self.error = None
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self.writer = threading.Thread(
+            target=self._run, name=f"db-writer-{spider.name}", daemon=True
+        )
+        self.writer.start()
+
+    def close_spider(self, spider: Any) -> None:
+        """Flush remaining items, commit and stop the writer thread."""
+        if self.writer is None:
+            return
+        try:
+            self._put(self._STOP)
+        finally:
+            self.writer.join()
+            self.writer = None
+        if self.error is not None:
+            raise RuntimeError("Database writer failed") from self.error
+
+    @timed_stage
+    def process_item(self, item: dict, spider: Any) -> dict:
+        """Enqueue item for the writer thread (blocks while the queue is full)."""
+        if self.writer is None:
+            raise RuntimeError("Database writer not started")
+        if self.queue.full():
+            self._inc("db/queue_full")
+        self._put(dict(item))
+        return item
+
+    def _put(self, entry: Any) -> None:
+        """Enqueue ``entry``, waiting while the queue is full; raises once the writer stops."""
+        while True:
+            if self.error is not None:
+                raise RuntimeError("Database writer failed") from self.error
+            if not self.writer.is_alive():
+                raise RuntimeError("Database writer stopped")
+            try:
+                self.queue.put(entry, timeout=self._PUT_TIMEOUT_S)
+                return
+            except queue.Full:
+                continue
+
+    def _run(self) -> None:
+        """Writer loop: collect items until the batch is full or the interval elapses."""
+        batch: list[dict] = []
+        deadline: float | None = None
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                entry = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+
+            if entry is self._STOP:
+                stopping = True
+            elif entry is not None:
+                batch.append(entry)
+                if deadline is None:
+                    deadline = time.monotonic() + self.batch_interval_s
+
+            expired = deadline is not None and time.monotonic() >= deadline
+            if batch and (stopping or expired or len(batch) >= self.batch_size):
+                self._flush(batch)
+                if self.error is not None:
+                    return  # connection-level failure: write nothing more
+                batch = []
+                deadline = None
+
+    def _flush(self, batch: list[dict]) -> None:
+        """Write one batch in a single transaction.
+
+        When the batch fails, its items are retried one by one so a bad item only
+        loses itself; only a connection-level failure stops the writer.
+        """
+        from confradar.db.ingest import IngestStats
+
+        started = time.perf_counter()
+        try:
+            stats = self._write(batch)
+        except Exception as e:
+            if self._fatal(e, len(batch)):
+                return
+            self._inc("db/flush_errors")
+            if self.logger:
+                self.logger.warning(
+                    f"Database error flushing {len(batch)} items, retrying one by one: {e}"
+                )
+            stats = IngestStats()
+            for item in batch:
+                try:
+                    stats.merge(self._write([item]))
+                except Exception as e:
+                    if self._fatal(e, len(batch)):
+                        return
+                    self._inc("db/item_errors")
+                    if self.logger:
+                        self.logger.error(f"Database error for {item.get('key')}: {e}")
+
+        self._inc("db/batches")
+        self._inc("db/items", stats.items)
+        self._inc("db/deadlines", stats.deadlines)
+        self._inc("db/deadlines_added", stats.changes.added)
+        self._inc("db/deadlines_moved", stats.changes.moved)
+        self._inc("db/deadlines_removed", stats.changes.removed)
+        if self.stats is not None:
+            self.stats.set_value("db/identity_hits", self.identity.hits)
+            self.stats.set_value("db/identity_queries", self.identity.queries)
+            self.stats.max_value("db/max_flush_ms", int((time.perf_counter() - started) * 1000))
+        if self.logger and stats.skipped_deadlines:
+            self.logger.warning(f"Skipped {stats.skipped_deadlines} deadlines with invalid dates")
+
+    def _write(self, items: list[dict]) -> Any:
+        """Upsert ``items`` and commit; rolls back and re-raises on error."""
+        from confradar.db.ingest import upsert_items
+
+        session = self.session_factory()
+        try:
+            stats = upsert_items(session, items, identity=self.identity, run_id=self.run_id)
+            session.commit()
+            return stats
+        except Exception:
+            session.rollback()
+            # Ids cached during the failed transaction may not exist
+            self.identity.clear()
+            raise
+        finally:
+            session.close()
+
+    def _fatal(self, error: Exception, count: int) -> bool:
+        """Stop the writer on a connection-level error; other errors are per item."""
+        from sqlalchemy.exc import DBAPIError, DisconnectionError, InterfaceError, OperationalError
+
+        fatal = isinstance(error, (DisconnectionError, InterfaceError, OperationalError)) or (
+            isinstance(error, DBAPIError) and error.connection_invalidated
+        )
+        if fatal:
+            self.error = error
+            self._inc("db/flush_errors")
+            if self.logger:
+                self.logger.error(f"Database error flushing {count} items: {error}")
+        return fatal
+
+    def _inc(self, key: str, count: int = 1) -> None:
+        if self.stats is not None:
+            self.stats.inc_value(key, count)
@@ -0,0 +1,110 @@
+"""Name-based registry of scrapers and spiders, imported only when used.
+
+Sources are registered as ``"module:attribute"`` targets, so listing or
+validating names never imports a scraper module (or Scrapy, lxml, httpx).
+Built-in sources are listed below; other packages add sources through entry
+points in their ``pyproject.toml``, which take precedence over a built-in of
+the same name::
+
+    [project.entry-points."confradar.scrapers"]
+    my_source = "my_package.scraper:MySourceScraper"
+
+    [project.entry-points."confradar.spiders"]
+    my_source = "my_package.spider:MySourceSpider"
+
+Example:
+    >>> scraper_cls = scrapers.load("aideadlines")
+    >>> sorted(spiders)
+    ['acl_web', 'ai_deadlines', 'chairing_tool', 'elra', 'seeded', 'wikicfp']
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import cached_property
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Any
+
+SCRAPER_GROUP = "confradar.scrapers"
+SPIDER_GROUP = "confradar.spiders"
+
+# Scraper subclasses by source name. Pages archived by the ai_deadlines spider
+# use the same markup as AIDeadlinesScraper's source
+_BUILTIN_SCRAPERS = {
+    "aideadlines": "confradar.scrapers.ai_deadlines:AIDeadlinesScraper",
+    "ai_deadlines": "confradar.scrapers.ai_deadlines:AIDeadlinesScraper",
+}
+
+# Scrapy spiders by spider name
+_BUILTIN_SPIDERS = {
+    "acl_web": "confradar.scrapers.spiders.acl_web:ACLWebSpider",
+    "ai_deadlines": "confradar.scrapers.spiders.ai_deadlines:AIDeadlinesSpider",
+    "chairing_tool": "confradar.scrapers.spiders.chairing_tool:ChairingToolSpider",
+    "elra": "confradar.scrapers.spiders.elra:ELRASpider",
+    "seeded": "confradar.scrapers.spiders.seeded:SeededSpider",
+    "wikicfp": "confradar.scrapers.spiders.wikicfp:WikiCFPSpider",
+}
+
+
+class Registry:
+    """Lazily imported classes by name: built-ins plus one entry point group.
+
+    Args:
+        group: Entry point group that extends or overrides the built-ins
+        builtin: Name -> ``"module:attribute"`` of the built-in classes
+        kind: Noun used in error messages (e.g., "scraper")
+    """
+
+    def __init__(self, group: str, builtin: dict[str, str], kind: str):
+        self.group = group
+        self.kind = kind
+        self._builtin = dict(builtin)
+        self._loaded: dict[str, Any] = {}
+
+    @cached_property
+    def _targets(self) -> dict[str, str]:
+        # Reading entry point metadata is cheap; importing their targets is not
+        targets = dict(self._builtin)
+        targets.update({ep.name: ep.value for ep in entry_points(group=self.group)})
+        return targets
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._targets))
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def target(self, name: str) -> str:
+        """Return the ``"module:attribute"`` registered for ``name`` without importing it."""
+        try:
+            return self._targets[name]
+        except KeyError:
+            raise ValueError(
+                f"No {self.kind} registered for source {name!r}; expected one of {sorted(self)}"
+            ) from None
+
+    def load(self, name: str) -> Any:
+        """Import and return the class registered for ``name``.
+
+        Raises:
+            ValueError: If no class is registered for ``name``
+        """
+        cls = self._loaded.get(name)
+        if cls is None:
+            module_name, _, attr = self.target(name).partition(":")
+            cls = getattr(import_module(module_name), attr)
+            self._loaded[name] = cls
+        return cls
+
+    def register(self, name: str, target: str) -> None:
+        """Register (or replace) ``name`` at runtime, e.g. in tests."""
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+
+scrapers = Registry(SCRAPER_GROUP, _BUILTIN_SCRAPERS, "scraper")
+spiders = Registry(SPIDER_GROUP, _BUILTIN_SPIDERS, "spider")
@@ -0,0 +1,188 @@
+"""Run many ``Scraper`` sources concurrently on one async connection pool.
+
+Non-Scrapy sources are I/O bound; awaiting them together on a shared
+``httpx.AsyncClient`` turns a sum of download times into roughly the slowest
+one. Connections are capped globally (``max_connections``) and per host
+(``per_host``), and the whole run has a deadline (``timeout``): sources still
+running then are cancelled and reported as timed out. One failing source never
+fails the others.
+
+Example:
+    >>> outcomes = run_scrapers([AIDeadlinesScraper(), OtherScraper()], per_host=2)
+    >>> items = [item for o in outcomes if o.ok for item in o.result.normalized]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .base import Scraper, ScrapeResult
+
+if TYPE_CHECKING:
+    from confradar.archive import RawArchive
+    from confradar.content_gate import ContentGate
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_PER_HOST = 2
+DEFAULT_TIMEOUT = 120.0  # whole run, seconds
+DEFAULT_REQUEST_TIMEOUT = 20.0
+
+
+@dataclass
+class SourceOutcome:
+    """Result or failure of one source in a run."""
+
+    source_name: str
+    result: ScrapeResult | None = None
+    error: str | None = None
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper allowing at most ``per_host`` requests in flight per host.
+
+    The body is read while the host slot is held, so a slot covers the whole
+    download rather than just the response headers.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host: int = DEFAULT_PER_HOST):
+        if per_host < 1:
+            raise ValueError("per_host must be at least 1")
+        self.per_host = per_host
+        self._transport = transport
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slots.get(request.url.host)
+        if slot is None:
+            slot = self._slots[request.url.host] = asyncio.Semaphore(self.per_host)
+        async with slot:
+            response = await self._transport.handle_async_request(request)
+            try:
+                await response.aread()
+            except BaseException:
+                await response.aclose()
+                raise
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def make_client(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    per_host: int = DEFAULT_PER_HOST,
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Shared client with a global connection cap and per-host limits.
+
+    Args:
+        max_connections: Pool size across all hosts
+        per_host: Requests in flight per host
+        request_timeout: Default timeout of each request, seconds
+        transport: Underlying transport (tests pass ``httpx.MockTransport``)
+    """
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            )
+        )
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(transport, per_host),
+        timeout=request_timeout,
+        follow_redirects=True,
+    )
+
+
+async def _run_one(
+    scraper: Scraper,
+    client: httpx.AsyncClient,
+    archive: RawArchive | None,
+    gate: ContentGate | None,
+    kwargs: dict[str, Any],
+) -> SourceOutcome:
+    started = time.perf_counter()
+    try:
+        result = await scraper.ascrape(client=client, archive=archive, gate=gate, **kwargs)
+    except Exception as e:
+        return SourceOutcome(
+            scraper.source_name,
+            error=f"{type(e).__name__}: {e}",
+            elapsed_s=time.perf_counter() - started,
+        )
+    return SourceOutcome(scraper.source_name, result, elapsed_s=time.perf_counter() - started)
+
+
+async def arun_scrapers(
+    scrapers: Sequence[Scraper],
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    per_host: int = DEFAULT_PER_HOST,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    archive: RawArchive | None = None,
+    gate: ContentGate | None = None,
+    client: httpx.AsyncClient | None = None,
+    **kwargs: Any,
+) -> list[SourceOutcome]:
+    """Run ``ascrape`` of every scraper concurrently on one client.
+
+    Args:
+        scrapers: Sources to run
+        max_connections: Pool size across all hosts (ignored with ``client``)
+        per_host: Requests in flight per host (ignored with ``client``)
+        timeout: Deadline for the whole run in seconds; None waits indefinitely
+        request_timeout: Default per-request timeout (ignored with ``client``)
+        archive: Raw archive passed to each ``ascrape``; ``archive.flush`` writes its index rows
+        gate: Content gate passed to each ``ascrape``
+        client: Client to use instead of a new ``make_client`` one; not closed
+        **kwargs: Passed to each ``ascrape``
+
+    Returns:
+        One SourceOutcome per scraper, in input order
+    """
+    if client is None:
+        async with make_client(max_connections, per_host, request_timeout) as own:
+            return await arun_scrapers(
+                scrapers, timeout=timeout, archive=archive, gate=gate, client=own, **kwargs
+            )
+
+    tasks = [
+        asyncio.create_task(_run_one(scraper, client, archive, gate, kwargs))
+        for scraper in scrapers
+    ]
+    if not tasks:
+        return []
+    started = time.perf_counter()
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    elapsed = time.perf_counter() - started
+    return [
+        (
+            task.result()
+            if task not in pending
+            else SourceOutcome(
+                scraper.source_name, error=f"Timed out after {timeout:g}s", elapsed_s=elapsed
+            )
+        )
+        for scraper, task in zip(scrapers, tasks, strict=True)
+    ]
+
+
+def run_scrapers(scrapers: Sequence[Scraper], **kwargs: Any) -> list[SourceOutcome]:
+    """Blocking wrapper around ``arun_scrapers`` for sync callers (Dagster ops, CLI)."""
+    return asyncio.run(arun_scrapers(scrapers, **kwargs))
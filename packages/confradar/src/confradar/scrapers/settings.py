@@ -39,30 +39,74 @@ DEFAULT_REQUEST_HEADERS = {
 
 # Enable or disable spider middlewares
 # See https://docs.scrapy.org/en/latest/topics/spider-middleware.html
-# SPIDER_MIDDLEWARES = {
-#    "confradar.scrapers.middlewares.ConfradarSpiderMiddleware": 543,
-# }
+SPIDER_MIDDLEWARES = {
+    # Above DepthMiddleware (900) so replayed follow-up requests get depth/referer
+    "confradar.scrapers.middlewares.ContentGateMiddleware": 950,
+    # Below the content gate so replayed follow-ups reach the frontier
+    "confradar.scrapers.middlewares.CrawlFrontierMiddleware": 940,
+    # Closest to the spider so only the callback's own iteration is timed
+    "confradar.scrapers.middlewares.CallbackTimingMiddleware": 990,
+}
 
 # Enable or disable downloader middlewares
 # See https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
-# DOWNLOADER_MIDDLEWARES = {
-#    "confradar.scrapers.middlewares.ConfradarDownloaderMiddleware": 543,
-# }
+DOWNLOADER_MIDDLEWARES = {
+    # Below HttpCompressionMiddleware (590) so bodies are archived decompressed
+    "confradar.scrapers.middlewares.RawArchiveMiddleware": 580,
+    # Above RobotsTxtMiddleware (100) and HttpCacheMiddleware (900): fresh URLs are
+    # dropped before any lookup, and cache hits are not recorded as fetches
+    "confradar.scrapers.middlewares.SeenUrlMiddleware": 50,
+}
+
+# Content-addressed raw page archive (see RawArchiveMiddleware); the directory
+# and compression level default to RAW_ARCHIVE_DIR / RAW_ARCHIVE_LEVEL from .env
+RAW_ARCHIVE_ENABLED = True
+RAW_ARCHIVE_BATCH_SIZE = 100
+
+# Skip callbacks for pages unchanged since their last parse (see ContentGateMiddleware);
+# disable for a full reparse, or bump a spider's parser_version after a parser fix
+CONTENT_GATE_ENABLED = True
+CONTENT_GATE_MAX_DISTANCE = 3
+
+# Persist the frontier of resumable spiders (see CrawlFrontierMiddleware); a rerun
+# of an interrupted crawl resumes, and incremental mode stops at known listings
+CRAWL_FRONTIER_ENABLED = True
+CRAWL_FRONTIER_BATCH_SIZE = 10
+CRAWL_FRONTIER_INCREMENTAL = False
+
+# Remember fetched URLs across crawls (see SeenUrlMiddleware); a URL fetched less
+# than its spider's freshness window ago (seconds, 0 = always fetch) is skipped.
+# Off until a spider has a window; needs the seen_urls table (alembic upgrade head)
+SEEN_URLS_ENABLED = False
+SEEN_URLS_DIR = "seen_urls"
+SEEN_URLS_FRESHNESS = {}
+SEEN_URLS_DEFAULT_FRESHNESS = 0
+SEEN_URLS_BATCH_SIZE = 100
+
+# Histograms of callback, download and pipeline stage times (see SpiderTimingExtension);
+# summaries go to the stats and full histograms to .scrapy/<SPIDER_TIMING_DIR>/<spider>/
+SPIDER_TIMING_ENABLED = True
+SPIDER_TIMING_DIR = "timing"
 
 # Enable or disable extensions
 # See https://docs.scrapy.org/en/latest/topics/extensions.html
-# EXTENSIONS = {
-#    "scrapy.extensions.telnet.TelnetConsole": None,
-# }
+EXTENSIONS = {
+    "confradar.scrapers.extensions.SpiderTimingExtension": 500,
+}
 
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 ITEM_PIPELINES = {
     "confradar.scrapers.pipelines.ValidationPipeline": 100,
     "confradar.scrapers.pipelines.DeduplicationPipeline": 200,
-    "confradar.scrapers.pipelines.DatabasePipeline": 300,  # Store in PostgreSQL
+    "confradar.scrapers.pipelines.BatchingDatabasePipeline": 300,  # Store in PostgreSQL
 }
 
+# Batched database writes (see BatchingDatabasePipeline)
+DB_BATCH_SIZE = 200
+DB_BATCH_INTERVAL_MS = 1000
+DB_WRITE_QUEUE_SIZE = 1000
+
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
 AUTOTHROTTLE_ENABLED = True
@@ -81,8 +125,14 @@ AUTOTHROTTLE_DEBUG = False
 HTTPCACHE_ENABLED = True
 HTTPCACHE_EXPIRATION_SECS = 3600  # Cache for 1 hour
 HTTPCACHE_DIR = "httpcache"
-HTTPCACHE_IGNORE_HTTP_CODES = [500, 502, 503, 504, 403, 404, 408]
-HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+HTTPCACHE_IGNORE_HTTP_CODES = [500, 502, 503, 504, 403, 404, 408, 409, 429]
+# One SQLite file with zstd bodies and LRU eviction (see confradar.scrapers.httpcache)
+HTTPCACHE_STORAGE = "confradar.scrapers.httpcache.SqliteCacheStorage"
+HTTPCACHE_SQLITE_FILE = "httpcache.sqlite"
+HTTPCACHE_MAX_BYTES = 256 * 1024 * 1024
+HTTPCACHE_MAX_ENTRIES = 0
+# RFC 2616 caching; pages without caching headers are kept for HTTPCACHE_EXPIRATION_SECS
+HTTPCACHE_POLICY = "confradar.scrapers.httpcache.RFC2616FallbackPolicy"
 
 # Set settings whose default value is deprecated to a future-proof value
 REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
@@ -34,13 +34,14 @@ class ACLWebSpider(scrapy.Spider):
 
     name = "acl_web"
     allowed_domains = ["aclweb.org"]
+    recrawlable = True
     start_urls = ["https://www.aclweb.org/portal/acl_sponsored_events"]
 
     custom_settings = {
         "DOWNLOAD_DELAY": 2,
         "COOKIES_ENABLED": True,
         "COOKIES_DEBUG": True,
-        "HTTPCACHE_ENABLED": False,  # Disable cache to avoid 409 issues
+        # The HTTP cache policy never stores the 409 served without the cookie
         "DEFAULT_REQUEST_HEADERS": {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         },
@@ -25,6 +25,7 @@ class AIDeadlinesSpider(scrapy.Spider):
 
     name = "ai_deadlines"
     allowed_domains = ["aideadlines.org"]
+    recrawlable = True
     start_urls = ["https://aideadlines.org/?sub=NLP"]
 
     custom_settings = {
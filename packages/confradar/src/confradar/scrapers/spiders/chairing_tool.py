@@ -20,10 +20,16 @@ class ChairingToolSpider(scrapy.Spider):
 
     Usage:
         scrapy crawl chairing_tool -o chairing_conferences.json
+
+    Resumable (see ``CrawlFrontierMiddleware``); stop at listings seen in the
+    previous crawl with:
+        scrapy crawl chairing_tool -a incremental=1
     """
 
     name = "chairing_tool"
     allowed_domains = ["chairingtool.com"]
+    recrawlable = True
+    resumable = True
     start_urls = ["https://chairingtool.com/conferences"]
 
     custom_settings = {
@@ -24,6 +24,7 @@ class ELRASpider(scrapy.Spider):
 
     name = "elra"
     allowed_domains = ["elra.info"]
+    recrawlable = True
     start_urls = ["https://www.elra.info/elra-events/"]
 
     custom_settings = {
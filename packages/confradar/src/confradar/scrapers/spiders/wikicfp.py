@@ -23,10 +23,16 @@ class WikiCFPSpider(scrapy.Spider):
 
     Can filter by category:
         scrapy crawl wikicfp -a category="natural language processing"
+
+    Resumable (see ``CrawlFrontierMiddleware``); stop at listings seen in the
+    previous crawl with:
+        scrapy crawl wikicfp -a incremental=1
     """
 
     name = "wikicfp"
     allowed_domains = ["wikicfp.com"]
+    recrawlable = True
+    resumable = True
 
     def __init__(self, category: str | None = None, *args, **kwargs):
         """Initialize spider.
@@ -42,7 +48,7 @@ class WikiCFPSpider(scrapy.Spider):
             self.start_urls = [
                 f"http://www.wikicfp.com/cfp/call?conference={category.replace(' ', '+')}"
             ]
-        else:
+        elif "start_urls" not in kwargs:
             # Get recent conferences
             self.start_urls = ["http://www.wikicfp.com/cfp/home"]
 
@@ -0,0 +1,172 @@
+"""Histograms of where a crawl spends its time.
+
+One ``CrawlTimings`` per crawler collects histograms from three places:
+
+- ``CallbackTimingMiddleware`` (spider middleware): time in each callback
+  (``callback/<name>``, ms), download latency (``download``, ms), response
+  size (``response_bytes``) and items yielded per response
+  (``items_per_response``)
+- ``timed_stage`` (pipeline ``process_item`` decorator): time in each
+  pipeline stage (``pipeline/<class name>``, ms)
+- ``SpiderTimingExtension``: writes summaries into the Scrapy stats
+  (``timing/<histogram>/<p50|p95|max|...>``) and the full histograms to a JSON
+  report when the spider closes; the report path is in ``timing/report``
+
+Buckets follow a 1-2-5 series, so percentiles are upper bucket bounds (at most
+2.5x the true value) and a histogram stays small however long the crawl.
+
+Example:
+    $ confradar timing-report acl_web
+    acl_web (finished) finished at 2026-10-19T02:04:11.372540+00:00
+    callback/parse  ms     count=12  mean=41.2  p50=50  p95=100  p99=100  max=87.3
+    download        ms     count=13  mean=310.5  p50=500  p95=1000  p99=1000  max=912.4
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import json
+import time
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# 0.1 .. 5e8: milliseconds, bytes and counts share one bucket series
+BOUNDS = [m * 10.0**e for e in range(-1, 9) for m in (1, 2, 5)]
+PERCENTILES = (50, 90, 95, 99)
+
+
+class Histogram:
+    """Counts of observed values per 1-2-5 bucket, with count, sum, min and max.
+
+    Args:
+        unit: Unit of the observed values, for reports
+    """
+
+    def __init__(self, unit: str = ""):
+        self.unit = unit
+        self.counts = [0] * (len(BOUNDS) + 1)  # last bucket: above the largest bound
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q``-th percentile, capped at the max."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                bound = BOUNDS[index] if index < len(BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Count, mean, max and percentiles, rounded for stats and metadata."""
+        summary = {"count": self.count, "mean": round(self.mean, 3), "max": round(self.max or 0, 3)}
+        summary.update({f"p{q}": round(self.percentile(q), 3) for q in PERCENTILES})
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "unit": self.unit,
+            **self.summary(),
+            "sum": round(self.sum, 3),
+            "min": round(self.min or 0, 3),
+            # Upper bound of each non-empty bucket; "inf" above the largest
+            "buckets": {
+                (f"{BOUNDS[i]:g}" if i < len(BOUNDS) else "inf"): count
+                for i, count in enumerate(self.counts)
+                if count
+            },
+        }
+
+
+class CrawlTimings:
+    """Named histograms of one crawl."""
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {}
+
+    def observe(self, name: str, value: float, unit: str = "ms") -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(unit)
+        histogram.observe(value)
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        return {name: h.to_dict() for name, h in sorted(self.histograms.items())}
+
+
+_timings: weakref.WeakKeyDictionary[Any, CrawlTimings] = weakref.WeakKeyDictionary()
+
+
+def crawl_timings(crawler: Any, create: bool = False) -> CrawlTimings | None:
+    """The timings of ``crawler``; created on first use if ``create``."""
+    if crawler is None:
+        return None
+    timings = _timings.get(crawler)
+    if timings is None and create:
+        timings = _timings[crawler] = CrawlTimings()
+    return timings
+
+
+def timed_stage(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Time a pipeline's ``process_item`` as ``pipeline/<class name>``.
+
+    Does nothing unless timing is enabled for the spider's crawler. Only the
+    synchronous part is timed; work handed to other threads is not.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: Any, item: Any, spider: Any = None) -> Any:
+        timings = crawl_timings(getattr(spider, "crawler", None))
+        if timings is None:
+            return method(self, item, spider)
+        started = time.perf_counter()
+        try:
+            return method(self, item, spider)
+        finally:
+            timings.observe(
+                f"pipeline/{type(self).__name__}", (time.perf_counter() - started) * 1000
+            )
+
+    return wrapper
+
+
+def load_report(path: str | Path) -> dict[str, Any]:
+    """Read a JSON report written by ``SpiderTimingExtension``."""
+    return json.loads(Path(path).read_text())
+
+
+def latest_report(directory: str | Path, spider: str) -> Path | None:
+    """Newest report of ``spider`` under ``directory``, if any."""
+    reports = sorted(Path(directory, spider).glob("*.json"))
+    return reports[-1] if reports else None
+
+
+def format_report(report: dict[str, Any]) -> list[str]:
+    """One aligned line per histogram of a report."""
+    histograms = report.get("histograms", {})
+    width = max((len(name) for name in histograms), default=0)
+    return [
+        f"{name:<{width}}  {h['unit'] or '-':<5}  count={h['count']}  mean={h['mean']:g}  "
+        f"p50={h['p50']:g}  p95={h['p95']:g}  p99={h['p99']:g}  max={h['max']:g}"
+        for name, h in histograms.items()
+    ]
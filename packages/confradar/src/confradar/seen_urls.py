@@ -0,0 +1,249 @@
+"""Cross-run store of fetched URLs: an on-disk Bloom filter over an exact table.
+
+Scrapy's dupefilter forgets every request when a crawl ends. ``SeenUrlStore``
+remembers, per source, when each request fingerprint was last fetched:
+
+- ``seen_urls`` rows hold the exact fingerprint, URL and ``last_fetched_at``
+- a Bloom filter file holds the same fingerprints, so a URL that was never
+  fetched (most of them, on a crawl that discovers new pages) is answered
+  without a query; only possible hits are looked up in the table
+
+The filter is rebuilt from the table when its file is missing or damaged, or
+once it holds more fingerprints than it was sized for. Writes are buffered and
+flushed in bulk; the filter file is saved on every flush.
+
+Example:
+    >>> store = SeenUrlStore("elra", bloom_path=".scrapy/seen_urls/elra.bloom")
+    >>> store.load(session)
+    >>> store.is_fresh(session, fingerprint, window_secs=7 * 86400)
+    False
+    >>> store.record(fingerprint, url)
+    >>> store.flush(session)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .db.ingest import CHUNK_SIZE, dialect_insert
+from .db.models import SeenUrl
+
+DEFAULT_CAPACITY = 100_000
+DEFAULT_ERROR_RATE = 0.001
+
+_HEADER = struct.Struct("<4sQIQd")
+_MAGIC = b"CRBF"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, saved to and loaded from a file.
+
+    Args:
+        capacity: Number of keys the filter is sized for
+        error_rate: False positive rate at ``capacity`` keys
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _positions(self, key: str) -> list[int]:
+        # Double hashing: k positions from two independent 64-bit hashes
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> bool:
+        """Add ``key``; returns False if it was (probably) present already."""
+        added = False
+        for p in self._positions(key):
+            mask = 1 << (p & 7)
+            if not self.bits[p >> 3] & mask:
+                self.bits[p >> 3] |= mask
+                added = True
+        self.count += added
+        return added
+
+    def save(self, path: str | Path) -> None:
+        """Write the filter atomically (temporary file, then rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(
+                _HEADER.pack(_MAGIC, self.capacity, self.num_hashes, self.count, self.error_rate)
+            )
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> BloomFilter | None:
+        """Read a filter written by ``save``; None if missing or damaged."""
+        try:
+            data = Path(path).read_bytes()
+            magic, capacity, num_hashes, count, error_rate = _HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return None
+        bloom = cls(capacity, error_rate)
+        bits = data[_HEADER.size :]
+        if magic != _MAGIC or num_hashes != bloom.num_hashes or len(bits) != len(bloom.bits):
+            return None
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        return bloom
+
+
+@dataclass
+class SeenUrlStats:
+    """Counters for one crawl."""
+
+    checked: int = 0
+    bloom_negative: int = 0  # answered by the filter alone
+    lookups: int = 0  # filter hits checked against the table
+    fresh: int = 0
+    recorded: int = 0
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class SeenUrlStore:
+    """Last fetch times of one source's request fingerprints, with buffered writes.
+
+    Args:
+        source: Spider or scraper name the fingerprints belong to
+        bloom_path: Filter file; without one the filter is rebuilt from the
+            table on every ``load``
+        capacity: Minimum number of fingerprints the filter is sized for
+        error_rate: Filter false positive rate at capacity
+    """
+
+    def __init__(
+        self,
+        source: str,
+        bloom_path: str | Path | None = None,
+        capacity: int = DEFAULT_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE,
+    ):
+        self.source = source
+        self.bloom_path = Path(bloom_path) if bloom_path else None
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.stats = SeenUrlStats()
+        self._pending: dict[str, dict[str, Any]] = {}
+
+    def load(self, session: Session) -> int:
+        """Open the filter file, rebuilding it from the table if needed; returns its size."""
+        bloom = BloomFilter.load(self.bloom_path) if self.bloom_path else None
+        if bloom is None or len(bloom) > bloom.capacity:
+            bloom = self._rebuild(session)
+        self.bloom = bloom
+        return len(bloom)
+
+    def _rebuild(self, session: Session) -> BloomFilter:
+        total = session.scalar(
+            select(func.count()).select_from(SeenUrl).where(SeenUrl.source == self.source)
+        )
+        # Leave room to grow before the next rebuild
+        bloom = BloomFilter(max(self.capacity, 2 * (total or 0)), self.error_rate)
+        rows = session.scalars(
+            select(SeenUrl.fingerprint).where(SeenUrl.source == self.source)
+        ).yield_per(CHUNK_SIZE)
+        for fingerprint in rows:
+            bloom.add(fingerprint)
+        if self.bloom_path:
+            bloom.save(self.bloom_path)
+        return bloom
+
+    def last_fetched(self, session: Session, fingerprint: str) -> datetime | None:
+        """When ``fingerprint`` was last fetched, or None if never."""
+        self.stats.checked += 1
+        pending = self._pending.get(fingerprint)
+        if pending is not None:
+            return pending["last_fetched_at"]
+        if fingerprint not in self.bloom:
+            self.stats.bloom_negative += 1
+            return None
+        self.stats.lookups += 1
+        fetched_at = session.scalar(
+            select(SeenUrl.last_fetched_at).where(
+                SeenUrl.source == self.source, SeenUrl.fingerprint == fingerprint
+            )
+        )
+        return _aware(fetched_at) if fetched_at else None
+
+    def is_fresh(
+        self,
+        session: Session,
+        fingerprint: str,
+        window_secs: float,
+        now: datetime | None = None,
+    ) -> bool:
+        """True if ``fingerprint`` was fetched less than ``window_secs`` ago."""
+        if window_secs <= 0:
+            return False
+        fetched_at = self.last_fetched(session, fingerprint)
+        now = now or datetime.now(timezone.utc)
+        fresh = fetched_at is not None and now - fetched_at < timedelta(seconds=window_secs)
+        self.stats.fresh += fresh
+        return fresh
+
+    def record(self, fingerprint: str, url: str, fetched_at: datetime | None = None) -> None:
+        """Record a fetch; written by the next ``flush``."""
+        self.bloom.add(fingerprint)
+        self._pending[fingerprint] = {
+            "source": self.source,
+            "fingerprint": fingerprint,
+            "url": url,
+            "last_fetched_at": fetched_at or datetime.now(timezone.utc),
+            "fetch_count": 1,
+        }
+        self.stats.recorded += 1
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self, session: Session) -> int:
+        """Upsert recorded fetches and save the filter; the caller owns the transaction."""
+        rows, self._pending = list(self._pending.values()), {}
+        for start in range(0, len(rows), CHUNK_SIZE):
+            stmt = dialect_insert(session, SeenUrl.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source", "fingerprint"],
+                set_={
+                    "url": stmt.excluded.url,
+                    "last_fetched_at": stmt.excluded.last_fetched_at,
+                    "fetch_count": SeenUrl.__table__.c.fetch_count + 1,
+                    "updated_at": func.now(),
+                },
+            )
+            session.execute(stmt, rows[start : start + CHUNK_SIZE])
+        if self.bloom_path and rows:
+            self.bloom.save(self.bloom_path)
+        return len(rows)
@@ -0,0 +1,168 @@
+"""Synthetic conference item streams for load tests.
+
+``generate_items`` yields ConferenceItem-like dicts for any number of
+conferences, deterministic for a seed, with the mess of real crawls:
+
+- multi-source overlap: some conferences are also listed by a second source,
+  which reports only some of their deadlines
+- aliases: some of those second listings use another key and a reworded name
+  for the same conference (``bcd26`` vs ``bcd_3f9a``)
+- duplicates: some listings appear twice in a source's stream
+- moved deadlines: in crawl ``n > 0`` some deadlines are extended by ``n``
+  weeks, so ingesting a later crawl exercises change detection
+
+Conferences are generated one at a time, so a stream of 100k conferences with
+1M deadlines never sits in memory.
+
+Example:
+    >>> config = SyntheticConfig(conferences=100_000, deadlines_per_conference=10)
+    >>> upsert_stream(session, generate_items(config, source="wikicfp"))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+SOURCES = ("ai_deadlines", "acl_web", "wikicfp", "elra", "chairing_tool")
+# Deadline kinds in the order a conference adds them, with days before its start
+KINDS = {
+    "submission": 150,
+    "abstract": 157,
+    "notification": 90,
+    "camera_ready": 60,
+    "rebuttal": 110,
+    "supplementary": 143,
+    "workshop_proposal": 220,
+    "tutorial_proposal": 200,
+    "early_registration": 45,
+    "registration": 20,
+}
+EVENTS = ["International Conference on", "Annual Meeting on", "Workshop on", "Symposium on"]
+TOPICS = [
+    "Computational Linguistics",
+    "Machine Learning",
+    "Computer Vision",
+    "Data Mining",
+    "Information Retrieval",
+    "Robotics",
+    "Speech Processing",
+    "Knowledge Discovery",
+    "Artificial Intelligence",
+    "Natural Language Processing",
+    "Software Engineering",
+    "Distributed Systems",
+]
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    """Scale and mess of a synthetic crawl.
+
+    Rates are probabilities per conference (``overlap``), per second listing
+    (``alias_rate``), per listing (``duplicate_rate``) and per deadline
+    (``move_rate``).
+    """
+
+    conferences: int = 1000
+    deadlines_per_conference: int = 4
+    sources: tuple[str, ...] = SOURCES
+    overlap: float = 0.3
+    alias_rate: float = 0.3
+    duplicate_rate: float = 0.02
+    move_rate: float = 0.05
+    seed: int = 7
+    first_year: int = 2026
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.deadlines_per_conference <= len(KINDS):
+            raise ValueError(f"deadlines_per_conference must be between 1 and {len(KINDS)}")
+        if not self.sources:
+            raise ValueError("at least one source is required")
+
+
+def acronym(index: int) -> str:
+    """Unique acronym of conference ``index`` (``AAA``, ``AAB``, ...)."""
+    n = index + 702  # skip the one- and two-letter acronyms
+    letters = ""
+    while n >= 0:
+        letters = chr(65 + n % 26) + letters
+        n = n // 26 - 1
+    return letters
+
+
+def conference_key(config: SyntheticConfig, index: int) -> str:
+    """Canonical key of conference ``index``, as its primary source lists it."""
+    return f"{acronym(index).lower()}{(config.first_year + index % 2) % 100:02d}"
+
+
+def _listings(config: SyntheticConfig, index: int, crawl: int) -> list[dict[str, Any]]:
+    """Every listing of conference ``index`` in crawl ``crawl``, across sources."""
+    # The conference itself does not depend on the crawl; only its moves do
+    rng = random.Random(f"{config.seed}:{index}")
+    moves = random.Random(f"{config.seed}:{index}:moves")
+
+    letters = acronym(index)
+    year = config.first_year + index % 2
+    event, topic = rng.choice(EVENTS), rng.choice(TOPICS)
+    name = f"{event} {topic} ({letters} {year})"
+    starts = date(year, 3, 1) + timedelta(days=rng.randrange(270))
+    deadlines = []
+    for kind in list(KINDS)[: config.deadlines_per_conference]:
+        due = starts - timedelta(days=KINDS[kind])
+        if moves.random() < config.move_rate:
+            due += timedelta(weeks=crawl)
+        deadlines.append({"kind": kind, "due_date": due.isoformat(), "timezone": "AoE"})
+
+    primary = config.sources[index % len(config.sources)]
+    listing = {
+        "key": conference_key(config, index),
+        "name": name,
+        "year": year,
+        "homepage": f"https://{letters.lower()}{year}.example.org/",
+        "deadlines": deadlines,
+        "source": primary,
+        "scraped_at": (date(config.first_year, 1, 1) + timedelta(days=crawl)).isoformat(),
+        "url": f"https://{primary}.example.org/conf/{letters.lower()}",
+    }
+    listings = [listing]
+
+    if len(config.sources) > 1 and rng.random() < config.overlap:
+        other = config.sources[
+            (index + 1 + rng.randrange(len(config.sources) - 1)) % len(config.sources)
+        ]
+        second = {
+            **listing,
+            "source": other,
+            "url": f"https://{other}.example.org/events/{index}",
+            "deadlines": deadlines[: max(1, len(deadlines) // 2)],
+        }
+        if rng.random() < config.alias_rate:
+            digest = hashlib.md5(name.encode()).hexdigest()[:4]
+            second["key"] = f"{letters.lower()}_{digest}"
+            second["name"] = f"{year} {event} {topic} ({letters})"
+        listings.append(second)
+
+    for item in list(listings):
+        if rng.random() < config.duplicate_rate:
+            listings.append(dict(item))
+    return listings
+
+
+def generate_items(
+    config: SyntheticConfig, crawl: int = 0, source: str | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield the items of crawl ``crawl``, optionally only those of ``source``.
+
+    Items are ordered by conference; a conference's listings from different
+    sources are adjacent. Crawl 0 is the baseline; each later crawl moves the
+    same deadlines one more week.
+    """
+    for index in range(config.conferences):
+        for item in _listings(config, index, crawl):
+            if source is None or item["source"] == source:
+                yield item
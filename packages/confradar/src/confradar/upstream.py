@@ -0,0 +1,177 @@
+"""Cheap probes of source index pages to tell which sources changed upstream.
+
+A full crawl of a source costs many requests; its index pages (each spider's
+``start_urls``) usually tell whether anything changed. ``probe_sources``
+checks every index page with as little traffic as the server allows:
+
+1. A ``HEAD`` request, conditional on the stored ``ETag``/``Last-Modified``.
+   A ``304``, or validators equal to the stored ones, means unchanged.
+2. Otherwise a conditional ``GET``; the body is digested like the content gate
+   does (``confradar.content_gate.digest``) and compared with the stored
+   digest, so rotating banners and nonces do not count as a change.
+
+Probe state is a JSON-serializable dict per URL, kept by the caller (the
+``upstream_change_sensor`` keeps it in its cursor). A URL probed for the first
+time only records a baseline; a failed probe keeps the previous state, and a
+URL whose first probe failed gets no state, so it records its baseline later.
+
+Example:
+    >>> probes = probe_sources({"elra": ["https://www.elra.info/elra-events/"]}, states)
+    >>> [name for name, probe in probes.items() if probe.changed]
+    ['elra']
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from .content_gate import PageDigest, digest, is_unchanged
+from .scrapers.runner import make_client
+from .scrapers.settings import USER_AGENT
+
+DEFAULT_TIMEOUT = 15.0  # per request, seconds
+
+
+@dataclass
+class UrlProbe:
+    """Outcome of probing one index page.
+
+    Attributes:
+        url: The page probed
+        state: State to keep for the next probe; None if the first probe failed
+        changed: True if the page changed since the previous probe
+        method: Request that decided the outcome (``HEAD`` or ``GET``)
+        error: Why the probe failed; the previous state is kept
+    """
+
+    url: str
+    state: dict[str, Any] | None
+    changed: bool = False
+    method: str = "HEAD"
+    error: str | None = None
+
+
+@dataclass
+class SourceProbe:
+    """Probes of one source's index pages."""
+
+    source: str
+    urls: list[UrlProbe] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return any(probe.changed for probe in self.urls)
+
+    @property
+    def states(self) -> dict[str, dict[str, Any]]:
+        return {probe.url: probe.state for probe in self.urls if probe.state is not None}
+
+
+def _validators(response: httpx.Response) -> dict[str, str]:
+    return {
+        key: value
+        for key, value in (
+            ("etag", response.headers.get("etag")),
+            ("last_modified", response.headers.get("last-modified")),
+        )
+        if value
+    }
+
+
+def _conditional_headers(state: Mapping[str, Any]) -> dict[str, str]:
+    headers = {"User-Agent": USER_AGENT}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def _astuple(page: PageDigest) -> tuple[str, int, str]:
+    return page.content_hash, page.simhash, page.numbers_hash
+
+
+async def probe_url(
+    client: httpx.AsyncClient, url: str, previous: Mapping[str, Any] | None = None
+) -> UrlProbe:
+    """Probe one index page against its ``previous`` state (None or empty on the first probe)."""
+    first = not previous
+    state = dict(previous or {})
+    headers = _conditional_headers(state)
+    method = "HEAD"
+    try:
+        head = await client.head(url, headers=headers)
+        if head.status_code == 304:
+            return UrlProbe(url, state)
+        validators = _validators(head)
+        # Servers that reject HEAD (405/501) still answer the GET
+        if head.is_success and validators and not first:
+            if all(state.get(key) == value for key, value in validators.items()):
+                return UrlProbe(url, state)
+
+        method = "GET"
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304:
+            return UrlProbe(url, state, method=method)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        error = f"{type(e).__name__}: {e}"
+        return UrlProbe(url, None if first else state, method=method, error=error)
+
+    page = digest(response.content)
+    new_state = {**_validators(response), "digest": list(_astuple(page))}
+    old = state.get("digest")
+    changed = not first and (old is None or not is_unchanged(PageDigest(*old), page))
+    return UrlProbe(url, new_state, changed=changed, method=method)
+
+
+async def aprobe_sources(
+    urls: Mapping[str, list[str]],
+    states: Mapping[str, Mapping[str, Any]] | None = None,
+    client: httpx.AsyncClient | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> dict[str, SourceProbe]:
+    """Probe every index page concurrently.
+
+    Args:
+        urls: Index page URLs by source
+        states: Previous state by URL, as returned in ``SourceProbe.states``
+        client: Client to use instead of a new ``make_client`` one; not closed
+        timeout: Per-request timeout (ignored with ``client``)
+
+    Returns:
+        One SourceProbe per source, in input order
+    """
+    if client is None:
+        async with make_client(request_timeout=timeout) as own:
+            return await aprobe_sources(urls, states, client=own)
+
+    states = states or {}
+    pairs = [(source, url) for source, source_urls in urls.items() for url in source_urls]
+    probes = await asyncio.gather(*(probe_url(client, url, states.get(url)) for _, url in pairs))
+    results = {source: SourceProbe(source) for source in urls}
+    for (source, _), probe in zip(pairs, probes, strict=True):
+        results[source].urls.append(probe)
+    return results
+
+
+def probe_sources(
+    urls: Mapping[str, list[str]],
+    states: Mapping[str, Mapping[str, Any]] | None = None,
+    **kwargs: Any,
+) -> dict[str, SourceProbe]:
+    """Blocking wrapper around ``aprobe_sources`` for sync callers (Dagster sensors)."""
+    return asyncio.run(aprobe_sources(urls, states, **kwargs))
+
+
+def index_urls(spider_name: str) -> list[str]:
+    """Index pages of a registered spider: the ``start_urls`` of a default instance."""
+    from .scrapers.registry import spiders
+
+    spider = spiders.load(spider_name)()
+    return list(getattr(spider, "start_urls", None) or [])
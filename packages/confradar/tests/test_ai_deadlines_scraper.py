@@ -261,3 +261,103 @@ class TestAIDeadlinesScraperValidation:
         # Missing deadlines
         with pytest.raises(ValueError, match="Invalid deadlines field"):
             scraper.validate([{"key": "test", "name": "Test"}])
+
+
+def aideadlines_page(conferences: int = 60) -> str:
+    """Build a page shaped like aideadlin.es, with the edge cases parsing must handle."""
+    items = []
+    blocks = ["$('#subject').change(function() { update_filtering(); });"]
+    for i in range(conferences):
+        key = f"conf{i}{20 + i % 10}"
+        if i % 4 == 0:
+            website = f'<a title="Conference Website" href="https://conf{i}.org/"><img/></a>'
+        elif i % 4 == 1:
+            website = f'<a title="Conference Website" href="http://www.conf{i}.net">site</a>'
+        elif i % 4 == 2:
+            website = '<a title="Conference Website" href="/local">site</a>'
+        else:
+            website = ""
+        items.append(f"""
+            <div id="{key}" class="ConfItem NLP-conf">
+              <div class="row conf-row">
+                <div class="col-xs-12 col-sm-6">
+                  <span class="conf-title">
+                    <a title="Click to show conference info" href="/conference?id={key}&amp;x=1">
+                      CONF{i} <!-- note --><b>&amp; Friends</b>&nbsp;20{20 + i % 10}
+                    </a>
+                  </span>
+                  <span class="conf-title-icon">{website}</span>
+                </div>
+                <div class="col-xs-12 col-sm-6"><span class="timer"></span></div>
+              </div>
+            </div>""")
+        if i % 7 == 3:
+            continue  # no deadline block
+        date = "not-a-date" if i % 11 == 5 else f"2025-{i % 12 + 1:02d}-{i % 27 + 1:02d} 23:59"
+        seconds = ":59" if i % 2 and date[0] == "2" else ""
+        blocks.append(f"""
+            $('#{key} .timer').html(countdown);
+            var timezone = "UTC-{i % 12}";
+            var confDeadline = moment.tz("{date}{seconds}", timezone);""")
+    duplicate = '<a href="/conference?id=conf020">CONF0 again</a>'
+    return f"""<!DOCTYPE html>
+    <html><head><title>AI Conference Deadlines</title>
+    <script>var dangling = $('#conf120'); // block cut off here</script>
+    </head><body>
+    <div class="container">{"".join(items)}{duplicate}</div>
+    <script type="text/javascript">{"".join(blocks[: len(blocks) // 2])}</script>
+    <script type="text/javascript">{"".join(blocks[len(blocks) // 2 :])}</script>
+    <script></script>
+    </body></html>"""
+
+
+class TestParseEngineParity:
+    """The lxml engine must produce exactly what the BeautifulSoup engine produces."""
+
+    def test_full_page_parity(self):
+        html = aideadlines_page()
+        fast = AIDeadlinesScraper(engine="lxml").parse(html)
+        reference = AIDeadlinesScraper(engine="bs4").parse(html)
+
+        assert fast == reference
+        assert len(fast) == 60
+        assert sum(len(c["deadlines"]) for c in fast) > 40
+        assert any(c["homepage"] for c in fast)
+        assert fast[0]["name"] == "CONF0& Friends2020"  # get_text(strip=True) semantics
+
+    def test_blocks_do_not_match_across_script_tags(self):
+        html = """
+        <html><body>
+            <a href="/conference?id=a25">A 2025</a>
+            <a href="/conference?id=b25">B 2025</a>
+        </body>
+        <script>$('#a25').html('no deadline yet');</script>
+        <script>
+            $('#b25').html('test');
+            var timezone = "UTC-12";
+            var confDate = moment.tz("2025-01-10 23:59:59", timezone);
+        </script>
+        </html>
+        """
+        fast = AIDeadlinesScraper().parse(html)
+
+        assert fast == AIDeadlinesScraper().parse(html, engine="bs4")
+        assert [len(c["deadlines"]) for c in fast] == [0, 1]
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "",
+            "   ",
+            '<a href="/conference?id=solo25">Solo</a>',
+            '<?xml version="1.0" encoding="utf-8"?><html><body>'
+            '<a href="/conference?id=x25">X</a></body></html>',
+            '<html><body><p><a href="/conference?id=">Empty id</a></p></body></html>',
+        ],
+    )
+    def test_edge_input_parity(self, html):
+        assert AIDeadlinesScraper().parse(html) == AIDeadlinesScraper(engine="bs4").parse(html)
+
+    def test_unknown_engine_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown parse engine"):
+            AIDeadlinesScraper(engine="regex")
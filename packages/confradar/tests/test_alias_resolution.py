@@ -0,0 +1,108 @@
+"""Tests for MinHash/LSH alias resolution."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from confradar.db import Base, Conference, ConferenceAlias
+from confradar.resolution.aliases import (
+    NameRecord,
+    canonical_key,
+    extract_year,
+    load_name_records,
+    normalize_name,
+    resolve_aliases,
+    write_aliases,
+)
+from confradar.resolution.minhash import MinHasher, lsh_candidate_pairs, shingles, similarity
+
+ACL = "Annual Meeting of the Association for Computational Linguistics"
+
+
+def test_signature_similarity_tracks_jaccard():
+    hasher = MinHasher(num_perm=64)
+    a = shingles(normalize_name(f"ACL 2025 : {ACL}"))
+    b = shingles(normalize_name(f"{ACL} (ACL)"))
+    c = shingles(normalize_name("International Conference on Machine Learning"))
+
+    assert similarity(hasher.signature(a), hasher.signature(b)) > 0.8
+    assert similarity(hasher.signature(a), hasher.signature(c)) < 0.3
+
+
+def test_minhasher_requires_power_of_two():
+    with pytest.raises(ValueError):
+        MinHasher(num_perm=48)
+
+
+def test_lsh_pairs_similar_signatures_only():
+    hasher = MinHasher(num_perm=64)
+    names = [f"ACL 2025 {ACL}", f"{ACL} ACL", "Empirical Methods in Natural Language Processing"]
+    signatures = [hasher.signature(shingles(normalize_name(n))) for n in names]
+
+    assert lsh_candidate_pairs(signatures, bands=8) == {(0, 1)}
+
+
+def test_extract_year_from_name_or_key():
+    assert extract_year("acl_ab12", "ACL 2025 : 63rd Annual Meeting") == 2025
+    assert extract_year("acl25", ACL) == 2025
+    assert extract_year("acl_ab12", ACL) is None
+
+
+def test_resolves_spider_key_variants():
+    records = [
+        NameRecord("acl25", f"ACL 2025 : 63rd {ACL}", "https://2025.aclweb.org"),
+        NameRecord("acl_3f9a", f"{ACL} (ACL)", "https://2025.aclweb.org/"),
+        NameRecord("lrec25", "LREC-COLING 2025 : Language Resources and Evaluation", None),
+        NameRecord("coling25", "LREC-COLING 2025 Language Resources and Evaluation", None),
+        NameRecord("emnlp25", "EMNLP 2025 : Empirical Methods in NLP", None),
+    ]
+    matches, stats = resolve_aliases(records)
+
+    assert {(m.alias_key, m.canonical_key) for m in matches} == {
+        ("acl_3f9a", "acl25"),
+        ("coling25", "lrec25"),
+    }
+    assert stats.records == 5
+    assert all(0.6 <= m.score <= 1.0 for m in matches)
+
+
+def test_keyless_year_does_not_chain_editions():
+    records = [
+        NameRecord("acl24", f"ACL 2024 : 62nd {ACL}"),
+        NameRecord("acl25", f"ACL 2025 : 63rd {ACL}"),
+        NameRecord("acl_3f9a", f"{ACL} (ACL)"),
+    ]
+    matches, _ = resolve_aliases(records)
+
+    canonicals = {m.canonical_key for m in matches}
+    assert len(matches) == 1
+    assert canonicals <= {"acl24", "acl25"}
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'aliases.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def test_write_aliases_upserts(session):
+    session.add_all(
+        [
+            Conference(key="acl25", name=f"ACL 2025 : 63rd {ACL}"),
+            Conference(key="acl_3f9a", name=f"{ACL} (ACL)"),
+        ]
+    )
+    session.commit()
+
+    matches, _ = resolve_aliases(load_name_records(session))
+    assert write_aliases(session, matches) == 1
+    assert write_aliases(session, matches) == 1
+    session.commit()
+
+    assert session.query(ConferenceAlias).count() == 1
+    assert canonical_key(session, "acl_3f9a") == "acl25"
+    assert canonical_key(session, "neurips25") == "neurips25"
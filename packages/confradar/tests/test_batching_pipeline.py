@@ -0,0 +1,207 @@
+"""Tests for bulk ingestion and the BatchingDatabasePipeline."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date
+
+import pytest
+from scrapy.statscollectors import StatsCollector
+from scrapy.utils.test import get_crawler
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from confradar.db import Base, Conference, Deadline, Source
+from confradar.db.ingest import coerce_due_date, upsert_items
+from confradar.scrapers.pipelines import BatchingDatabasePipeline
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+class MockSpider:
+    name = "mock"
+
+    class MockLogger:
+        def warning(self, msg):
+            print(f"WARNING: {msg}")
+
+        def error(self, msg):
+            print(f"ERROR: {msg}")
+
+    logger = MockLogger()
+
+
+def _item(key: str, **overrides) -> dict:
+    item = {
+        "key": key,
+        "name": f"{key.upper()} Conference",
+        "homepage": f"https://{key}.org",
+        "url": "https://aideadlines.org",
+        "source": "aideadlines",
+        "scraped_at": "2025-01-01T00:00:00",
+        "deadlines": [{"kind": "submission", "due_at": "2025-05-15T23:59:59", "timezone": "AoE"}],
+    }
+    item.update(overrides)
+    return item
+
+
+class TestUpsertItems:
+    def test_inserts_conferences_sources_and_deadlines(self, engine):
+        with Session(engine) as session:
+            stats = upsert_items(session, [_item("icml25"), _item("neurips25")])
+            session.commit()
+
+            assert stats.conferences == 2
+            assert session.query(Conference).count() == 2
+            assert session.query(Source).count() == 2
+            deadline = session.query(Deadline).join(Conference).filter_by(key="icml25").one()
+            assert deadline.due_date == date(2025, 5, 15)
+            assert deadline.source_id is not None
+
+    def test_rerun_is_idempotent_and_updates_names(self, engine):
+        with Session(engine) as session:
+            upsert_items(session, [_item("icml25")])
+            session.commit()
+            upsert_items(session, [_item("icml25", name="ICML 2025", homepage=None)])
+            session.commit()
+
+            conf = session.query(Conference).filter_by(key="icml25").one()
+            assert conf.name == "ICML 2025"
+            # Missing homepage does not erase the stored one
+            assert conf.homepage == "https://icml25.org"
+            assert session.query(Source).count() == 1
+            assert session.query(Deadline).count() == 1
+
+    def test_skips_invalid_deadlines(self, engine):
+        with Session(engine) as session:
+            stats = upsert_items(
+                session, [_item("acl25", deadlines=[{"kind": "submission", "due_at": "tbd"}])]
+            )
+            session.commit()
+            assert stats.skipped_deadlines == 1
+            assert session.query(Deadline).count() == 0
+
+    def test_coerce_due_date(self):
+        assert coerce_due_date("2025-05-15") == date(2025, 5, 15)
+        assert coerce_due_date("2025-05-15T23:59:59") == date(2025, 5, 15)
+        assert coerce_due_date(date(2025, 5, 15)) == date(2025, 5, 15)
+        assert coerce_due_date("invalid-date") is None
+        assert coerce_due_date(None) is None
+
+
+class TestBatchingDatabasePipeline:
+    def test_flushes_on_close(self, engine):
+        pipeline = BatchingDatabasePipeline(
+            batch_size=1000, batch_interval_ms=60_000, session_factory=sessionmaker(engine)
+        )
+        spider = MockSpider()
+        pipeline.open_spider(spider)
+        for i in range(25):
+            pipeline.process_item(_item(f"conf{i}"), spider)
+        pipeline.close_spider(spider)
+
+        with Session(engine) as session:
+            assert session.query(Conference).count() == 25
+            assert session.query(Deadline).count() == 25
+
+    def test_flushes_when_batch_is_full(self, engine):
+        flushed = threading.Event()
+        factory = sessionmaker(engine)
+
+        def session_factory():
+            flushed.set()
+            return factory()
+
+        pipeline = BatchingDatabasePipeline(
+            batch_size=2, batch_interval_ms=60_000, session_factory=session_factory
+        )
+        spider = MockSpider()
+        pipeline.open_spider(spider)
+        pipeline.process_item(_item("a"), spider)
+        pipeline.process_item(_item("b"), spider)
+        assert flushed.wait(timeout=5)
+        pipeline.close_spider(spider)
+
+    def test_flushes_after_interval(self, engine):
+        pipeline = BatchingDatabasePipeline(
+            batch_size=1000, batch_interval_ms=10, session_factory=sessionmaker(engine)
+        )
+        spider = MockSpider()
+        pipeline.open_spider(spider)
+        pipeline.process_item(_item("solo"), spider)
+        for _ in range(200):
+            with Session(engine) as session:
+                if session.query(Conference).count():
+                    break
+            time.sleep(0.01)
+        else:
+            pytest.fail("Item was not flushed after the batch interval")
+        pipeline.close_spider(spider)
+
+    def test_bad_item_is_skipped_without_losing_its_batch(self, engine):
+        stats = StatsCollector(get_crawler())
+        pipeline = BatchingDatabasePipeline(session_factory=sessionmaker(engine), stats=stats)
+        spider = MockSpider()
+        pipeline.open_spider(spider)
+        pipeline.process_item(_item("acl25"), spider)
+        pipeline.process_item(_item("broken", name=None), spider)  # NOT NULL violation
+        pipeline.process_item(_item("emnlp25"), spider)
+        pipeline.close_spider(spider)
+
+        with Session(engine) as session:
+            assert {c.key for c in session.query(Conference)} == {"acl25", "emnlp25"}
+        assert stats.get_value("db/item_errors") == 1
+        assert stats.get_value("db/items") == 2
+
+        # The writer keeps running for later batches
+        pipeline.open_spider(spider)
+        pipeline.process_item(_item("naacl25"), spider)
+        pipeline.close_spider(spider)
+        with Session(engine) as session:
+            assert session.query(Conference).count() == 3
+
+    def test_connection_error_is_raised_on_close(self, tmp_path):
+        unreachable = create_engine(f"sqlite:///{tmp_path / 'missing' / 'ingest.db'}")
+        pipeline = BatchingDatabasePipeline(session_factory=sessionmaker(unreachable))
+        spider = MockSpider()
+        pipeline.open_spider(spider)
+        pipeline.process_item(_item("acl25"), spider)
+        with pytest.raises(RuntimeError, match="Database writer failed"):
+            pipeline.close_spider(spider)
+
+    def test_connection_error_stops_the_writer(self, tmp_path):
+        unreachable = create_engine(f"sqlite:///{tmp_path / 'missing' / 'ingest.db'}")
+        factory = sessionmaker(unreachable)
+        sessions = []
+        pipeline = BatchingDatabasePipeline(
+            batch_size=1, session_factory=lambda: sessions.append(1) or factory()
+        )
+        spider = MockSpider()
+        pipeline.open_spider(spider)
+        pipeline.process_item(_item("acl25"), spider)
+        pipeline.writer.join(timeout=5)
+        assert not pipeline.writer.is_alive()
+        with pytest.raises(RuntimeError, match="Database writer failed"):
+            pipeline.process_item(_item("emnlp25"), spider)
+        assert len(sessions) == 1
+        with pytest.raises(RuntimeError, match="Database writer failed"):
+            pipeline.close_spider(spider)
+
+    def test_dead_writer_raises_instead_of_blocking(self, engine, monkeypatch):
+        monkeypatch.setattr(BatchingDatabasePipeline, "_run", lambda self: None)
+        pipeline = BatchingDatabasePipeline(queue_size=1, session_factory=sessionmaker(engine))
+        pipeline._PUT_TIMEOUT_S = 0.01
+        spider = MockSpider()
+        pipeline.open_spider(spider)
+        pipeline.writer.join()
+        pipeline.queue.put(_item("acl25"))  # full, and nothing drains it
+        with pytest.raises(RuntimeError, match="Database writer stopped"):
+            pipeline.process_item(_item("emnlp25"), spider)
+        with pytest.raises(RuntimeError, match="Database writer stopped"):
+            pipeline.close_spider(spider)
@@ -0,0 +1,261 @@
+"""Tests for the unchanged-content gate."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from scrapy import Spider
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from confradar.content_gate import ContentGate, digest, hamming_distance, is_unchanged
+from confradar.db import Base, ContentFingerprint
+from confradar.scrapers.base import Scraper
+from confradar.scrapers.middlewares import ContentGateMiddleware, UnchangedContent
+
+ROWS = "".join(
+    f'<tr><td><a href="/conf?id=conf{i}">CONF{i} 2026</a></td><td>Deadline: 2026-0{i % 9 + 1}-15'
+    f" 23:59 AoE</td><td>Workshop on topic {i} held in city {i}</td></tr>"
+    for i in range(40)
+)
+
+
+def cfp_page(
+    rows: str = ROWS, banner: str = "Welcome to the call for papers list", extra: str = ""
+) -> str:
+    return (
+        f'<html><head><link href="/static/site.css?v=8f3a9c2b71d4e605"></head><body>'
+        f'<div class="banner">{banner}</div><!-- rendered {extra} --><table>{rows}</table>'
+        f'<script nonce="a94f1c0be37d52e8">var csrf = "5e2b9f7c1a3d4086";</script></body></html>'
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'gate.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_volatile_tokens_do_not_change_the_hash():
+    a = digest(cfp_page(extra="12:00:01"))
+    b = digest(
+        cfp_page(extra="12:07:44")
+        .replace("8f3a9c2b71d4e605", "0c1d2e3f4a5b6c7d")
+        .replace("a94f1c0be37d52e8", "ffe0d1c2b3a49586")
+        .replace("5e2b9f7c1a3d4086", "9a8b7c6d5e4f3021")
+    )
+
+    assert a.content_hash == b.content_hash
+
+
+def test_wording_churn_is_unchanged_but_numbers_are_not():
+    base = digest(cfp_page())
+    churn = digest(cfp_page(banner="Browse the upcoming calls for papers"))
+    moved = digest(cfp_page(rows=ROWS.replace("2026-03-15", "2026-03-22")))
+    rewritten = digest(cfp_page(rows=ROWS[: len(ROWS) // 2]))
+
+    assert base.content_hash != churn.content_hash
+    assert hamming_distance(base.simhash, churn.simhash) <= 3
+    assert is_unchanged(base, churn)
+    assert hamming_distance(base.simhash, moved.simhash) <= 3
+    assert not is_unchanged(base, moved)
+    assert not is_unchanged(base, rewritten)
+    assert not is_unchanged(base, churn, max_distance=-1)
+
+
+class CountingScraper(Scraper):
+    def __init__(self, html: str, version: str = "1.0"):
+        self.html = html
+        self.version = version
+        self.parses = 0
+
+    @property
+    def source_name(self) -> str:
+        return "counting"
+
+    @property
+    def schema_version(self) -> str:
+        return self.version
+
+    def fetch(self, **kwargs: Any) -> str:
+        return self.html
+
+    def parse(self, raw: str, **kwargs: Any) -> list[dict[str, Any]]:
+        self.parses += 1
+        return [{"key": "conf1", "name": "CONF1 2026"}]
+
+
+def test_scraper_skips_parse_for_unchanged_page(engine):
+    gate = ContentGate()
+    scraper = CountingScraper(cfp_page())
+
+    first = scraper.scrape(gate=gate)
+    assert (first.metadata["unchanged"], len(first.normalized), scraper.parses) == (False, 1, 1)
+
+    again = scraper.scrape(gate=gate)
+    assert again.metadata == {"count": 0, "unchanged": True}
+    assert again.normalized == []
+    assert scraper.parses == 1
+
+    scraper.version = "1.1"  # parser change invalidates the fingerprint
+    assert scraper.scrape(gate=gate).metadata["unchanged"] is False
+    assert scraper.parses == 2
+    assert (gate.stats.checked, gate.stats.unchanged, gate.stats.new) == (3, 1, 2)
+
+    with Session(engine) as session:
+        assert gate.flush(session) == 1
+        session.commit()
+
+        reloaded = ContentGate()
+        assert reloaded.load(session, source="counting") == 1
+    assert reloaded.check("counting", digest(cfp_page()), "1.1")
+
+
+def test_fingerprints_roundtrip_high_simhash_bit(engine):
+    page = digest(cfp_page())
+    gate = ContentGate()
+    high = type(page)(page.content_hash, page.simhash | 1 << 63, page.numbers_hash)
+    gate.record("https://example.org/cfp", high, source="s", follow_ups=[["https://x/2", "parse"]])
+
+    with Session(engine) as session:
+        gate.flush(session)
+        session.commit()
+        assert session.scalar(select(ContentFingerprint.simhash)) < 0
+
+        reloaded = ContentGate()
+        reloaded.load(session)
+    assert reloaded.check("https://example.org/cfp", high)
+    assert reloaded.follow_ups("https://example.org/cfp") == [["https://x/2", "parse"]]
+
+
+class ListSpider(Spider):
+    name = "cfp_list"
+
+    def parse(self, response):
+        yield {"key": "conf1", "name": "CONF1 2026"}
+        yield response.follow(
+            "/cfp?page=2",
+            callback=self.parse_page,
+            errback=self.page_failed,
+            priority=5,
+            meta={"listing": "cfp", "response": response},
+            cb_kwargs={"page": 2},
+        )
+
+    def parse_page(self, response, page):
+        yield from ()
+
+    def page_failed(self, failure):
+        pass
+
+
+def make_middleware(engine):
+    crawler = get_crawler(ListSpider, settings_dict={"CONTENT_GATE_ENABLED": True})
+    crawler.spider = ListSpider()
+    middleware = ContentGateMiddleware.from_crawler(crawler)
+    middleware.session_factory = sessionmaker(engine)
+    return middleware, crawler
+
+
+def respond(spider, html: str) -> HtmlResponse:
+    url = "https://cfp.example.org/cfp"
+    return HtmlResponse(url=url, body=html.encode(), request=Request(url), encoding="utf-8")
+
+
+def test_middleware_skips_callback_and_replays_follow_ups(engine):
+    middleware, crawler = make_middleware(engine)
+    spider = crawler.spider
+
+    response = respond(spider, cfp_page())
+    middleware.process_spider_input(response, spider)
+    output = list(middleware.process_spider_output(response, spider.parse(response), spider))
+    assert len(output) == 2
+    middleware.spider_closed(spider)
+
+    with Session(engine) as session:
+        stored = session.scalar(select(ContentFingerprint))
+        assert (stored.url, stored.source) == ("https://cfp.example.org/cfp", "cfp_list")
+        assert stored.follow_ups == [
+            {
+                "url": "https://cfp.example.org/cfp?page=2",
+                "callback": "parse_page",
+                "errback": "page_failed",
+                "priority": 5,
+                "meta": {"listing": "cfp"},  # the response itself cannot be stored
+                "cb_kwargs": {"page": 2},
+            }
+        ]
+
+    # Next crawl: a fresh middleware loads the fingerprints from the database
+    middleware, crawler = make_middleware(engine)
+    spider = crawler.spider
+    response = respond(spider, cfp_page(banner="Browse the upcoming calls for papers"))
+    with pytest.raises(UnchangedContent) as excinfo:
+        middleware.process_spider_input(response, spider)
+
+    replayed = middleware.process_spider_exception(response, excinfo.value, spider)
+    (request,) = replayed
+    assert request.url == "https://cfp.example.org/cfp?page=2"
+    assert (request.callback, request.errback) == (spider.parse_page, spider.page_failed)
+    assert (request.priority, request.meta, request.cb_kwargs) == (
+        5,
+        {"listing": "cfp"},
+        {"page": 2},
+    )
+    assert crawler.stats.get_value("content_gate/unchanged") == 1
+    assert crawler.stats.get_value("content_gate/replayed_requests") == 1
+
+    moved = respond(spider, cfp_page(rows=ROWS.replace("2026-03-15", "2026-03-22")))
+    middleware.process_spider_input(moved, spider)
+    assert crawler.stats.get_value("content_gate/parsed") == 1
+
+
+def test_fingerprints_wait_for_stored_items(engine):
+    middleware, crawler = make_middleware(engine)
+    spider = crawler.spider
+    response = respond(spider, cfp_page())
+    middleware.process_spider_input(response, spider)
+    list(middleware.process_spider_output(response, spider.parse(response), spider))
+    with Session(engine) as session:
+        assert session.scalar(select(ContentFingerprint)) is None  # items not stored yet
+
+    crawler.stats.inc_value("db/item_errors")
+    middleware.spider_closed(spider)
+    with Session(engine) as session:
+        assert session.scalar(select(ContentFingerprint)) is None
+    assert crawler.stats.get_value("content_gate/discarded") == 1
+
+
+def test_old_follow_ups_are_replayed(engine):
+    page2 = "https://cfp.example.org/cfp?page=2"
+    with Session(engine) as session:
+        gate = ContentGate()
+        page = digest(cfp_page())
+        gate.record("https://cfp.example.org/cfp", page, "cfp_list", follow_ups=[[page2, "parse"]])
+        gate.flush(session)
+        session.commit()
+
+    middleware, crawler = make_middleware(engine)
+    spider = crawler.spider
+    response = respond(spider, cfp_page())
+    with pytest.raises(UnchangedContent) as excinfo:
+        middleware.process_spider_input(response, spider)
+    (request,) = middleware.process_spider_exception(response, excinfo.value, spider)
+    assert (request.url, request.callback, request.meta) == (page2, spider.parse, {})
+
+
+def test_dont_gate_and_errors_bypass(engine):
+    middleware, crawler = make_middleware(engine)
+    spider = crawler.spider
+    url = "https://cfp.example.org/cfp"
+    response = HtmlResponse(
+        url=url, body=cfp_page().encode(), request=Request(url, meta={"dont_gate": True})
+    )
+
+    assert middleware.process_spider_input(response, spider) is None
+    assert "content_digest" not in response.meta
+    assert middleware.process_spider_exception(response, ValueError("boom"), spider) is None
@@ -0,0 +1,225 @@
+"""Tests for the resumable crawl frontier."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from scrapy import Spider
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from confradar.db import Base, CrawlKey, CrawlRequest, CrawlState
+from confradar.frontier import FINISHED, RUNNING, CrawlFrontier
+from confradar.scrapers.middlewares import CrawlFrontierMiddleware
+
+BASE = "https://cfp.example.org/list"
+
+
+class PagedSpider(Spider):
+    """Three listing pages, newest first, two conferences per page."""
+
+    name = "paged"
+    resumable = True
+    start_urls = [f"{BASE}?page=1"]
+
+    def parse(self, response, depth=0):
+        page = int(response.url.rsplit("=", 1)[1])
+        for key in response.meta.get("keys", [f"conf{page}a", f"conf{page}b"]):
+            yield {"key": key}
+        if page < 3:
+            yield response.follow(
+                f"{BASE}?page={page + 1}",
+                callback=self.parse,
+                errback=self.failed,
+                priority=page,
+                meta={"listing": "cfp"},
+                cb_kwargs={"depth": page},
+            )
+
+    def failed(self, failure):
+        pass
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'frontier.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def make_middleware(engine, **settings):
+    crawler = get_crawler(PagedSpider, settings_dict={"CRAWL_FRONTIER_ENABLED": True, **settings})
+    crawler.spider = PagedSpider()
+    crawler.spider.crawler = crawler
+    middleware = CrawlFrontierMiddleware.from_crawler(crawler)
+    middleware.session_factory = sessionmaker(engine)
+    return middleware, crawler
+
+
+def respond(request: Request, keys: list[str] | None = None) -> HtmlResponse:
+    if keys is not None:
+        request.meta["keys"] = keys
+    return HtmlResponse(url=request.url, body=b"<html></html>", request=request)
+
+
+def crawl_page(middleware, request: Request, keys: list[str] | None = None) -> list:
+    spider = middleware.crawler.spider
+    response = respond(request, keys)
+    return list(middleware.process_spider_output(response, spider.parse(response), spider))
+
+
+def start(middleware) -> list[Request]:
+    async def original():
+        for url in middleware.crawler.spider.start_urls:
+            yield Request(url)
+
+    async def collect():
+        return [r async for r in middleware.process_start(original())]
+
+    return asyncio.run(collect())
+
+
+def test_frontier_roundtrip(engine):
+    page2 = {"url": f"{BASE}?page=2", "callback": "parse", "meta": {"listing": "cfp"}}
+    frontier = CrawlFrontier("paged")
+    with Session(engine) as session:
+        assert frontier.load(session) is False
+        assert frontier.enqueue("fp2", page2)
+        frontier.page_done("fp1", f"{BASE}?page=1", ["conf1a"])
+        assert not frontier.enqueue("fp1", {"url": f"{BASE}?page=1"})
+        frontier.flush(session)
+        session.commit()
+
+        reloaded = CrawlFrontier("paged")
+        assert reloaded.load(session) is True
+    assert reloaded.pending == {"fp2": page2}
+    assert (reloaded.seen, reloaded.cursor, reloaded.pages) == ({"fp1"}, f"{BASE}?page=1", 1)
+    assert reloaded.run_keys == {"conf1a"}
+
+
+def test_interrupted_crawl_resumes_from_pending(engine):
+    middleware, crawler = make_middleware(engine, CRAWL_FRONTIER_BATCH_SIZE=1)
+    (first,) = start(middleware)
+    output = crawl_page(middleware, first)
+    assert [o["key"] for o in output if isinstance(o, dict)] == ["conf1a", "conf1b"]
+    middleware.spider_closed(crawler.spider, reason="shutdown")
+
+    with Session(engine) as session:
+        state = session.scalar(select(CrawlState))
+        assert (state.status, state.pages, state.cursor) == (RUNNING, 1, first.url)
+
+    # Rerun: starts from the pending page 2 instead of the start URL
+    middleware, crawler = make_middleware(engine)
+    resumed = start(middleware)
+    assert [r.url for r in resumed] == [f"{BASE}?page=2"]
+    assert resumed[0].callback == crawler.spider.parse
+    assert resumed[0].errback == crawler.spider.failed
+    assert (resumed[0].priority, resumed[0].cb_kwargs) == (1, {"depth": 1})
+    assert resumed[0].meta["listing"] == "cfp"
+    assert crawler.stats.get_value("frontier/resumed_requests") == 1
+
+    # A link to a page already parsed in this run is dropped
+    (page3,) = [o for o in crawl_page(middleware, resumed[0]) if isinstance(o, Request)]
+    crawl_page(middleware, page3)
+    assert [
+        o for o in crawl_page(middleware, Request(resumed[0].url)) if isinstance(o, Request)
+    ] == []
+    assert crawler.stats.get_value("frontier/skipped_seen") == 1
+
+
+def known_keys(session) -> set[str]:
+    return set(session.scalars(select(CrawlKey.key).where(CrawlKey.known.is_(True))))
+
+
+def test_flush_writes_only_changes(engine):
+    frontier = CrawlFrontier("paged")
+    with Session(engine) as session:
+        frontier.load(session)
+        for page in range(1, 50):
+            frontier.enqueue(f"fp{page + 1}", {"url": f"{BASE}?page={page + 1}"})
+            frontier.page_done(f"fp{page}", f"{BASE}?page={page}", [f"conf{page}"])
+        frontier.flush(session)
+        session.commit()
+
+        frontier.enqueue("fp51", {"url": f"{BASE}?page=51"})
+        frontier.page_done("fp50", f"{BASE}?page=50", ["conf1", "conf50"])
+        written = {"crawl_requests": [], "crawl_keys": []}
+
+        def record(conn, cursor, sql, params, context, many):
+            for table, rows in written.items():
+                if f"INTO {table}" in sql:
+                    rows.extend(params if many else [params])
+
+        event.listen(engine, "before_cursor_execute", record)
+        frontier.flush(session)
+        session.commit()
+
+        assert len(written["crawl_requests"]) == 2  # page 51 enqueued, page 50 parsed
+        assert [row[1] for row in written["crawl_keys"]] == ["conf50"]
+        assert session.query(CrawlRequest).count() == 51
+        assert session.query(CrawlRequest).filter_by(parsed=False).one().fingerprint == "fp51"
+        assert session.query(CrawlKey).filter_by(current=True).count() == 50
+
+
+def test_finished_crawl_starts_fresh(engine):
+    middleware, crawler = make_middleware(engine)
+    requests = start(middleware)
+    while requests:
+        output = crawl_page(middleware, requests.pop())
+        requests.extend(o for o in output if isinstance(o, Request))
+    middleware.spider_closed(crawler.spider, reason="finished")
+
+    with Session(engine) as session:
+        assert session.scalar(select(CrawlState.status)) == FINISHED
+        assert len(known_keys(session)) == 6
+        assert session.scalar(select(CrawlRequest)) is None
+        assert session.scalar(select(CrawlKey).where(CrawlKey.current.is_(True))) is None
+
+    middleware, crawler = make_middleware(engine)
+    assert [r.url for r in start(middleware)] == [f"{BASE}?page=1"]
+    assert middleware.frontier.resuming is False
+
+
+def test_incremental_crawl_stops_at_known_listings(engine):
+    middleware, crawler = make_middleware(engine)
+    requests = start(middleware)
+    while requests:
+        output = crawl_page(middleware, requests.pop())
+        requests.extend(o for o in output if isinstance(o, Request))
+    middleware.spider_closed(crawler.spider, reason="finished")
+
+    # One new conference on page 1; page 2 lists only known ones, so page 3 is never requested
+    middleware, crawler = make_middleware(engine)
+    crawler.spider.incremental = "1"
+    (first,) = start(middleware)
+    (page2,) = [
+        o for o in crawl_page(middleware, first, ["conf0", "conf1a"]) if isinstance(o, Request)
+    ]
+    assert [o for o in crawl_page(middleware, page2) if isinstance(o, Request)] == []
+    assert crawler.stats.get_value("frontier/incremental_stops") == 1
+    middleware.spider_closed(crawler.spider, reason="finished")
+
+    with Session(engine) as session:
+        assert known_keys(session) == {"conf0"} | {f"conf{p}{s}" for p in (1, 2, 3) for s in "ab"}
+
+    # A full crawl forgets keys that are no longer listed
+    middleware, crawler = make_middleware(engine)
+    (first,) = start(middleware)
+    crawl_page(middleware, first, ["conf0"])
+    middleware.spider_closed(crawler.spider, reason="finished")
+    with Session(engine) as session:
+        assert known_keys(session) == {"conf0"}
+
+
+def test_non_resumable_spider_passes_through(engine):
+    middleware, crawler = make_middleware(engine)
+    crawler.spider.resumable = False
+    output = crawl_page(middleware, Request(f"{BASE}?page=1"))
+
+    assert len(output) == 3
+    assert middleware.frontier is None
+    with Session(engine) as session:
+        assert session.scalar(select(CrawlState)) is None
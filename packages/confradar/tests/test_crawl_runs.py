@@ -0,0 +1,73 @@
+"""Tests for per-run crawl performance metrics."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from confradar.crawl_runs import CrawlMetrics, recent_crawl_runs, record_crawl_run
+from confradar.db import Base
+
+STATS = {
+    "downloader/request_count": 12,
+    "downloader/response_count": 12,
+    "downloader/response_bytes": 480_000,
+    "httpcache/hit": 9,
+    "httpcache/miss": 3,
+}
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'runs.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def test_metrics_from_scrapy_stats():
+    metrics = CrawlMetrics.from_scrapy_stats(STATS, items=30, wall_time_s=6.0)
+    assert (metrics.requests, metrics.bytes_downloaded) == (12, 480_000)
+    assert metrics.cache_hit_ratio == 0.75
+    assert metrics.items_per_s == 5.0
+    assert metrics.metadata() == {
+        "wall_time_s": 6.0,
+        "requests": 12,
+        "bytes_downloaded": 480_000,
+        "items_per_s": 5.0,
+        "db_rows": 0,
+        "db_write_s": 0.0,
+        "cache_hit_ratio": 0.75,
+    }
+
+    # Without cache lookups there is no ratio; a zero wall time has no rate
+    uncached = CrawlMetrics(items=3)
+    assert uncached.cache_hit_ratio is None and uncached.items_per_s == 0.0
+    assert "cache_hit_ratio" not in uncached.metadata()
+
+
+def test_runs_are_recorded_and_listed_oldest_first(session):
+    start = datetime(2026, 10, 1, 2, 0, tzinfo=timezone.utc)
+    for day, wall_time in enumerate([10.0, 12.0, 30.0]):
+        record_crawl_run(
+            session,
+            CrawlMetrics.from_scrapy_stats(STATS, items=60, wall_time_s=wall_time),
+            asset="scraped_conferences",
+            source="wikicfp",
+            run_id=f"run-{day}",
+            partition=f"2026-10-0{day + 1}|wikicfp",
+            finished_at=start + timedelta(days=day),
+        )
+    record_crawl_run(
+        session, CrawlMetrics(items=60, db_rows=150), asset="store_conferences", source="wikicfp"
+    )
+    session.commit()
+
+    runs = recent_crawl_runs(session, "scraped_conferences", "wikicfp", limit=2)
+    assert [run.run_id for run in runs] == ["run-1", "run-2"]
+    assert [run.items_per_s for run in runs] == [5.0, 2.0]
+    assert runs[-1].cache_hit_ratio == 0.75
+    assert recent_crawl_runs(session, "store_conferences", "wikicfp")[0].db_rows == 150
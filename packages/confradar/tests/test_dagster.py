@@ -11,7 +11,7 @@ def test_dagster_definitions_load():
     assert defs is not None
     # Check that we have assets defined
     assert hasattr(defs, "assets")
-    assert len(defs.assets) == 7  # 6 scrapers (incl. seeded) + 1 storage
+    assert len(defs.assets) == 2  # scraper + storage, partitioned by source and date
     # Check that we have jobs defined
     assert hasattr(defs, "jobs")
     assert len(defs.jobs) > 0
@@ -24,24 +24,109 @@ def test_asset_names():
     """Test that all expected assets are defined."""
     asset_names = [a.key.to_user_string() for a in defs.assets]
 
-    # Check scraper assets
-    assert "ai_deadlines_conferences" in asset_names
-    assert "acl_web_conferences" in asset_names
-    assert "chairing_tool_conferences" in asset_names
-    assert "elra_conferences" in asset_names
-    assert "wikicfp_conferences" in asset_names
-    assert "seeded_conferences" in asset_names
-
-    # Check storage asset
+    assert "scraped_conferences" in asset_names
     assert "store_conferences" in asset_names
 
 
+def test_assets_partitioned_by_source_and_date():
+    """Test that every source is its own partition of both assets."""
+    for asset_def in defs.assets:
+        dims = {d.name: d.partitions_def for d in asset_def.partitions_def.partitions_defs}
+        assert set(dims) == {"source", "date"}
+        assert set(dims["source"].get_partition_keys()) == {
+            "seeded",
+            "aideadlines",
+            "acl_web",
+            "chairing_tool",
+            "elra",
+            "wikicfp",
+        }
+
+
 def test_crawl_job_exists():
     """Test that the crawl job is defined."""
     job_names = [job.name for job in defs.jobs]
     assert "crawl_job" in job_names
 
 
+def test_reprocess_job_exists():
+    """Test that the raw page reprocessing job is defined."""
+    job_names = [job.name for job in defs.jobs]
+    assert "reprocess_job" in job_names
+
+
+def test_scrape_sources_job_exists():
+    """Test that the concurrent non-Scrapy scraping job is defined."""
+    job_names = [job.name for job in defs.jobs]
+    assert "scrape_sources_job" in job_names
+
+
+def test_scrape_sources_stores_fetched_url(monkeypatch, tmp_path):
+    """Test that scraped sources are stored under the page they were fetched from."""
+    import httpx
+    from dagster import build_op_context
+    from sqlalchemy import select
+
+    from confradar.dagster.jobs import ScrapeSourcesConfig, scrape_sources
+    from confradar.db.base import get_sessionmaker
+    from confradar.db.models import Source
+    from confradar.scrapers import runner
+
+    page = """<a href="/conference?id=acl">ACL</a><script>
+    $('#acl .ML-tag').html('ml'); var timezone = "UTC-12";
+    var confDate = moment.tz("2026-05-15 23:59", timezone);</script>"""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=page))
+    real_make_client = runner.make_client
+    monkeypatch.setattr(
+        runner, "make_client", lambda *a, **kw: real_make_client(*a, **kw, transport=transport)
+    )
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'sources.db'}")
+
+    output = scrape_sources(build_op_context(), ScrapeSourcesConfig())
+    assert output.value["items"] == 1
+    with get_sessionmaker()() as session:
+        sources = session.scalars(select(Source)).all()
+    assert [s.url for s in sources] == ["https://aideadlin.es"]
+
+
+def test_recrawl_job_and_sensor_exist():
+    """Test that the deadline-proximity recrawl job and its sensor are defined."""
+    assert "recrawl_job" in [job.name for job in defs.jobs]
+    sensor = [s for s in defs.sensors if s.name == "deadline_recrawl_sensor"][0]
+    assert sensor.job_name == "recrawl_job"
+
+
+def test_upstream_change_sensor_requests_changed_sources_only(monkeypatch):
+    """Test that the upstream sensor runs today's partition of changed sources only."""
+    import httpx
+    from dagster import SkipReason, build_sensor_context
+
+    from confradar import upstream
+    from confradar.dagster.sensors import upstream_change_sensor
+    from confradar.scrapers.runner import make_client
+
+    pages = {}
+
+    def handler(request):
+        return httpx.Response(200, text=pages.get(request.url.host, "<p>2026-05-01</p>"))
+
+    monkeypatch.setattr(
+        upstream, "make_client", lambda **kw: make_client(transport=httpx.MockTransport(handler))
+    )
+    assert upstream_change_sensor.job_name == "crawl_job"
+
+    context = build_sensor_context()
+    assert isinstance(upstream_change_sensor(context), SkipReason)  # baseline
+
+    pages["www.elra.info"] = "<p>LREC deadline moved to 2026-05-08</p>"
+    context = build_sensor_context(cursor=context.cursor)
+    (request,) = upstream_change_sensor(context)
+    assert request.partition_key.keys_by_dimension["source"] == "elra"
+    assert isinstance(
+        upstream_change_sensor(build_sensor_context(cursor=context.cursor)), SkipReason
+    )
+
+
 def test_daily_schedule_exists():
     """Test that the daily crawl schedule is defined."""
     schedule_names = [s.name for s in defs.schedules]
@@ -52,6 +137,69 @@ def test_daily_schedule_exists():
     assert daily_schedule.cron_schedule == "0 2 * * *"
 
 
+def test_failed_crawl_is_retried_for_its_partition_only(monkeypatch):
+    """Test that a failed crawl is retried with its source's policy."""
+    from confradar.dagster.assets import scrapers
+
+    calls = []
+    runs = {
+        "wikicfp": scrapers.SpiderRun([], {"finish_reason": "shutdown"}),
+        "elra": scrapers.SpiderRun(
+            [{"key": "lrec", "name": "LREC"}], {"finish_reason": "finished"}
+        ),
+    }
+    monkeypatch.setattr(
+        scrapers, "crawl_spider", lambda spider, *a, **kw: calls.append(spider) or runs[spider]
+    )
+    monkeypatch.setitem(
+        scrapers.SOURCES, "wikicfp", scrapers.CrawlSource("wikicfp", "test", 2, retry_delay_s=0)
+    )
+
+    failed = materialize(
+        [scrapers.scraped_conferences], partition_key="2026-10-19|wikicfp", raise_on_error=False
+    )
+    assert not failed.success
+    assert calls == ["wikicfp"] * 3
+
+    stored = materialize([scrapers.scraped_conferences], partition_key="2026-10-19|elra")
+    assert stored.output_for_node("scraped_conferences") == [{"key": "lrec", "name": "LREC"}]
+    (materialization,) = stored.asset_materializations_for_node("scraped_conferences")
+    assert {"wall_time_s", "requests", "bytes_downloaded", "items_per_s"} <= set(
+        materialization.metadata
+    )
+
+
+def test_crawl_spider_disables_content_gate(monkeypatch):
+    """Items are stored by a later asset, so the crawl must not write fingerprints."""
+    from types import SimpleNamespace
+
+    import scrapy.crawler
+
+    from confradar.dagster.assets import scrapers
+
+    captured = []
+
+    class FakeProcess:
+        def __init__(self, settings):
+            captured.append(settings)
+
+        def create_crawler(self, spider_class):
+            signals = SimpleNamespace(connect=lambda *args, **kwargs: None)
+            return SimpleNamespace(signals=signals, stats=None)
+
+        def crawl(self, crawler, **kwargs):
+            pass
+
+        def start(self):
+            pass
+
+    monkeypatch.setattr(scrapy.crawler, "CrawlerProcess", FakeProcess)
+    scrapers.crawl_spider("elra")
+    assert captured[0].getbool("CONTENT_GATE_ENABLED") is False
+    scrapers.crawl_spider("elra", {"CONTENT_GATE_ENABLED": True})
+    assert captured[1].getbool("CONTENT_GATE_ENABLED") is True
+
+
 @pytest.mark.integration
 def test_materialize_mock_asset():
     """Test that we can materialize a simple asset (mock test).
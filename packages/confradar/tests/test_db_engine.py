@@ -0,0 +1,93 @@
+"""Tests for the shared engine registry in confradar.db.base."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from confradar.db import base
+from confradar.db.base import (
+    TimedQueuePool,
+    create_sqlite_engine,
+    dispose_engines,
+    get_engine,
+    get_sessionmaker,
+    pool_stats,
+)
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    yield f"sqlite:///{tmp_path / 'engine.db'}"
+    dispose_engines()
+
+
+def test_engine_is_shared_per_url(db_url, tmp_path):
+    assert get_engine(db_url) is get_engine(db_url)
+    assert get_engine(db_url) is not get_engine(f"sqlite:///{tmp_path / 'other.db'}")
+
+
+def test_sessionmaker_is_shared(db_url):
+    factory = get_sessionmaker(db_url)
+    assert factory is get_sessionmaker(db_url)
+    with factory() as session:
+        assert session.get_bind() is get_engine(db_url)
+
+
+def test_pool_stats_reports_checked_out_connections(db_url):
+    engine = get_engine(db_url)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        stats = pool_stats(db_url)
+        assert stats.checked_out == 1
+    assert pool_stats(db_url).checked_out == 0
+
+
+def test_timed_pool_records_waits(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'timed.db'}", poolclass=TimedQueuePool)
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    assert engine.pool.checkouts == 3
+    assert engine.pool.wait_time_s >= engine.pool.max_wait_s >= 0
+    engine.dispose()
+
+
+def test_engine_usable_after_fork_reset(db_url):
+    engine = get_engine(db_url)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    base._reset_after_fork()
+
+    assert get_engine(db_url) is engine
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_sqlite_performance_pragmas(db_url):
+    with get_engine(db_url).connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() > 0
+
+
+def test_stock_sqlite_engine_keeps_defaults(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'stock.db'}", performance=False)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    engine.dispose()
+
+
+def test_read_only_engine_rejects_writes(db_url):
+    with get_engine(db_url).begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    reader = get_engine(db_url, read_only=True)
+    assert reader is not get_engine(db_url)
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
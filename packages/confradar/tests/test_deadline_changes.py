@@ -0,0 +1,113 @@
+"""Tests for set-based deadline change detection."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from confradar.db import Base, Conference, Deadline, DeadlineChange
+from confradar.db.ingest import upsert_items
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'changes.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _item(key: str, deadlines: list[tuple[str, str]], url: str = "https://aideadlines.org"):
+    return {
+        "key": key,
+        "name": key.upper(),
+        "url": url,
+        "source": "test",
+        "deadlines": [{"kind": kind, "due_date": due} for kind, due in deadlines],
+    }
+
+
+def _ingest(session: Session, items: list[dict], run_id: str):
+    stats = upsert_items(session, items, run_id=run_id)
+    session.commit()
+    return stats.changes
+
+
+def _deadlines(session: Session, key: str) -> set[tuple[str, date]]:
+    rows = session.query(Deadline).join(Conference).filter(Conference.key == key)
+    return {(d.kind, d.due_date) for d in rows}
+
+
+def test_first_crawl_records_additions(session):
+    changes = _ingest(session, [_item("icml25", [("submission", "2025-01-30")])], "run1")
+
+    assert (changes.added, changes.moved, changes.removed) == (1, 0, 0)
+    event = session.query(DeadlineChange).one()
+    assert event.change == "added"
+    assert event.new_due_date == date(2025, 1, 30)
+    assert event.run_id == "run1"
+
+
+def test_unchanged_crawl_is_a_noop(session):
+    items = [_item("icml25", [("submission", "2025-01-30")])]
+    _ingest(session, items, "run1")
+    changes = _ingest(session, items, "run2")
+
+    assert (changes.added, changes.moved, changes.removed, changes.unchanged) == (0, 0, 0, 1)
+    assert session.query(DeadlineChange).count() == 1
+
+
+def test_moved_deadline_updates_in_place(session):
+    _ingest(session, [_item("icml25", [("submission", "2025-01-30")])], "run1")
+    changes = _ingest(session, [_item("icml25", [("submission", "2025-02-06")])], "run2")
+
+    assert changes.moved == 1
+    assert _deadlines(session, "icml25") == {("submission", date(2025, 2, 6))}
+    moved = session.query(DeadlineChange).filter_by(change="moved").one()
+    assert (moved.old_due_date, moved.new_due_date) == (date(2025, 1, 30), date(2025, 2, 6))
+
+
+def test_removed_deadline(session):
+    _ingest(
+        session,
+        [_item("acl25", [("abstract", "2025-02-01"), ("submission", "2025-02-15")])],
+        "run1",
+    )
+    changes = _ingest(session, [_item("acl25", [("submission", "2025-02-15")])], "run2")
+
+    assert changes.removed == 1
+    assert _deadlines(session, "acl25") == {("submission", date(2025, 2, 15))}
+    removed = session.query(DeadlineChange).filter_by(change="removed").one()
+    assert removed.kind == "abstract"
+    assert removed.old_due_date == date(2025, 2, 1)
+
+
+def test_other_sources_deadlines_are_not_removed(session):
+    _ingest(session, [_item("acl25", [("abstract", "2025-02-01")], url="https://aclweb.org")], "r1")
+    changes = _ingest(session, [_item("acl25", [("submission", "2025-02-15")])], "r2")
+
+    assert (changes.added, changes.removed) == (1, 0)
+    assert len(_deadlines(session, "acl25")) == 2
+
+
+def test_items_without_deadlines_remove_nothing(session):
+    _ingest(session, [_item("acl25", [("submission", "2025-02-15")])], "run1")
+    changes = _ingest(session, [_item("acl25", [])], "run2")
+
+    assert changes.removed == 0
+    assert _deadlines(session, "acl25") == {("submission", date(2025, 2, 15))}
+
+
+def test_multiple_dates_per_kind_are_paired_by_rank(session):
+    _ingest(session, [_item("emnlp25", [("submission", "2025-05-01")])], "run1")
+    changes = _ingest(
+        session,
+        [_item("emnlp25", [("submission", "2025-05-01"), ("submission", "2025-05-20")])],
+        "r2",
+    )
+
+    # The existing date is unchanged; the extra one is an addition, not a move
+    assert (changes.added, changes.moved, changes.unchanged) == (1, 0, 1)
@@ -0,0 +1,127 @@
+"""Tests for versioned deadline history and as-of queries."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from confradar.db import Base, Conference
+from confradar.db.changes import apply_deadline_changes
+from confradar.db.history import deadline_timeline, deadlines_as_of
+from confradar.db.models import OPEN_END
+
+RUN1 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+RUN2 = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def icml(session):
+    conf = Conference(key="icml25", name="ICML 2025")
+    session.add(conf)
+    session.flush()
+    return conf
+
+
+def _crawl(session: Session, conference_id: int, deadlines: list[tuple[str, date]], at: datetime):
+    rows = [
+        {
+            "conference_id": conference_id,
+            "kind": kind,
+            "due_date": due,
+            "timezone": None,
+            "source_id": None,
+        }
+        for kind, due in deadlines
+    ]
+    apply_deadline_changes(session, rows, observed_at=at)
+    session.commit()
+
+
+def _as_of(session: Session, at: datetime, conference_id: int) -> set[tuple[str, date]]:
+    return {(v.kind, v.due_date) for v in deadlines_as_of(session, at, conference_id=conference_id)}
+
+
+def test_move_closes_old_version_and_opens_new(session, icml):
+    _crawl(session, icml.id, [("submission", date(2025, 1, 30))], RUN1)
+    _crawl(session, icml.id, [("submission", date(2025, 2, 6))], RUN2)
+
+    old, new = deadline_timeline(session, icml.id)
+    assert (old.due_date, new.due_date) == (date(2025, 1, 30), date(2025, 2, 6))
+    assert old.valid_to.replace(tzinfo=timezone.utc) == RUN2
+    assert new.valid_from.replace(tzinfo=timezone.utc) == RUN2
+    assert new.valid_to.replace(tzinfo=timezone.utc) == OPEN_END
+
+
+def test_as_of_returns_value_current_at_that_time(session, icml):
+    _crawl(session, icml.id, [("submission", date(2025, 1, 30))], RUN1)
+    _crawl(session, icml.id, [("submission", date(2025, 2, 6))], RUN2)
+
+    assert _as_of(session, datetime(2024, 12, 31, tzinfo=timezone.utc), icml.id) == set()
+    assert _as_of(session, datetime(2025, 1, 7, tzinfo=timezone.utc), icml.id) == {
+        ("submission", date(2025, 1, 30))
+    }
+    assert _as_of(session, RUN2, icml.id) == {("submission", date(2025, 2, 6))}
+
+
+def test_unchanged_crawl_adds_no_versions(session, icml):
+    _crawl(session, icml.id, [("submission", date(2025, 1, 30))], RUN1)
+    _crawl(session, icml.id, [("submission", date(2025, 1, 30))], RUN2)
+
+    assert len(deadline_timeline(session, icml.id)) == 1
+
+
+def test_removed_deadline_closes_version(session, icml):
+    _crawl(
+        session,
+        icml.id,
+        [("abstract", date(2025, 1, 23)), ("submission", date(2025, 1, 30))],
+        RUN1,
+    )
+    _crawl(session, icml.id, [("submission", date(2025, 1, 30))], RUN2)
+
+    (abstract,) = deadline_timeline(session, icml.id, kind="abstract")
+    assert abstract.valid_to.replace(tzinfo=timezone.utc) == RUN2
+    assert _as_of(session, RUN2, icml.id) == {("submission", date(2025, 1, 30))}
+
+
+def test_migration_seeds_versions_that_later_crawls_close(tmp_path, monkeypatch):
+    from alembic import command
+    from alembic.config import Config
+
+    root = Path(__file__).resolve().parents[3]
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = Config()
+    config.set_main_option("script_location", str(root / "alembic"))
+
+    # A deadline stored before the history table existed
+    command.upgrade(config, "9c1f4b2a7d3e")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO conferences (key, name) VALUES ('icml25', 'ICML 2025')"))
+        conn.execute(
+            text(
+                "INSERT INTO deadlines (conference_id, kind, due_date) "
+                "VALUES (1, 'submission', '2025-01-30')"
+            )
+        )
+    command.upgrade(config, "b5e2d8f0a4c1")
+
+    with Session(engine) as session:
+        _crawl(session, 1, [("submission", date(2025, 2, 6))], RUN2)
+        versions = deadline_timeline(session, 1)
+    open_versions = [v for v in versions if v.valid_to.replace(tzinfo=timezone.utc) == OPEN_END]
+    assert [v.due_date for v in open_versions] == [date(2025, 2, 6)]
+    assert len(versions) == 2
@@ -0,0 +1,165 @@
+"""Tests for the SQLite HTTP cache storage and the RFC 2616 fallback policy."""
+
+from __future__ import annotations
+
+import inspect
+import os
+import time
+
+import pytest
+from scrapy import Spider
+from scrapy.http import HtmlResponse, Request, Response
+from scrapy.utils.test import get_crawler
+
+from confradar.scrapers.httpcache import RFC2616FallbackPolicy, SqliteCacheStorage
+
+
+class CacheSpider(Spider):
+    name = "cache_test"
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    crawler = get_crawler(
+        CacheSpider,
+        settings_dict={
+            "HTTPCACHE_DIR": str(tmp_path / "httpcache"),
+            "HTTPCACHE_EXPIRATION_SECS": 3600,
+            "HTTPCACHE_MAX_BYTES": 0,
+            "HTTPCACHE_IGNORE_HTTP_CODES": [500, 503, 409],
+        },
+    )
+    crawler.spider = CacheSpider()
+    crawler.spider.crawler = crawler
+    return crawler
+
+
+def spider_arg(method, spider) -> tuple:
+    """``(spider,)`` where ``method`` still requires it (older Scrapy), else ``()``."""
+    parameter = inspect.signature(method).parameters.get("spider")
+    return (spider,) if parameter and parameter.default is inspect.Parameter.empty else ()
+
+
+def open_storage(crawler, **overrides) -> SqliteCacheStorage:
+    crawler.settings.frozen = False
+    for name, value in overrides.items():
+        crawler.settings.set(name, value)
+    storage = SqliteCacheStorage(crawler.settings)
+    storage.open_spider(crawler.spider)
+    return storage
+
+
+def page(url: str, body: bytes = b"<html>CFP</html>", **headers) -> HtmlResponse:
+    return HtmlResponse(url=url, body=body, headers=headers, request=Request(url))
+
+
+def test_roundtrip_in_one_file(crawler, tmp_path):
+    storage = open_storage(crawler)
+    spider = crawler.spider
+    body = b"<html>" + b"Deadline: 2026-05-15 " * 500 + b"</html>"
+    response = page("https://cfp.example.org/a", body, **{"X-Test": "1"})
+    storage.store_response(spider, Request(response.url), response)
+
+    request = Request("https://cfp.example.org/a")
+    cached = storage.retrieve_response(spider, request)
+    assert cached.body == body
+    assert cached.headers["X-Test"] == b"1"
+    assert isinstance(cached, HtmlResponse)
+    assert request.meta["cache_timestamp"] > 0
+    assert storage.retrieve_response(spider, Request("https://cfp.example.org/b")) is None
+    storage.close_spider(spider)
+
+    assert sorted(os.listdir(tmp_path / "httpcache")) == ["httpcache.sqlite"]
+    reopened = open_storage(crawler)
+    assert reopened.retrieve_response(spider, Request(response.url)).body == body
+    assert reopened._bytes < len(body)  # stored compressed
+
+
+def test_expired_entries_are_not_served(crawler):
+    storage = open_storage(crawler, HTTPCACHE_EXPIRATION_SECS=1)
+    spider = crawler.spider
+    storage.store_response(spider, Request("https://x.org/"), page("https://x.org/"))
+    storage.db.execute("UPDATE http_cache SET stored_at = ?", (time.time() - 10,))
+
+    assert storage.retrieve_response(spider, Request("https://x.org/")) is None
+
+
+def test_lru_eviction_by_entries_and_size(crawler):
+    storage = open_storage(crawler, HTTPCACHE_MAX_ENTRIES=10)
+    spider = crawler.spider
+    urls = [f"https://cfp.example.org/{i}" for i in range(10)]
+    for url in urls:
+        storage.store_response(spider, Request(url), page(url))
+    # Touch the oldest entry so it becomes the most recently used
+    storage.db.execute("UPDATE http_cache SET accessed_at = accessed_at - 100")
+    assert storage.retrieve_response(spider, Request(urls[0])) is not None
+
+    storage.store_response(spider, Request("https://cfp.example.org/new"), page(urls[0]))
+    assert storage.evictions == 2  # 11 entries, evicted down to 9
+    assert storage.retrieve_response(spider, Request(urls[0])) is not None
+    assert storage.retrieve_response(spider, Request("https://cfp.example.org/new")) is not None
+
+    bytes_before = storage._bytes
+    storage.max_entries = 0
+    storage.max_bytes = bytes_before // 2
+    storage.store_response(spider, Request(urls[5]), page(urls[5]))  # replace, not add
+    assert storage._bytes <= storage.max_bytes * 0.9
+    assert storage.retrieve_response(spider, Request(urls[5])) is not None
+
+
+def test_policy_never_caches_conflicts_and_honours_headers(crawler):
+    policy = RFC2616FallbackPolicy(crawler.settings)
+    request = Request("https://aclweb.org/portal/acl_sponsored_events")
+
+    def check(status: int, **headers) -> bool:
+        response = Response(request.url, status=status, headers=headers)
+        return policy.should_cache_response(response, request)
+
+    assert not check(409)
+    assert not check(409, **{"Cache-Control": "max-age=600"})  # ignored status
+    assert not check(404)
+    assert not check(200, **{"Cache-Control": "no-store"})
+    assert check(200)  # no caching headers: fallback lifetime
+    assert check(200, ETag='"abc"')
+    assert check(301)
+
+    plain = Response(request.url, status=200)
+    assert policy.is_cached_response_fresh(plain, Request(request.url))
+    no_cache = Response(request.url, status=200, headers={"Cache-Control": "no-cache"})
+    assert not policy.is_cached_response_fresh(no_cache, Request(request.url))
+
+    # Stale with a validator: revalidated with a conditional request
+    etag = Response(
+        request.url, status=200, headers={"ETag": '"abc"', "Cache-Control": "max-age=0"}
+    )
+    revalidate = Request(request.url)
+    assert not policy.is_cached_response_fresh(etag, revalidate)
+    assert revalidate.headers["If-None-Match"] == b'"abc"'
+
+
+def test_middleware_skips_conflict_and_serves_cached_page(crawler):
+    from scrapy.downloadermiddlewares.httpcache import HttpCacheMiddleware
+
+    crawler.settings.frozen = False
+    crawler.settings.set("HTTPCACHE_ENABLED", True)
+    crawler.settings.set("HTTPCACHE_STORAGE", "confradar.scrapers.httpcache.SqliteCacheStorage")
+    crawler.settings.set("HTTPCACHE_POLICY", "confradar.scrapers.httpcache.RFC2616FallbackPolicy")
+    crawler.stats.open_spider(*spider_arg(crawler.stats.open_spider, crawler.spider))
+    middleware = HttpCacheMiddleware.from_crawler(crawler)
+    middleware.spider_opened(crawler.spider)
+    url = "https://aclweb.org/portal/acl_sponsored_events"
+    spider = spider_arg(middleware.process_request, crawler.spider)
+
+    request = Request(url)
+    assert middleware.process_request(request, *spider) is None
+    middleware.process_response(request, Response(url, status=409, request=request), *spider)
+
+    request = Request(url)
+    assert middleware.process_request(request, *spider) is None  # the 409 was not stored
+    middleware.process_response(request, page(url), *spider)
+
+    cached = middleware.process_request(Request(url), *spider)
+    assert "cached" in cached.flags
+    assert cached.body == b"<html>CFP</html>"
+    assert crawler.stats.get_value("httpcache/store") == 1
+    middleware.spider_closed(crawler.spider)
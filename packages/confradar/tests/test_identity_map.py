@@ -0,0 +1,104 @@
+"""Tests for the ingestion identity map."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from confradar.db import Base, Conference, Source
+from confradar.db.identity import IdentityMap
+from confradar.db.ingest import upsert_items
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'identity.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _count_selects(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def _item(key: str, url: str = "https://aideadlines.org") -> dict:
+    return {"key": key, "name": key.upper(), "url": url, "source": "test", "deadlines": []}
+
+
+def test_resolve_conferences_queries_once(engine):
+    with Session(engine) as session:
+        session.add_all([Conference(key="acl", name="ACL"), Conference(key="icml", name="ICML")])
+        session.commit()
+
+        identity = IdentityMap()
+        selects = _count_selects(engine)
+        ids = identity.resolve_conferences(session, ["acl", "icml", "missing"])
+        assert set(ids) == {"acl", "icml"}
+        assert len(selects) == 1
+
+        # Second lookup is served from the cache
+        again = identity.resolve_conferences(session, ["acl", "icml"])
+        assert again == ids
+        assert len(selects) == 1
+        assert identity.hits == 2
+
+
+def test_lru_is_bounded():
+    identity = IdentityMap(max_size=2)
+    identity.add_conference("a", 1)
+    identity.add_conference("b", 2)
+    identity.get_conference("a")  # refresh "a"
+    identity.add_conference("c", 3)
+
+    assert identity.get_conference("b") is None
+    assert identity.get_conference("a") == 1
+    assert identity.get_conference("c") == 3
+
+
+def test_repeated_conferences_cost_no_lookups(engine):
+    identity = IdentityMap()
+    with Session(engine) as session:
+        upsert_items(session, [_item("acl25"), _item("icml25")], identity=identity)
+        session.commit()
+
+        selects = _count_selects(engine)
+        upsert_items(session, [_item("acl25"), _item("icml25")], identity=identity)
+        session.commit()
+
+        assert selects == []
+        assert session.query(Source).count() == 2
+
+
+def test_multiple_sources_per_key_are_kept(engine):
+    with Session(engine) as session:
+        upsert_items(
+            session,
+            [_item("acl25", "https://seed.example"), _item("acl25", "https://aideadlines.org")],
+        )
+        session.commit()
+        assert session.query(Source).count() == 2
+
+
+def test_items_without_url_add_no_source(engine):
+    item = {**_item("wsdm26", ""), "deadlines": [{"kind": "submission", "due_date": "2026-08-01"}]}
+    with Session(engine) as session:
+        stats = upsert_items(session, [item, {**item, "url": None}])
+        session.commit()
+        assert session.query(Source).count() == 0
+    assert (stats.sources, stats.changes.added) == (0, 1)
+
+
+def test_clear_drops_cached_ids():
+    identity = IdentityMap()
+    identity.add_conference("acl", 1)
+    identity.add_source(1, "https://aclweb.org", 7)
+    identity.clear()
+    assert len(identity) == 0
@@ -0,0 +1,93 @@
+"""Import-time budget for the package and the CLI.
+
+Each check runs in a fresh interpreter. Besides the wall-clock budget, heavy
+dependencies must not be imported at all, which keeps the test meaningful on
+fast machines too.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from confradar.scrapers.registry import scrapers, spiders
+
+# Seconds for importing confradar, or for importing the CLI and printing --help
+IMPORT_BUDGET_S = 0.5
+
+# Only imported by the commands, spiders and scrapers that need them
+HEAVY_MODULES = [
+    "scrapy",
+    "dagster",
+    "dateparser",
+    "httpx",
+    "lxml",
+    "bs4",
+    "litellm",
+    "sqlalchemy",
+    "pydantic_settings",
+    "confradar.scrapers.spiders",
+]
+
+CHILD = """
+import contextlib, io, json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+HELP = """
+from confradar.cli import main
+with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):
+    main(["--help"])
+"""
+
+
+def measure(statement: str) -> dict:
+    code = CHILD.format(statement=statement, heavy=HEAVY_MODULES)
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "statement", ["import confradar", HELP], ids=["import confradar", "confradar --help"]
+)
+def test_import_time_budget(statement):
+    result = measure(statement)
+
+    assert result["heavy"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_S
+
+
+def test_registry_lists_sources_without_importing_them():
+    result = measure(
+        "from confradar.scrapers.registry import scrapers, spiders\n"
+        "names = sorted(scrapers) + sorted(spiders)\n"
+        "scrapers.target('aideadlines')"
+    )
+
+    assert result["heavy"] == []
+    assert "aideadlines" in scrapers
+    assert list(spiders) == [
+        "acl_web",
+        "ai_deadlines",
+        "chairing_tool",
+        "elra",
+        "seeded",
+        "wikicfp",
+    ]
+
+
+def test_registry_loads_and_rejects_by_name():
+    from confradar.scrapers.ai_deadlines import AIDeadlinesScraper
+
+    assert scrapers.load("ai_deadlines") is AIDeadlinesScraper
+    with pytest.raises(ValueError, match="No scraper registered for source 'nope'"):
+        scrapers.load("nope")
@@ -0,0 +1,144 @@
+"""Tests for the content-addressed raw page archive."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+
+import pytest
+from scrapy import Spider
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from confradar.archive import RawArchive, iter_pages, record_page
+from confradar.db import Base, RawPage
+from confradar.scrapers.base import Scraper
+from confradar.scrapers.middlewares import RawArchiveMiddleware
+
+PAGE = b"<html><body>" + b"<tr><td>ACL 2025</td><td>15 May 2025</td></tr>" * 200 + b"</body></html>"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return RawArchive(tmp_path / "archive")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'raw.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_put_get_roundtrip_is_content_addressed(archive):
+    blob = archive.put(PAGE)
+
+    assert blob.sha256 == hashlib.sha256(PAGE).hexdigest()
+    assert 0 < blob.stored_bytes < len(PAGE)
+    assert archive.get(blob.sha256) == PAGE
+    assert archive.path(blob.sha256).relative_to(archive.root).parts[:2] == (
+        "objects",
+        blob.sha256[:2],
+    )
+
+
+def test_identical_bodies_are_stored_once(archive):
+    first = archive.put(PAGE)
+    again = archive.put(PAGE)
+
+    assert again.deduplicated
+    assert again.stored_bytes == 0
+    assert len(list(archive.root.rglob("*.zst"))) == 1
+    assert not first.deduplicated
+
+
+def test_missing_blob_raises(archive):
+    with pytest.raises(FileNotFoundError):
+        archive.get("0" * 64)
+
+
+def test_record_and_iter_pages(engine, archive):
+    url = "https://www.aclweb.org/portal/call"
+    with Session(engine) as session:
+        for day, body in [(1, PAGE), (2, PAGE), (3, PAGE + b"<!-- changed -->")]:
+            record_page(
+                session,
+                archive,
+                url,
+                body,
+                status=200,
+                fetched_at=datetime(2025, 1, day, tzinfo=timezone.utc),
+                source="acl_web",
+            )
+        session.commit()
+
+        history = list(iter_pages(session, archive, url=url))
+        assert [p.fetched_at.day for p, _ in history] == [1, 2, 3]
+        assert [body for _, body in history][:2] == [PAGE, PAGE]
+        assert history[2][1].endswith(b"<!-- changed -->")
+        assert len({p.sha256 for p, _ in history}) == 2
+        assert list(iter_pages(session, archive, source="wikicfp")) == []
+
+
+class PageScraper(Scraper):
+    source_name = "acl_web"
+    schema_version = "1.0"
+    url = "https://www.aclweb.org/portal/call"
+
+    def fetch(self, **kwargs):
+        return PAGE.decode()
+
+    def parse(self, raw, **kwargs):
+        return [{"key": "acl25", "name": "ACL 2025"}]
+
+
+def test_scraped_pages_are_indexed_for_reprocessing(engine, archive):
+    scraper = PageScraper()
+    results = [scraper.scrape(archive=archive), scraper.scrape(archive=archive)]
+    assert archive.pending == 2
+
+    with Session(engine) as session:
+        assert archive.flush(session) == 2
+        session.commit()
+        history = list(iter_pages(session, archive, source="acl_web"))
+
+    assert [page.url for page, _ in history] == [PageScraper.url] * 2
+    assert [page.fetched_at.replace(tzinfo=timezone.utc) for page, _ in history] == [
+        result.scraped_at for result in results
+    ]
+    assert [body for _, body in history] == [PAGE, PAGE]
+    assert {page.sha256 for page, _ in history} == {results[0].metadata["raw_sha256"]}
+
+
+def _response(url: str, body: bytes, flags: list[str] | None = None) -> HtmlResponse:
+    return HtmlResponse(url=url, body=body, request=Request(url), flags=flags or [])
+
+
+def test_middleware_archives_fetched_responses(engine, archive):
+    crawler = get_crawler(settings_dict={"RAW_ARCHIVE_ENABLED": True})
+    spider = Spider(name="acl_web")
+    middleware = RawArchiveMiddleware(
+        archive, batch_size=2, session_factory=sessionmaker(engine), stats=crawler.stats
+    )
+
+    for url in ["https://a.example/1", "https://a.example/2"]:
+        middleware.process_response(Request(url), _response(url, PAGE), spider)
+    cached = _response("https://a.example/3", PAGE, flags=["cached"])
+    middleware.process_response(Request(cached.url), cached, spider)
+    middleware.spider_closed(spider)
+
+    with Session(engine) as session:
+        rows = session.query(RawPage).order_by(RawPage.url).all()
+    assert [r.url for r in rows] == ["https://a.example/1", "https://a.example/2"]
+    assert {r.source for r in rows} == {"acl_web"}
+    assert crawler.stats.get_value("raw_archive/pages") == 2
+    assert crawler.stats.get_value("raw_archive/deduplicated") == 1
+
+
+def test_middleware_disabled_by_default():
+    from scrapy.exceptions import NotConfigured
+
+    with pytest.raises(NotConfigured):
+        RawArchiveMiddleware.from_crawler(get_crawler())
@@ -0,0 +1,127 @@
+"""Tests for deadline-proximity recrawl scheduling."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from confradar.db import Base, Conference, Deadline, RecrawlTarget, Source
+from confradar.recrawl import (
+    DAILY,
+    HOURLY,
+    WEEKLY,
+    due_by_spider,
+    mark_crawled,
+    recrawl_interval,
+    recrawl_spiders,
+    refresh_targets,
+    run_key,
+    spider_for_url,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+TODAY = NOW.date()
+DOMAINS = {"wikicfp": ["wikicfp.com"], "elra": ["elra.info"]}
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'recrawl.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def add_conference(session: Session, key: str, url: str, *due: date) -> Conference:
+    conf = Conference(key=key, name=key.upper())
+    conf.sources.append(Source(url=url))
+    conf.deadlines.extend(Deadline(kind=f"d{i}", due_date=d) for i, d in enumerate(due))
+    session.add(conf)
+    session.flush()
+    return conf
+
+
+def targets(session: Session) -> dict[str, RecrawlTarget]:
+    return {t.url: t for t in session.scalars(select(RecrawlTarget))}
+
+
+def test_interval_follows_nearest_deadline():
+    assert recrawl_interval(TODAY + timedelta(days=3), TODAY) == HOURLY
+    assert recrawl_interval(TODAY + timedelta(days=7), TODAY) == HOURLY
+    assert recrawl_interval(TODAY + timedelta(days=8), TODAY) == DAILY
+    assert recrawl_interval(TODAY + timedelta(days=30), TODAY) == DAILY
+    assert recrawl_interval(TODAY + timedelta(days=31), TODAY) == WEEKLY
+    assert recrawl_interval(TODAY - timedelta(days=1), TODAY) == WEEKLY
+    assert recrawl_interval(None, TODAY) == WEEKLY
+
+
+def test_spider_for_url_matches_subdomains():
+    assert spider_for_url("http://www.wikicfp.com/cfp/call?conference=acl", DOMAINS) == "wikicfp"
+    assert spider_for_url("https://elra.info/events/", DOMAINS) == "elra"
+    assert spider_for_url("https://notwikicfp.com/", DOMAINS) is None
+
+    recrawlable = recrawl_spiders()
+    assert "wikicfp" in recrawlable and "seeded" not in recrawlable
+
+
+def test_refresh_schedules_by_nearest_upcoming_deadline(session):
+    listing = "http://www.wikicfp.com/cfp/call?conference=nlp"
+    add_conference(session, "soon", listing, TODAY - timedelta(days=2), TODAY + timedelta(days=3))
+    add_conference(session, "later", listing, TODAY + timedelta(days=60))
+    add_conference(session, "month", "https://www.elra.info/events/", TODAY + timedelta(days=20))
+    add_conference(session, "past", "https://elra.info/past/", TODAY - timedelta(days=5))
+    add_conference(session, "other", "https://example.org/cfp", TODAY + timedelta(days=1))
+
+    stats = refresh_targets(session, NOW, DOMAINS)
+    assert (stats.urls, stats.added, stats.unassigned) == (4, 3, 1)
+    by_url = targets(session)
+    assert by_url[listing].nearest_due_date == TODAY + timedelta(days=3)
+    assert by_url[listing].interval_s == 3600
+    assert by_url["https://www.elra.info/events/"].interval_s == 86400
+    assert by_url["https://elra.info/past/"].interval_s == 7 * 86400
+
+    # An unchanged schedule writes nothing
+    assert refresh_targets(session, NOW, DOMAINS).rescheduled == 0
+
+    # A deadline moving within its band is recorded without rescheduling
+    month = session.scalars(select(Conference).filter_by(key="month")).one()
+    month.deadlines[0].due_date = TODAY + timedelta(days=25)
+    session.flush()
+    before = targets(session)["https://www.elra.info/events/"].next_crawl_at
+    assert refresh_targets(session, NOW, DOMAINS).rescheduled == 0
+    session.expire_all()
+    target = targets(session)["https://www.elra.info/events/"]
+    assert target.nearest_due_date == TODAY + timedelta(days=25)
+    assert target.next_crawl_at == before
+
+    due = due_by_spider(session, NOW + timedelta(hours=2))
+    assert {s: [t.url for t in ts] for s, ts in due.items()} == {"wikicfp": [listing]}
+    assert len(due_by_spider(session, NOW + timedelta(days=2))["elra"]) == 1
+
+
+def test_mark_crawled_and_rescheduling(session):
+    url = "https://www.elra.info/events/"
+    conf = add_conference(session, "lrec", url, TODAY + timedelta(days=20))
+    refresh_targets(session, NOW, DOMAINS)
+    session.commit()
+
+    crawled_at = NOW + timedelta(days=1, minutes=5)
+    (target,) = due_by_spider(session, crawled_at)["elra"]
+    key = run_key("elra", [target], crawled_at)
+    assert key == run_key("elra", [target], crawled_at + timedelta(minutes=30))
+    assert mark_crawled(session, [url], crawled_at, run_id="run-1") == 1
+    assert due_by_spider(session, crawled_at) == {}
+    session.commit()
+
+    target = targets(session)[url]
+    assert (target.last_run_id, target.interval_s) == ("run-1", 86400)
+    assert key != run_key("elra", [target], crawled_at)
+
+    # A deadline moved within a week: the next recrawl is one hour after the last one
+    conf.deadlines[0].due_date = TODAY + timedelta(days=4)
+    session.flush()
+    assert refresh_targets(session, crawled_at, DOMAINS).rescheduled == 1
+    assert due_by_spider(session, crawled_at + timedelta(minutes=61))["elra"][0].url == url
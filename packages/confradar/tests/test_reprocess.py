@@ -0,0 +1,214 @@
+"""Tests for reprocessing archived raw pages."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from confradar.archive import RawArchive, record_page
+from confradar.db import (
+    Base,
+    Conference,
+    Deadline,
+    DeadlineChange,
+    DeadlineHistory,
+    ReprocessCheckpoint,
+    Source,
+)
+from confradar.reprocess import checkpoint_name, reprocess, select_pages
+
+T0 = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def page(key: str, name: str, due: str) -> bytes:
+    return f"""
+    <html><body><a href="/conference?id={key}">{name}</a></body>
+    <script>
+        $('#{key} .NLP-tag').html('nlp');
+        var timezone = "UTC-12";
+        var confDate = moment.tz("{due}", timezone);
+    </script></html>
+    """.encode()
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return RawArchive(tmp_path / "archive")
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'reprocess.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def archive_pages(session, archive, bodies, source="ai_deadlines"):
+    for offset, (url, body) in enumerate(bodies):
+        record_page(
+            session, archive, url, body, 200, fetched_at=T0 + timedelta(days=offset), source=source
+        )
+    session.commit()
+
+
+def due_dates(session) -> dict[str, str]:
+    rows = session.execute(
+        select(Conference.key, Deadline.due_date).join(Deadline.conference)
+    ).all()
+    return {key: due.isoformat() for key, due in rows}
+
+
+def test_reprocess_parses_latest_fetch_per_url(session, archive):
+    archive_pages(
+        session,
+        archive,
+        [
+            ("https://aideadlines.org/?sub=NLP", page("acl25", "ACL 2025", "2025-02-10 23:59")),
+            ("https://aideadlines.org/?sub=ML", page("icml25", "ICML 2025", "2025-01-30 23:59")),
+            ("https://aideadlines.org/?sub=NLP", page("acl25", "ACL 2025", "2025-02-15 23:59")),
+        ],
+    )
+
+    stats = reprocess(session, archive, "ai_deadlines", workers=1)
+
+    assert (stats.pages, stats.items, stats.errors) == (2, 2, 0)
+    assert due_dates(session) == {"acl25": "2025-02-15", "icml25": "2025-01-30"}
+    source_urls = set(session.scalars(select(Source.url)))
+    assert source_urls == {"https://aideadlines.org/?sub=NLP", "https://aideadlines.org/?sub=ML"}
+
+
+def test_time_window_and_status_filter(session, archive):
+    archive_pages(
+        session,
+        archive,
+        [
+            ("https://aideadlines.org/a", page("acl25", "ACL 2025", "2025-02-10 23:59")),
+            ("https://aideadlines.org/b", page("icml25", "ICML 2025", "2025-01-30 23:59")),
+        ],
+    )
+    record_page(session, archive, "https://aideadlines.org/c", b"gone", 404, source="ai_deadlines")
+    session.commit()
+
+    window = select_pages(session, "ai_deadlines", since=T0 + timedelta(hours=12))
+    assert len(window) == 1
+
+    stats = reprocess(session, archive, "ai_deadlines", since=T0 + timedelta(hours=12), workers=1)
+    assert stats.pages == 1
+    assert set(due_dates(session)) == {"icml25"}
+
+
+def test_resume_from_checkpoint(session, archive):
+    archive_pages(
+        session,
+        archive,
+        [
+            (
+                f"https://aideadlines.org/{i}",
+                page(f"conf{i}25", f"CONF{i} 2025", "2025-05-01 12:00"),
+            )
+            for i in range(5)
+        ],
+    )
+
+    def interrupt(stats):
+        if stats.batches == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        reprocess(session, archive, "ai_deadlines", workers=1, batch_size=1, progress=interrupt)
+
+    checkpoint = session.scalar(select(ReprocessCheckpoint))
+    assert checkpoint.name == checkpoint_name("ai_deadlines") == "ai_deadlines@1.0"
+    assert checkpoint.pages == 2
+    interrupted_at = checkpoint.last_page_id
+
+    resumed = reprocess(session, archive, "ai_deadlines", workers=1, batch_size=2)
+    assert resumed.resumed_from == interrupted_at
+    assert resumed.pages == 3
+    assert len(due_dates(session)) == 5
+
+    session.refresh(checkpoint)
+    assert (checkpoint.pages, checkpoint.items) == (5, 5)
+
+    again = reprocess(session, archive, "ai_deadlines", workers=1)
+    assert again.pages == 0
+    restarted = reprocess(session, archive, "ai_deadlines", workers=1, restart=True)
+    assert restarted.pages == 5
+
+
+def test_missing_blob_counts_as_error(session, archive):
+    archive_pages(
+        session,
+        archive,
+        [
+            ("https://aideadlines.org/a", page("acl25", "ACL 2025", "2025-02-10 23:59")),
+            ("https://aideadlines.org/b", page("icml25", "ICML 2025", "2025-01-30 23:59")),
+        ],
+    )
+    lost = min(archive.root.rglob("*.zst"))
+    lost.unlink()
+
+    stats = reprocess(session, archive, "ai_deadlines", workers=1)
+
+    assert (stats.pages, stats.items, stats.errors) == (2, 1, 1)
+    ((url, error),) = stats.failures
+    assert url.startswith("https://aideadlines.org/") and "FileNotFoundError" in error
+
+
+def test_items_are_observed_at_fetch_time(session, archive):
+    url = "https://aideadlines.org/?sub=NLP"
+    archive_pages(session, archive, [(url, page("acl25", "ACL 2025", "2025-02-10 23:59"))])
+
+    reprocess(session, archive, "ai_deadlines", workers=1)
+
+    (change,) = session.scalars(select(DeadlineChange)).all()
+    (version,) = session.scalars(select(DeadlineHistory)).all()
+    assert change.detected_at.replace(tzinfo=timezone.utc) == T0
+    assert version.valid_from.replace(tzinfo=timezone.utc) == T0
+
+
+def test_pages_with_a_newer_fetch_are_skipped(session, archive):
+    url = "https://aideadlines.org/?sub=NLP"
+    archive_pages(
+        session,
+        archive,
+        [
+            (url, page("acl25", "ACL 2025", "2025-02-10 23:59")),
+            (url, page("acl25", "ACL 2025", "2025-02-15 23:59")),
+        ],
+    )
+    reprocess(session, archive, "ai_deadlines", workers=1)
+
+    old_window = reprocess(
+        session, archive, "ai_deadlines", until=T0 + timedelta(hours=12), workers=1
+    )
+    assert (old_window.pages, old_window.stale, old_window.items) == (1, 1, 0)
+    assert due_dates(session) == {"acl25": "2025-02-15"}
+
+
+def test_process_pool_matches_inline(session, archive):
+    archive_pages(
+        session,
+        archive,
+        [
+            (
+                f"https://aideadlines.org/{i}",
+                page(f"conf{i}25", f"CONF{i} 2025", "2025-05-01 12:00"),
+            )
+            for i in range(4)
+        ],
+    )
+
+    stats = reprocess(session, archive, "ai_deadlines", workers=2, batch_size=2)
+
+    assert (stats.pages, stats.items, stats.batches) == (4, 4, 2)
+    assert len(due_dates(session)) == 4
+
+
+def test_unknown_source_is_rejected(session, archive):
+    with pytest.raises(ValueError, match="No scraper registered"):
+        reprocess(session, archive, "nope", workers=1)
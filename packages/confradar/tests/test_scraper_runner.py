@@ -0,0 +1,119 @@
+"""Tests for async scrapers and the concurrent multi-source runner."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from confradar.scrapers.ai_deadlines import AIDeadlinesScraper
+from confradar.scrapers.base import Scraper
+from confradar.scrapers.runner import arun_scrapers, make_client, run_scrapers
+
+PAGE = """
+<html><body><a href="/conference?id={key}">{name}</a></body>
+<script>
+    $('#{key} .ML-tag').html('ml');
+    var timezone = "UTC-12";
+    var confDate = moment.tz("2026-05-15 23:59", timezone);
+</script></html>
+"""
+
+
+class SlowHandler:
+    """Mock transport handler that records how many requests overlap per host."""
+
+    def __init__(self, delay: float = 0.05, hang: tuple[str, ...] = ()):
+        self.delay = delay
+        self.hang = hang
+        self.in_flight: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total_peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+        self.total_peak = max(self.total_peak, sum(self.in_flight.values()))
+        try:
+            await asyncio.sleep(3600 if host in self.hang else self.delay)
+        finally:
+            self.in_flight[host] -= 1
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        key = request.url.host.split(".")[0] + request.url.path.strip("/")
+        return httpx.Response(200, text=PAGE.format(key=key, name=key.upper()))
+
+
+def scraper(url: str) -> AIDeadlinesScraper:
+    return AIDeadlinesScraper(url=url)
+
+
+async def run(scrapers, handler, **kwargs):
+    async with make_client(
+        per_host=kwargs.pop("per_host", 2), transport=httpx.MockTransport(handler)
+    ) as client:
+        return await arun_scrapers(scrapers, client=client, **kwargs)
+
+
+def test_sources_run_concurrently_within_per_host_limit():
+    handler = SlowHandler()
+    scrapers = [scraper(f"https://a.example/{i}") for i in range(4)] + [
+        scraper(f"https://b.example/{i}") for i in range(4)
+    ]
+
+    outcomes = asyncio.run(run(scrapers, handler, per_host=2))
+
+    assert all(o.ok for o in outcomes)
+    assert [o.result.normalized[0]["key"] for o in outcomes[:2]] == ["a0", "a1"]
+    assert outcomes[0].result.normalized[0]["deadlines"][0]["due_at"] == "2026-05-15T23:59:00"
+    assert handler.peak == {"a.example": 2, "b.example": 2}
+    assert handler.total_peak == 4
+
+
+def test_failures_and_timeouts_are_isolated():
+    handler = SlowHandler(hang=("slow.example",))
+    scrapers = [
+        scraper("https://a.example/ok"),
+        scraper("https://a.example/missing"),
+        scraper("https://slow.example/x"),
+    ]
+
+    ok, missing, slow = asyncio.run(run(scrapers, handler, timeout=0.5))
+
+    assert ok.ok and ok.result.metadata["count"] == 1
+    assert not missing.ok and missing.error.startswith("HTTPStatusError")
+    assert not slow.ok and slow.error == "Timed out after 0.5s"
+    assert handler.in_flight["slow.example"] == 0
+
+
+class ThreadedScraper(Scraper):
+    """Sync-only scraper: ascrape falls back to fetch in a worker thread."""
+
+    @property
+    def source_name(self) -> str:
+        return "threaded"
+
+    @property
+    def schema_version(self) -> str:
+        return "1.0"
+
+    def fetch(self, **kwargs: Any) -> list[dict[str, Any]]:
+        return [{"key": "conf1", "name": "CONF1"}]
+
+    def parse(self, raw: list[dict[str, Any]], **kwargs: Any) -> list[dict[str, Any]]:
+        return raw
+
+
+def test_sync_scraper_runs_through_default_afetch():
+    (outcome,) = run_scrapers([ThreadedScraper()], timeout=5)
+
+    assert outcome.ok
+    assert outcome.result.normalized == [{"key": "conf1", "name": "CONF1"}]
+
+
+def test_per_host_must_be_positive():
+    with pytest.raises(ValueError, match="per_host"):
+        make_client(per_host=0)
@@ -0,0 +1,153 @@
+"""Tests for the cross-run seen-URL store and its downloader middleware."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from scrapy import Spider
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from confradar.db import Base, SeenUrl
+from confradar.scrapers.middlewares import FreshUrl, SeenUrlMiddleware
+from confradar.seen_urls import BloomFilter, SeenUrlStore
+
+DAY = 86400
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'seen.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_bloom_filter_roundtrip_and_error_rate(tmp_path):
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    keys = [f"fp{i}" for i in range(2000)]
+    assert sum(bloom.add(key) for key in keys) > 1950  # a few collide with earlier keys
+    assert not bloom.add("fp0")
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+    path = tmp_path / "s.bloom"
+    bloom.save(path)
+    loaded = BloomFilter.load(path)
+    assert (len(loaded), loaded.bits) == (len(bloom), bloom.bits)
+
+    path.write_bytes(b"garbage")
+    assert BloomFilter.load(path) is None
+    assert BloomFilter.load(tmp_path / "missing.bloom") is None
+
+
+def test_store_answers_from_filter_then_table(engine, tmp_path):
+    path = tmp_path / "elra.bloom"
+    store = SeenUrlStore("elra", bloom_path=path, capacity=100)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        store.load(session)
+        store.record("a", "https://x/a", fetched_at=now - timedelta(days=2))
+        store.record("b", "https://x/b", fetched_at=now - timedelta(days=10))
+        assert store.flush(session) == 2
+        store.record("a", "https://x/a", fetched_at=now - timedelta(hours=1))
+        store.flush(session)
+        session.commit()
+
+        reloaded = SeenUrlStore("elra", bloom_path=path, capacity=100)
+        assert reloaded.load(session) == 2
+        assert reloaded.is_fresh(session, "a", 7 * DAY)
+        assert not reloaded.is_fresh(session, "b", 7 * DAY)
+        assert not reloaded.is_fresh(session, "c", 7 * DAY)
+        assert not reloaded.is_fresh(session, "a", 0)
+        counts = dict(session.execute(select(SeenUrl.fingerprint, SeenUrl.fetch_count)).all())
+    assert counts == {"a": 2, "b": 1}
+    assert (reloaded.stats.lookups, reloaded.stats.bloom_negative) == (2, 1)
+
+
+def test_missing_filter_is_rebuilt_from_table(engine, tmp_path):
+    path = tmp_path / "elra.bloom"
+    with Session(engine) as session:
+        store = SeenUrlStore("elra", bloom_path=path)
+        store.load(session)
+        store.record("a", "https://x/a")
+        store.flush(session)
+        session.commit()
+        path.unlink()
+
+        rebuilt = SeenUrlStore("elra", bloom_path=path)
+        assert rebuilt.load(session) == 1
+        assert rebuilt.is_fresh(session, "a", DAY)
+    assert path.exists()
+
+
+class DetailSpider(Spider):
+    name = "details"
+
+
+def make_middleware(engine, tmp_path, **settings):
+    crawler = get_crawler(
+        DetailSpider,
+        settings_dict={
+            "SEEN_URLS_ENABLED": True,
+            "SEEN_URLS_DIR": str(tmp_path / "seen"),
+            "SEEN_URLS_FRESHNESS": {"details": 7 * DAY},
+            **settings,
+        },
+    )
+    crawler.spider = DetailSpider()
+    middleware = SeenUrlMiddleware.from_crawler(crawler)
+    middleware.session_factory = sessionmaker(engine)
+    return middleware, crawler
+
+
+def fetch(middleware, url: str, **kwargs) -> Request:
+    request = Request(url, **kwargs)
+    middleware.process_request(request)
+    response = HtmlResponse(url=url, body=b"<html></html>", request=request)
+    middleware.process_response(request, response)
+    return request
+
+
+def test_middleware_skips_urls_fetched_within_window(engine, tmp_path):
+    middleware, crawler = make_middleware(engine, tmp_path)
+    fetch(middleware, "https://cfp.example.org/conf/1")
+    middleware.spider_closed(crawler.spider)
+    assert (tmp_path / "seen" / "details.bloom").exists()
+
+    # Next crawl
+    middleware, crawler = make_middleware(engine, tmp_path)
+    with pytest.raises(FreshUrl):
+        middleware.process_request(Request("https://cfp.example.org/conf/1"))
+    assert middleware.process_request(Request("https://cfp.example.org/conf/2")) is None
+    assert (
+        middleware.process_request(Request("https://cfp.example.org/conf/1", dont_filter=True))
+        is None
+    )
+    assert (
+        middleware.process_request(
+            Request("https://cfp.example.org/conf/1", meta={"freshness_secs": 0})
+        )
+        is None
+    )
+    assert crawler.stats.get_value("seen_urls/skipped_fresh") == 1
+
+    # Windows are per source: other spiders fetch again
+    middleware, crawler = make_middleware(engine, tmp_path, SEEN_URLS_FRESHNESS={})
+    assert middleware.process_request(Request("https://cfp.example.org/conf/1")) is None
+
+
+def test_cached_and_failed_responses_are_not_recorded(engine, tmp_path):
+    middleware, crawler = make_middleware(engine, tmp_path)
+    request = Request("https://cfp.example.org/conf/1")
+    cached = HtmlResponse(url=request.url, body=b"", request=request, flags=["cached"])
+    missing = HtmlResponse(url=request.url, body=b"", request=request, status=404)
+    middleware.process_response(request, cached)
+    middleware.process_response(request, missing)
+    middleware.spider_closed(crawler.spider)
+
+    with Session(engine) as session:
+        assert session.scalar(select(SeenUrl)) is None
@@ -0,0 +1,63 @@
+"""Tests for the offline spider replay benchmark."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARK = Path(__file__).parents[1] / "benchmarks" / "spider_replay.py"
+
+_spec = importlib.util.spec_from_file_location("spider_replay", BENCHMARK)
+spider_replay = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(spider_replay)
+
+
+def test_replays_redirected_gzip_fixture():
+    # Each replay runs a reactor, so it gets its own process as in `run`
+    proc = subprocess.run(
+        [sys.executable, str(BENCHMARK), "replay-one", "elra"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"},
+        timeout=120,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    assert result["finish_reason"] == "finished"
+    assert (result["pages"], result["items"], result["stored"]) == (2, 50, 50)
+    assert result["missing"] == []
+    assert {"download", "callback/parse"} <= set(result["stage_ms"])
+
+    baseline = json.loads((spider_replay.FIXTURES / "baseline.json").read_text())["elra"]
+    assert (baseline["pages"], baseline["items"]) == (result["pages"], result["items"])
+
+
+def test_median_result_and_regressions():
+    runs = [
+        {
+            "spider": "elra",
+            "elapsed_s": elapsed,
+            "pages_per_s": 2 / elapsed,
+            "items_per_s": 50 / elapsed,
+            "peak_rss_mb": rss,
+            "stage_ms": {"download": elapsed * 100},
+        }
+        for elapsed, rss in [(0.1, 100.0), (0.4, 90.0), (0.2, 95.0)]
+    ]
+    result = spider_replay.median_result(runs)
+    assert (result["elapsed_s"], result["pages_per_s"], result["peak_rss_mb"]) == (0.2, 10, 95)
+    assert result["stage_ms"] == {"download": 20.0}
+
+    baseline = {"pages_per_s": 10, "items_per_s": 250, "peak_rss_mb": 95}
+    assert spider_replay.regressions(result, baseline, tolerance=0.25) == []
+    slower = {**result, "pages_per_s": 7, "peak_rss_mb": 120}
+    assert spider_replay.regressions(slower, baseline, tolerance=0.25) == [
+        "pages_per_s 7 < 10",
+        "peak_rss_mb 120 > 95",
+    ]
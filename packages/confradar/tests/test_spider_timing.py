@@ -0,0 +1,117 @@
+"""Tests for callback and pipeline timing histograms and their reports."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from scrapy import Request, Spider
+from scrapy.http import HtmlResponse
+from scrapy.utils.test import get_crawler
+
+from confradar.cli import main
+from confradar.scrapers.extensions import SpiderTimingExtension
+from confradar.scrapers.middlewares import CallbackTimingMiddleware
+from confradar.scrapers.pipelines import ValidationPipeline
+from confradar.scrapers.timing import Histogram, crawl_timings, load_report
+
+
+class ListingSpider(Spider):
+    name = "listings"
+
+    def parse(self, response):
+        time.sleep(0.02)
+        yield {"key": "acl2026", "name": "ACL 2026"}
+        yield Request("https://example.org/page/2", callback=self.parse_page)
+        yield {"key": "emnlp2026", "name": "EMNLP 2026"}
+
+    async def parse_page(self, response):
+        yield {"key": "naacl2026", "name": "NAACL 2026"}
+
+
+def make_crawler(tmp_path, **settings):
+    crawler = get_crawler(
+        ListingSpider,
+        settings_dict={
+            "SPIDER_TIMING_ENABLED": True,
+            "SPIDER_TIMING_DIR": str(tmp_path / "timing"),
+            **settings,
+        },
+    )
+    crawler.spider = ListingSpider.from_crawler(crawler)
+    return crawler
+
+
+def response_for(callback, url="https://example.org/", body=b"<html>" + b"x" * 3000):
+    request = Request(url, callback=callback, meta={"download_latency": 0.25})
+    return HtmlResponse(url=url, body=body, request=request)
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = Histogram("ms")
+    for value in [0.05, 3, 4, 4, 7, 40, 900]:
+        histogram.observe(value)
+    assert histogram.count == 7 and histogram.max == 900
+    assert histogram.percentile(50) == 5  # upper bound of the 2..5 bucket
+    assert histogram.percentile(99) == 900  # capped at the max
+    assert histogram.to_dict()["buckets"] == {"0.1": 1, "5": 3, "10": 1, "50": 1, "1000": 1}
+    assert Histogram().summary()["p95"] == 0.0
+
+
+def test_callbacks_and_pipeline_stages_are_timed(tmp_path):
+    crawler = make_crawler(tmp_path)
+    spider = crawler.spider
+    middleware = CallbackTimingMiddleware.from_crawler(crawler)
+    pipeline = ValidationPipeline()
+
+    response = response_for(spider.parse)
+    output = list(middleware.process_spider_output(response, spider.parse(response), spider))
+    for item in output:
+        if not isinstance(item, Request):
+            pipeline.process_item(item, spider)
+
+    async def consume():
+        page = response_for(spider.parse_page, url="https://example.org/page/2")
+        result = middleware.process_spider_output_async(page, spider.parse_page(page), spider)
+        return [obj async for obj in result]
+
+    assert len(asyncio.run(consume())) == 1
+
+    histograms = crawl_timings(crawler).histograms
+    assert histograms["callback/parse"].count == 1
+    assert histograms["callback/parse"].min >= 20
+    assert histograms["callback/parse_page"].count == 1
+    assert histograms["download"].max == 250
+    assert histograms["response_bytes"].unit == "bytes"
+    assert histograms["items_per_response"].sum == 3
+    assert histograms["pipeline/ValidationPipeline"].count == 2
+
+
+def test_report_written_on_close_and_shown_by_cli(tmp_path, capsys):
+    crawler = make_crawler(tmp_path)
+    extension = SpiderTimingExtension.from_crawler(crawler)
+    middleware = CallbackTimingMiddleware.from_crawler(crawler)
+    spider = crawler.spider
+    response = response_for(spider.parse)
+    list(middleware.process_spider_output(response, spider.parse(response), spider))
+    extension.spider_closed(spider, "finished")
+
+    stats = crawler.stats
+    assert stats.get_value("timing/callback/parse/count") == 1
+    assert stats.get_value("timing/download/max") == 250
+    report = load_report(stats.get_value("timing/report"))
+    assert report["spider"] == "listings"
+    assert report["histograms"]["items_per_response"]["buckets"] == {"2": 1}
+
+    assert main(["timing-report", "listings", "--dir", str(tmp_path / "timing")]) == 0
+    out = capsys.readouterr().out
+    assert "listings (finished)" in out
+    assert "callback/parse" in out and "download" in out
+    assert main(["timing-report", "other", "--dir", str(tmp_path / "timing")]) == 1
+
+
+def test_disabled_timing_is_a_no_op(tmp_path):
+    crawler = make_crawler(tmp_path, SPIDER_TIMING_ENABLED=False)
+    assert crawl_timings(crawler) is None
+    item = {"key": "acl2026", "name": "ACL 2026"}
+    assert ValidationPipeline().process_item(item, crawler.spider) is item
@@ -0,0 +1,133 @@
+"""Tests for the streaming Scraper protocol (iter_parse / iter_scrape)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from confradar.content_gate import ContentGate
+from confradar.db import Base, Conference, Deadline
+from confradar.db.ingest import upsert_stream
+from confradar.scrapers import Scraper, ScrapeStream
+from confradar.scrapers.ai_deadlines import AIDeadlinesScraper
+
+
+class FeedScraper(Scraper):
+    """Streams one record per line of a line-delimited feed."""
+
+    def __init__(self, lines: list[str]):
+        self.lines = lines
+        self.produced = 0
+
+    @property
+    def source_name(self) -> str:
+        return "feed"
+
+    @property
+    def schema_version(self) -> str:
+        return "1.0"
+
+    def fetch(self, **kwargs: Any) -> str:
+        return "\n".join(self.lines)
+
+    def iter_parse(self, raw: str, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        for line in raw.splitlines():
+            key, _, due = line.partition(" ")
+            self.produced += 1
+            yield {
+                "key": key,
+                "name": key.upper(),
+                "deadlines": [{"kind": "submission", "due_at": due}] if due else [],
+            }
+
+
+def test_iter_scrape_is_lazy_and_counts():
+    scraper = FeedScraper([f"conf{i} 2026-05-{i % 28 + 1:02d}" for i in range(5)])
+
+    stream = scraper.iter_scrape()
+    assert isinstance(stream, ScrapeStream)
+    assert scraper.produced == 0
+    assert "count" not in stream.metadata
+
+    records = iter(stream)
+    assert next(records)["key"] == "conf0"
+    assert scraper.produced == 1
+    assert len(list(records)) == 4
+    assert stream.metadata["count"] == 5
+
+
+def test_parse_is_derived_from_iter_parse():
+    scraper = FeedScraper(["a 2026-01-01", "b"])
+
+    assert [r["key"] for r in scraper.parse(scraper.fetch())] == ["a", "b"]
+    assert scraper.scrape().metadata["count"] == 2
+
+
+def test_list_scraper_streams_through_adapter():
+    html = """
+    <html><body>
+        <a href="/conference?id=icml25">ICML 2025</a>
+        <a href="/conference?id=acl25">ACL 2025</a>
+    </body></html>
+    """
+    scraper = AIDeadlinesScraper()
+    scraper.fetch = lambda **kwargs: html
+
+    streamed = list(scraper.iter_scrape())
+    assert streamed == scraper.scrape().normalized
+    assert [r["key"] for r in streamed] == ["icml25", "acl25"]
+
+
+def test_invalid_record_stops_the_stream():
+    scraper = FeedScraper(["good 2026-01-01", "bad"])
+    scraper.iter_parse = lambda raw, **kwargs: iter([{"key": "good", "name": "G"}, {"key": "x"}])
+
+    records = iter(scraper.iter_scrape())
+    assert next(records)["key"] == "good"
+    with pytest.raises(ValueError, match="Missing required fields"):
+        next(records)
+
+
+def test_scraper_without_parse_is_rejected():
+    class Empty(FeedScraper):
+        iter_parse = Scraper.iter_parse
+
+    with pytest.raises(NotImplementedError, match="parse or iter_parse"):
+        list(Empty([]).iter_scrape())
+
+
+def test_gate_records_only_after_the_stream_is_consumed():
+    gate = ContentGate()
+    scraper = FeedScraper(["conf1 2026-03-15", "conf2 2026-04-15"])
+
+    stream = scraper.iter_scrape(gate=gate)
+    assert stream.metadata["unchanged"] is False
+    assert gate.pending == 0
+    list(stream)
+    assert gate.pending == 1
+
+    again = scraper.iter_scrape(gate=gate)
+    assert again.metadata == {"unchanged": True, "count": 0}
+    assert list(again) == []
+    assert scraper.produced == 2
+
+
+def test_upsert_stream_writes_in_batches(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stream.db'}")
+    Base.metadata.create_all(engine)
+    scraper = FeedScraper([f"conf{i} 2026-05-{i % 28 + 1:02d}" for i in range(25)])
+
+    with Session(engine) as session:
+        stream = scraper.iter_scrape()
+        stats = upsert_stream(session, stream, batch_size=10)
+        session.commit()
+
+        assert (stats.items, stats.conferences, stats.deadlines) == (25, 25, 25)
+        assert stats.changes.added == 25
+        assert session.scalar(select(func.count()).select_from(Conference)) == 25
+        assert session.scalar(select(func.count()).select_from(Deadline)) == 25
+    assert stream.metadata["count"] == 25
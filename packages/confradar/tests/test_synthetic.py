@@ -0,0 +1,55 @@
+"""Tests for synthetic conference item streams."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from confradar.db import Base
+from confradar.db.ingest import upsert_stream
+from confradar.scrapers.pipelines import ValidationPipeline
+from confradar.synthetic import SyntheticConfig, acronym, conference_key, generate_items
+
+CONFIG = SyntheticConfig(conferences=400, deadlines_per_conference=5, duplicate_rate=0.05)
+
+
+def test_stream_is_deterministic_and_messy():
+    items = list(generate_items(CONFIG))
+    assert items == list(generate_items(CONFIG))
+    assert acronym(0) == "AAA" and acronym(1) == "AAB"
+
+    keys = {item["key"] for item in items}
+    assert {conference_key(CONFIG, i) for i in range(CONFIG.conferences)} <= keys
+    assert any("_" in key for key in keys)  # aliases
+    listings = Counter((item["key"], item["source"]) for item in items)
+    assert max(listings.values()) == 2  # duplicates within a source
+    sources_per_key = Counter(key for key, _ in listings)
+    assert max(sources_per_key.values()) == 2  # multi-source overlap
+
+    for item in items:
+        assert ValidationPipeline().process_item(item, None) is item
+
+    wikicfp = list(generate_items(CONFIG, source="wikicfp"))
+    assert wikicfp == [item for item in items if item["source"] == "wikicfp"]
+
+
+def test_later_crawls_move_deadlines(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'load.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        first = upsert_stream(session, generate_items(CONFIG), batch_size=100)
+        assert first.changes.added >= CONFIG.conferences * 5  # aliases add their own
+        second = upsert_stream(session, generate_items(CONFIG, crawl=1), batch_size=100)
+        session.commit()
+    assert second.changes.added == 0 and second.changes.removed == 0
+    assert 0 < second.changes.moved < first.changes.added * 0.2
+
+
+def test_config_is_validated():
+    with pytest.raises(ValueError):
+        SyntheticConfig(deadlines_per_conference=11)
+    with pytest.raises(ValueError):
+        SyntheticConfig(sources=())
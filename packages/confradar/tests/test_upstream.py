@@ -0,0 +1,100 @@
+"""Tests for conditional probes of source index pages."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from confradar.scrapers.runner import make_client
+from confradar.upstream import aprobe_sources, index_urls
+
+URL = "https://www.elra.info/elra-events/"
+PAGE = "<html><body><h1>Events</h1><p>LREC 2026 deadline: {date}</p>{extra}</body></html>"
+
+
+class Site:
+    """Mock server for one page, honouring (or ignoring) conditional requests."""
+
+    def __init__(self, etag: str | None = '"v1"', head_allowed: bool = True):
+        self.etag = etag
+        self.head_allowed = head_allowed
+        self.body = PAGE.format(date="2026-01-10", extra="")
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.method)
+        if request.method == "HEAD" and not self.head_allowed:
+            return httpx.Response(405)
+        headers = {"ETag": self.etag} if self.etag else {}
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers=headers)
+        body = "" if request.method == "HEAD" else self.body
+        return httpx.Response(200, headers=headers, text=body)
+
+
+def probe(handler, states=None):
+    async def run():
+        async with make_client(transport=httpx.MockTransport(handler)) as client:
+            return await aprobe_sources({"elra": [URL]}, states, client=client)
+
+    return asyncio.run(run())["elra"]
+
+
+def test_etag_answers_from_head_until_it_changes():
+    site = Site()
+    first = probe(site)
+    assert not first.changed  # baseline
+    assert site.requests == ["HEAD", "GET"]
+
+    site.requests.clear()
+    assert not probe(site, first.states).changed
+    assert site.requests == ["HEAD"]  # 304, no body downloaded
+
+    site.etag = '"v2"'
+    site.body = PAGE.format(date="2026-01-17", extra="")
+    second = probe(site, first.states)
+    assert second.changed
+    assert second.states[URL]["etag"] == '"v2"'
+
+
+def test_without_validators_the_content_digest_decides():
+    site = Site(etag=None, head_allowed=False)
+    first = probe(site)
+
+    # A per-request nonce is not a change; a moved deadline is
+    site.body = PAGE.format(date="2026-01-10", extra="<!-- 9f8e7d6c5b4a39281706f5e4d3c2b1a0 -->")
+    assert not probe(site, first.states).changed
+    site.body = PAGE.format(date="2026-01-24", extra="")
+    assert probe(site, first.states).changed
+
+
+def test_failed_probe_keeps_previous_state():
+    site = Site()
+    first = probe(site)
+
+    def down(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    failed = probe(down, first.states)
+    assert not failed.changed
+    assert failed.urls[0].error.startswith("ConnectError")
+    assert failed.states == first.states
+
+
+def test_failed_first_probe_records_no_baseline():
+    def down(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    failed = probe(down)
+    assert failed.urls[0].error and failed.states == {}
+
+    site = Site()
+    assert not probe(site, failed.states).changed  # baseline, not a change
+    assert not probe(site, {URL: {}}).changed  # cursors written before the fix
+
+
+def test_index_urls_are_spider_start_urls():
+    assert index_urls("elra") == [URL]
+    assert index_urls("wikicfp") == ["http://www.wikicfp.com/cfp/home"]
+    assert index_urls("seeded") == []
@@ -0,0 +1,127 @@
+"""Tests for workshop -> parent conference linking."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from confradar.db import Base, Conference
+from confradar.resolution.workshops import (
+    EventRecord,
+    WorkshopLinker,
+    is_workshop,
+    link_workshops,
+    registrable_domain,
+)
+
+ACL = EventRecord(
+    1, "acl25", "ACL 2025 : 63rd Annual Meeting of the ACL", "https://2025.aclweb.org"
+)
+EMNLP = EventRecord(2, "emnlp25", "EMNLP 2025 : Empirical Methods in NLP", "https://2025.emnlp.org")
+ACL24 = EventRecord(
+    3, "acl24", "ACL 2024 : 62nd Annual Meeting of the ACL", "https://2024.aclweb.org"
+)
+GEBNLP = EventRecord(10, "gebnlp25", "GeBNLP 2025 : Workshop on Gender Bias in NLP @ ACL 2025")
+WMT = EventRecord(
+    11, "wmt25", "WMT 2025 Workshop on Machine Translation", "https://www2.statmt.org"
+)
+SIGDIAL = EventRecord(12, "ws-sigdial", "SIGDIAL 2025 Workshop", "https://sigdial2025.aclweb.org")
+
+
+def test_is_workshop():
+    assert is_workshop("Workshop on Gender Bias in NLP")
+    assert is_workshop("Tutorial", key="ws-tutorial25")
+    assert not is_workshop("Empirical Methods in Natural Language Processing")
+    assert is_workshop("SIGDIAL 2025", key="acl-ws25")
+    assert not is_workshop("WSDM 2026 : Web Search and Data Mining", key="wsdm26")
+    assert not is_workshop("Winter Simulation Conference", key="wsc25")
+
+
+def test_registrable_domain():
+    assert registrable_domain("https://2025.aclweb.org/calls") == "aclweb.org"
+    assert registrable_domain("http://www.cs.example.ac.uk") == "example.ac.uk"
+    assert registrable_domain(None) is None
+
+
+def test_links_by_host_acronym_and_year():
+    linker = WorkshopLinker()
+    links = linker.add([ACL, ACL24, EMNLP, GEBNLP])
+
+    assert links == {GEBNLP.id: ACL.id}
+
+
+def test_links_by_registrable_domain():
+    links = WorkshopLinker().add([ACL, EMNLP, SIGDIAL])
+    assert links == {SIGDIAL.id: ACL.id}
+
+
+def test_candidates_come_from_shared_postings_only():
+    linker = WorkshopLinker()
+    conferences = [
+        EventRecord(100 + i, f"conf{i}25", f"CONF{i} 2025 Conference", f"https://conf{i}.org")
+        for i in range(200)
+    ]
+    linker.add([*conferences, ACL, GEBNLP])
+
+    # GeBNLP shares postings with ACL only; the 200 other conferences are never scored
+    assert linker.stats.candidates == 1
+
+
+def test_unmatched_workshop_is_linked_when_parent_arrives():
+    linker = WorkshopLinker()
+    assert linker.add([EMNLP, GEBNLP, WMT]) == {}
+    assert linker.add([ACL]) == {GEBNLP.id: ACL.id}
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'workshops.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _store(session: Session, *records: EventRecord) -> None:
+    session.add_all(
+        Conference(id=r.id, key=r.key, name=r.name, homepage=r.homepage) for r in records
+    )
+    session.commit()
+
+
+def test_link_workshops_persists_parent(session):
+    _store(session, ACL, EMNLP, GEBNLP)
+
+    stats = link_workshops(session)
+    session.commit()
+
+    assert stats.linked == 1
+    workshop = session.get(Conference, GEBNLP.id)
+    assert workshop.parent_id == ACL.id
+    assert [w.key for w in session.get(Conference, ACL.id).workshops] == ["gebnlp25"]
+
+
+def test_link_workshops_incremental(session):
+    _store(session, EMNLP, GEBNLP)
+    assert link_workshops(session).linked == 0
+
+    # A later crawl brings in ACL; only the new id is passed in
+    _store(session, ACL)
+    stats = link_workshops(session, conference_ids=[ACL.id])
+    session.commit()
+
+    assert stats.linked == 1
+    assert session.get(Conference, GEBNLP.id).parent_id == ACL.id
+
+
+def test_link_workshops_incremental_loads_related_rows_only(session):
+    _store(session, EMNLP, GEBNLP, WMT, SIGDIAL)
+
+    stats = link_workshops(session, conference_ids=[])
+    assert (stats.conferences, stats.workshops) == (0, 0)
+
+    # ACL shares the "acl" acronym with GeBNLP and aclweb.org with SIGDIAL; EMNLP and WMT
+    # share no posting and are never loaded
+    _store(session, ACL)
+    stats = link_workshops(session, conference_ids=[ACL.id])
+    assert (stats.conferences, stats.workshops, stats.linked) == (1, 2, 2)